@@ -1,5 +1,6 @@
 """API service configuration — loads from environment variables."""
 
+import json
 from pathlib import Path
 from urllib.parse import quote_plus
 
@@ -61,6 +62,41 @@ class Settings(BaseSettings):
     cache_user_ttl: int = 30
     cache_list_ttl: int = 60
 
+    # Rate limiting (disable only for local load testing)
+    rate_limit_enabled: bool = True
+
+    # Location
+    timezone_preload: bool = False  # Load timezone polygons into memory at startup
+
+    # Deferred AI enrichment (two-phase readings)
+    ai_jobs_enabled: bool = True  # Run the background AI job worker
+    ai_job_max_attempts: int = 3  # Attempts before a job is dead-lettered
+    ai_job_retry_base_seconds: float = 5.0  # Backoff: base * 2^(attempt-1), capped at 5 min
+    ai_job_concurrency: int = 2  # Jobs processed in parallel per worker
+
+    # Admission control (reading endpoints — degrade, then 503 + Retry-After)
+    admission_enabled: bool = True
+    admission_max_concurrency: int = 16  # Full (AI) requests in flight per route
+    admission_max_queue: int = 64  # Waiting requests before degrading immediately
+    admission_target_ms: float = 100.0  # CoDel target: wait budget once overloaded
+    admission_interval_ms: float = 1000.0  # CoDel interval: normal wait budget
+    admission_degrade_latency_ms: float = 10000.0  # Skip the queue above this latency
+    admission_degrade_concurrency: int = 0  # Degraded requests in flight (0 = max_concurrency)
+    admission_route_overrides: str = ""  # JSON, e.g. {"question": {"max_concurrency": 4}}
+
+    # Request metrics (/api/health/performance, /api/health/metrics)
+    metrics_enabled: bool = True
+    metrics_aggregation: str = "local"  # "local" (this worker) or "redis" (all workers)
+    metrics_push_interval: float = 10.0  # Seconds between snapshot pushes to Redis
+
+    # Tracing (reading pipeline spans, Server-Timing header)
+    tracing_enabled: bool = False
+    tracing_export: str = ""  # "file:<path>" (OTLP/JSON lines) or OTLP/HTTP collector URL
+    tracing_server_timing: bool = False  # Expose span durations to every client
+
+    # Persistent groups (incremental compatibility)
+    oracle_group_max_members: int = 200  # Pair-score rows grow with members²
+
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"
@@ -111,6 +147,19 @@ class Settings(BaseSettings):
             or f"redis://{self.redis_host}:{self.redis_port}"
         )
 
+    @property
+    def admission_overrides(self) -> dict[str, dict]:
+        """Per-route admission settings parsed from ADMISSION_ROUTE_OVERRIDES."""
+        if not self.admission_route_overrides:
+            return {}
+        try:
+            parsed = json.loads(self.admission_route_overrides)
+        except ValueError:
+            return {}
+        if not isinstance(parsed, dict):
+            return {}
+        return {k: v for k, v in parsed.items() if isinstance(v, dict)}
+
     @property
     def cors_origins(self) -> list[str]:
         origins = [o.strip() for o in self.api_cors_origins.split(",") if o.strip()]
@@ -14,12 +14,15 @@ from fastapi.staticfiles import StaticFiles
 import app.orm.api_key  # noqa: F401
 import app.orm.audit_log  # noqa: F401
 import app.orm.finding  # noqa: F401
+import app.orm.oracle_ai_job  # noqa: F401
 import app.orm.oracle_feedback  # noqa: F401
+import app.orm.oracle_group  # noqa: F401
 import app.orm.oracle_reading  # noqa: F401
 import app.orm.oracle_settings  # noqa: F401
 
 # Import ORM models so Base.metadata knows all tables
 import app.orm.oracle_user  # noqa: F401
+import app.orm.oracle_user_feature  # noqa: F401
 import app.orm.session  # noqa: F401
 import app.orm.share_link  # noqa: F401
 import app.orm.telegram_daily_preference  # noqa: F401
@@ -28,6 +31,7 @@ import app.orm.user  # noqa: F401
 import app.orm.user_settings  # noqa: F401
 from app.config import settings
 from app.database import get_session_factory
+from app.middleware.priority import PriorityMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.routers import (
@@ -107,6 +111,20 @@ async def lifespan(app: FastAPI):
         init_blacklist_redis(app.state.redis)
         logger.info("JWT blacklist connected to Redis")
 
+        # Shared translation cache tier (sync client — translation endpoints
+        # run in the threadpool)
+        try:
+            import redis as sync_redis
+
+            from app.services.translation import init_translation_redis
+
+            init_translation_redis(
+                sync_redis.Redis.from_url(settings.effective_redis_url, socket_timeout=1)
+            )
+            logger.info("Translation cache connected to Redis")
+        except Exception as exc:
+            logger.warning("Translation cache Redis tier unavailable (non-fatal): %s", exc)
+
     # Probe Oracle gRPC channel (graceful fallback)
     app.state.oracle_channel = None
     try:
@@ -133,6 +151,51 @@ async def lifespan(app: FastAPI):
         logger.warning("Daily scheduler failed to start (non-fatal): %s", exc)
         daily_scheduler = None
 
+    # Start deferred AI enrichment worker (graceful fallback)
+    ai_worker_started = False
+    if settings.ai_jobs_enabled:
+        try:
+            from app.services.ai_jobs import ai_job_queue
+
+            await ai_job_queue.start(get_session_factory())
+            ai_worker_started = True
+        except Exception as exc:
+            logger.warning("AI job worker failed to start (non-fatal): %s", exc)
+
+    # Preload timezone polygons so the first geocode doesn't pay the load
+    if settings.timezone_preload:
+        from app.services.location_service import preload_timezone_finder
+
+        if preload_timezone_finder(in_memory=True):
+            logger.info("TimezoneFinder preloaded in memory")
+
+    # Publish request metrics for cross-worker aggregation
+    metrics_pusher = None
+    if (
+        settings.metrics_enabled
+        and settings.metrics_aggregation == "redis"
+        and app.state.redis is not None
+    ):
+        from app.services.request_metrics import MetricsPusher, get_request_metrics
+
+        metrics_pusher = MetricsPusher(
+            app.state.redis, get_request_metrics(), settings.metrics_push_interval
+        )
+        await metrics_pusher.start()
+        logger.info("Request metrics aggregation via Redis started")
+
+    # Trace exporter (spans are recorded only with TRACING_ENABLED)
+    trace_exporter_set = False
+    if settings.tracing_enabled and settings.tracing_export:
+        try:
+            from oracle_service.tracing import exporter_from_spec, set_exporter
+
+            set_exporter(exporter_from_spec(settings.tracing_export))
+            trace_exporter_set = True
+            logger.info("Trace export to %s", settings.tracing_export)
+        except Exception as exc:
+            logger.warning("Trace exporter unavailable (non-fatal): %s", exc)
+
     # Start WebSocket heartbeat
     await ws_manager.start_heartbeat()
     logger.info("WebSocket heartbeat started")
@@ -145,6 +208,16 @@ async def lifespan(app: FastAPI):
     if daily_scheduler:
         await daily_scheduler.stop()
         logger.info("Daily scheduler stopped")
+    if ai_worker_started:
+        from app.services.ai_jobs import ai_job_queue
+
+        await ai_job_queue.stop()
+    if metrics_pusher:
+        await metrics_pusher.stop()
+    if trace_exporter_set:
+        from oracle_service.tracing import set_exporter
+
+        set_exporter(None)
     if app.state.redis:
         await app.state.redis.close()
         logger.info("Redis connection closed")
@@ -179,7 +252,23 @@ if settings.cache_enabled:
     app.add_middleware(ResponseCacheMiddleware)
 
 # Rate limiting
-app.add_middleware(RateLimitMiddleware)
+if settings.rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware)
+
+# Request metrics (times everything below, including rate-limited and cached responses)
+if settings.metrics_enabled:
+    from app.middleware.metrics import MetricsMiddleware
+
+    app.add_middleware(MetricsMiddleware)
+
+# Per-request tracing spans (and, opt-in, a Server-Timing header)
+if settings.tracing_enabled:
+    from app.middleware.tracing import TracingMiddleware
+
+    app.add_middleware(TracingMiddleware, server_timing=settings.tracing_server_timing)
+
+# Work-scheduler priority class (outermost, so every layer below inherits it)
+app.add_middleware(PriorityMiddleware)
 
 # Routers
 app.include_router(health.router, prefix="/api/health", tags=["health"])
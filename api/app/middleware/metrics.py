@@ -0,0 +1,63 @@
+"""Request metrics middleware for NPS API.
+
+Records each HTTP request's latency, method, route template and status code
+in ``app.services.request_metrics`` and maintains the in-flight gauge. The
+route label is the matched route's path template (read from
+``scope["route"]`` after the router has run), so ``/api/oracle/users/42``
+and ``/api/oracle/users/7`` share one series; requests that match no route
+are labelled ``unmatched``.
+
+Written as a plain ASGI middleware so streaming responses are timed to their
+last body chunk and exceptions are still counted (as 500).
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.request_metrics import UNMATCHED_ROUTE, RequestMetrics, get_request_metrics
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the route that handled the request, prefix included."""
+    # FastAPI resolves included routers lazily: scope["route"] is the router's
+    # own APIRoute (path without the include prefix) and the prefixed
+    # template lives on the effective route context.
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    template = getattr(context, "path_format", None)
+    if template is None:
+        template = getattr(scope.get("route"), "path", None)
+    return template or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Count and time every HTTP request by method, route and status."""
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics | None = None) -> None:
+        self.app = app
+        self._metrics = metrics or get_request_metrics()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self._metrics.request_started()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._metrics.request_finished(
+                scope.get("method", "GET"),
+                route_template(scope),
+                status,
+                time.perf_counter() - start,
+            )
@@ -0,0 +1,43 @@
+"""Priority class middleware for NPS API.
+
+Tags each request with a work-scheduler priority class so blocking reading
+work it triggers is queued fairly against other traffic. Clients choose a
+class with the ``X-NPS-Priority`` header (the Telegram bot sends ``bot``, its
+daily push loop sends ``batch``); requests without one are ``interactive``.
+
+Written as a plain ASGI middleware so the contextvar it sets is visible to
+the endpoint and everything the endpoint awaits.
+"""
+
+from contextlib import nullcontext
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+PRIORITY_HEADER = b"x-nps-priority"
+
+
+class PriorityMiddleware:
+    """Set the work-scheduler priority class for the duration of a request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        try:
+            from oracle_service.work_scheduler import priority
+        except ImportError:  # Oracle engines not installed — nothing to schedule
+            priority = None
+        self._priority = priority
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = ""
+        for name, value in scope.get("headers", []):
+            if name == PRIORITY_HEADER:
+                requested = value.decode("latin-1")
+                break
+
+        scope_cm = self._priority(requested) if self._priority else nullcontext()
+        with scope_cm:
+            await self.app(scope, receive, send)
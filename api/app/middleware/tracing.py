@@ -0,0 +1,57 @@
+"""Tracing middleware for NPS API.
+
+Opens an ``oracle_service.tracing`` trace for each HTTP request so spans in
+the reading pipeline (framework steps, AI call, encryption, persistence)
+attach to it. The finished trace goes to the configured exporter
+(``TRACING_EXPORT``). With ``server_timing`` (``TRACING_SERVER_TIMING``), a
+response whose request produced spans also carries a ``Server-Timing``
+header with their durations, visible in browser devtools. It is off by
+default because the header goes to every caller, authenticated or not.
+
+Written as a plain ASGI middleware so the trace contextvar is visible to
+the endpoint and everything the endpoint awaits, and so the header can be
+added to the response start message.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.metrics import route_template
+
+SERVER_TIMING_HEADER = b"server-timing"
+
+
+class TracingMiddleware:
+    """Trace each HTTP request; optionally report its spans in ``Server-Timing``."""
+
+    def __init__(self, app: ASGIApp, server_timing: bool = False) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        try:
+            from oracle_service.tracing import start_trace
+        except ImportError:  # Oracle engines not installed — nothing to trace
+            start_trace = None
+        self._start_trace = start_trace
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._start_trace is None:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        with self._start_trace(method, **{"http.request.method": method}) as trace:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    trace.root.set_attribute("http.response.status_code", message["status"])
+                    if self.server_timing and trace.spans:
+                        headers = list(message.get("headers", []))
+                        headers.append((SERVER_TIMING_HEADER, trace.server_timing().encode()))
+                        message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = route_template(scope)
+                trace.root.name = f"{method} {route}"
+                trace.root.set_attribute("http.route", route)
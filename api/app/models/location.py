@@ -1,6 +1,6 @@
 """Location request/response models."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class CoordinatesResponse(BaseModel):
@@ -64,3 +64,34 @@ class CitySearchResponse(BaseModel):
     latitude: float
     longitude: float
     timezone: str
+
+
+class NearestCityResponse(BaseModel):
+    name: str
+    country_code: str
+    country_name: str
+    latitude: float
+    longitude: float
+    timezone: str
+    distance_km: float
+
+
+class NearestCityListResponse(BaseModel):
+    cities: list[NearestCityResponse]
+    total: int
+
+
+class CoordinatePoint(BaseModel):
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+
+
+class NearestCityBatchRequest(BaseModel):
+    coordinates: list[CoordinatePoint] = Field(..., min_length=1, max_length=500)
+    k: int = Field(1, ge=1, le=50)
+    lang: str = Field("en", pattern=r"^(en|fa)$")
+
+
+class NearestCityBatchResponse(BaseModel):
+    results: list[NearestCityListResponse]
+    total: int
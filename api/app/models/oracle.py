@@ -21,6 +21,8 @@ class TimeReadingRequest(BaseModel):
     locale: str = "en"
     numerology_system: NumerologySystemType = "auto"
     inquiry_context: dict[str, str] | None = None
+    stream_sections: bool = False  # push AI sections over /ws/oracle as they complete
+    defer_ai: bool = False  # return the framework result now, enrich with AI in the background
 
     @field_validator("sign_value")
     @classmethod
@@ -112,6 +114,7 @@ class AIInterpretationSections(BaseModel):
     elapsed_ms: float = 0.0
     cached: bool = False
     confidence_score: int = 0
+    time_to_first_section_ms: float | None = None  # set when sections were streamed
 
     model_config = ConfigDict(extra="allow")
 
@@ -132,6 +135,8 @@ class FrameworkReadingResponse(BaseModel):
     ganzhi: dict | None = None
     locale: str = "en"
     created_at: str = ""
+    ai_status: str | None = None  # "pending" when AI enrichment was deferred
+    degraded: bool = False  # AI skipped under load; fallback interpretation returned
 
     model_config = ConfigDict(extra="allow")
 
@@ -341,6 +346,7 @@ class QuestionReadingResponse(BaseModel):
     confidence: dict | None = None
     ai_interpretation: str | None = None
     reading_id: int | None = None
+    degraded: bool = False  # AI skipped under load; fallback interpretation returned
 
     model_config = ConfigDict(extra="allow")
 
@@ -384,6 +390,7 @@ class NameReadingResponse(BaseModel):
     ai_interpretation: str | None = None
     letter_breakdown: list[LetterAnalysis] = []
     reading_id: int | None = None
+    degraded: bool = False  # AI skipped under load; fallback interpretation returned
 
     model_config = ConfigDict(extra="allow")
 
@@ -395,6 +402,29 @@ class DailyInsightResponse(BaseModel):
     optimal_activity: str = ""
 
 
+class TimingDay(BaseModel):
+    date: str
+    moon_phase: str
+    weekday_planet: str
+    day_number: int
+    best_hour: int
+    best_score: float
+
+
+class TimingWindow(BaseModel):
+    start: str
+    end: str
+    score: float
+    quality: str
+
+
+class TimingPlanResponse(BaseModel):
+    start: str
+    days: list[TimingDay]
+    heatmap: list[list[float]]  # days x 24 UTC hours
+    windows: list[TimingWindow]
+
+
 class RangeRequest(BaseModel):
     scanned_ranges: list[str] = []
     puzzle_number: int = 0
@@ -418,6 +448,7 @@ class StoredReadingResponse(BaseModel):
     question: str | None = None
     reading_result: dict | None = None
     ai_interpretation: str | None = None
+    ai_status: str | None = None  # pending | complete | failed (deferred AI only)
     created_at: str
     is_favorite: bool = False
     deleted_at: str | None = None
@@ -717,3 +748,72 @@ class MultiUserFrameworkResponse(BaseModel):
     created_at: str = ""
 
     model_config = ConfigDict(extra="allow")
+
+
+# ─── Persistent Group Models ────────────────────────────────────────────────
+
+
+class GroupCreateRequest(BaseModel):
+    """Request for POST /api/oracle/groups."""
+
+    name: str
+    user_ids: list[int] = []
+    date: str | None = None  # Reading moment for every member (default: now)
+    numerology_system: NumerologySystemType = "auto"
+
+    @field_validator("name")
+    @classmethod
+    def validate_name(cls, v: str) -> str:
+        v = v.strip()
+        if not v or len(v) > 200:
+            raise ValueError("Group name must be 1-200 characters")
+        return v
+
+    @field_validator("user_ids")
+    @classmethod
+    def validate_user_ids(cls, v: list[int]) -> list[int]:
+        if len(v) != len(set(v)):
+            raise ValueError("Duplicate user IDs not allowed")
+        return v
+
+
+class GroupMemberRequest(BaseModel):
+    """Request for POST /api/oracle/groups/{group_id}/members."""
+
+    user_id: int
+
+
+class GroupPairResult(BaseModel):
+    """One pair from the stored group matrix."""
+
+    user_a_id: int
+    user_b_id: int
+    overall_score: float
+    life_path_score: float
+    element_score: float
+    animal_score: float
+    moon_score: float
+    pattern_score: float
+    description: str = ""
+    strengths: list[str] = []
+    challenges: list[str] = []
+
+
+class GroupAnalysisResponse(BaseModel):
+    """Current analysis of a persistent group, read from its stored state."""
+
+    id: int
+    name: str
+    reading_moment: str
+    numerology_system: str
+    members: list[int] = []
+    member_count: int = 0
+    pair_count: int = 0
+    group_harmony_score: float = 0.0
+    group_element_balance: dict[str, int] = {}
+    group_summary: str = ""
+    strongest_pairs: list[GroupPairResult] = []
+    challenging_pairs: list[GroupPairResult] = []
+    computation_ms: float = 0.0
+    created_at: str = ""
+    updated_at: str = ""
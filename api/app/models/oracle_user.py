@@ -82,3 +82,25 @@ class OracleUserListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+class CompatibleProfile(BaseModel):
+    user_id: int
+    name: str
+    overall_score: float
+    life_path_score: float
+    element_score: float
+    animal_score: float
+    moon_score: float
+    pattern_score: float
+    description: str
+    strengths: list[str] = []
+    challenges: list[str] = []
+
+
+class CompatibleProfilesResponse(BaseModel):
+    user_id: int
+    matches: list[CompatibleProfile]
+    indexed: bool = True  # False until the profile has a feature row
+    indexed_profiles: int
+    computation_ms: float
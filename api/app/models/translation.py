@@ -48,6 +48,11 @@ class CacheStatsResponse(BaseModel):
     hit_count: int
     miss_count: int
     ttl_seconds: int
+    eviction_count: int = 0
+    expired_count: int = 0
+    shared_tier: str | None = None
+    shared_hit_count: int = 0
+    shared_error_count: int = 0
 
 
 class ReadingTranslationRequest(BaseModel):
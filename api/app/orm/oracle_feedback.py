@@ -32,7 +32,9 @@ class OracleReadingFeedback(Base):
     section_feedback: Mapped[dict | None] = mapped_column(PlatformJSONB, server_default="{}")
     text_feedback: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), onupdate=func.now(), nullable=False
+    )
 
     __table_args__ = (UniqueConstraint("reading_id", "user_id", name="oracle_feedback_unique"),)
 
@@ -0,0 +1,73 @@
+"""SQLAlchemy ORM models for oracle_groups and their member / pair-score rows."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.orm import PlatformJSONB
+
+
+class OracleGroup(Base):
+    __tablename__ = "oracle_groups"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    created_by: Mapped[str | None] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="SET NULL"), index=True
+    )
+    # Every member is read at this moment, so joins match a full recompute
+    reading_moment: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    numerology_system: Mapped[str] = mapped_column(String(20), nullable=False, default="auto")
+    # Running totals, updated in O(1) per join/leave
+    member_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    element_counts: Mapped[dict] = mapped_column(PlatformJSONB, nullable=False, default=dict)
+    harmony_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class OracleGroupMember(Base):
+    __tablename__ = "oracle_group_members"
+
+    # Join order
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    group_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("oracle_groups.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # oracle_service.compatibility_matrix.compact_comparison()
+    comparison: Mapped[dict] = mapped_column(PlatformJSONB, nullable=False)
+
+    __table_args__ = (UniqueConstraint("group_id", "user_id", name="uq_oracle_group_member"),)
+
+
+class OracleGroupPair(Base):
+    """One pair score in basis points; ``member_a`` joined before ``member_b``."""
+
+    __tablename__ = "oracle_group_pairs"
+
+    group_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("oracle_groups.id", ondelete="CASCADE"), primary_key=True
+    )
+    member_a: Mapped[int] = mapped_column(Integer, primary_key=True)
+    member_b: Mapped[int] = mapped_column(Integer, primary_key=True)
+    score: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (Index("idx_oracle_group_pairs_member_b", "group_id", "member_b"),)
@@ -0,0 +1,30 @@
+"""SQLAlchemy ORM model for the oracle_user_features table (profile compatibility index)."""
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.orm import PlatformJSONB
+
+
+class OracleUserFeature(Base):
+    __tablename__ = "oracle_user_features"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("oracle_users.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Copied from oracle_users.created_by for ownership filtering in the index
+    created_by: Mapped[str | None] = mapped_column(String(36))
+    # oracle_service.profile_index.natal_comparison()
+    features: Mapped[dict] = mapped_column(PlatformJSONB, nullable=False, default=dict)
+    # Soft-deleted profiles stay as tombstones so every API process drops them
+    deleted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        index=True,
+    )
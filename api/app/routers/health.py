@@ -8,14 +8,23 @@ import time
 from datetime import date, datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import Date, Float, cast, extract, func
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db, get_engine, is_database_ready
 from app.middleware.auth import require_scope
 from app.orm.audit_log import OracleAuditLog
 from app.orm.oracle_reading import OracleReading
+from app.services.admission import admission_stats
 from app.services.audit import AuditService, get_audit_service
+from app.services.request_metrics import (
+    current_snapshot,
+    get_request_metrics,
+    performance_summary,
+    render_prometheus,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -136,17 +145,41 @@ async def readiness_check(request: Request):
     }
 
 
+async def _metrics_snapshot(request: Request) -> dict:
+    """Request metrics for this worker, or all workers when aggregating via Redis."""
+    return await current_snapshot(
+        getattr(request.app.state, "redis", None),
+        get_request_metrics(),
+        settings.metrics_aggregation,
+        settings.metrics_push_interval,
+    )
+
+
 @router.get("/performance")
-async def performance_stats():
-    """Performance metrics (wraps legacy PerfMonitor pattern)."""
+async def performance_stats(request: Request):
+    """Performance metrics — uptime, request totals, recent RPM and latency percentiles."""
+    try:
+        from oracle_service.work_scheduler import get_work_scheduler
+
+        scheduler = get_work_scheduler().stats()
+    except ImportError:
+        scheduler = None
     return {
-        "uptime_seconds": 0,
-        "requests_total": 0,
-        "requests_per_minute": 0,
-        "p95_response_ms": 0,
+        **performance_summary(await _metrics_snapshot(request)),
+        "scheduler": scheduler,
+        "admission": admission_stats(),
     }
 
 
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics(request: Request):
+    """Request counters, latency histograms and in-flight gauge in Prometheus text format."""
+    return PlainTextResponse(
+        render_prometheus(await _metrics_snapshot(request)),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 # ─── Admin-only monitoring endpoints ─────────────────────────────────────────
 
 
@@ -27,6 +27,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+
+def _learner():
+    """The oracle learner engine (documented exception: imported by this router)."""
+    from services.oracle.oracle_service.engines import learner
+
+    return learner
+
+
 # ─── Level thresholds based on feedback count ────────────────────────────────
 
 _LEVELS = [
@@ -369,6 +377,7 @@ async def submit_feedback(
         existing.text_feedback = body.text_feedback
         db.commit()
         db.refresh(existing)
+        _learner().invalidate_prompt_cache()
         return FeedbackResponse(
             id=existing.id,
             reading_id=reading_id,
@@ -389,6 +398,7 @@ async def submit_feedback(
     db.add(feedback)
     db.commit()
     db.refresh(feedback)
+    _learner().invalidate_prompt_cache()
 
     return FeedbackResponse(
         id=feedback.id,
@@ -462,25 +472,11 @@ async def get_oracle_learning_stats(db: Session = Depends(get_db)):
     )
     avg_by_reading_type = {t: round(float(a), 2) for t, a in type_rows}
 
-    # Section helpful percentages (JSONB column, handle legacy string data)
-    all_feedback = db.query(OracleReadingFeedback.section_feedback).all()
-    section_totals: dict[str, int] = {}
-    section_helpful: dict[str, int] = {}
-    for (sf_text,) in all_feedback:
-        if not sf_text:
-            continue
-        try:
-            sf = json.loads(sf_text) if isinstance(sf_text, str) else sf_text
-        except (json.JSONDecodeError, TypeError):
-            continue
-        for section, value in sf.items():
-            section_totals[section] = section_totals.get(section, 0) + 1
-            if value == "helpful":
-                section_helpful[section] = section_helpful.get(section, 0) + 1
-
-    section_helpful_pct = {}
-    for section, total_count in section_totals.items():
-        section_helpful_pct[section] = round(section_helpful.get(section, 0) / total_count, 2)
+    # Section helpful percentages (aggregated in SQL over the JSONB column)
+    section_helpful_pct = {
+        section: round(helpful / total_count, 2)
+        for section, (total_count, helpful) in _learner().section_helpful_counts(db).items()
+    }
 
     # Active prompt adjustments from learning data
     adjustments: list[str] = []
@@ -513,16 +509,23 @@ async def get_oracle_learning_stats(db: Session = Depends(get_db)):
     response_model=OracleLearningStatsResponse,
     dependencies=[Depends(require_scope("oracle:admin"))],
 )
-async def recalculate_learning(db: Session = Depends(get_db)):
-    """Trigger learning recalculation."""
-    from services.oracle.oracle_service.engines.learner import (
-        generate_prompt_emphasis,
-        recalculate_learning_metrics,
-    )
+async def recalculate_learning(incremental: bool = False, db: Session = Depends(get_db)):
+    """Trigger learning recalculation.
 
-    recalculate_learning_metrics(db)
-    generate_prompt_emphasis(db)
-    db.commit()
+    ``incremental=true`` folds in only feedback newer than the last
+    recalculation (falling back to a full pass if older feedback changed).
+    """
+    learner = _learner()
+
+    from oracle_service.work_scheduler import BATCH, run_framework
+
+    def _recalculate() -> None:
+        learner.recalculate_learning_metrics(db, incremental=incremental)
+        learner.generate_prompt_emphasis(db)
+        db.commit()
+
+    # Bulk aggregation — queue it as batch work so it can't crowd out readings
+    await run_framework(_recalculate, BATCH)
 
     # Return updated stats
     return await get_oracle_learning_stats(db)
@@ -12,6 +12,10 @@ from app.models.location import (
     CountryListResponse,
     CountryResponse,
     LocationDetectResponse,
+    NearestCityBatchRequest,
+    NearestCityBatchResponse,
+    NearestCityListResponse,
+    NearestCityResponse,
     TimezoneResponse,
 )
 from app.services.location_service import LocationService
@@ -81,6 +85,47 @@ def get_timezone_endpoint(
     return TimezoneResponse(**result)
 
 
+@router.get(
+    "/nearest",
+    response_model=NearestCityListResponse,
+    dependencies=[Depends(require_scope("oracle:read"))],
+)
+def nearest_city(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    k: int = Query(1, ge=1, le=50),
+    lang: str = Query("en", pattern=r"^(en|fa)$"),
+):
+    """Reverse-geocode coordinates to the nearest known cities (offline)."""
+    cities = _svc.nearest_city(lat, lon, k=k, lang=lang)
+    return NearestCityListResponse(
+        cities=[NearestCityResponse(**c) for c in cities],
+        total=len(cities),
+    )
+
+
+@router.post(
+    "/nearest/batch",
+    response_model=NearestCityBatchResponse,
+    dependencies=[Depends(require_scope("oracle:read"))],
+)
+def nearest_city_batch(body: NearestCityBatchRequest):
+    """Batch reverse-geocode an array of coordinates (offline)."""
+    batches = _svc.nearest_cities(
+        [(p.latitude, p.longitude) for p in body.coordinates], k=body.k, lang=body.lang
+    )
+    return NearestCityBatchResponse(
+        results=[
+            NearestCityListResponse(
+                cities=[NearestCityResponse(**c) for c in cities],
+                total=len(cities),
+            )
+            for cities in batches
+        ],
+        total=len(batches),
+    )
+
+
 # ─── Geocoding endpoints (existing) ─────────────────────────────────────────
 
 
@@ -26,6 +26,9 @@ from app.models.oracle import (
     DailyReadingCacheResponse,
     DailyReadingRequest,
     FrameworkReadingResponse,
+    GroupAnalysisResponse,
+    GroupCreateRequest,
+    GroupMemberRequest,
     MultiUserFrameworkRequest,
     MultiUserFrameworkResponse,
     MultiUserReadingRequest,
@@ -44,8 +47,10 @@ from app.models.oracle import (
     StoredReadingListResponse,
     StoredReadingResponse,
     TimeReadingRequest,
+    TimingPlanResponse,
 )
 from app.models.oracle_user import (
+    CompatibleProfilesResponse,
     OracleUserCreate,
     OracleUserListResponse,
     OracleUserResponse,
@@ -53,11 +58,15 @@ from app.models.oracle_user import (
 )
 from app.orm.oracle_user import OracleUser
 from app.services.audit import AuditService, get_audit_service
+from app.services.oracle_groups import OracleGroupService, get_oracle_group_service
 from app.services.oracle_reading import (
     OracleReadingService,
     get_oracle_reading_service,
 )
+from app.services.profile_index import compatible_profiles, sync_profile
 from app.services.security import EncryptionService, get_encryption_service
+from app.services.admission import Ticket, admission
+from app.services.ai_jobs import ai_job_queue
 from app.services.websocket_manager import ws_manager
 
 logger = logging.getLogger(__name__)
@@ -197,16 +206,19 @@ async def create_question_sign(
     body: QuestionReadingRequest,
     request: Request,
     _user: dict = Depends(get_current_user),
+    ticket: Ticket = Depends(admission("question")),
     svc: OracleReadingService = Depends(get_oracle_reading_service),
     audit: AuditService = Depends(get_audit_service),
 ):
     """Question reading with numerological hashing and framework analysis."""
     import asyncio
 
+    from oracle_service.work_scheduler import run_ai, run_framework
+
+    run = run_ai if body.include_ai else run_framework
     try:
         result = await asyncio.wait_for(
-            asyncio.get_running_loop().run_in_executor(
-                None,
+            run(
                 lambda: svc.get_question_reading_v2(
                     question=body.question,
                     user_id=body.user_id,
@@ -215,6 +227,7 @@ async def create_question_sign(
                     category=body.category,
                     question_time=body.question_time,
                     inquiry_context=body.inquiry_context,
+                    degraded=ticket.degraded,
                 ),
             ),
             timeout=45.0,
@@ -243,6 +256,7 @@ async def create_question_sign(
     )
     svc.db.commit()
     result["reading_id"] = reading.id
+    result["degraded"] = ticket.degraded
     return QuestionReadingResponse(**result)
 
 
@@ -255,22 +269,26 @@ async def create_name_reading(
     body: NameReadingRequest,
     request: Request,
     _user: dict = Depends(get_current_user),
+    ticket: Ticket = Depends(admission("name")),
     svc: OracleReadingService = Depends(get_oracle_reading_service),
     audit: AuditService = Depends(get_audit_service),
 ):
     """Name reading with framework numerology analysis."""
     import asyncio
 
+    from oracle_service.work_scheduler import run_ai, run_framework
+
+    run = run_ai if body.include_ai else run_framework
     try:
         result = await asyncio.wait_for(
-            asyncio.get_running_loop().run_in_executor(
-                None,
+            run(
                 lambda: svc.get_name_reading_v2(
                     name=body.name,
                     user_id=body.user_id,
                     numerology_system=body.numerology_system,
                     include_ai=body.include_ai,
                     inquiry_context=body.inquiry_context,
+                    degraded=ticket.degraded,
                 ),
             ),
             timeout=45.0,
@@ -299,6 +317,7 @@ async def create_name_reading(
     )
     svc.db.commit()
     result["reading_id"] = reading.id
+    result["degraded"] = ticket.degraded
     return NameReadingResponse(**result)
 
 
@@ -316,6 +335,23 @@ def get_daily_insight(
     return DailyInsightResponse(**result)
 
 
+@router.get(
+    "/timing/plan",
+    response_model=TimingPlanResponse,
+    dependencies=[Depends(require_scope("oracle:read"))],
+)
+def get_timing_plan(
+    start: str | None = None,
+    days: int = Query(90, ge=1, le=366),
+    window_hours: int = Query(1, ge=1, le=24),
+    top_k: int = Query(10, ge=1, le=100),
+    svc: OracleReadingService = Depends(get_oracle_reading_service),
+):
+    """Hourly timing heatmap and best windows over a date range (calendar view)."""
+    result = svc.get_timing_plan(start, days, window_hours, top_k)
+    return TimingPlanResponse(**result)
+
+
 @router.post(
     "/suggest-range",
     response_model=RangeResponse,
@@ -436,6 +472,7 @@ def create_multi_user_reading(
 async def create_framework_reading(
     request: Request,
     _user: dict = Depends(get_current_user),
+    ticket: Ticket = Depends(admission("reading")),
     svc: OracleReadingService = Depends(get_oracle_reading_service),
     audit: AuditService = Depends(get_audit_service),
 ):
@@ -512,7 +549,7 @@ async def create_framework_reading(
                     date_str=body.date,
                     locale=body.locale,
                     numerology_system=body.numerology_system,
-                    include_interpretation=body.include_interpretation,
+                    include_interpretation=body.include_interpretation and not ticket.degraded,
                     progress_callback=progress_callback,
                 ),
                 timeout=_READING_TIMEOUT,
@@ -530,6 +567,26 @@ async def create_framework_reading(
             # Session 14 time reading (default)
             body = TimeReadingRequest(**body_raw)
 
+            section_callback = None
+            if body.stream_sections and _user.get("user_id"):
+
+                async def section_callback(key: str, text: str, index: int):
+                    from oracle_service.engines.ai_interpreter import SECTIONS_RESET
+
+                    if key == SECTIONS_RESET:
+                        # AI failed mid-stream; the fallback follows
+                        await ws_manager.send_to_user(
+                            _user["user_id"],
+                            "reading_sections_reset",
+                            {"index": index, "user_id": body.user_id},
+                        )
+                        return
+                    await ws_manager.send_to_user(
+                        _user["user_id"],
+                        "reading_section",
+                        {"section": key, "text": text, "index": index, "user_id": body.user_id},
+                    )
+
             result = await asyncio.wait_for(
                 svc.create_framework_reading(
                     user_id=body.user_id,
@@ -540,6 +597,10 @@ async def create_framework_reading(
                     numerology_system=body.numerology_system,
                     progress_callback=progress_callback,
                     inquiry_context=body.inquiry_context,
+                    section_callback=section_callback,
+                    defer_ai=body.defer_ai,
+                    notify_user_id=_user.get("user_id"),
+                    degraded=ticket.degraded,
                 ),
                 timeout=_READING_TIMEOUT,
             )
@@ -550,6 +611,9 @@ async def create_framework_reading(
                 key_hash=_user.get("api_key_hash"),
             )
             svc.db.commit()
+            if body.defer_ai:
+                ai_job_queue.notify()
+            result["degraded"] = ticket.degraded and not body.defer_ai
             return FrameworkReadingResponse(**result)
 
     except asyncio.TimeoutError:
@@ -682,6 +746,155 @@ def get_dashboard_stats(
     return DashboardStatsResponse(**stats)
 
 
+# ─── Persistent Group Endpoints ──────────────────────────────────────────────
+
+
+def _group_owner(_user: dict) -> str | None:
+    """Ownership filter: admin/moderator see every group and profile."""
+    return None if _user["role"] in ("admin", "moderator") else _user["user_id"]
+
+
+def _get_group_or_404(svc: OracleGroupService, group_id: int, _user: dict):
+    group = svc.get_group(group_id, owner=_group_owner(_user))
+    if not group:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
+    return group
+
+
+@router.post(
+    "/groups",
+    response_model=GroupAnalysisResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_scope("oracle:write"))],
+)
+async def create_group(
+    body: GroupCreateRequest,
+    request: Request,
+    _user: dict = Depends(get_current_user),
+    svc: OracleGroupService = Depends(get_oracle_group_service),
+    audit: AuditService = Depends(get_audit_service),
+):
+    """Create a persistent group; every member is read at one fixed moment."""
+    try:
+        group = await svc.create_group(
+            name=body.name,
+            user_ids=body.user_ids,
+            date_str=body.date,
+            numerology_system=body.numerology_system,
+            owner=_group_owner(_user),
+            created_by=_user.get("user_id"),
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    audit.log_group_changed(
+        group.id, "create", ip=_get_client_ip(request), key_hash=_user.get("api_key_hash")
+    )
+    svc.db.commit()
+    return GroupAnalysisResponse(**svc.analysis(group))
+
+
+@router.get(
+    "/groups/{group_id}",
+    response_model=GroupAnalysisResponse,
+    dependencies=[Depends(require_scope("oracle:read"))],
+)
+def get_group_analysis(
+    group_id: int,
+    top_k: int = Query(5, ge=0, le=50),
+    _user: dict = Depends(get_current_user),
+    svc: OracleGroupService = Depends(get_oracle_group_service),
+):
+    """Current group analysis from the stored state (no recomputation)."""
+    group = _get_group_or_404(svc, group_id, _user)
+    return GroupAnalysisResponse(**svc.analysis(group, top_k))
+
+
+@router.post(
+    "/groups/{group_id}/members",
+    response_model=GroupAnalysisResponse,
+    dependencies=[Depends(require_scope("oracle:write"))],
+)
+async def add_group_member(
+    group_id: int,
+    body: GroupMemberRequest,
+    request: Request,
+    _user: dict = Depends(get_current_user),
+    svc: OracleGroupService = Depends(get_oracle_group_service),
+    audit: AuditService = Depends(get_audit_service),
+):
+    """Add a member — one framework reading plus O(N) pair scores."""
+    group = _get_group_or_404(svc, group_id, _user)
+    try:
+        group = await svc.add_member(group, body.user_id, owner=_group_owner(_user))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    audit.log_group_changed(
+        group.id,
+        "member_add",
+        member_id=body.user_id,
+        ip=_get_client_ip(request),
+        key_hash=_user.get("api_key_hash"),
+    )
+    svc.db.commit()
+    return GroupAnalysisResponse(**svc.analysis(group))
+
+
+@router.delete(
+    "/groups/{group_id}/members/{user_id}",
+    response_model=GroupAnalysisResponse,
+    dependencies=[Depends(require_scope("oracle:write"))],
+)
+def remove_group_member(
+    group_id: int,
+    user_id: int,
+    request: Request,
+    _user: dict = Depends(get_current_user),
+    svc: OracleGroupService = Depends(get_oracle_group_service),
+    audit: AuditService = Depends(get_audit_service),
+):
+    """Remove a member — subtracts its row from the running totals."""
+    group = _get_group_or_404(svc, group_id, _user)
+    try:
+        group = svc.remove_member(group, user_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    audit.log_group_changed(
+        group.id,
+        "member_remove",
+        member_id=user_id,
+        ip=_get_client_ip(request),
+        key_hash=_user.get("api_key_hash"),
+    )
+    svc.db.commit()
+    return GroupAnalysisResponse(**svc.analysis(group))
+
+
+@router.delete(
+    "/groups/{group_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_scope("oracle:write"))],
+)
+def delete_group(
+    group_id: int,
+    request: Request,
+    _user: dict = Depends(get_current_user),
+    svc: OracleGroupService = Depends(get_oracle_group_service),
+    audit: AuditService = Depends(get_audit_service),
+):
+    """Delete a persistent group."""
+    group = _get_group_or_404(svc, group_id, _user)
+    audit.log_group_changed(
+        group.id, "delete", ip=_get_client_ip(request), key_hash=_user.get("api_key_hash")
+    )
+    svc.delete_group(group)
+    svc.db.commit()
+    return StarletteResponse(status_code=status.HTTP_204_NO_CONTENT)
+
+
 # ─── Reading History Endpoints ───────────────────────────────────────────────
 
 
@@ -898,6 +1111,7 @@ def create_user(
 
     # Set coordinates if provided
     _set_coordinates(db, user.id, body.latitude, body.longitude)
+    sync_profile(db, user, enc)
 
     audit.log_user_created(
         user.id,
@@ -989,6 +1203,33 @@ def get_user(
     return _decrypt_user(user, enc, db)
 
 
+@router.get(
+    "/users/{user_id}/compatible",
+    response_model=CompatibleProfilesResponse,
+    dependencies=[Depends(require_scope("oracle:read"))],
+)
+def get_compatible_users(
+    user_id: int,
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    _user: dict = Depends(get_current_user),
+):
+    """Profiles most compatible with this one (natal features, top-k search).
+
+    Non-admin/moderator callers only search among their own profiles.
+    """
+    user = (
+        db.query(OracleUser)
+        .filter(OracleUser.id == user_id, OracleUser.deleted_at.is_(None))
+        .first()
+    )
+    owner = _group_owner(_user)
+    if not user or (owner is not None and user.created_by != owner):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    return CompatibleProfilesResponse(**compatible_profiles(db, user, limit, owner))
+
+
 @router.put(
     "/users/{user_id}",
     response_model=OracleUserResponse,
@@ -1052,6 +1293,7 @@ def update_user(
         if enc and field in ("mother_name", "mother_name_persian") and value:
             value = enc.encrypt(value)
         setattr(user, field, value)
+    sync_profile(db, user, enc)
 
     audit.log_user_updated(
         user.id,
@@ -1088,6 +1330,7 @@ def delete_user(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     user.deleted_at = datetime.now(timezone.utc)
+    sync_profile(db, user, enc)
     audit.log_user_deleted(
         user.id,
         ip=_get_client_ip(request),
@@ -0,0 +1,262 @@
+"""Admission control — CoDel-style load shedding for reading endpoints.
+
+Each guarded route gets an AdmissionController with a fixed number of
+in-flight slots and a bounded wait queue. Instead of letting overload show up
+as 30-second timeouts, the controller decides up front:
+
+1. **Full** — a slot is free (or frees up within the wait budget): run the
+   normal pipeline including AI interpretation.
+2. **Degraded** — the queue is standing or full: skip the AI step and return
+   the framework fallback text (``_build_fallback``). Degraded requests use a
+   separate, cheap slot budget so they do not queue behind AI work.
+3. **Rejected** — degraded capacity is exhausted too: fail fast with 503 and
+   a ``Retry-After`` estimated from queue depth and recent latency.
+
+The wait budget follows CoDel's adaptive-timeout variant: while the queue has
+drained at least once within the last ``interval_ms`` a request may wait up
+to ``interval_ms`` for a slot; once the queue has been standing for a whole
+interval (overload) the budget drops to ``target_ms``, and if recent full
+latency is also above ``degrade_latency_ms`` requests degrade immediately.
+
+Configuration (app.config.Settings): ``admission_*`` defaults plus per-route
+overrides in ``admission_route_overrides`` (JSON), e.g.
+``{"question": {"max_concurrency": 4}, "name": {"enabled": false}}``.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from fastapi import HTTPException, status
+
+logger = logging.getLogger(__name__)
+
+_LATENCY_ALPHA = 0.2  # EWMA weight of the newest full-request latency
+_MAX_RETRY_AFTER = 60
+
+
+@dataclass
+class Ticket:
+    """Admission decision handed to the endpoint."""
+
+    degraded: bool = False
+
+
+class AdmissionController:
+    """In-flight limit + CoDel-style queue with degrade-then-reject shedding."""
+
+    def __init__(
+        self,
+        name: str,
+        enabled: bool = True,
+        max_concurrency: int = 16,
+        max_queue: int = 64,
+        target_ms: float = 100.0,
+        interval_ms: float = 1000.0,
+        degrade_latency_ms: float = 10000.0,
+        degrade_concurrency: int | None = None,
+    ) -> None:
+        self.name = name
+        self.enabled = enabled
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.target_ms = target_ms
+        self.interval_ms = interval_ms
+        self.degrade_latency_ms = degrade_latency_ms
+        self.degrade_concurrency = max(
+            0, self.max_concurrency if degrade_concurrency is None else degrade_concurrency
+        )
+        self._in_flight = 0
+        self._degraded_in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_empty = time.monotonic()
+        self._latency_ms = 0.0
+        self.stats_counters = {"admitted": 0, "degraded": 0, "rejected": 0}
+
+    # ── Public API ──
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[Ticket]:
+        """Hold a slot for the request body; raises 503 when shedding."""
+        if not self.enabled:
+            yield Ticket()
+            return
+
+        if await self._acquire_full():
+            self.stats_counters["admitted"] += 1
+            start = time.monotonic()
+            try:
+                yield Ticket()
+            finally:
+                self._release_full((time.monotonic() - start) * 1000)
+            return
+
+        if self._degraded_in_flight >= self.degrade_concurrency:
+            self.stats_counters["rejected"] += 1
+            retry_after = self.retry_after()
+            logger.warning(
+                "Admission %s: rejecting (in_flight=%d, queued=%d, latency=%.0fms)",
+                self.name,
+                self._in_flight,
+                len(self._waiters),
+                self._latency_ms,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy — please retry shortly",
+                headers={"Retry-After": str(retry_after)},
+            )
+
+        self.stats_counters["degraded"] += 1
+        self._degraded_in_flight += 1
+        try:
+            yield Ticket(degraded=True)
+        finally:
+            self._degraded_in_flight -= 1
+
+    def overloaded(self, now: float | None = None) -> bool:
+        """CoDel: the queue has not drained for a whole interval."""
+        if not self._waiters:
+            return False
+        now = time.monotonic() if now is None else now
+        return (now - self._last_empty) * 1000 > self.interval_ms
+
+    def retry_after(self) -> int:
+        """Seconds until the current queue should have drained."""
+        latency_s = max(self._latency_ms, self.target_ms) / 1000
+        backlog = len(self._waiters) + self._in_flight + 1
+        seconds = math.ceil(backlog * latency_s / self.max_concurrency)
+        return max(1, min(_MAX_RETRY_AFTER, seconds))
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "in_flight": self._in_flight,
+            "degraded_in_flight": self._degraded_in_flight,
+            "queued": len(self._waiters),
+            "overloaded": self.overloaded(),
+            "latency_ms_ewma": round(self._latency_ms, 1),
+            **self.stats_counters,
+        }
+
+    # ── Slots ──
+
+    async def _acquire_full(self) -> bool:
+        """Take a full slot, waiting within the CoDel budget. False → shed."""
+        now = time.monotonic()
+        if self._in_flight < self.max_concurrency and not self._waiters:
+            self._in_flight += 1
+            self._last_empty = now
+            return True
+
+        if len(self._waiters) >= self.max_queue:
+            return False
+        if self.overloaded(now):
+            if self._latency_ms > self.degrade_latency_ms:
+                return False
+            budget_ms = self.target_ms
+        else:
+            budget_ms = self.interval_ms
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=budget_ms / 1000)
+        except asyncio.TimeoutError:
+            if waiter.done():  # slot was handed over as the timer fired
+                return True
+            waiter.cancel()
+            self._remove_waiter(waiter)
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release_full(None)
+            else:
+                waiter.cancel()
+                self._remove_waiter(waiter)
+            raise
+        return True
+
+    def _release_full(self, latency_ms: float | None) -> None:
+        if latency_ms is not None:
+            if self._latency_ms:
+                self._latency_ms += _LATENCY_ALPHA * (latency_ms - self._latency_ms)
+            else:
+                self._latency_ms = latency_ms
+        # Hand the slot straight to the oldest live waiter (in_flight unchanged)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                if not self._waiters:
+                    self._last_empty = time.monotonic()
+                return
+        self._in_flight -= 1
+        self._last_empty = time.monotonic()
+
+    def _remove_waiter(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        if not self._waiters:
+            self._last_empty = time.monotonic()
+
+
+# ─── Per-route registry ──────────────────────────────────────────────────────
+
+_controllers: dict[str, AdmissionController] = {}
+
+
+def _route_config(route: str) -> dict:
+    from app.config import settings
+
+    config = {
+        "enabled": settings.admission_enabled,
+        "max_concurrency": settings.admission_max_concurrency,
+        "max_queue": settings.admission_max_queue,
+        "target_ms": settings.admission_target_ms,
+        "interval_ms": settings.admission_interval_ms,
+        "degrade_latency_ms": settings.admission_degrade_latency_ms,
+        "degrade_concurrency": settings.admission_degrade_concurrency or None,
+    }
+    overrides = settings.admission_overrides.get(route, {})
+    config.update({k: v for k, v in overrides.items() if k in config})
+    return config
+
+
+def get_admission_controller(route: str) -> AdmissionController:
+    """Controller for a guarded route ("reading", "question", "name")."""
+    controller = _controllers.get(route)
+    if controller is None:
+        controller = AdmissionController(route, **_route_config(route))
+        _controllers[route] = controller
+    return controller
+
+
+def admission_stats() -> dict:
+    return {route: c.stats() for route, c in _controllers.items()}
+
+
+def reset_admission_controllers() -> None:
+    """Drop all controllers so the next request re-reads settings (tests)."""
+    _controllers.clear()
+
+
+def admission(route: str):
+    """FastAPI dependency factory: hold ``route``'s admission slot per request.
+
+    Usage: ``ticket: Ticket = Depends(admission("question"))`` — declare it
+    after the auth dependency so unauthenticated requests never take a slot.
+    """
+
+    async def _admit() -> AsyncIterator[Ticket]:
+        async with get_admission_controller(route).admit() as ticket:
+            yield ticket
+
+    return _admit
@@ -0,0 +1,323 @@
+"""AI Job Queue — deferred AI enrichment for two-phase readings.
+
+A reading created with ``defer_ai=true`` is stored with its framework
+result straight away and an ``oracle_ai_jobs`` row is inserted in the same
+transaction. This worker (a background asyncio task started in the app
+lifespan, like DailyScheduler) picks up runnable jobs, generates the AI
+interpretation, writes it onto the reading, and pushes a
+``reading_ai_ready`` WebSocket event to the requesting user. Clients that
+are not connected poll ``GET /api/oracle/readings/{id}`` for ``ai_status``.
+
+Job lifecycle:
+    pending → running → done
+    running → pending (attempt failed, retried after exponential backoff)
+    running → dead    (max_attempts reached — dead letter; the framework
+                       fallback text is stored so the reading is usable)
+
+Jobs are claimed with a conditional UPDATE (``WHERE status='pending'``), so
+several API workers can share one table without double-processing. Jobs
+left ``running`` by a crashed worker are released after a lease timeout.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.orm.oracle_ai_job import OracleAIJob
+from app.orm.oracle_reading import OracleReading
+
+logger = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 2.0  # seconds between idle polls (enqueue wakes the worker early)
+_LEASE_SECONDS = 300  # a running job older than this is considered abandoned
+_MAX_BACKOFF_SECONDS = 300
+
+# ai_status reported to clients, by job status
+AI_STATUS_BY_JOB = {
+    "pending": "pending",
+    "running": "pending",
+    "done": "complete",
+    "dead": "failed",
+}
+
+
+class AIEnrichmentError(Exception):
+    """AI interpretation failed; ``fallback`` holds framework fallback sections."""
+
+    def __init__(self, message: str, fallback: dict | None = None):
+        super().__init__(message)
+        self.fallback = fallback
+
+
+InterpretFn = Callable[[dict, dict], Awaitable[dict]]
+
+
+async def _interpret_with_engine(framework_output: dict, payload: dict) -> dict:
+    """Default interpreter: Oracle ai_interpreter on the scheduled AI pool.
+
+    Raises AIEnrichmentError when the model was available but the call
+    failed (the interpreter returned its fallback), so the job is retried.
+    When no AI is configured at all the fallback is the final answer.
+    """
+    from oracle_service.engines.ai_client import is_available
+    from oracle_service.engines.ai_interpreter import interpret_reading
+    from oracle_service.work_scheduler import run_ai
+
+    result = await run_ai(
+        lambda: interpret_reading(
+            framework_output,
+            reading_type=payload.get("reading_type", "time"),
+            locale=payload.get("locale", "en"),
+            inquiry_context=payload.get("inquiry_context"),
+        ),
+    )
+    sections = result.to_dict()
+    if not sections.get("ai_generated") and is_available():
+        raise AIEnrichmentError("AI interpretation failed; fallback returned", sections)
+    return sections
+
+
+def enqueue_ai_job(db: Session, reading_id: int, payload: dict, max_attempts: int) -> OracleAIJob:
+    """Insert a pending job in the caller's transaction (caller commits)."""
+    job = OracleAIJob(
+        reading_id=reading_id,
+        status="pending",
+        payload=payload,
+        attempts=0,
+        max_attempts=max_attempts,
+        available_at=datetime.now(timezone.utc),
+    )
+    db.add(job)
+    db.flush()
+    return job
+
+
+def get_ai_status(db: Session, reading_id: int) -> str | None:
+    """Client-facing ai_status for a reading, or None if it was not deferred."""
+    job = (
+        db.query(OracleAIJob)
+        .filter(OracleAIJob.reading_id == reading_id)
+        .order_by(OracleAIJob.id.desc())
+        .first()
+    )
+    return AI_STATUS_BY_JOB.get(job.status) if job else None
+
+
+class AIJobQueue:
+    """Background worker that drains the oracle_ai_jobs table."""
+
+    def __init__(
+        self,
+        interpret: InterpretFn | None = None,
+        concurrency: int = 2,
+        retry_base_seconds: float = 5.0,
+        poll_interval: float = _POLL_INTERVAL,
+    ) -> None:
+        self.interpret = interpret or _interpret_with_engine
+        self.concurrency = max(1, concurrency)
+        self.retry_base_seconds = retry_base_seconds
+        self.poll_interval = poll_interval
+        self.db_session_factory = None
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self.stats = {"completed": 0, "retried": 0, "dead_lettered": 0}
+
+    # ── Lifecycle ──
+
+    async def start(self, db_session_factory) -> None:
+        """Start the worker background task."""
+        self.db_session_factory = db_session_factory
+        self._wake = asyncio.Event()
+        self._running = True
+        self._task = asyncio.create_task(self._worker_loop())
+        logger.info("AI job worker started (concurrency=%d)", self.concurrency)
+
+    async def stop(self) -> None:
+        """Stop the worker."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("AI job worker stopped")
+
+    def notify(self) -> None:
+        """Wake the worker after enqueueing (call once the insert is committed)."""
+        self._wake.set()
+
+    async def _worker_loop(self) -> None:
+        while self._running:
+            try:
+                processed = await self.run_pending()
+                if processed:
+                    continue
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("AI job worker error — retrying in %.0fs", self.poll_interval)
+                await asyncio.sleep(self.poll_interval)
+
+    # ── Processing ──
+
+    async def run_pending(self, limit: int | None = None) -> int:
+        """Claim and process up to ``limit`` runnable jobs. Returns jobs processed."""
+        limit = limit or self.concurrency
+        db = self.db_session_factory()
+        try:
+            self._release_stale(db)
+            now = datetime.now(timezone.utc)
+            candidates = (
+                db.query(OracleAIJob.id)
+                .filter(OracleAIJob.status == "pending", OracleAIJob.available_at <= now)
+                .order_by(OracleAIJob.available_at, OracleAIJob.id)
+                .limit(limit)
+                .all()
+            )
+            claimed = [job_id for (job_id,) in candidates if self._claim(db, job_id, now)]
+            db.commit()
+        finally:
+            db.close()
+
+        if claimed:
+            await asyncio.gather(*(self._process(job_id) for job_id in claimed))
+        return len(claimed)
+
+    @staticmethod
+    def _claim(db: Session, job_id: int, now: datetime) -> bool:
+        """Atomically move one job pending → running. False if another worker won."""
+        result = db.execute(
+            update(OracleAIJob)
+            .where(OracleAIJob.id == job_id, OracleAIJob.status == "pending")
+            .values(
+                status="running",
+                locked_at=now,
+                attempts=OracleAIJob.attempts + 1,
+            )
+        )
+        return result.rowcount == 1
+
+    @staticmethod
+    def _release_stale(db: Session) -> None:
+        """Return jobs abandoned in 'running' (worker crash) to the queue."""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=_LEASE_SECONDS)
+        released = db.execute(
+            update(OracleAIJob)
+            .where(OracleAIJob.status == "running", OracleAIJob.locked_at < cutoff)
+            .values(status="pending", locked_at=None, last_error="lease expired")
+        ).rowcount
+        if released:
+            logger.warning("Released %d stale AI jobs", released)
+
+    async def _process(self, job_id: int) -> None:
+        from app.services.security import get_encryption_service
+
+        db = self.db_session_factory()
+        try:
+            job = db.get(OracleAIJob, job_id)
+            reading = db.get(OracleReading, job.reading_id) if job else None
+            if job is None:
+                return
+            if reading is None or reading.deleted_at is not None:
+                job.status = "dead"
+                job.last_error = "reading not found"
+                job.completed_at = datetime.now(timezone.utc)
+                db.commit()
+                return
+
+            enc = get_encryption_service()
+            try:
+                sections = await self.interpret(reading.reading_result or {}, job.payload or {})
+            except Exception as exc:
+                fallback = getattr(exc, "fallback", None)
+                await self._fail(db, job, reading, enc, exc, fallback)
+                return
+
+            self._store(reading, enc, sections)
+            job.status = "done"
+            job.last_error = None
+            job.completed_at = datetime.now(timezone.utc)
+            db.commit()
+            self.stats["completed"] += 1
+            await self._push(job, "reading_ai_ready", {"ai_interpretation": sections})
+        except Exception:
+            logger.exception("AI job %s crashed", job_id)
+            db.rollback()
+        finally:
+            db.close()
+
+    async def _fail(self, db, job, reading, enc, exc: Exception, fallback: dict | None) -> None:
+        job.last_error = f"{type(exc).__name__}: {exc}"[:1000]
+        if job.attempts < job.max_attempts:
+            delay = min(_MAX_BACKOFF_SECONDS, self.retry_base_seconds * (2 ** (job.attempts - 1)))
+            job.status = "pending"
+            job.locked_at = None
+            job.available_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+            db.commit()
+            self.stats["retried"] += 1
+            logger.warning(
+                "AI job %d attempt %d/%d failed (%s) — retrying in %.0fs",
+                job.id,
+                job.attempts,
+                job.max_attempts,
+                job.last_error,
+                delay,
+            )
+            return
+
+        # Dead letter: keep the job for inspection, give the reading the fallback
+        job.status = "dead"
+        job.completed_at = datetime.now(timezone.utc)
+        if fallback:
+            self._store(reading, enc, fallback)
+        db.commit()
+        self.stats["dead_lettered"] += 1
+        logger.error(
+            "AI job %d dead-lettered after %d attempts: %s", job.id, job.attempts, job.last_error
+        )
+        await self._push(
+            job,
+            "reading_ai_failed",
+            {"error": "AI interpretation unavailable", "fallback": bool(fallback)},
+        )
+
+    @staticmethod
+    def _store(reading: OracleReading, enc, sections: dict) -> None:
+        text = sections.get("full_text", "") or None
+        if text and enc:
+            text = enc.encrypt_field(text)
+        reading.ai_interpretation = text
+
+    @staticmethod
+    async def _push(job: OracleAIJob, event: str, data: dict) -> None:
+        from app.services.websocket_manager import ws_manager
+
+        notify_user = (job.payload or {}).get("notify_user_id")
+        if not notify_user:
+            return
+        await ws_manager.send_to_user(notify_user, event, {"reading_id": job.reading_id, **data})
+
+
+def _build_default_queue() -> AIJobQueue:
+    from app.config import settings
+
+    return AIJobQueue(
+        concurrency=settings.ai_job_concurrency,
+        retry_base_seconds=settings.ai_job_retry_base_seconds,
+    )
+
+
+# Singleton
+ai_job_queue = _build_default_queue()
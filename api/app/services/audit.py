@@ -171,6 +171,27 @@ class AuditService:
             details={"fields": fields},
         )
 
+    # ─── Oracle Group audit methods ───────────────────────────────────────────
+
+    def log_group_changed(
+        self,
+        group_id: int,
+        action: str,
+        *,
+        member_id: int | None = None,
+        ip: str | None = None,
+        key_hash: str | None = None,
+    ):
+        """``action``: create, member_add, member_remove, delete."""
+        return self.log(
+            f"oracle_group.{action}",
+            resource_type="oracle_group",
+            resource_id=group_id,
+            ip_address=ip,
+            api_key_hash=key_hash,
+            details={"member_id": member_id} if member_id is not None else None,
+        )
+
     # ─── Auth audit methods ───────────────────────────────────────────────────
 
     def log_auth_failed(self, *, ip: str | None = None, details: dict | None = None):
@@ -2,8 +2,10 @@
 
 import json
 import logging
+import math
 import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -38,6 +40,98 @@ except FileNotFoundError:
 # Index for fast lookup
 _COUNTRY_BY_CODE: dict[str, dict[str, Any]] = {c["code"]: c for c in _COUNTRIES}
 
+# ─── Spatial Index ──────────────────────────────────────────────────────────
+
+_EARTH_RADIUS_KM = 6371.0088
+_GRID_CELL_DEG = 2.0
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * _EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class _CityGrid:
+    """Fixed-size lat/lon bucket grid over the static city dataset.
+
+    Cities are bucketed into ``cell_deg`` x ``cell_deg`` cells. A query walks
+    rings of cells outward from the query cell, collecting candidates, and
+    stops once no unvisited ring can hold anything closer than the current
+    k-th best (haversine distance). Longitude wraps at the antimeridian.
+    """
+
+    def __init__(self, cities: dict[str, list[dict[str, Any]]], cell_deg: float) -> None:
+        self.cell_deg = cell_deg
+        self.n_rows = math.ceil(180.0 / cell_deg)
+        self.n_cols = math.ceil(360.0 / cell_deg)
+        self.max_ring = max(self.n_rows, self.n_cols // 2 + 1)
+        self.cells: dict[tuple[int, int], list[tuple[float, float, str, dict[str, Any]]]] = {}
+        self.size = 0
+        for code, entries in cities.items():
+            for city in entries:
+                lat, lon = float(city["latitude"]), float(city["longitude"])
+                self.cells.setdefault(self._cell(lat, lon), []).append((lat, lon, code, city))
+                self.size += 1
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        row = min(int((lat + 90.0) // self.cell_deg), self.n_rows - 1)
+        col = int(((lon + 180.0) % 360.0) // self.cell_deg) % self.n_cols
+        return row, col
+
+    def _ring(self, row: int, col: int, r: int) -> list[tuple[int, int]]:
+        """Cells at Chebyshev distance exactly ``r`` from (row, col)."""
+        if r == 0:
+            return [(row, col)]
+        out: list[tuple[int, int]] = []
+        for dr in range(-r, r + 1):
+            rr = row + dr
+            if rr < 0 or rr >= self.n_rows:
+                continue
+            dcs = range(-r, r + 1) if abs(dr) == r else (-r, r)
+            for dc in dcs:
+                out.append((rr, (col + dc) % self.n_cols))
+        return out
+
+    def _ring_lower_bound_km(self, lat: float, r: int) -> float:
+        """Lower bound on the distance to any city outside rings 0..r."""
+        span = math.radians(r * self.cell_deg)
+        lat_bound = _EARTH_RADIUS_KM * span
+        phi_max = math.radians(min(90.0, abs(lat) + (r + 1) * self.cell_deg))
+        half = min(span, math.pi) / 2
+        lon_bound = 2 * _EARTH_RADIUS_KM * math.asin(min(1.0, math.cos(phi_max) * math.sin(half)))
+        return min(lat_bound, lon_bound)
+
+    def nearest(self, lat: float, lon: float, k: int) -> list[tuple[float, str, dict[str, Any]]]:
+        """Return up to ``k`` (distance_km, country_code, city) tuples, closest first."""
+        if k <= 0 or self.size == 0:
+            return []
+        k = min(k, self.size)
+        row, col = self._cell(lat, lon)
+        seen: set[tuple[int, int]] = set()
+        found: list[tuple[float, str, dict[str, Any]]] = []
+        for r in range(self.max_ring + 1):
+            for cell in self._ring(row, col, r):
+                if cell in seen:
+                    continue
+                seen.add(cell)
+                for c_lat, c_lon, code, city in self.cells.get(cell, ()):
+                    found.append((_haversine_km(lat, lon, c_lat, c_lon), code, city))
+            if len(found) >= k:
+                found.sort(key=lambda t: t[0])
+                del found[k:]
+                if found[-1][0] <= self._ring_lower_bound_km(lat, r):
+                    break
+        found.sort(key=lambda t: t[0])
+        return found[:k]
+
+
+_CITY_GRID = _CityGrid(_CITIES, _GRID_CELL_DEG)
+
 # ─── Caches ─────────────────────────────────────────────────────────────────
 
 _CITY_CACHE_TTL = 30 * 86400  # 30 days
@@ -57,22 +151,80 @@ def reset_caches() -> None:
     with _cache_lock:
         _city_cache.clear()
         _ip_cache.clear()
+    _timezone_at_key.cache_clear()
 
 
-def _get_timezone(lat: float, lon: float) -> str | None:
-    """Get timezone from coordinates using timezonefinder (optional dep)."""
-    try:
-        from timezonefinder import TimezoneFinder
+# ─── Timezone lookup ────────────────────────────────────────────────────────
+
+# Memo keys are coordinates rounded to 1/_TZ_KEY_SCALE degrees (~0.1 m), below
+# the precision of the boundary data, so every lookup resolves the requested
+# point itself and only repeats of that point hit the memo.
+_TZ_KEY_SCALE = 1_000_000
+_TZ_MEMO_SIZE = 8192
+
+_tz_finder: Any = None
+_tz_finder_lock = threading.Lock()
+
+
+def _get_finder(in_memory: bool = False) -> Any:
+    """Return the process-wide TimezoneFinder, creating it on first use.
+
+    Raises ImportError if timezonefinder is not installed.
+    """
+    global _tz_finder
+    if _tz_finder is None:
+        with _tz_finder_lock:
+            if _tz_finder is None:
+                from timezonefinder import TimezoneFinder
 
-        tf = TimezoneFinder()
-        return tf.timezone_at(lat=lat, lng=lon)
+                _tz_finder = TimezoneFinder(in_memory=in_memory)
+    return _tz_finder
+
+
+def preload_timezone_finder(in_memory: bool = True) -> bool:
+    """Eagerly build the shared TimezoneFinder (optionally fully in memory).
+
+    Call at startup so the first request does not pay the polygon load.
+    Returns False if timezonefinder is unavailable or already initialized
+    lazily; True if this call created the finder.
+    """
+    global _tz_finder
+    with _tz_finder_lock:
+        if _tz_finder is not None:
+            return False
+        try:
+            from timezonefinder import TimezoneFinder
+        except ImportError:
+            return False
+        _tz_finder = TimezoneFinder(in_memory=in_memory)
+    return True
+
+
+def _tz_key(lat: float, lon: float) -> tuple[int, int]:
+    return round(lat * _TZ_KEY_SCALE), round(lon * _TZ_KEY_SCALE)
+
+
+@lru_cache(maxsize=_TZ_MEMO_SIZE)
+def _timezone_at_key(k_lat: int, k_lon: int) -> str | None:
+    """Memoized timezone lookup. Errors propagate, so failures are not cached."""
+    return _get_finder().timezone_at(lat=k_lat / _TZ_KEY_SCALE, lng=k_lon / _TZ_KEY_SCALE)
+
+
+def _timezone_for_key(key: tuple[int, int]) -> str | None:
+    try:
+        return _timezone_at_key(*key)
     except ImportError:
         return None
     except (ValueError, TypeError, OSError) as exc:
-        logger.debug("Timezone lookup failed for (%s, %s): %s", lat, lon, exc)
+        logger.debug("Timezone lookup failed for %s: %s", key, exc)
         return None
 
 
+def _get_timezone(lat: float, lon: float) -> str | None:
+    """Get timezone from coordinates using timezonefinder (optional dep)."""
+    return _timezone_for_key(_tz_key(lat, lon))
+
+
 # ─── Location Service ───────────────────────────────────────────────────────
 
 
@@ -220,6 +372,74 @@ class LocationService:
 
         return results
 
+    def nearest_city(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 1,
+        lang: str = "en",
+    ) -> list[dict[str, Any]]:
+        """Find the closest known cities to a coordinate — fully offline.
+
+        Uses the static-data spatial grid, so no Nominatim request is made.
+
+        Args:
+            lat: Latitude in degrees (-90..90).
+            lon: Longitude in degrees (-180..180).
+            k: Number of cities to return (default 1, max 50).
+            lang: 'en' or 'fa' for result name language.
+
+        Returns:
+            List of city dicts (closest first) with keys: name, country_code,
+            country_name, latitude, longitude, timezone, distance_km.
+        """
+        k = min(k, 50)
+        name_key = "name_fa" if lang == "fa" else "name_en"
+        results: list[dict[str, Any]] = []
+        for dist, code, city in _CITY_GRID.nearest(lat, lon, k):
+            country = _COUNTRY_BY_CODE.get(code)
+            results.append(
+                {
+                    "name": city[name_key],
+                    "country_code": code,
+                    "country_name": country[name_key] if country else code,
+                    "latitude": city["latitude"],
+                    "longitude": city["longitude"],
+                    "timezone": city["timezone"],
+                    "distance_km": round(dist, 3),
+                }
+            )
+        return results
+
+    def nearest_cities(
+        self,
+        coords: list[tuple[float, float]],
+        k: int = 1,
+        lang: str = "en",
+    ) -> list[list[dict[str, Any]]]:
+        """Batch form of :meth:`nearest_city` — one result list per coordinate."""
+        return [self.nearest_city(lat, lon, k=k, lang=lang) for lat, lon in coords]
+
+    def timezones_for(self, coords: list[tuple[float, float]]) -> list[str | None]:
+        """Resolve IANA timezones for many coordinates in one call.
+
+        Repeated points are looked up once.
+
+        Args:
+            coords: Sequence of (latitude, longitude) pairs.
+
+        Returns:
+            Timezone names in input order (None where unresolvable).
+        """
+        by_key: dict[tuple[int, int], str | None] = {}
+        result: list[str | None] = []
+        for lat, lon in coords:
+            key = _tz_key(lat, lon)
+            if key not in by_key:
+                by_key[key] = _timezone_for_key(key)
+            result.append(by_key[key])
+        return result
+
     # ─── Static lookup helper ───────────────────────────────────────────
 
     def _lookup_static(self, city: str, country: str | None = None) -> dict[str, Any] | None:
@@ -0,0 +1,268 @@
+"""Persistent groups — incremental compatibility (oracle_groups).
+
+A group is stored as rows: the group itself with running totals (pair score
+total in basis points, element counts, harmony), one ``oracle_group_members``
+row per member with its comparison data from one framework reading at the
+group's fixed ``reading_moment``, and one ``oracle_group_pairs`` row per pair
+score. Joining runs one framework reading, scores the newcomer against the
+current members and inserts N pair rows; leaving deletes the member's pair
+rows and subtracts their sum. Neither rewrites the rest of the matrix.
+Fetching the analysis rebuilds a GroupState (oracle_service.group_compatibility)
+from the rows — no framework readings, no AI call.
+
+The framework reading for a joining member runs before the group row is
+locked, so the lock (``SELECT ... FOR UPDATE`` on PostgreSQL) only covers the
+O(N) update.
+"""
+
+import time
+from datetime import datetime, timezone
+
+from fastapi import Depends
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_db
+from app.orm.oracle_group import OracleGroup, OracleGroupMember, OracleGroupPair
+from app.orm.oracle_user import OracleUser
+from app.services.oracle_reading import OracleReadingService, _parse_datetime
+from app.services.security import EncryptionService, get_encryption_service
+
+
+class OracleGroupService:
+    """Create groups, apply joins/leaves, and read the stored analysis."""
+
+    def __init__(self, db: Session, enc: EncryptionService | None = None):
+        self.db = db
+        self.readings = OracleReadingService(db, enc)
+
+    # ── Lookup ──
+
+    def get_group(
+        self, group_id: int, owner: str | None = None, for_update: bool = False
+    ) -> OracleGroup | None:
+        """Group by id; ``owner`` restricts to groups created by that account."""
+        query = self.db.query(OracleGroup).filter(OracleGroup.id == group_id)
+        if owner is not None:
+            query = query.filter(OracleGroup.created_by == owner)
+        if for_update:
+            # Re-read under the row lock; the identity map may hold a stale state
+            query = query.with_for_update().populate_existing()
+        return query.first()
+
+    def _members(self, group_id: int) -> list[OracleGroupMember]:
+        """Member rows in join order."""
+        return (
+            self.db.query(OracleGroupMember)
+            .filter(OracleGroupMember.group_id == group_id)
+            .order_by(OracleGroupMember.id)
+            .all()
+        )
+
+    def _member_row(self, group_id: int, user_id: int) -> OracleGroupMember | None:
+        return (
+            self.db.query(OracleGroupMember)
+            .filter(OracleGroupMember.group_id == group_id, OracleGroupMember.user_id == user_id)
+            .first()
+        )
+
+    def _member_user(self, user_id: int, owner: str | None) -> OracleUser:
+        oracle_user = self.readings._get_oracle_user(user_id)
+        if owner is not None and oracle_user.created_by != owner:
+            raise ValueError(f"Oracle user {user_id} not found")
+        return oracle_user
+
+    @staticmethod
+    def _moment(group: OracleGroup) -> datetime:
+        moment = group.reading_moment
+        return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+    # ── Comparison data (framework readings) ──
+
+    async def _comparisons(
+        self, users: list[OracleUser], moment: datetime, numerology_system: str
+    ) -> list[dict]:
+        from oracle_service.group_compatibility import member_comparison
+        from oracle_service.work_scheduler import run_framework
+
+        profiles = [self.readings._build_user_profile(u, numerology_system) for u in users]
+        return await run_framework(lambda: [member_comparison(p, moment) for p in profiles])
+
+    # ── Mutations ──
+
+    async def create_group(
+        self,
+        name: str,
+        user_ids: list[int],
+        date_str: str | None,
+        numerology_system: str,
+        owner: str | None,
+        created_by: str | None,
+    ) -> OracleGroup:
+        from oracle_service.group_compatibility import GroupState
+
+        self._check_size(len(user_ids))
+        users = [self._member_user(uid, owner) for uid in user_ids]
+        moment = _parse_datetime(date_str)
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+
+        comparisons = await self._comparisons(users, moment, numerology_system)
+        state = GroupState.from_comparisons(user_ids, comparisons)
+
+        group = OracleGroup(
+            name=name,
+            created_by=created_by,
+            reading_moment=moment,
+            numerology_system=numerology_system,
+        )
+        self._set_totals(group, state.score_total, state.element_counts, len(state))
+        self.db.add(group)
+        self.db.flush()
+
+        self.db.add_all(
+            OracleGroupMember(group_id=group.id, user_id=uid, comparison=comparison)
+            for uid, comparison in zip(user_ids, comparisons)
+        )
+        self.db.add_all(
+            OracleGroupPair(
+                group_id=group.id,
+                member_a=user_ids[i],
+                member_b=user_ids[j],
+                score=int(state.scores[i, j]),
+            )
+            for i in range(len(user_ids))
+            for j in range(i + 1, len(user_ids))
+        )
+        self.db.flush()
+        return group
+
+    async def add_member(self, group: OracleGroup, user_id: int, owner: str | None) -> OracleGroup:
+        """Join in O(N): one framework reading + N pair-score rows."""
+        from oracle_service.group_compatibility import score_newcomer
+
+        if self._member_row(group.id, user_id) is not None:
+            raise ValueError(f"User {user_id} is already a group member")
+        self._check_size(group.member_count + 1)
+        user = self._member_user(user_id, owner)
+        (comparison,) = await self._comparisons(
+            [user], self._moment(group), group.numerology_system
+        )
+
+        group = self.get_group(group.id, for_update=True)
+        members = self._members(group.id)
+        if any(m.user_id == user_id for m in members):
+            raise ValueError(f"User {user_id} is already a group member")
+        self._check_size(len(members) + 1)
+        row = score_newcomer(
+            [m.user_id for m in members], [m.comparison for m in members], user_id, comparison
+        )
+
+        self.db.add(OracleGroupMember(group_id=group.id, user_id=user_id, comparison=comparison))
+        self.db.add_all(
+            OracleGroupPair(group_id=group.id, member_a=m.user_id, member_b=user_id, score=int(s))
+            for m, s in zip(members, row)
+        )
+        counts = dict(group.element_counts or {})
+        counts[comparison["element"]] = counts.get(comparison["element"], 0) + 1
+        self._set_totals(group, group.score_total + int(row.sum()), counts, len(members) + 1)
+        self.db.flush()
+        return group
+
+    def remove_member(self, group: OracleGroup, user_id: int) -> OracleGroup:
+        """Leave in O(N): delete the member's pair rows and subtract their sum."""
+        group = self.get_group(group.id, for_update=True)
+        member = self._member_row(group.id, user_id)
+        if member is None:
+            raise ValueError(f"User {user_id} is not a group member")
+
+        pairs = self.db.query(OracleGroupPair).filter(
+            OracleGroupPair.group_id == group.id,
+            or_(OracleGroupPair.member_a == user_id, OracleGroupPair.member_b == user_id),
+        )
+        removed = pairs.with_entities(func.coalesce(func.sum(OracleGroupPair.score), 0)).scalar()
+        pairs.delete(synchronize_session=False)
+        self.db.delete(member)
+
+        counts = dict(group.element_counts or {})
+        element = member.comparison["element"]
+        counts[element] -= 1
+        if not counts[element]:
+            del counts[element]
+        self._set_totals(group, group.score_total - int(removed), counts, group.member_count - 1)
+        self.db.flush()
+        return group
+
+    def delete_group(self, group: OracleGroup) -> None:
+        # Explicit so backends without ON DELETE CASCADE enforcement stay clean
+        for model in (OracleGroupPair, OracleGroupMember):
+            self.db.query(model).filter(model.group_id == group.id).delete(
+                synchronize_session=False
+            )
+        self.db.delete(group)
+        self.db.flush()
+
+    # ── Analysis ──
+
+    def analysis(self, group: OracleGroup, top_k: int = 5) -> dict:
+        """Current analysis from the stored state (no recomputation)."""
+        from oracle_service.group_compatibility import GroupState
+
+        start = time.perf_counter()
+        members = self._members(group.id)
+        pairs = (
+            self.db.query(OracleGroupPair.member_a, OracleGroupPair.member_b, OracleGroupPair.score)
+            .filter(OracleGroupPair.group_id == group.id)
+            .all()
+        )
+        state = GroupState.from_pairs(
+            [m.user_id for m in members],
+            [m.comparison for m in members],
+            pairs,
+            group.score_total,
+            group.element_counts,
+        )
+        result = state.analysis(top_k)
+        result.update(
+            id=group.id,
+            name=group.name,
+            reading_moment=self._moment(group).isoformat(),
+            numerology_system=group.numerology_system,
+            computation_ms=(time.perf_counter() - start) * 1000,
+            created_at=_isoformat(group.created_at),
+            updated_at=_isoformat(group.updated_at),
+        )
+        return result
+
+    # ── Helpers ──
+
+    @staticmethod
+    def _check_size(member_count: int) -> None:
+        if member_count > settings.oracle_group_max_members:
+            raise ValueError(f"Maximum {settings.oracle_group_max_members} group members allowed")
+
+    @staticmethod
+    def _set_totals(
+        group: OracleGroup, score_total: int, element_counts: dict, member_count: int
+    ) -> None:
+        from oracle_service.group_compatibility import group_harmony
+
+        group.score_total = score_total
+        # Reassign (not mutate) so the JSON column is flagged dirty
+        group.element_counts = dict(element_counts)
+        group.member_count = member_count
+        group.harmony_score = round(group_harmony(score_total, member_count), 4)
+        group.updated_at = datetime.now(timezone.utc)
+
+
+def _isoformat(value) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value or "")
+
+
+def get_oracle_group_service(
+    db: Session = Depends(get_db),
+    enc: EncryptionService | None = Depends(get_encryption_service),
+) -> OracleGroupService:
+    """FastAPI dependency — returns an OracleGroupService."""
+    return OracleGroupService(db, enc)
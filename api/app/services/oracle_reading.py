@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -59,6 +60,7 @@ try:
     )
     from engines.timing_advisor import (  # noqa: E402
         get_current_quality,
+        plan_timing,
     )
     from oracle_service.framework_bridge import (  # noqa: E402
         ANIMAL_NAMES,
@@ -74,6 +76,8 @@ try:
         personal_year,
     )
 
+    from oracle_service.tracing import span  # noqa: E402
+
     # Backward-compatible alias — interpret_group was renamed to interpret_multi_user in Session 13
     interpret_group = interpret_multi_user
     _ORACLE_ENGINES_AVAILABLE = True
@@ -88,11 +92,14 @@ except ImportError as _import_err:
     interpret_group = None  # type: ignore[assignment]
     MultiUserFC60Service = None  # type: ignore[assignment]
     _get_zodiac = daily_insight = question_sign = read_name = read_sign = None  # type: ignore[assignment]
-    get_current_quality = None  # type: ignore[assignment]
+    get_current_quality = plan_timing = None  # type: ignore[assignment]
     ANIMAL_NAMES = LETTER_VALUES = LIFE_PATH_MEANINGS = None  # type: ignore[assignment]
     STEM_ELEMENTS = STEM_NAMES = STEM_POLARITY = None  # type: ignore[assignment]
     encode_fc60 = ganzhi_year = life_path = numerology_reduce = personal_year = None  # type: ignore[assignment]
 
+    def span(name: str, **attributes):  # type: ignore[no-redef]
+        return nullcontext()
+
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
 
@@ -369,6 +376,14 @@ class OracleReadingService:
             "optimal_activity": result.get("energy", ""),
         }
 
+    def get_timing_plan(
+        self, start_str: str | None, days: int, window_hours: int, top_k: int
+    ) -> dict:
+        """Hourly timing heatmap and best windows over ``days`` days (UTC)."""
+        self._require_engines()
+        start = _parse_datetime(start_str).date()
+        return plan_timing(start, days=days, window_hours=window_hours, top_k=top_k)
+
     def suggest_range(
         self,
         scanned_ranges: list[str],
@@ -781,9 +796,24 @@ class OracleReadingService:
         numerology_system: str,
         progress_callback=None,
         inquiry_context: dict[str, str] | None = None,
+        section_callback=None,
+        defer_ai: bool = False,
+        notify_user_id: str | None = None,
+        degraded: bool = False,
     ) -> dict:
         """Create a reading using the framework pipeline.
 
+        With ``section_callback``, AI sections are streamed to it as they
+        complete; the full interpretation is still stored once at the end.
+
+        With ``defer_ai``, only the framework step runs: the reading is
+        stored without AI text, an oracle_ai_jobs row is queued in the same
+        transaction, and the result carries ``ai_status="pending"``. The
+        caller must commit and then wake the worker (ai_job_queue.notify()).
+
+        With ``degraded`` (admission control shedding load) the AI call is
+        skipped and the framework fallback interpretation is stored instead.
+
         Returns dict ready for FrameworkReadingResponse + the OracleReading DB row.
         """
         from app.orm.oracle_user import OracleUser
@@ -813,7 +843,9 @@ class OracleReadingService:
         # 4. Orchestrate reading
         from oracle_service.reading_orchestrator import ReadingOrchestrator
 
-        orchestrator = ReadingOrchestrator(progress_callback=progress_callback)
+        orchestrator = ReadingOrchestrator(
+            progress_callback=progress_callback, section_callback=section_callback
+        )
         result = await orchestrator.generate_time_reading(
             user_profile,
             hour,
@@ -822,6 +854,8 @@ class OracleReadingService:
             target_date,
             locale,
             inquiry_context=inquiry_context,
+            include_ai=not defer_ai,
+            fallback_only=degraded,
         )
 
         # 5. Store in database
@@ -841,6 +875,23 @@ class OracleReadingService:
             ai_interpretation=ai_text or None,
         )
 
+        if defer_ai:
+            from app.config import settings
+            from app.services.ai_jobs import enqueue_ai_job
+
+            enqueue_ai_job(
+                self.db,
+                reading.id,
+                payload={
+                    "reading_type": "time",
+                    "locale": locale,
+                    "inquiry_context": inquiry_context,
+                    "notify_user_id": notify_user_id,
+                },
+                max_attempts=settings.ai_job_max_attempts,
+            )
+            result["ai_status"] = "pending"
+
         result["id"] = reading.id
         created_at = reading.created_at
         if isinstance(created_at, datetime):
@@ -859,6 +910,7 @@ class OracleReadingService:
         numerology_system: str = "pythagorean",
         include_ai: bool = True,
         inquiry_context: dict[str, str] | None = None,
+        degraded: bool = False,
     ) -> dict:
         """Name reading using framework via ReadingOrchestrator."""
         from oracle_service.reading_orchestrator import ReadingOrchestrator
@@ -903,6 +955,7 @@ class OracleReadingService:
             numerology_system=numerology_system,
             include_ai=include_ai,
             inquiry_context=inquiry_context,
+            fallback_only=degraded,
         )
 
     def get_question_reading_v2(
@@ -914,6 +967,7 @@ class OracleReadingService:
         category: str | None = None,
         question_time: str | None = None,
         inquiry_context: dict[str, str] | None = None,
+        degraded: bool = False,
     ) -> dict:
         """Question reading using framework via ReadingOrchestrator."""
         from oracle_service.reading_orchestrator import ReadingOrchestrator
@@ -962,6 +1016,7 @@ class OracleReadingService:
             category=category,
             question_time=question_time,
             inquiry_context=inquiry_context,
+            fallback_only=degraded,
         )
 
     # ── DB storage methods ──
@@ -976,30 +1031,39 @@ class OracleReadingService:
         ai_interpretation: str | None,
     ) -> OracleReading:
         """Create an OracleReading row with encrypted sensitive fields."""
-        enc_question = question or ""
-        enc_ai = ai_interpretation
-        if self.enc:
-            enc_question = self.enc.encrypt_field(enc_question) if enc_question else ""
-            enc_ai = self.enc.encrypt_field(enc_ai) if enc_ai else enc_ai
-
-        reading = OracleReading(
-            user_id=user_id,
-            sign_type=sign_type,
-            sign_value=sign_value,
-            question=enc_question,
-            reading_result=reading_result,
-            ai_interpretation=enc_ai,
-        )
-        self.db.add(reading)
-        self.db.flush()
-        return reading
+        with span("db.store_reading", sign_type=sign_type):
+            enc_question = question or ""
+            enc_ai = ai_interpretation
+            if self.enc:
+                with span("encrypt"):
+                    enc_question = self.enc.encrypt_field(enc_question) if enc_question else ""
+                    enc_ai = self.enc.encrypt_field(enc_ai) if enc_ai else enc_ai
+
+            reading = OracleReading(
+                user_id=user_id,
+                sign_type=sign_type,
+                sign_value=sign_value,
+                question=enc_question,
+                reading_result=reading_result,
+                ai_interpretation=enc_ai,
+            )
+            self.db.add(reading)
+            self.db.flush()
+            return reading
 
     def get_reading_by_id(self, reading_id: int) -> dict | None:
-        """Fetch a reading by ID, decrypt, and return as dict."""
+        """Fetch a reading by ID, decrypt, and return as dict.
+
+        Includes ``ai_status`` when the reading's AI step was deferred.
+        """
+        from app.services.ai_jobs import get_ai_status
+
         row = self.db.query(OracleReading).filter(OracleReading.id == reading_id).first()
         if not row:
             return None
-        return self._decrypt_reading(row)
+        data = self._decrypt_reading(row)
+        data["ai_status"] = get_ai_status(self.db, reading_id)
+        return data
 
     _ALLOWED_SORT_FIELDS = {"created_at", "confidence"}
 
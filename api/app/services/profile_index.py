@@ -0,0 +1,259 @@
+"""Profile compatibility index — "most compatible profiles" (oracle_user_features).
+
+Each oracle user's natal comparison data (``oracle_service.profile_index.
+natal_comparison``: a framework reading at the profile's own birth moment) is
+stored in ``oracle_user_features`` whenever the profile is created, updated
+or soft-deleted — the endpoints call ``sync_profile`` inside their
+transaction. Each API process keeps one ProfileCompatibilityIndex in memory:
+
+- first use: load every row
+- later uses: re-read only rows whose ``updated_at`` is at or past the last
+  seen watermark (minus a small overlap for concurrent commits), so changes
+  made through other processes are picked up without a full reload
+- soft-deleted profiles are kept as ``deleted`` rows so every process drops
+  them; hard-deleted profiles (cascade) are dropped when a query finds them
+  gone (``compatible_profiles``)
+
+The rows are read without holding the cache lock; only applying them to the
+index is locked, and a row older than the version already applied is skipped.
+
+Profiles that predate the table have no feature row until it is backfilled
+with ``make backfill-profile-features`` (``backfill_features``). The backfill
+runs a framework reading per profile, so it is a deploy step, not something a
+request does: querying a profile without a row reports it as not indexed yet.
+"""
+
+import argparse
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.orm.oracle_user import OracleUser
+from app.orm.oracle_user_feature import OracleUserFeature
+from app.services.oracle_reading import OracleReadingService
+from app.services.security import EncryptionService
+
+logger = logging.getLogger(__name__)
+
+_REFRESH_OVERLAP = timedelta(seconds=5)  # re-read rows committed out of order
+_STALE_RETRIES = 3
+
+
+def sync_profile(db: Session, oracle_user: OracleUser, enc: EncryptionService | None) -> None:
+    """Upsert ``oracle_user``'s feature row (not committed).
+
+    A failed framework reading is logged and leaves the row untouched — the
+    profile then drops out of (or stays stale in) compatibility results
+    rather than failing the profile write.
+    """
+    from oracle_service.profile_index import natal_comparison
+
+    deleted = oracle_user.deleted_at is not None
+    features = None
+    if not deleted:
+        try:
+            profile = OracleReadingService(db, enc)._build_user_profile(oracle_user)
+            features = natal_comparison(profile)
+        except Exception:
+            logger.warning(
+                "Natal features failed for oracle user %d", oracle_user.id, exc_info=True
+            )
+            return
+
+    row = db.get(OracleUserFeature, oracle_user.id)
+    if row is None:
+        if deleted:
+            return
+        row = OracleUserFeature(user_id=oracle_user.id)
+        db.add(row)
+    row.created_by = oracle_user.created_by
+    row.deleted = deleted
+    if features is not None:
+        row.features = features
+    row.updated_at = datetime.now(timezone.utc)
+
+
+class ProfileIndexCache:
+    """Process-wide index plus the ``updated_at`` watermark it is synced to."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.index = None
+        self._watermark: datetime | None = None
+        self._versions: dict[int, datetime] = {}  # updated_at applied per profile
+
+    def get(self, db: Session):
+        """The index, refreshed from ``oracle_user_features``.
+
+        Queries run outside the lock; concurrent callers may read
+        overlapping rows, and ``_apply`` keeps the newest version of each.
+        """
+        with self._lock:
+            loaded = self.index is not None
+            since = self._watermark
+        if not loaded:
+            rows = db.query(OracleUserFeature).filter(OracleUserFeature.deleted.is_(False)).all()
+        elif since is None:
+            rows = db.query(OracleUserFeature).all()
+        else:
+            rows = (
+                db.query(OracleUserFeature)
+                .filter(OracleUserFeature.updated_at >= since - _REFRESH_OVERLAP)
+                .all()
+            )
+
+        with self._lock:
+            if self.index is None:
+                from oracle_service.profile_index import ProfileCompatibilityIndex
+
+                self.index = ProfileCompatibilityIndex()
+            self._apply(rows)
+            return self.index
+
+    def reset(self) -> None:
+        with self._lock:
+            self.index = None
+            self._watermark = None
+            self._versions.clear()
+
+    def _apply(self, rows: list[OracleUserFeature]) -> None:
+        """Apply rows newer than what the index holds. Caller holds ``_lock``."""
+        for row in rows:
+            applied = self._versions.get(row.user_id)
+            if applied is not None and row.updated_at < applied:
+                continue
+            self._versions[row.user_id] = row.updated_at
+            if row.deleted:
+                self.index.remove(row.user_id)
+            else:
+                self.index.upsert(row.user_id, row.features, owner=row.created_by)
+            if self._watermark is None or row.updated_at > self._watermark:
+                self._watermark = row.updated_at
+
+
+profile_index_cache = ProfileIndexCache()
+
+
+def compatible_profiles(
+    db: Session,
+    oracle_user: OracleUser,
+    limit: int,
+    owner: str | None,
+) -> dict:
+    """Top ``limit`` profiles most compatible with ``oracle_user``.
+
+    ``owner`` restricts candidates to profiles created by that account (the
+    non-admin rule of ``list_users``); None searches every profile. A profile
+    without a feature row yet (not backfilled, or its sync failed) is
+    reported with ``indexed=False`` and no matches; the request never writes.
+    """
+    index = profile_index_cache.get(db)
+    indexed = oracle_user.id in index
+
+    start = time.perf_counter()
+    matches, names = [], {}
+    if indexed:
+        for _ in range(_STALE_RETRIES):
+            matches = index.top_matches(
+                oracle_user.id, limit, owner=owner, restrict_owner=owner is not None
+            )
+            ids = [m.user_b_id for m in matches]
+            names = dict(
+                db.query(OracleUser.id, OracleUser.name)
+                .filter(OracleUser.id.in_(ids), OracleUser.deleted_at.is_(None))
+                .all()
+            )
+            stale = [uid for uid in ids if uid not in names]
+            if not stale:
+                break
+            for uid in stale:
+                index.remove(uid)
+
+    return {
+        "user_id": oracle_user.id,
+        "matches": [
+            {
+                "user_id": m.user_b_id,
+                "name": names[m.user_b_id],
+                "overall_score": m.overall_score,
+                "life_path_score": m.life_path_score,
+                "element_score": m.element_score,
+                "animal_score": m.animal_score,
+                "moon_score": m.moon_score,
+                "pattern_score": m.pattern_score,
+                "description": m.description,
+                "strengths": m.strengths,
+                "challenges": m.challenges,
+            }
+            for m in matches
+            if m.user_b_id in names
+        ],
+        "indexed": indexed,
+        "indexed_profiles": len(index),
+        "computation_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+def reset_profile_index() -> None:
+    """Drop the in-memory index so the next query reloads it (tests)."""
+    profile_index_cache.reset()
+
+
+def backfill_features(db: Session, enc: EncryptionService | None, batch_size: int = 100) -> int:
+    """Write feature rows for live profiles that have none, committing per batch.
+
+    Returns the number of profiles processed. Profiles whose sync fails stay
+    without a row and are not retried in the same run.
+    """
+    done = 0
+    last_id = 0
+    while True:
+        batch = (
+            db.query(OracleUser)
+            .outerjoin(OracleUserFeature, OracleUserFeature.user_id == OracleUser.id)
+            .filter(
+                OracleUser.id > last_id,
+                OracleUser.deleted_at.is_(None),
+                OracleUserFeature.user_id.is_(None),
+            )
+            .order_by(OracleUser.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+        for oracle_user in batch:
+            sync_profile(db, oracle_user, enc)
+        db.commit()
+        done += len(batch)
+        last_id = batch[-1].id
+        logger.info("Backfilled natal features for %d oracle users", done)
+    return done
+
+
+def main(argv=None) -> int:
+    from app.config import settings
+    from app.database import get_session_factory
+    from app.services.security import get_encryption_service, init_encryption
+
+    parser = argparse.ArgumentParser(description="Profile compatibility features")
+    parser.add_argument("command", choices=["backfill"])
+    parser.add_argument("--batch-size", type=int, default=100, help="Profiles per commit")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    init_encryption(settings)
+    db = get_session_factory()()
+    try:
+        count = backfill_features(db, get_encryption_service(), args.batch_size)
+    finally:
+        db.close()
+    print(f"Backfilled natal features for {count} oracle users")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
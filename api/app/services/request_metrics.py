@@ -0,0 +1,384 @@
+"""Request metrics — fixed-memory latency histograms per route and status.
+
+``MetricsMiddleware`` records every HTTP request here, labelled by method,
+route template (``/api/oracle/users/{user_id}``, not the raw path) and
+status code. Each label set gets a request counter and a
+``LatencyHistogram``. The histogram is an HDR-style log-linear sketch: 32
+linear sub-buckets per power of two of microseconds, so every recorded
+value lands in a bucket no more than ~3% wide. The bucket array has a fixed
+size (896 counters) however many requests are recorded. Quantiles and
+Prometheus ``le`` buckets are read from the counters.
+
+``/api/health/performance`` also needs *recent* throughput and latency.
+Two window histograms are rotated every ``window_seconds``, and RPM and p95
+come from the current and previous windows together.
+
+Aggregation across workers (``metrics_aggregation = "redis"``): each
+worker pushes its cumulative ``snapshot()`` into the Redis hash
+``nps:metrics:workers`` every ``metrics_push_interval`` seconds.
+``collect_snapshots`` reads every fresh entry, and ``merge_snapshots``
+sums them — histogram counters merge exactly by addition. Without Redis
+each worker reports only itself.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+SUB_BUCKET_BITS = 5
+_SUB = 1 << SUB_BUCKET_BITS
+_MAX_BITS = 32  # values are clamped below 2**32 µs (~71 minutes)
+N_BUCKETS = (_MAX_BITS - SUB_BUCKET_BITS + 1) * _SUB
+_MAX_VALUE = (1 << _MAX_BITS) - 1
+
+# Prometheus histogram boundaries (seconds)
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REDIS_KEY = "nps:metrics:workers"
+STALE_AFTER_INTERVALS = 3  # pushes a worker may miss before it is dropped
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB:
+        return value
+    shift = value.bit_length() - 1 - SUB_BUCKET_BITS
+    return (shift + 1) * _SUB + (value >> shift) - _SUB
+
+
+def _bucket_upper(index: int) -> int:
+    """Highest value (µs) that falls in bucket ``index``."""
+    if index < _SUB:
+        return index
+    shift = index // _SUB - 1
+    mantissa = index % _SUB + _SUB
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear latency sketch over microseconds with a fixed bucket array."""
+
+    __slots__ = ("counts", "total", "sum_us", "max_us")
+
+    def __init__(self) -> None:
+        self.counts = [0] * N_BUCKETS
+        self.total = 0
+        self.sum_us = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        value = min(_MAX_VALUE, max(0, int(seconds * 1_000_000)))
+        self.counts[_bucket_index(value)] += 1
+        self.total += 1
+        self.sum_us += value
+        if value > self.max_us:
+            self.max_us = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def quantile(self, q: float) -> float:
+        """Value (seconds) at quantile ``q``: the upper bound of its bucket, capped at max."""
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(q * self.total))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_upper(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def count_le(self, seconds: float) -> int:
+        """Recorded values in buckets that end at or below ``seconds``."""
+        limit = int(seconds * 1_000_000)
+        total = 0
+        for index, count in enumerate(self.counts):
+            if _bucket_upper(index) > limit:
+                break
+            total += count
+        return total
+
+    def to_dict(self) -> dict:
+        """Sparse, JSON-serializable form."""
+        return {
+            "buckets": {str(i): c for i, c in enumerate(self.counts) if c},
+            "total": self.total,
+            "sum_us": self.sum_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        hist = cls()
+        for index, count in data.get("buckets", {}).items():
+            hist.counts[int(index)] = count
+        hist.total = data.get("total", 0)
+        hist.sum_us = data.get("sum_us", 0)
+        hist.max_us = data.get("max_us", 0)
+        return hist
+
+
+class RequestMetrics:
+    """Per-(method, route, status) counters and histograms plus a rolling window."""
+
+    def __init__(self, window_seconds: float = 60.0) -> None:
+        self.window_seconds = window_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = time.time()
+            self._series: dict[tuple[str, str, int], LatencyHistogram] = {}
+            self._in_flight = 0
+            self._window_start = time.monotonic()
+            self._current = LatencyHistogram()
+            self._previous: LatencyHistogram | None = None
+
+    def request_started(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self, method: str, route: str, status: int, seconds: float) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            key = (method, route, status)
+            hist = self._series.get(key)
+            if hist is None:
+                hist = self._series[key] = LatencyHistogram()
+            hist.record(seconds)
+            self._rotate(time.monotonic())
+            self._current.record(seconds)
+
+    def _rotate(self, now: float) -> None:
+        """Advance the window. Caller holds ``_lock``."""
+        elapsed = now - self._window_start
+        if elapsed < self.window_seconds:
+            return
+        # A whole idle window in between leaves nothing worth keeping
+        self._previous = self._current if elapsed < 2 * self.window_seconds else None
+        self._current = LatencyHistogram()
+        self._window_start = now
+
+    def snapshot(self) -> dict:
+        """JSON-serializable cumulative state of this worker."""
+        with self._lock:
+            now = time.monotonic()
+            self._rotate(now)
+            window = LatencyHistogram()
+            window.merge(self._current)
+            seconds = now - self._window_start
+            if self._previous is not None:
+                window.merge(self._previous)
+                seconds += self.window_seconds
+            return {
+                "worker": self.worker_id,
+                "at": time.time(),
+                "started": self.started,
+                "in_flight": self._in_flight,
+                "series": [
+                    [method, route, status, hist.to_dict()]
+                    for (method, route, status), hist in self._series.items()
+                ],
+                "window": {
+                    "rpm": window.total / max(seconds, 1.0) * 60,
+                    "histogram": window.to_dict(),
+                },
+            }
+
+
+def merge_snapshots(snapshots: list[dict]) -> dict:
+    """Sum worker snapshots into one (same shape; ``workers`` counts the inputs)."""
+    series: dict[tuple, LatencyHistogram] = {}
+    window = LatencyHistogram()
+    merged = {"workers": len(snapshots), "in_flight": 0, "started": None, "at": time.time()}
+    rpm = 0.0
+    for snap in snapshots:
+        merged["in_flight"] += snap.get("in_flight", 0)
+        started = snap.get("started")
+        if started is not None and (merged["started"] is None or started < merged["started"]):
+            merged["started"] = started
+        for method, route, status, data in snap.get("series", []):
+            key = (method, route, status)
+            if key not in series:
+                series[key] = LatencyHistogram()
+            series[key].merge(LatencyHistogram.from_dict(data))
+        win = snap.get("window", {})
+        rpm += win.get("rpm", 0.0)
+        window.merge(LatencyHistogram.from_dict(win.get("histogram", {})))
+    merged["series"] = [[*key, hist.to_dict()] for key, hist in series.items()]
+    merged["window"] = {"rpm": rpm, "histogram": window.to_dict()}
+    return merged
+
+
+def performance_summary(snapshot: dict) -> dict:
+    """Uptime, totals, recent RPM and p95 from a (possibly merged) snapshot."""
+    requests_total = errors_total = 0
+    for _, _, status, data in snapshot.get("series", []):
+        requests_total += data.get("total", 0)
+        if status >= 500:
+            errors_total += data.get("total", 0)
+    window = LatencyHistogram.from_dict(snapshot.get("window", {}).get("histogram", {}))
+    started = snapshot.get("started") or time.time()
+    return {
+        "uptime_seconds": round(time.time() - started),
+        "requests_total": requests_total,
+        "errors_total": errors_total,
+        "requests_in_flight": snapshot.get("in_flight", 0),
+        "requests_per_minute": round(snapshot.get("window", {}).get("rpm", 0.0), 1),
+        "p50_response_ms": round(window.quantile(0.50) * 1000, 1),
+        "p95_response_ms": round(window.quantile(0.95) * 1000, 1),
+        "p99_response_ms": round(window.quantile(0.99) * 1000, 1),
+        "workers": snapshot.get("workers", 1),
+    }
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(snapshot: dict) -> str:
+    """Prometheus text exposition (format 0.0.4) for a (possibly merged) snapshot."""
+    lines = [
+        "# HELP nps_http_requests_total HTTP requests by method, route and status.",
+        "# TYPE nps_http_requests_total counter",
+    ]
+    histograms = []
+    for method, route, status, data in snapshot.get("series", []):
+        labels = f'method="{_label(method)}",route="{_label(route)}",status="{status}"'
+        lines.append(f"nps_http_requests_total{{{labels}}} {data.get('total', 0)}")
+        histograms.append((labels, LatencyHistogram.from_dict(data)))
+
+    lines += [
+        "# HELP nps_http_request_duration_seconds HTTP request latency.",
+        "# TYPE nps_http_request_duration_seconds histogram",
+    ]
+    for labels, hist in histograms:
+        for le in PROMETHEUS_BUCKETS:
+            lines.append(
+                f'nps_http_request_duration_seconds_bucket{{{labels},le="{le}"}} '
+                f"{hist.count_le(le)}"
+            )
+        lines.append(f'nps_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {hist.total}')
+        lines.append(f"nps_http_request_duration_seconds_sum{{{labels}}} {hist.sum_us / 1e6}")
+        lines.append(f"nps_http_request_duration_seconds_count{{{labels}}} {hist.total}")
+
+    summary = performance_summary(snapshot)
+    lines += [
+        "# HELP nps_http_requests_in_flight HTTP requests currently being served.",
+        "# TYPE nps_http_requests_in_flight gauge",
+        f"nps_http_requests_in_flight {summary['requests_in_flight']}",
+        "# HELP nps_process_uptime_seconds Seconds since the (earliest) worker started.",
+        "# TYPE nps_process_uptime_seconds gauge",
+        f"nps_process_uptime_seconds {summary['uptime_seconds']}",
+        "# HELP nps_metrics_workers Workers included in these metrics.",
+        "# TYPE nps_metrics_workers gauge",
+        f"nps_metrics_workers {summary['workers']}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+# ─── Cross-worker aggregation (Redis) ────────────────────────────────────────
+
+
+async def push_snapshot(redis, metrics: "RequestMetrics") -> None:
+    """Publish this worker's snapshot to the shared Redis hash."""
+    await redis.hset(REDIS_KEY, metrics.worker_id, json.dumps(metrics.snapshot()))
+
+
+async def collect_snapshots(redis, metrics: "RequestMetrics", interval: float) -> list[dict]:
+    """Fresh snapshots of every worker, with this worker's taken live.
+
+    Entries not refreshed within ``STALE_AFTER_INTERVALS`` pushes (exited
+    workers) are removed from the hash.
+    """
+    own = metrics.snapshot()
+    snapshots = [own]
+    cutoff = time.time() - interval * STALE_AFTER_INTERVALS
+    stale = []
+    for worker, raw in (await redis.hgetall(REDIS_KEY)).items():
+        if isinstance(worker, bytes):
+            worker = worker.decode()
+        if worker == own["worker"]:
+            continue
+        try:
+            snap = json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            stale.append(worker)
+            continue
+        if snap.get("at", 0) < cutoff:
+            stale.append(worker)
+        else:
+            snapshots.append(snap)
+    if stale:
+        await redis.hdel(REDIS_KEY, *stale)
+    return snapshots
+
+
+async def current_snapshot(redis, metrics: "RequestMetrics", mode: str, interval: float) -> dict:
+    """This worker's snapshot, or all workers merged in Redis mode (local fallback)."""
+    if mode == "redis" and redis is not None:
+        try:
+            return merge_snapshots(await collect_snapshots(redis, metrics, interval))
+        except Exception as exc:
+            logger.warning("Metrics aggregation via Redis failed, reporting local: %s", exc)
+    return merge_snapshots([metrics.snapshot()])
+
+
+class MetricsPusher:
+    """Background task pushing the local snapshot to Redis every ``interval`` seconds."""
+
+    def __init__(self, redis, metrics: "RequestMetrics", interval: float) -> None:
+        self._redis = redis
+        self._metrics = metrics
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        try:
+            await self._redis.hdel(REDIS_KEY, self._metrics.worker_id)
+        except Exception:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await push_snapshot(self._redis, self._metrics)
+            except Exception as exc:
+                logger.debug("Metrics push failed: %s", exc)
+            await asyncio.sleep(self._interval)
+
+
+# Process-wide registry used by MetricsMiddleware and the health endpoints
+request_metrics = RequestMetrics()
+
+
+def get_request_metrics() -> RequestMetrics:
+    return request_metrics
@@ -1,9 +1,13 @@
 """Translation service wrapper — API-level cache over T3-S3 translation engine."""
 
 import hashlib
+import json
 import logging
 import sys
+import threading
 import time
+import zlib
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -125,10 +129,7 @@ except ImportError as _err:
 
 _MAX_CACHE_ENTRIES = 1000
 _CACHE_TTL_SECONDS = 86400  # 24 hours
-
-_cache: dict[str, dict[str, Any]] = {}
-_cache_hits = 0
-_cache_misses = 0
+_REDIS_PREFIX = "translation:"
 
 
 def _cache_key(text: str, source_lang: str, target_lang: str) -> str:
@@ -136,25 +137,137 @@ def _cache_key(text: str, source_lang: str, target_lang: str) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
-def _evict_expired() -> None:
-    """Remove expired entries."""
-    now = time.monotonic()
-    expired = [k for k, v in _cache.items() if now - v["ts"] > _CACHE_TTL_SECONDS]
-    for k in expired:
-        del _cache[k]
+class _LocalLRU:
+    """Bounded in-process LRU with lazy TTL — O(1) get/put/evict.
+
+    Entries live in an OrderedDict ordered by last access; the least
+    recently used entry is always at the front. Expired entries are dropped
+    when they are looked up rather than by a periodic full scan.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            ts, value = entry
+            if time.monotonic() - ts > self.ttl_seconds:
+                del self._data[key]
+                self.expirations += 1
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: dict[str, Any], ts: float | None = None) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() if ts is None else ts, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.evictions = 0
+            self.expirations = 0
+
+
+class _RedisTier:
+    """Optional shared tier — zlib-compressed JSON values in Redis with TTL.
+
+    Uses a synchronous client because the translation endpoints run in the
+    threadpool. Any Redis error degrades to a miss; the local tier keeps
+    working on its own.
+    """
+
+    def __init__(self, client, ttl_seconds: int) -> None:  # noqa: ANN001
+        self._client = client
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.errors = 0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            raw = self._client.get(f"{_REDIS_PREFIX}{key}")
+        except Exception:
+            self.errors += 1
+            logger.debug("Translation cache Redis read failed", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        try:
+            value = json.loads(zlib.decompress(raw))
+        except (zlib.error, ValueError):
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        try:
+            self._client.setex(f"{_REDIS_PREFIX}{key}", self.ttl_seconds, payload)
+        except Exception:
+            self.errors += 1
+            logger.debug("Translation cache Redis write failed", exc_info=True)
+
+
+_cache = _LocalLRU(_MAX_CACHE_ENTRIES, _CACHE_TTL_SECONDS)
+_shared: _RedisTier | None = None
+_cache_hits = 0
+_cache_misses = 0
+_stats_lock = threading.Lock()
+
 
+def init_translation_redis(redis_client) -> None:  # noqa: ANN001
+    """Attach a synchronous Redis client as the shared cache tier.
+
+    Called from app startup. Pass None to detach.
+    """
+    global _shared
+    _shared = _RedisTier(redis_client, _CACHE_TTL_SECONDS) if redis_client is not None else None
+
+
+def _cache_get(key: str) -> dict[str, Any] | None:
+    """Look up a result: local tier first, then the shared tier."""
+    global _cache_hits, _cache_misses
+    result = _cache.get(key)
+    if result is None and _shared is not None:
+        result = _shared.get(key)
+        if result is not None:
+            _cache.put(key, result)
+    with _stats_lock:
+        if result is None:
+            _cache_misses += 1
+        else:
+            _cache_hits += 1
+    return result
 
-def _evict_lru() -> None:
-    """Evict oldest entries if over capacity."""
-    while len(_cache) >= _MAX_CACHE_ENTRIES:
-        oldest_key = min(_cache, key=lambda k: _cache[k]["ts"])
-        del _cache[oldest_key]
+
+def _cache_put(key: str, result: dict[str, Any]) -> None:
+    _cache.put(key, result)
+    if _shared is not None:
+        _shared.put(key, result)
 
 
 def reset_cache() -> None:
     """Clear all cached translations and reset counters."""
     global _cache_hits, _cache_misses
     _cache.clear()
+    if _shared is not None:
+        _shared.hits = 0
+        _shared.errors = 0
     _cache_hits = 0
     _cache_misses = 0
 
@@ -171,8 +284,6 @@ class TranslationService:
         Returns dict with keys: source_text, translated_text, source_lang,
         target_lang, preserved_terms, ai_generated, elapsed_ms, cached.
         """
-        global _cache_hits, _cache_misses
-
         # Same-language short-circuit
         if source_lang == target_lang:
             return {
@@ -189,14 +300,9 @@ class TranslationService:
         key = _cache_key(text, source_lang, target_lang)
 
         # Check cache
-        _evict_expired()
-        if key in _cache:
-            _cache_hits += 1
-            entry = _cache[key]
-            entry["ts"] = time.monotonic()  # refresh access time
-            return {**entry["result"], "cached": True}
-
-        _cache_misses += 1
+        cached = _cache_get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
 
         # Call T3-S3 engine
         start = time.monotonic()
@@ -208,8 +314,7 @@ class TranslationService:
         result_dict["cached"] = False
 
         # Cache result
-        _evict_lru()
-        _cache[key] = {"result": result_dict, "ts": time.monotonic()}
+        _cache_put(key, result_dict)
 
         return result_dict
 
@@ -236,18 +341,11 @@ class TranslationService:
         Returns dict with keys: source_text, translated_text, source_lang,
         target_lang, preserved_terms, ai_generated, elapsed_ms, cached.
         """
-        global _cache_hits, _cache_misses
-
         key = _cache_key(f"{reading_type}:{text}", source_lang, target_lang)
 
-        _evict_expired()
-        if key in _cache:
-            _cache_hits += 1
-            entry = _cache[key]
-            entry["ts"] = time.monotonic()
-            return {**entry["result"], "cached": True}
-
-        _cache_misses += 1
+        cached = _cache_get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
 
         start = time.monotonic()
         result = _translate_reading(text, reading_type, source_lang, target_lang)
@@ -257,8 +355,7 @@ class TranslationService:
         result_dict["elapsed_ms"] = round(elapsed_ms, 1)
         result_dict["cached"] = False
 
-        _evict_lru()
-        _cache[key] = {"result": result_dict, "ts": time.monotonic()}
+        _cache_put(key, result_dict)
 
         return result_dict
 
@@ -270,21 +367,56 @@ class TranslationService:
     ) -> list[dict]:
         """Translate multiple texts at once.
 
-        Returns list of dicts with translation results.
+        Identical texts are translated once, and texts already in the cache
+        are not sent to the engine. If the engine returns the wrong number of
+        results, the texts are translated one by one instead.
+
+        Returns list of dicts with translation results, in input order.
         """
         if not texts:
             return []
 
-        results = _batch_translate(texts, source_lang, target_lang)
-        return [{**r.to_dict(), "cached": False} for r in results]
+        unique = list(dict.fromkeys(texts))
+        keys = {t: _cache_key(t, source_lang, target_lang) for t in unique}
+        by_text: dict[str, dict] = {}
+        pending: list[str] = []
+        for t in unique:
+            cached = _cache_get(keys[t])
+            if cached is not None:
+                by_text[t] = {**cached, "cached": True}
+            else:
+                pending.append(t)
+
+        if pending:
+            results = _batch_translate(pending, source_lang, target_lang)
+            if len(results) == len(pending):
+                for t, r in zip(pending, results):
+                    result_dict = {**r.to_dict(), "cached": False}
+                    _cache_put(keys[t], result_dict)
+                    by_text[t] = result_dict
+            else:
+                # Results can't be matched to inputs; translate each one instead
+                logger.warning(
+                    "Batch translation returned %d results for %d texts — translating per item",
+                    len(results),
+                    len(pending),
+                )
+                for t in pending:
+                    by_text[t] = self.translate(t, source_lang, target_lang)
+
+        return [by_text[t] for t in texts]
 
     def get_cache_stats(self) -> dict:
         """Return cache statistics."""
-        _evict_expired()
         return {
             "total_entries": len(_cache),
             "max_entries": _MAX_CACHE_ENTRIES,
             "hit_count": _cache_hits,
             "miss_count": _cache_misses,
             "ttl_seconds": _CACHE_TTL_SECONDS,
+            "eviction_count": _cache.evictions,
+            "expired_count": _cache.expirations,
+            "shared_tier": "redis" if _shared is not None else None,
+            "shared_hit_count": _shared.hits if _shared is not None else 0,
+            "shared_error_count": _shared.errors if _shared is not None else 0,
         }
@@ -78,10 +78,13 @@ def override_get_encryption_service_none():
 
 @pytest.fixture(autouse=True)
 def setup_database():
-    """Create all tables before each test and drop after. Also reset rate limiter."""
+    """Create all tables before each test and drop after. Also reset rate limiter
+    and the in-memory profile index (ids are reused across tests)."""
     from app.middleware.rate_limit import _limiter
+    from app.services.profile_index import reset_profile_index
 
     _limiter._requests.clear()
+    reset_profile_index()
     Base.metadata.create_all(bind=test_engine)
     yield
     Base.metadata.drop_all(bind=test_engine)
@@ -0,0 +1,170 @@
+"""Tests for admission control — CoDel-style queueing, degrade, then 503."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import admission as admission_module
+from app.services.admission import AdmissionController
+
+_NAME_V2 = "app.services.oracle_reading.OracleReadingService.get_name_reading_v2"
+
+
+def _name_result() -> dict:
+    return {
+        "name": "Alice",
+        "detected_script": "latin",
+        "numerology_system": "pythagorean",
+        "expression": 8,
+        "soul_urge": 9,
+        "personality": 8,
+        "ai_interpretation": "Framework synthesis.",
+        "letter_breakdown": [],
+    }
+
+
+@pytest.fixture
+def name_controller():
+    """Install a small controller for the /name route, restore afterwards."""
+    controller = AdmissionController("name", max_concurrency=1, max_queue=0, degrade_concurrency=1)
+    admission_module._controllers["name"] = controller
+    yield controller
+    admission_module.reset_admission_controllers()
+
+
+# ─── Controller ─────────────────────────────────────────────────────────────
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_free_slot_admits_full(self):
+        controller = AdmissionController("t", max_concurrency=2)
+        async with controller.admit() as ticket:
+            assert ticket.degraded is False
+            assert controller.stats()["in_flight"] == 1
+        assert controller.stats()["in_flight"] == 0
+        assert controller.stats()["admitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_gets_slot_within_interval(self):
+        controller = AdmissionController("t", max_concurrency=1, interval_ms=500)
+        order: list[str] = []
+
+        async def hold():
+            async with controller.admit():
+                await asyncio.sleep(0.05)
+                order.append("first")
+
+        async def wait():
+            async with controller.admit() as ticket:
+                order.append("second")
+                return ticket
+
+        first = asyncio.ensure_future(hold())
+        await asyncio.sleep(0)
+        ticket = await wait()
+        await first
+        assert order == ["first", "second"]
+        assert ticket.degraded is False
+        assert controller.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_degrades_then_rejects(self):
+        controller = AdmissionController("t", max_concurrency=1, max_queue=0, degrade_concurrency=1)
+        async with controller.admit():
+            async with controller.admit() as degraded:
+                assert degraded.degraded is True
+                with pytest.raises(HTTPException) as exc_info:
+                    async with controller.admit():
+                        pass
+        assert exc_info.value.status_code == 503
+        assert int(exc_info.value.headers["Retry-After"]) >= 1
+        stats = controller.stats()
+        assert (stats["admitted"], stats["degraded"], stats["rejected"]) == (1, 1, 1)
+        assert (stats["in_flight"], stats["degraded_in_flight"]) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_wait_budget_expires_into_degraded(self):
+        controller = AdmissionController("t", max_concurrency=1, interval_ms=20)
+        async with controller.admit():
+            async with controller.admit() as ticket:
+                assert ticket.degraded is True
+        assert controller.stats()["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_standing_queue_with_high_latency_sheds_immediately(self):
+        controller = AdmissionController(
+            "t", max_concurrency=1, interval_ms=200, target_ms=1000, degrade_latency_ms=50
+        )
+        controller._latency_ms = 500.0  # recent full requests are slow
+        async with controller.admit():
+            waiter = asyncio.ensure_future(controller.admit().__aenter__())
+            await asyncio.sleep(0)
+            controller._last_empty -= 1.0  # queue has not drained for a whole interval
+            assert controller.overloaded()
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            async with controller.admit() as ticket:
+                assert ticket.degraded is True
+            assert loop.time() - start < 0.5  # did not wait target_ms
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+    @pytest.mark.asyncio
+    async def test_disabled_controller_never_sheds(self):
+        controller = AdmissionController("t", enabled=False, max_concurrency=1, max_queue=0)
+        async with controller.admit():
+            async with controller.admit() as ticket:
+                assert ticket.degraded is False
+
+
+# ─── Configuration ──────────────────────────────────────────────────────────
+
+
+def test_route_overrides_from_settings():
+    from app.config import settings
+
+    admission_module.reset_admission_controllers()
+    with (
+        patch.object(settings, "admission_max_concurrency", 7),
+        patch.object(settings, "admission_route_overrides", '{"question": {"max_concurrency": 2}}'),
+    ):
+        assert admission_module.get_admission_controller("question").max_concurrency == 2
+        assert admission_module.get_admission_controller("name").max_concurrency == 7
+    admission_module.reset_admission_controllers()
+
+
+# ─── Endpoints ──────────────────────────────────────────────────────────────
+
+
+class TestAdmissionEndpoints:
+    @pytest.mark.asyncio
+    async def test_overloaded_route_returns_degraded_reading(self, client, name_controller):
+        with patch(_NAME_V2, new_callable=MagicMock, return_value=_name_result()) as name_v2:
+            async with name_controller.admit():  # saturate full capacity
+                resp = await client.post("/api/oracle/name", json={"name": "Alice"})
+        assert resp.status_code == 200
+        assert resp.json()["degraded"] is True
+        assert name_v2.call_args.kwargs["degraded"] is True
+
+    @pytest.mark.asyncio
+    async def test_exhausted_route_returns_503_with_retry_after(self, client, name_controller):
+        name_controller.degrade_concurrency = 0
+        with patch(_NAME_V2, new_callable=MagicMock, return_value=_name_result()) as name_v2:
+            async with name_controller.admit():
+                resp = await client.post("/api/oracle/name", json={"name": "Alice"})
+        assert resp.status_code == 503
+        assert int(resp.headers["retry-after"]) >= 1
+        name_v2.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_idle_route_runs_full_pipeline(self, client, name_controller):
+        with patch(_NAME_V2, new_callable=MagicMock, return_value=_name_result()) as name_v2:
+            resp = await client.post("/api/oracle/name", json={"name": "Alice"})
+        assert resp.status_code == 200
+        assert resp.json()["degraded"] is False
+        assert name_v2.call_args.kwargs["degraded"] is False
+        assert name_controller.stats()["in_flight"] == 0
@@ -0,0 +1,166 @@
+"""Tests for two-phase readings: deferred AI enrichment via the oracle_ai_jobs queue."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.orm.oracle_ai_job import OracleAIJob
+from app.orm.oracle_user import OracleUser
+from app.services.ai_jobs import AIEnrichmentError, AIJobQueue
+from tests.conftest import TestSession
+
+_GENERATE = "oracle_service.reading_orchestrator.ReadingOrchestrator.generate_time_reading"
+
+
+def _seed_user() -> int:
+    db = TestSession()
+    user = OracleUser(name="Test User", birthday=date(1990, 6, 15), mother_name="Mother")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def _framework_only_result() -> dict:
+    return {
+        "reading_type": "time",
+        "sign_value": "14:30:00",
+        "framework_result": {"fc60_stamp": {"fc60": "LU-OX-OXWA"}, "synthesis": "Fallback."},
+        "ai_interpretation": None,
+        "confidence": {"score": 72, "level": "high"},
+        "patterns": [],
+        "fc60_stamp": "LU-OX-OXWA",
+        "locale": "en",
+    }
+
+
+def _queue(interpret, **kwargs) -> AIJobQueue:
+    queue = AIJobQueue(interpret=interpret, retry_base_seconds=0, **kwargs)
+    queue.db_session_factory = TestSession
+    return queue
+
+
+async def _create_deferred(client) -> int:
+    user_id = _seed_user()
+    with (
+        patch(_GENERATE, new_callable=AsyncMock, return_value=_framework_only_result()) as gen,
+        patch("app.routers.oracle.ai_job_queue.notify") as notify,
+    ):
+        resp = await client.post(
+            "/api/oracle/readings",
+            json={"user_id": user_id, "sign_value": "14:30:00", "defer_ai": True},
+        )
+    assert resp.status_code == 200, resp.text
+    assert gen.call_args.kwargs["include_ai"] is False
+    notify.assert_called_once()
+    data = resp.json()
+    assert data["ai_status"] == "pending"
+    assert data["ai_interpretation"] is None
+    return data["id"]
+
+
+class TestDeferredReading:
+    @pytest.mark.asyncio
+    async def test_post_returns_pending_and_queues_job(self, client):
+        reading_id = await _create_deferred(client)
+        db = TestSession()
+        job = db.query(OracleAIJob).filter(OracleAIJob.reading_id == reading_id).one()
+        assert job.status == "pending"
+        assert job.payload["notify_user_id"] == "test-user-id"
+        db.close()
+
+        resp = await client.get(f"/api/oracle/readings/{reading_id}")
+        assert resp.json()["ai_status"] == "pending"
+
+    @pytest.mark.asyncio
+    async def test_sync_readings_have_no_ai_status(self, client):
+        user_id = _seed_user()
+        result = _framework_only_result()
+        result["ai_interpretation"] = {"full_text": "Now."}
+        with patch(_GENERATE, new_callable=AsyncMock, return_value=result):
+            resp = await client.post(
+                "/api/oracle/readings", json={"user_id": user_id, "sign_value": "14:30:00"}
+            )
+        reading_id = resp.json()["id"]
+        assert resp.json()["ai_status"] is None
+        resp = await client.get(f"/api/oracle/readings/{reading_id}")
+        assert resp.json()["ai_status"] is None
+        assert resp.json()["ai_interpretation"] == "Now."
+
+
+class TestAIJobWorker:
+    @pytest.mark.asyncio
+    async def test_worker_fills_interpretation_and_pushes(self, client):
+        reading_id = await _create_deferred(client)
+        interpret = AsyncMock(return_value={"full_text": "Deferred AI text.", "ai_generated": True})
+        queue = _queue(interpret)
+
+        with patch(
+            "app.services.websocket_manager.ws_manager.send_to_user", new_callable=AsyncMock
+        ) as send:
+            assert await queue.run_pending() == 1
+            assert await queue.run_pending() == 0
+
+        framework_output, payload = interpret.call_args.args
+        assert framework_output["fc60_stamp"]["fc60"] == "LU-OX-OXWA"
+        assert payload["locale"] == "en"
+        user, event, data = send.call_args.args
+        assert (user, event, data["reading_id"]) == ("test-user-id", "reading_ai_ready", reading_id)
+
+        resp = await client.get(f"/api/oracle/readings/{reading_id}")
+        body = resp.json()
+        assert body["ai_status"] == "complete"
+        assert body["ai_interpretation"] == "Deferred AI text."
+        assert queue.stats["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_then_dead_letter_stores_fallback(self, client):
+        reading_id = await _create_deferred(client)
+        interpret = AsyncMock(
+            side_effect=AIEnrichmentError("model down", {"full_text": "Fallback."})
+        )
+        queue = _queue(interpret)
+
+        with patch(
+            "app.services.websocket_manager.ws_manager.send_to_user", new_callable=AsyncMock
+        ) as send:
+            for _ in range(3):  # max_attempts defaults to 3
+                assert await queue.run_pending() == 1
+            assert await queue.run_pending() == 0
+
+        assert interpret.await_count == 3
+        assert queue.stats == {"completed": 0, "retried": 2, "dead_lettered": 1}
+        assert send.call_args.args[1] == "reading_ai_failed"
+
+        db = TestSession()
+        job = db.query(OracleAIJob).filter(OracleAIJob.reading_id == reading_id).one()
+        assert job.status == "dead"
+        assert job.attempts == 3
+        assert "model down" in job.last_error
+        db.close()
+
+        body = (await client.get(f"/api/oracle/readings/{reading_id}")).json()
+        assert body["ai_status"] == "failed"
+        assert body["ai_interpretation"] == "Fallback."
+
+    @pytest.mark.asyncio
+    async def test_backoff_delays_retry(self, client):
+        await _create_deferred(client)
+        queue = AIJobQueue(interpret=AsyncMock(side_effect=RuntimeError("boom")))
+        queue.db_session_factory = TestSession  # default 5s backoff
+
+        assert await queue.run_pending() == 1
+        assert await queue.run_pending() == 0  # not yet available
+
+    @pytest.mark.asyncio
+    async def test_claim_is_exclusive(self, client):
+        reading_id = await _create_deferred(client)
+        db = TestSession()
+        job_id = db.query(OracleAIJob.id).filter(OracleAIJob.reading_id == reading_id).scalar()
+        now = datetime.now(timezone.utc)
+        assert AIJobQueue._claim(db, job_id, now) is True
+        assert AIJobQueue._claim(db, job_id, now) is False
+        db.commit()
+        db.close()
@@ -275,3 +275,163 @@ async def test_section_feedback_aggregation(client):
     # 2 out of 3 marked advice as helpful
     assert "advice" in data["section_helpful_pct"]
     assert abs(data["section_helpful_pct"]["advice"] - 0.67) < 0.02
+
+
+# ─── Learner recalculation (SQL aggregation, incremental watermark) ─────────
+
+
+def _learner():
+    from services.oracle.oracle_service.engines import learner
+
+    return learner
+
+
+def _add_feedback(db, rating: int, sections: dict | str | None = None, sign_type="time") -> int:
+    from app.orm.oracle_feedback import OracleReadingFeedback
+
+    reading = OracleReading(question="q", sign_type=sign_type, sign_value="x")
+    db.add(reading)
+    db.flush()
+    row = OracleReadingFeedback(reading_id=reading.id, rating=rating, section_feedback=sections)
+    db.add(row)
+    db.commit()
+    return row.id
+
+
+def _backdate_feedback(db):
+    """Move feedback timestamps before the next watermark (SQLite has 1s resolution)."""
+    from sqlalchemy import text
+
+    db.execute(text("UPDATE oracle_reading_feedback SET updated_at = '2000-01-01 00:00:00'"))
+    db.commit()
+
+
+def _metrics(db) -> dict:
+    from app.orm.oracle_feedback import OracleLearningData
+
+    return {
+        row.metric_key: (round(row.metric_value, 6), row.sample_count)
+        for row in db.query(OracleLearningData).all()
+    }
+
+
+def test_recalculate_aggregates_in_sql():
+    learner = _learner()
+    db = TestSession()
+    try:
+        _add_feedback(db, 5, {"advice": "helpful", "caution": "not_helpful"})
+        _add_feedback(db, 3, {"advice": "not_helpful"}, sign_type="name")
+        _add_feedback(db, 4, '{"advice": "helpful"}')  # legacy JSON string
+        _add_feedback(db, 2)
+
+        result = learner.recalculate_learning_metrics(db)
+        db.commit()
+        assert result["mode"] == "full"
+        assert result["total_feedback"] == 4
+        metrics = _metrics(db)
+        assert metrics["avg_rating:overall"] == (3.5, 4)
+        assert metrics["avg_rating:time"] == (round(11 / 3, 6), 3)
+        assert metrics["avg_rating:name"] == (3.0, 1)
+        assert metrics["section_helpful:advice"] == (round(2 / 3, 6), 3)
+        assert metrics["section_helpful:caution"] == (0.0, 1)
+        assert metrics[learner.WATERMARK_KEY][1] == 4
+    finally:
+        db.close()
+
+
+def test_recalculate_incremental_matches_full():
+    learner = _learner()
+    db = TestSession()
+    try:
+        for rating in (5, 4, 2):
+            _add_feedback(db, rating, {"advice": "helpful" if rating > 3 else "not_helpful"})
+        _backdate_feedback(db)
+        learner.recalculate_learning_metrics(db)
+        db.commit()
+
+        _add_feedback(db, 1, {"advice": "not_helpful", "caution": "helpful"}, sign_type="name")
+        _add_feedback(db, 5, {"advice": "helpful"})
+        result = learner.recalculate_learning_metrics(db, incremental=True)
+        db.commit()
+        assert (result["mode"], result["folded"]) == ("incremental", 2)
+        incremental = _metrics(db)
+
+        learner.recalculate_learning_metrics(db)
+        db.commit()
+        full = _metrics(db)
+        for key, value in full.items():
+            assert incremental[key] == pytest.approx(value), key
+
+        # Nothing new: still incremental, nothing folded
+        _backdate_feedback(db)
+        learner.recalculate_learning_metrics(db)
+        db.commit()
+        result = learner.recalculate_learning_metrics(db, incremental=True)
+        assert (result["mode"], result["folded"]) == ("incremental", 0)
+    finally:
+        db.close()
+
+
+def test_recalculate_incremental_falls_back_when_feedback_changes():
+    from app.orm.oracle_feedback import OracleReadingFeedback
+
+    learner = _learner()
+    db = TestSession()
+    try:
+        first = _add_feedback(db, 5)
+        _add_feedback(db, 3)
+        _backdate_feedback(db)
+        learner.recalculate_learning_metrics(db)
+        db.commit()
+
+        db.get(OracleReadingFeedback, first).rating = 1  # ORM update bumps updated_at
+        db.commit()
+        result = learner.recalculate_learning_metrics(db, incremental=True)
+        db.commit()
+        assert result["mode"] == "full"
+        assert _metrics(db)["avg_rating:overall"] == (2.0, 2)
+
+        _backdate_feedback(db)
+        learner.recalculate_learning_metrics(db)
+        db.commit()
+        db.delete(db.get(OracleReadingFeedback, first))
+        db.commit()
+        result = learner.recalculate_learning_metrics(db, incremental=True)
+        assert result["mode"] == "full"
+        assert _metrics(db)["avg_rating:overall"] == (3.0, 1)
+    finally:
+        db.close()
+
+
+@pytest.mark.asyncio
+async def test_prompt_emphasis_cached_until_feedback(client):
+    learner = _learner()
+    learner.invalidate_prompt_cache()
+    db = TestSession()
+    try:
+        for _ in range(5):
+            _add_feedback(db, 5, {"advice": "helpful"})
+        learner.recalculate_learning_metrics(db)
+        emphasis = learner.generate_prompt_emphasis(db)
+        db.commit()
+        assert "Emphasize practical, actionable advice in your interpretations." in emphasis
+        assert "actionable advice" in learner.get_prompt_context(db)
+
+        # A cache hit does not touch the database
+        db.close()
+        assert learner.generate_prompt_emphasis(None) == emphasis
+        assert learner.get_prompt_context(None).startswith("=== LEARNED USER PREFERENCES ===")
+
+        reading_id = _create_reading(db)
+    finally:
+        db.close()
+
+    resp = await client.post(
+        f"/api/learning/oracle/readings/{reading_id}/feedback", json={"rating": 2}
+    )
+    assert resp.status_code == 201
+    assert learner._cached_prompt("emphasis") is None
+
+    resp = await client.post("/api/learning/oracle/recalculate?incremental=true")
+    assert resp.status_code == 200
+    assert resp.json()["active_prompt_adjustments"] == emphasis
@@ -79,6 +79,10 @@ async def test_performance_stats(client):
     assert resp.status_code == 200
     data = resp.json()
     assert "uptime_seconds" in data
+    scheduler = data["scheduler"]
+    assert set(scheduler) == {"framework", "ai"}
+    assert set(scheduler["ai"]["classes"]) == {"interactive", "bot", "batch"}
+    assert "wait_ms_p99" in scheduler["framework"]["classes"]["batch"]
 
 
 # ─── Admin: /health/detailed ────────────────────────────────────────────────
@@ -394,3 +394,156 @@ def test_coordinates_static_fallback():
     assert result is not None
     assert abs(result["latitude"] - 35.6892) < 0.1
     assert result["cached"] is False
+
+
+# ─── Nearest city (offline reverse geocoding) ────────────────────────────────
+
+NEAREST_URL = "/api/location/nearest"
+
+
+def test_nearest_city_matches_brute_force():
+    """Grid index returns the same k nearest cities as a full scan."""
+    from app.services.location_service import _CITIES, _haversine_km
+
+    svc = LocationService()
+    points = [(35.7, 51.4), (40.7, -74.0), (-33.9, 151.2), (64.1, -21.9), (0.0, 179.9)]
+    for lat, lon in points:
+        expected = sorted(
+            _haversine_km(lat, lon, c["latitude"], c["longitude"])
+            for cities in _CITIES.values()
+            for c in cities
+        )[:3]
+        got = [c["distance_km"] for c in svc.nearest_city(lat, lon, k=3)]
+        assert got == [round(d, 3) for d in expected]
+
+
+def test_nearest_city_no_network():
+    """Reverse lookup never touches Nominatim."""
+    svc = LocationService()
+    with patch("app.services.location_service.httpx.Client") as MockClient:
+        result = svc.nearest_city(35.69, 51.39)
+        MockClient.assert_not_called()
+    assert result[0]["name"] == "Tehran"
+    assert result[0]["country_code"] == "IR"
+
+
+def test_nearest_cities_batch():
+    svc = LocationService()
+    results = svc.nearest_cities([(35.69, 51.39), (32.65, 51.67)], k=2, lang="fa")
+    assert len(results) == 2
+    assert results[0][0]["name"] == "تهران"
+    assert results[1][0]["name"] == "اصفهان"
+    assert all(len(r) == 2 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_nearest_endpoint(client):
+    resp = await client.get(NEAREST_URL, params={"lat": 35.69, "lon": 51.39, "k": 3})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total"] == 3
+    distances = [c["distance_km"] for c in data["cities"]]
+    assert distances == sorted(distances)
+    assert data["cities"][0]["timezone"] == "Asia/Tehran"
+
+
+@pytest.mark.asyncio
+async def test_nearest_endpoint_invalid_lat_422(client):
+    resp = await client.get(NEAREST_URL, params={"lat": 95, "lon": 0})
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_nearest_batch_endpoint(client):
+    resp = await client.post(
+        f"{NEAREST_URL}/batch",
+        json={"coordinates": [{"latitude": 35.69, "longitude": 51.39}], "k": 1},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total"] == 1
+    assert data["results"][0]["cities"][0]["name"] == "Tehran"
+
+
+# ─── Timezone lookup (shared finder + per-point memo) ────────────────────────
+
+
+class _CountingFinder:
+    def __init__(self):
+        self.calls = 0
+
+    def timezone_at(self, lat, lng):
+        self.calls += 1
+        return "Asia/Tehran" if lng > 40 else "Europe/London"
+
+
+def test_get_timezone_memoizes_repeated_points(monkeypatch):
+    from app.services import location_service
+
+    finder = _CountingFinder()
+    monkeypatch.setattr(location_service, "_tz_finder", finder)
+    assert location_service._get_timezone(35.6892, 51.3890) == "Asia/Tehran"
+    assert location_service._get_timezone(35.6892, 51.3890) == "Asia/Tehran"
+    assert finder.calls == 1
+    assert location_service._get_timezone(51.5, -0.12) == "Europe/London"
+    assert finder.calls == 2
+
+
+def test_get_timezone_resolves_the_requested_point(monkeypatch):
+    """Nearby points across a zone boundary resolve to their own zones."""
+    from app.services import location_service
+
+    class BoundaryFinder:
+        def timezone_at(self, lat, lng):
+            return "Asia/Kabul" if lng >= 60.5042 else "Asia/Tehran"
+
+    monkeypatch.setattr(location_service, "_tz_finder", BoundaryFinder())
+    assert location_service._get_timezone(33.0, 60.5038) == "Asia/Tehran"
+    assert location_service._get_timezone(33.0, 60.5046) == "Asia/Kabul"
+
+
+def test_get_timezone_failure_is_not_cached(monkeypatch):
+    from app.services import location_service
+
+    class FlakyFinder(_CountingFinder):
+        def timezone_at(self, lat, lng):
+            self.calls += 1
+            if self.calls == 1:
+                raise OSError("polygon file busy")
+            return "Asia/Tehran"
+
+    finder = FlakyFinder()
+    monkeypatch.setattr(location_service, "_tz_finder", finder)
+    assert location_service._get_timezone(35.6892, 51.389) is None
+    assert location_service._get_timezone(35.6892, 51.389) == "Asia/Tehran"
+    assert location_service._get_timezone(35.6892, 51.389) == "Asia/Tehran"
+    assert finder.calls == 2  # the failure was retried, the success memoized
+
+
+def test_timezone_finder_created_once(monkeypatch):
+    from app.services import location_service
+
+    created = []
+
+    class FakeFinder(_CountingFinder):
+        def __init__(self, in_memory=False):
+            super().__init__()
+            created.append(in_memory)
+
+    monkeypatch.setattr(location_service, "_tz_finder", None)
+    with patch("timezonefinder.TimezoneFinder", FakeFinder):
+        location_service._get_timezone(10.0, 50.0)
+        location_service._get_timezone(20.0, 60.0)
+        assert location_service.preload_timezone_finder() is False
+    assert created == [False]
+
+
+def test_timezones_for_batch(monkeypatch):
+    from app.services import location_service
+
+    finder = _CountingFinder()
+    monkeypatch.setattr(location_service, "_tz_finder", finder)
+    svc = LocationService()
+    result = svc.timezones_for([(35.6892, 51.389), (51.5, -0.12), (35.6892, 51.389)])
+    assert result == ["Asia/Tehran", "Europe/London", "Asia/Tehran"]
+    assert finder.calls == 2
@@ -249,3 +249,33 @@ class TestQuestionReadingEndpoint:
             data = resp.json()
             assert "confidence" in data
             assert data["confidence"]["score"] == 65
+
+
+# ─── Work-scheduler priority ────────────────────────────────────────────────
+
+
+class TestReadingPriority:
+    @staticmethod
+    def _recording_name_reading(seen: list):
+        from oracle_service.work_scheduler import current_priority
+
+        def fake(*args, **kwargs):
+            seen.append(current_priority())
+            return _mock_name_result()
+
+        return fake
+
+    @pytest.mark.anyio
+    async def test_priority_header_reaches_scheduled_work(self, client):
+        seen: list[str] = []
+        with patch(
+            "app.services.oracle_reading.OracleReadingService.get_name_reading_v2",
+            side_effect=self._recording_name_reading(seen),
+        ):
+            resp = await client.post(
+                "/api/oracle/name", json={"name": "Alice"}, headers={"X-NPS-Priority": "bot"}
+            )
+            assert resp.status_code == 200
+            resp = await client.post("/api/oracle/name", json={"name": "Alice"})
+            assert resp.status_code == 200
+        assert seen == ["bot", "interactive"]
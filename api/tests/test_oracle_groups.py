@@ -0,0 +1,194 @@
+"""Tests for persistent groups — /api/oracle/groups incremental compatibility."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.config import settings
+from app.orm.oracle_group import OracleGroup, OracleGroupMember, OracleGroupPair
+from app.orm.oracle_user import OracleUser
+from tests.conftest import TestSession
+
+GROUPS_URL = "/api/oracle/groups"
+MOMENT = "2026-03-01T12:30:00+00:00"
+
+_BIRTHDAYS = [
+    date(1990, 6, 15),
+    date(1985, 12, 1),
+    date(1978, 3, 22),
+    date(2001, 9, 9),
+    date(1969, 1, 30),
+]
+
+
+def _create_users(count: int, created_by: str = "test-user-id") -> list[int]:
+    db = TestSession()
+    users = [
+        OracleUser(
+            name=f"Member {i}",
+            birthday=_BIRTHDAYS[i],
+            mother_name="Mother",
+            created_by=created_by,
+        )
+        for i in range(count)
+    ]
+    db.add_all(users)
+    db.commit()
+    ids = [u.id for u in users]
+    db.close()
+    return ids
+
+
+async def _create_group(client, user_ids: list[int]) -> dict:
+    resp = await client.post(
+        GROUPS_URL, json={"name": "Book club", "user_ids": user_ids, "date": MOMENT}
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+def _pair_rows(group_id: int) -> dict:
+    db = TestSession()
+    rows = db.query(OracleGroupPair).filter(OracleGroupPair.group_id == group_id).all()
+    pairs = {(r.member_a, r.member_b): r.score for r in rows}
+    db.close()
+    return pairs
+
+
+def _comparable(analysis: dict) -> tuple:
+    return (
+        sorted(analysis["members"]),
+        analysis["pair_count"],
+        analysis["group_harmony_score"],
+        analysis["group_element_balance"],
+        analysis["group_summary"],
+    )
+
+
+class TestGroupLifecycle:
+    @pytest.mark.asyncio
+    async def test_create_group(self, client):
+        ids = _create_users(3)
+        data = await _create_group(client, ids)
+
+        assert data["members"] == ids
+        assert data["member_count"] == 3
+        assert data["pair_count"] == 3
+        assert 0.0 <= data["group_harmony_score"] <= 1.0
+        assert sum(data["group_element_balance"].values()) == 3
+        assert len(data["strongest_pairs"]) == 3
+        assert data["reading_moment"].startswith("2026-03-01T12:30:00")
+
+    @pytest.mark.asyncio
+    async def test_join_matches_full_recompute(self, client):
+        ids = _create_users(4)
+        group = await _create_group(client, ids[:3])
+
+        resp = await client.post(f"{GROUPS_URL}/{group['id']}/members", json={"user_id": ids[3]})
+        assert resp.status_code == 200, resp.text
+        joined = resp.json()
+
+        assert joined["member_count"] == 4
+        assert _comparable(joined) == _comparable(await _create_group(client, ids))
+
+    @pytest.mark.asyncio
+    async def test_leave_matches_full_recompute(self, client):
+        ids = _create_users(4)
+        group = await _create_group(client, ids)
+
+        resp = await client.delete(f"{GROUPS_URL}/{group['id']}/members/{ids[1]}")
+        assert resp.status_code == 200, resp.text
+        remaining = [ids[0], ids[2], ids[3]]
+        assert _comparable(resp.json()) == _comparable(await _create_group(client, remaining))
+
+    @pytest.mark.asyncio
+    async def test_join_and_leave_only_touch_that_members_pairs(self, client):
+        ids = _create_users(4)
+        group = await _create_group(client, ids[:3])
+        before = _pair_rows(group["id"])
+        assert len(before) == 3
+
+        await client.post(f"{GROUPS_URL}/{group['id']}/members", json={"user_id": ids[3]})
+        joined = _pair_rows(group["id"])
+        added = {pair: score for pair, score in joined.items() if pair not in before}
+        assert set(added) == {(uid, ids[3]) for uid in ids[:3]}
+        assert {pair: joined[pair] for pair in before} == before
+
+        await client.delete(f"{GROUPS_URL}/{group['id']}/members/{ids[0]}")
+        assert _pair_rows(group["id"]) == {
+            pair: score for pair, score in joined.items() if ids[0] not in pair
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_reads_stored_state_without_readings(self, client):
+        ids = _create_users(3)
+        group = await _create_group(client, ids)
+
+        with patch(
+            "oracle_service.group_compatibility.member_comparison",
+            side_effect=AssertionError("no framework readings on GET"),
+        ):
+            resp = await client.get(f"{GROUPS_URL}/{group['id']}", params={"top_k": 1})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert _comparable(data) == _comparable(group)
+        assert len(data["strongest_pairs"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_group(self, client):
+        group = await _create_group(client, _create_users(2))
+        resp = await client.delete(f"{GROUPS_URL}/{group['id']}")
+        assert resp.status_code == 204
+        assert (await client.get(f"{GROUPS_URL}/{group['id']}")).status_code == 404
+        assert _pair_rows(group["id"]) == {}
+        db = TestSession()
+        assert db.query(OracleGroupMember).filter_by(group_id=group["id"]).count() == 0
+        db.close()
+
+
+class TestGroupErrors:
+    @pytest.mark.asyncio
+    async def test_duplicate_member_rejected(self, client):
+        ids = _create_users(2)
+        group = await _create_group(client, ids)
+        resp = await client.post(f"{GROUPS_URL}/{group['id']}/members", json={"user_id": ids[0]})
+        assert resp.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_remove_non_member_is_404(self, client):
+        group = await _create_group(client, _create_users(2))
+        resp = await client.delete(f"{GROUPS_URL}/{group['id']}/members/9999")
+        assert resp.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_rejected(self, client):
+        resp = await client.post(GROUPS_URL, json={"name": "Ghosts", "user_ids": [9999]})
+        assert resp.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_member_limit(self, client):
+        ids = _create_users(3)
+        group = await _create_group(client, ids[:2])
+        with patch.object(settings, "oracle_group_max_members", 2):
+            resp = await client.post(
+                f"{GROUPS_URL}/{group['id']}/members", json={"user_id": ids[2]}
+            )
+        assert resp.status_code == 422
+        assert "Maximum 2" in resp.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_other_accounts_cannot_see_group(self, readonly_client):
+        db = TestSession()
+        group = OracleGroup(
+            name="Private",
+            created_by="test-user-id",
+            reading_moment=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        )
+        db.add(group)
+        db.commit()
+        group_id = group.id
+        db.close()
+
+        resp = await readonly_client.get(f"{GROUPS_URL}/{group_id}")
+        assert resp.status_code == 404
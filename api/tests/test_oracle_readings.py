@@ -7,6 +7,7 @@ QUESTION_URL = "/api/oracle/question"
 NAME_URL = "/api/oracle/name"
 DAILY_URL = "/api/oracle/daily"
 RANGE_URL = "/api/oracle/suggest-range"
+TIMING_PLAN_URL = "/api/oracle/timing/plan"
 READINGS_URL = "/api/oracle/readings"
 
 
@@ -130,6 +131,38 @@ async def test_daily_insight_readonly_allowed(readonly_client):
     assert resp.status_code == 200
 
 
+# ─── GET /timing/plan ────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_timing_plan(client):
+    resp = await client.get(
+        TIMING_PLAN_URL, params={"start": "2026-03-01", "days": 90, "window_hours": 2}
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["start"] == "2026-03-01"
+    assert len(data["days"]) == 90
+    assert len(data["heatmap"]) == 90
+    assert all(len(row) == 24 for row in data["heatmap"])
+    assert len(data["windows"]) == 10
+    best = data["windows"][0]
+    assert best["start"].startswith("2026-")
+    assert best["score"] >= data["windows"][-1]["score"]
+
+
+@pytest.mark.asyncio
+async def test_timing_plan_rejects_out_of_range_days(client):
+    resp = await client.get(TIMING_PLAN_URL, params={"days": 400})
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_timing_plan_readonly_allowed(readonly_client):
+    resp = await readonly_client.get(TIMING_PLAN_URL, params={"days": 7})
+    assert resp.status_code == 200
+
+
 # ─── POST /suggest-range ────────────────────────────────────────────────────
 
 
@@ -0,0 +1,189 @@
+"""Tests for /api/oracle/users/{id}/compatible — profile compatibility index."""
+
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.orm.oracle_user import OracleUser
+from app.orm.oracle_user_feature import OracleUserFeature
+from app.services.profile_index import backfill_features
+from tests.conftest import TestSession
+
+USERS_URL = "/api/oracle/users"
+
+_BIRTHDAYS = [
+    date(1990, 6, 15),
+    date(1985, 12, 1),
+    date(1978, 3, 22),
+    date(2001, 9, 9),
+    date(1969, 1, 30),
+    date(1995, 7, 4),
+]
+
+
+async def _create_profiles(client, count: int) -> list[int]:
+    ids = []
+    for i in range(count):
+        resp = await client.post(
+            USERS_URL,
+            json={"name": f"Profile {i}", "birthday": str(_BIRTHDAYS[i]), "mother_name": "Mother"},
+        )
+        assert resp.status_code == 201, resp.text
+        ids.append(resp.json()["id"])
+    return ids
+
+
+def _insert_profiles(owners: list[str], backfill: bool = True) -> list[int]:
+    """Profiles written directly (no feature rows), then optionally backfilled."""
+    db = TestSession()
+    users = [
+        OracleUser(name=f"Direct {i}", birthday=_BIRTHDAYS[i], mother_name="M", created_by=owner)
+        for i, owner in enumerate(owners)
+    ]
+    db.add_all(users)
+    db.commit()
+    ids = [u.id for u in users]
+    if backfill:
+        backfill_features(db, None, batch_size=2)
+    db.close()
+    return ids
+
+
+class TestCompatibleProfiles:
+    @pytest.mark.asyncio
+    async def test_ranked_matches(self, client):
+        ids = await _create_profiles(client, 5)
+        resp = await client.get(f"{USERS_URL}/{ids[0]}/compatible")
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+
+        assert data["user_id"] == ids[0]
+        assert data["indexed_profiles"] == 5
+        matches = data["matches"]
+        assert {m["user_id"] for m in matches} == set(ids[1:])
+        scores = [m["overall_score"] for m in matches]
+        assert scores == sorted(scores, reverse=True)
+        assert matches[0]["name"].startswith("Profile")
+        assert matches[0]["description"]
+
+    @pytest.mark.asyncio
+    async def test_limit(self, client):
+        ids = await _create_profiles(client, 5)
+        resp = await client.get(f"{USERS_URL}/{ids[0]}/compatible", params={"limit": 2})
+        assert len(resp.json()["matches"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_feature_rows_written_on_create(self, client):
+        ids = await _create_profiles(client, 2)
+        db = TestSession()
+        rows = db.query(OracleUserFeature).order_by(OracleUserFeature.user_id).all()
+        db.close()
+        assert [r.user_id for r in rows] == ids
+        assert all(r.features["element"] for r in rows)
+
+    @pytest.mark.asyncio
+    async def test_update_is_reflected(self, client):
+        ids = await _create_profiles(client, 3)
+        before = (await client.get(f"{USERS_URL}/{ids[0]}/compatible")).json()
+
+        resp = await client.put(f"{USERS_URL}/{ids[1]}", json={"birthday": str(_BIRTHDAYS[0])})
+        assert resp.status_code == 200
+        after = (await client.get(f"{USERS_URL}/{ids[0]}/compatible")).json()
+
+        def score(data):
+            return next(m["overall_score"] for m in data["matches"] if m["user_id"] == ids[1])
+
+        # Same birthday → same natal features → element/animal/life path all align
+        assert score(after) > score(before)
+
+    @pytest.mark.asyncio
+    async def test_soft_deleted_profile_dropped(self, client):
+        ids = await _create_profiles(client, 3)
+        await client.get(f"{USERS_URL}/{ids[0]}/compatible")  # load the index
+
+        assert (await client.delete(f"{USERS_URL}/{ids[2]}")).status_code == 200
+        data = (await client.get(f"{USERS_URL}/{ids[0]}/compatible")).json()
+        assert [m["user_id"] for m in data["matches"]] == [ids[1]]
+        assert data["indexed_profiles"] == 2
+
+    @pytest.mark.asyncio
+    async def test_backfills_existing_profiles(self, client):
+        ids = _insert_profiles(["test-user-id"] * 3)
+        data = (await client.get(f"{USERS_URL}/{ids[0]}/compatible")).json()
+        assert {m["user_id"] for m in data["matches"]} == set(ids[1:])
+
+    @pytest.mark.asyncio
+    async def test_query_never_writes_feature_rows(self, client):
+        ids = _insert_profiles(["test-user-id"] * 3, backfill=False)
+        resp = await client.get(f"{USERS_URL}/{ids[0]}/compatible")
+        assert resp.status_code == 200
+        data = resp.json()
+        # Not indexed until the backfill runs; the GET itself writes nothing
+        assert data["indexed"] is False
+        assert data["indexed_profiles"] == 0
+        assert data["matches"] == []
+
+        db = TestSession()
+        assert db.query(OracleUserFeature).count() == 0
+        assert backfill_features(db, None) == 3
+        assert backfill_features(db, None) == 0
+        db.close()
+        data = (await client.get(f"{USERS_URL}/{ids[0]}/compatible")).json()
+        assert data["indexed"] is True
+        assert {m["user_id"] for m in data["matches"]} == set(ids[1:])
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_404(self, client):
+        resp = await client.get(f"{USERS_URL}/9999/compatible")
+        assert resp.status_code == 404
+
+
+class TestProfileIndexCache:
+    def test_late_stale_rows_do_not_overwrite_newer_ones(self):
+        """Rows are read outside the lock, so a slow reader can apply old rows last."""
+        from app.services.profile_index import ProfileIndexCache
+
+        def row(second: int, deleted: bool = False) -> SimpleNamespace:
+            return SimpleNamespace(
+                user_id=1,
+                updated_at=datetime(2026, 1, 1, 0, 0, second, tzinfo=timezone.utc),
+                deleted=deleted,
+                features={
+                    "life_path": 7,
+                    "element": "Fire",
+                    "animal": "Rat",
+                    "moon": {"phase_name": "Full Moon"},
+                    "patterns": [],
+                },
+                created_by=None,
+            )
+
+        cache = ProfileIndexCache()
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = [row(1)]
+        index = cache.get(db)
+        assert 1 in index
+
+        # The delete lands first; a reader holding the original row applies it after
+        db.query.return_value.filter.return_value.all.return_value = [row(2, deleted=True)]
+        cache.get(db)
+        with cache._lock:
+            cache._apply([row(1)])
+        assert 1 not in index
+
+
+class TestCompatibleOwnership:
+    @pytest.mark.asyncio
+    async def test_non_admin_searches_own_profiles_only(self, readonly_client):
+        ids = _insert_profiles(["readonly-user-id", "other-user", "readonly-user-id", "other-user"])
+        resp = await readonly_client.get(f"{USERS_URL}/{ids[0]}/compatible")
+        assert resp.status_code == 200, resp.text
+        assert [m["user_id"] for m in resp.json()["matches"]] == [ids[2]]
+
+    @pytest.mark.asyncio
+    async def test_non_admin_cannot_query_others_profile(self, readonly_client):
+        ids = _insert_profiles(["other-user", "other-user"])
+        resp = await readonly_client.get(f"{USERS_URL}/{ids[0]}/compatible")
+        assert resp.status_code == 404
@@ -0,0 +1,201 @@
+"""Tests for request metrics — histograms, middleware labels, exports, aggregation."""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware.metrics import MetricsMiddleware
+from app.services.request_metrics import (
+    REDIS_KEY,
+    LatencyHistogram,
+    RequestMetrics,
+    collect_snapshots,
+    merge_snapshots,
+    performance_summary,
+    push_snapshot,
+    render_prometheus,
+)
+
+# ─── Helpers ────────────────────────────────────────────────────────────────
+
+
+class _FakeRedis:
+    """The hash commands the aggregation uses, over a dict."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+
+def _create_test_app(metrics: RequestMetrics) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+    @app.get("/api/oracle/users/{user_id}")
+    async def user_detail(user_id: int) -> dict:
+        return {"id": user_id}
+
+    @app.get("/api/fail")
+    async def fail() -> JSONResponse:
+        return JSONResponse({"error": "bad"}, status_code=503)
+
+    @app.get("/api/boom")
+    async def boom() -> dict:
+        raise RuntimeError("boom")
+
+    return app
+
+
+def _series(snapshot: dict) -> dict:
+    return {(m, r, s): d["total"] for m, r, s, d in snapshot["series"]}
+
+
+# ─── LatencyHistogram ───────────────────────────────────────────────────────
+
+
+def test_histogram_quantiles_within_bucket_error():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(-4, 1) for _ in range(20_000)]
+    hist = LatencyHistogram()
+    for v in values:
+        hist.record(v)
+    values.sort()
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert abs(hist.quantile(q) - exact) / exact < 0.04
+    assert hist.quantile(1.0) == pytest.approx(values[-1], abs=1e-6)
+
+
+def test_histogram_memory_is_fixed_and_merge_adds():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    for i in range(1000):
+        a.record(i / 1000)
+        b.record(3600 * 10)  # beyond the top bucket: clamped, not grown
+    assert len(a.counts) == len(b.counts)
+
+    merged = LatencyHistogram.from_dict(json.loads(json.dumps(a.to_dict())))
+    merged.merge(b)
+    assert merged.total == 2000
+    assert merged.count_le(0.5) == a.count_le(0.5)
+    assert merged.quantile(0.25) == a.quantile(0.5)
+
+
+# ─── Middleware ─────────────────────────────────────────────────────────────
+
+
+@pytest.mark.anyio
+async def test_middleware_labels_by_route_template_and_status():
+    metrics = RequestMetrics()
+    app = _create_test_app(metrics)
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        for user_id in (1, 2, 3):
+            assert (await ac.get(f"/api/oracle/users/{user_id}")).status_code == 200
+        assert (await ac.get("/api/fail")).status_code == 503
+        assert (await ac.get("/api/boom")).status_code == 500
+        assert (await ac.get("/nowhere")).status_code == 404
+
+    snapshot = metrics.snapshot()
+    assert _series(snapshot) == {
+        ("GET", "/api/oracle/users/{user_id}", 200): 3,
+        ("GET", "/api/fail", 503): 1,
+        ("GET", "/api/boom", 500): 1,
+        ("GET", "unmatched", 404): 1,
+    }
+    assert snapshot["in_flight"] == 0
+    summary = performance_summary(merge_snapshots([snapshot]))
+    assert summary["requests_total"] == 6
+    assert summary["errors_total"] == 2
+    assert summary["requests_per_minute"] > 0
+
+
+def test_window_rotation_drops_old_requests():
+    metrics = RequestMetrics(window_seconds=60)
+    metrics.request_started()
+    metrics.request_finished("GET", "/a", 200, 0.2)
+    metrics._window_start -= 150  # two idle windows pass
+    window = metrics.snapshot()["window"]
+    assert window["histogram"]["total"] == 0
+    assert window["rpm"] == 0
+    # The cumulative series is unaffected
+    assert _series(metrics.snapshot()) == {("GET", "/a", 200): 1}
+
+
+# ─── Exports ────────────────────────────────────────────────────────────────
+
+
+def test_prometheus_exposition():
+    metrics = RequestMetrics()
+    for seconds in (0.003, 0.02, 0.02, 4.0):
+        metrics.request_started()
+        metrics.request_finished("POST", '/api/x"y', 201, seconds)
+    text = render_prometheus(merge_snapshots([metrics.snapshot()]))
+
+    labels = 'method="POST",route="/api/x\\"y",status="201"'
+    assert f"nps_http_requests_total{{{labels}}} 4" in text
+    assert f'nps_http_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in text
+    assert f'nps_http_request_duration_seconds_bucket{{{labels},le="0.025"}} 3' in text
+    assert f'nps_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 4' in text
+    assert f"nps_http_request_duration_seconds_count{{{labels}}} 4" in text
+    assert "nps_http_requests_in_flight 0" in text
+    assert "# TYPE nps_http_request_duration_seconds histogram" in text
+
+
+@pytest.mark.anyio
+async def test_performance_endpoint_reports_real_traffic(client):
+    for _ in range(3):
+        await client.get("/api/health")
+    data = (await client.get("/api/health/performance")).json()
+    assert data["requests_total"] >= 3
+    assert data["requests_per_minute"] > 0
+    assert data["p95_response_ms"] > 0
+
+    resp = await client.get("/api/health/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert 'route="/api/health",status="200"' in resp.text
+
+
+# ─── Cross-worker aggregation ───────────────────────────────────────────────
+
+
+@pytest.mark.anyio
+async def test_redis_aggregation_merges_workers_and_drops_stale():
+    redis = _FakeRedis()
+    workers = [RequestMetrics() for _ in range(3)]
+    for i, worker in enumerate(workers):
+        worker.worker_id = f"host:{i}"
+        for _ in range(i + 1):
+            worker.request_started()
+            worker.request_finished("GET", "/a", 200, 0.01 * (i + 1))
+    for worker in workers[1:]:
+        await push_snapshot(redis, worker)
+
+    # A worker that stopped pushing long ago
+    stale = json.loads(redis.hashes[REDIS_KEY]["host:2"])
+    stale["at"] = time.time() - 3600
+    redis.hashes[REDIS_KEY]["host:9"] = json.dumps(stale)
+
+    snapshots = await collect_snapshots(redis, workers[0], interval=10)
+    merged = merge_snapshots(snapshots)
+    assert merged["workers"] == 3
+    assert _series(merged) == {("GET", "/a", 200): 6}
+    assert merged["started"] == min(w.started for w in workers)
+    assert "host:9" not in redis.hashes[REDIS_KEY]
+    assert performance_summary(merged)["p95_response_ms"] >= 29
@@ -216,3 +216,66 @@ class TestTimeReadingEndpoint:
             data = resp.json()
             assert "created_at" in data
             assert data["created_at"] != ""
+
+    @pytest.mark.anyio
+    async def test_stream_sections_pushes_to_requesting_user(self, client):
+        """stream_sections=true forwards each AI section to the caller's WebSocket."""
+
+        async def fake_create(**kwargs):
+            await kwargs["section_callback"]("core_identity", "You are a 3.", 0)
+            return _mock_framework_result()
+
+        with (
+            patch(
+                "app.services.oracle_reading.OracleReadingService.create_framework_reading",
+                side_effect=fake_create,
+            ),
+            patch("app.routers.oracle.ws_manager.send_to_user", new_callable=AsyncMock) as send,
+        ):
+            resp = await client.post(
+                "/api/oracle/readings",
+                json={"user_id": 1, "sign_value": "14:30:00", "stream_sections": True},
+            )
+            assert resp.status_code == 200
+            send.assert_awaited_once()
+            _uid, event, data = send.call_args.args
+            assert event == "reading_section"
+            assert data["section"] == "core_identity"
+            assert data["index"] == 0
+
+    @pytest.mark.anyio
+    async def test_stream_reset_is_forwarded(self, client):
+        """A mid-stream AI failure tells the caller to discard the streamed sections."""
+        from oracle_service.engines.ai_interpreter import SECTIONS_RESET
+
+        async def fake_create(**kwargs):
+            await kwargs["section_callback"]("header", "Partial", 0)
+            await kwargs["section_callback"](SECTIONS_RESET, "", 1)
+            return _mock_framework_result()
+
+        with (
+            patch(
+                "app.services.oracle_reading.OracleReadingService.create_framework_reading",
+                side_effect=fake_create,
+            ),
+            patch("app.routers.oracle.ws_manager.send_to_user", new_callable=AsyncMock) as send,
+        ):
+            resp = await client.post(
+                "/api/oracle/readings",
+                json={"user_id": 1, "sign_value": "14:30:00", "stream_sections": True},
+            )
+            assert resp.status_code == 200
+            events = [c.args[1] for c in send.call_args_list]
+            assert events == ["reading_section", "reading_sections_reset"]
+            assert send.call_args.args[2] == {"index": 1, "user_id": 1}
+
+    @pytest.mark.anyio
+    async def test_no_section_callback_by_default(self, client):
+        """Without stream_sections the orchestrator is not asked to stream."""
+        with patch(
+            "app.services.oracle_reading.OracleReadingService.create_framework_reading",
+            new_callable=AsyncMock,
+            return_value=_mock_framework_result(),
+        ) as mock_create:
+            await client.post("/api/oracle/readings", json={"user_id": 1, "sign_value": "14:30:00"})
+            assert mock_create.call_args.kwargs["section_callback"] is None
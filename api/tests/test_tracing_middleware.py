@@ -0,0 +1,83 @@
+"""Tests for the tracing middleware — Server-Timing header and trace export."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from oracle_service import tracing
+from oracle_service.tracing import JsonFileExporter, span
+
+from app.middleware.tracing import TracingMiddleware
+
+# ─── Helpers ────────────────────────────────────────────────────────────────
+
+
+def _create_test_app(server_timing: bool = True) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, server_timing=server_timing)
+
+    @app.post("/api/oracle/readings/{reading_id}")
+    async def reading(reading_id: int) -> dict:
+        with span("framework_bridge"):
+            with span("framework.numerology"):
+                pass
+        with span("db.store_reading"):
+            pass
+        return {"id": reading_id}
+
+    @app.get("/api/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    return app
+
+
+@pytest.fixture
+def exported(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracing.set_exporter(JsonFileExporter(str(path)))
+    yield path
+    tracing.set_exporter(None)
+
+
+# ─── Tests ──────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.anyio
+async def test_server_timing_on_traced_responses_only(exported):
+    transport = ASGITransport(app=_create_test_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        traced = await ac.post("/api/oracle/readings/5")
+        plain = await ac.get("/api/health")
+
+    assert traced.status_code == 200
+    names = [part.split(";")[0] for part in traced.headers["server-timing"].split(", ")]
+    assert names == ["framework.numerology", "framework_bridge", "db.store_reading", "total"]
+    assert "server-timing" not in plain.headers
+
+    roots = [
+        json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"][-1]
+        for line in exported.read_text().splitlines()
+    ]
+    assert [r["name"] for r in roots] == [
+        "POST /api/oracle/readings/{reading_id}",
+        "GET /api/health",
+    ]
+    attributes = {a["key"]: a["value"] for a in roots[0]["attributes"]}
+    assert attributes["http.route"] == {"stringValue": "/api/oracle/readings/{reading_id}"}
+    assert attributes["http.response.status_code"] == {"intValue": "200"}
+
+
+@pytest.mark.anyio
+async def test_server_timing_off_by_default(exported):
+    transport = ASGITransport(app=_create_test_app(server_timing=False))
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/api/oracle/readings/5")
+
+    assert resp.status_code == 200
+    assert "server-timing" not in resp.headers
+    # Spans are still traced and exported
+    assert len(exported.read_text().splitlines()) == 1
@@ -193,3 +193,137 @@ async def test_translate_unauthenticated_401(unauth_client):
         TRANSLATE_URL, json={"text": "Hello", "source_lang": "en", "target_lang": "fa"}
     )
     assert resp.status_code == 401
+
+
+# ─── Cache internals ─────────────────────────────────────────────────────────
+
+
+def test_local_lru_evicts_least_recently_used():
+    from app.services.translation import _LocalLRU
+
+    lru = _LocalLRU(max_entries=2, ttl_seconds=60)
+    lru.put("a", {"v": 1})
+    lru.put("b", {"v": 2})
+    assert lru.get("a") == {"v": 1}  # "a" is now most recent
+    lru.put("c", {"v": 3})
+    assert lru.get("b") is None
+    assert lru.get("a") == {"v": 1}
+    assert lru.evictions == 1
+
+
+def test_local_lru_lazy_ttl():
+    import time
+
+    from app.services.translation import _LocalLRU
+
+    lru = _LocalLRU(max_entries=10, ttl_seconds=60)
+    lru.put("old", {"v": 1}, ts=time.monotonic() - 120)
+    assert len(lru) == 1
+    assert lru.get("old") is None
+    assert lru.expirations == 1
+    assert len(lru) == 0
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+def test_shared_tier_serves_other_workers():
+    """A result written by one worker is read back from Redis by another."""
+    import zlib
+
+    from app.services import translation
+    from app.services.translation import TranslationService, init_translation_redis
+
+    fake = _FakeRedis()
+    init_translation_redis(fake)
+    try:
+        svc = TranslationService()
+        first = svc.translate("Shared hello", "en", "fa")
+        assert first["cached"] is False
+        stored = next(iter(fake.store.values()))
+        assert b"Shared hello" in zlib.decompress(stored)
+
+        translation._cache.clear()  # simulate a different process
+        second = svc.translate("Shared hello", "en", "fa")
+        assert second["cached"] is True
+        stats = svc.get_cache_stats()
+        assert stats["shared_tier"] == "redis"
+        assert stats["shared_hit_count"] == 1
+    finally:
+        init_translation_redis(None)
+
+
+def test_shared_tier_errors_degrade_to_miss():
+    from app.services.translation import TranslationService, init_translation_redis
+
+    class BrokenRedis:
+        def get(self, key):
+            raise ConnectionError("down")
+
+        def setex(self, key, ttl, value):
+            raise ConnectionError("down")
+
+    init_translation_redis(BrokenRedis())
+    try:
+        svc = TranslationService()
+        assert svc.translate("Broken", "en", "fa")["cached"] is False
+        assert svc.translate("Broken", "en", "fa")["cached"] is True  # local tier
+        assert svc.get_cache_stats()["shared_error_count"] >= 1
+    finally:
+        init_translation_redis(None)
+
+
+def test_batch_translate_deduplicates():
+    from unittest.mock import patch
+
+    from app.services import translation
+    from app.services.translation import TranslationService
+
+    calls = []
+    real = translation._batch_translate
+
+    def spy(texts, source_lang="en", target_lang="fa"):
+        calls.append(list(texts))
+        return real(texts, source_lang, target_lang)
+
+    svc = TranslationService()
+    with patch.object(translation, "_batch_translate", spy):
+        results = svc.batch_translate(["Moon", "Sun", "Moon"], "en", "fa")
+        assert len(results) == 3
+        assert results[0]["source_text"] == results[2]["source_text"] == "Moon"
+        assert calls == [["Moon", "Sun"]]
+
+        again = svc.batch_translate(["Sun", "Star"], "en", "fa")
+        assert again[0]["cached"] is True
+        assert again[1]["cached"] is False
+        assert calls[-1] == ["Star"]
+
+
+def test_batch_translate_short_result_list_falls_back_per_item():
+    from unittest.mock import patch
+
+    from app.services import translation
+    from app.services.translation import TranslationService
+
+    real = translation._batch_translate
+
+    def short(texts, source_lang="en", target_lang="fa"):
+        return real(texts, source_lang, target_lang)[:-1]
+
+    svc = TranslationService()
+    with (
+        patch.object(translation, "_batch_translate", short),
+        patch.object(translation, "_translate", wraps=translation._translate) as single,
+    ):
+        results = svc.batch_translate(["Dawn", "Dusk", "Dawn"], "en", "fa")
+    assert [r["source_text"] for r in results] == ["Dawn", "Dusk", "Dawn"]
+    assert sorted(c.args[0] for c in single.call_args_list) == ["Dawn", "Dusk"]
+    assert svc.translate("Dusk", "en", "fa")["cached"] is True
@@ -526,3 +526,85 @@ CREATE TABLE IF NOT EXISTS oracle_learning_data (
 CREATE TRIGGER oracle_learning_data_updated_at
     BEFORE UPDATE ON oracle_learning_data
     FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+-- ─── Oracle AI Jobs (deferred AI enrichment, migration 022) ───
+
+CREATE TABLE IF NOT EXISTS oracle_ai_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    reading_id INTEGER NOT NULL REFERENCES oracle_readings(id) ON DELETE CASCADE,
+    status VARCHAR(16) NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'running', 'done', 'dead')),
+    payload JSONB NOT NULL DEFAULT '{}',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    last_error TEXT,
+    available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_at TIMESTAMPTZ,
+    completed_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_oracle_ai_jobs_runnable
+    ON oracle_ai_jobs(available_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_oracle_ai_jobs_reading_id ON oracle_ai_jobs(reading_id);
+CREATE INDEX IF NOT EXISTS idx_oracle_ai_jobs_dead
+    ON oracle_ai_jobs(created_at DESC) WHERE status = 'dead';
+
+-- ─── Oracle Groups (incremental group compatibility, migration 023) ───
+
+CREATE TABLE IF NOT EXISTS oracle_groups (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(200) NOT NULL,
+    created_by UUID REFERENCES users(id) ON DELETE SET NULL,
+    reading_moment TIMESTAMPTZ NOT NULL,
+    numerology_system VARCHAR(20) NOT NULL DEFAULT 'auto',
+    member_count INTEGER NOT NULL DEFAULT 0,
+    score_total BIGINT NOT NULL DEFAULT 0,
+    element_counts JSONB NOT NULL DEFAULT '{}',
+    harmony_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_oracle_groups_created_by ON oracle_groups(created_by);
+
+CREATE TRIGGER oracle_groups_updated_at
+    BEFORE UPDATE ON oracle_groups
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+CREATE TABLE IF NOT EXISTS oracle_group_members (
+    id SERIAL PRIMARY KEY,
+    group_id INTEGER NOT NULL REFERENCES oracle_groups(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL,
+    comparison JSONB NOT NULL,
+    CONSTRAINT uq_oracle_group_member UNIQUE (group_id, user_id)
+);
+
+-- One row per pair score (basis points); member_a joined before member_b
+CREATE TABLE IF NOT EXISTS oracle_group_pairs (
+    group_id INTEGER NOT NULL REFERENCES oracle_groups(id) ON DELETE CASCADE,
+    member_a INTEGER NOT NULL,
+    member_b INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (group_id, member_a, member_b)
+);
+
+CREATE INDEX IF NOT EXISTS idx_oracle_group_pairs_member_b
+    ON oracle_group_pairs(group_id, member_b);
+
+-- ─── Oracle User Features (profile compatibility index, migration 024) ───
+
+CREATE TABLE IF NOT EXISTS oracle_user_features (
+    user_id INTEGER PRIMARY KEY REFERENCES oracle_users(id) ON DELETE CASCADE,
+    created_by UUID,
+    features JSONB NOT NULL DEFAULT '{}',
+    deleted BOOLEAN NOT NULL DEFAULT FALSE,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_oracle_user_features_updated_at
+    ON oracle_user_features(updated_at);
+
+CREATE TRIGGER oracle_user_features_updated_at
+    BEFORE UPDATE ON oracle_user_features
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at();
@@ -0,0 +1,34 @@
+-- Migration 022: Deferred AI enrichment job queue
+-- Description: Persisted queue for two-phase readings. The reading is stored
+-- with its framework result immediately; a background worker fills in
+-- ai_interpretation later. Failed jobs are retried with backoff and moved to
+-- status 'dead' (dead letter) after max_attempts.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS oracle_ai_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    reading_id INTEGER NOT NULL REFERENCES oracle_readings(id) ON DELETE CASCADE,
+    status VARCHAR(16) NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'running', 'done', 'dead')),
+    payload JSONB NOT NULL DEFAULT '{}',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    last_error TEXT,
+    available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_at TIMESTAMPTZ,
+    completed_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Worker poll: next runnable jobs
+CREATE INDEX IF NOT EXISTS idx_oracle_ai_jobs_runnable
+    ON oracle_ai_jobs(available_at) WHERE status = 'pending';
+-- ai_status lookup for GET /readings/{id}
+CREATE INDEX IF NOT EXISTS idx_oracle_ai_jobs_reading_id
+    ON oracle_ai_jobs(reading_id);
+-- Dead-letter inspection
+CREATE INDEX IF NOT EXISTS idx_oracle_ai_jobs_dead
+    ON oracle_ai_jobs(created_at DESC) WHERE status = 'dead';
+
+COMMIT;
@@ -0,0 +1,3 @@
+-- Rollback migration 022: Remove deferred AI enrichment job queue.
+
+DROP TABLE IF EXISTS oracle_ai_jobs CASCADE;
@@ -0,0 +1,49 @@
+-- Migration 023: Persistent groups with incremental compatibility state
+-- Description: A group keeps running harmony/element totals, one row per
+-- member with its comparison data, and one row per pair score, so members
+-- can join or leave in O(N) rows without regenerating everyone's reading or
+-- rewriting the rest of the pair matrix.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS oracle_groups (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(200) NOT NULL,
+    created_by UUID REFERENCES users(id) ON DELETE SET NULL,
+    reading_moment TIMESTAMPTZ NOT NULL,
+    numerology_system VARCHAR(20) NOT NULL DEFAULT 'auto',
+    member_count INTEGER NOT NULL DEFAULT 0,
+    score_total BIGINT NOT NULL DEFAULT 0,
+    element_counts JSONB NOT NULL DEFAULT '{}',
+    harmony_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_oracle_groups_created_by ON oracle_groups(created_by);
+
+CREATE TRIGGER oracle_groups_updated_at
+    BEFORE UPDATE ON oracle_groups
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+CREATE TABLE IF NOT EXISTS oracle_group_members (
+    id SERIAL PRIMARY KEY,
+    group_id INTEGER NOT NULL REFERENCES oracle_groups(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL,
+    comparison JSONB NOT NULL,
+    CONSTRAINT uq_oracle_group_member UNIQUE (group_id, user_id)
+);
+
+-- One row per pair score (basis points); member_a joined before member_b
+CREATE TABLE IF NOT EXISTS oracle_group_pairs (
+    group_id INTEGER NOT NULL REFERENCES oracle_groups(id) ON DELETE CASCADE,
+    member_a INTEGER NOT NULL,
+    member_b INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (group_id, member_a, member_b)
+);
+
+CREATE INDEX IF NOT EXISTS idx_oracle_group_pairs_member_b
+    ON oracle_group_pairs(group_id, member_b);
+
+COMMIT;
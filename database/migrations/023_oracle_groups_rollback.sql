@@ -0,0 +1,5 @@
+-- Rollback migration 023: Remove persistent groups.
+
+DROP TABLE IF EXISTS oracle_group_pairs;
+DROP TABLE IF EXISTS oracle_group_members;
+DROP TABLE IF EXISTS oracle_groups CASCADE;
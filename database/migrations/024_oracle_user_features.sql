@@ -0,0 +1,25 @@
+-- Migration 024: Profile compatibility feature table
+-- Description: Natal comparison features (life path, birth-year element and
+-- animal, birth moon phase, natal patterns) per oracle profile, maintained on
+-- profile create/update. API processes load it into an in-memory vectorized
+-- index and pick up changes incrementally via updated_at.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS oracle_user_features (
+    user_id INTEGER PRIMARY KEY REFERENCES oracle_users(id) ON DELETE CASCADE,
+    created_by UUID,
+    features JSONB NOT NULL DEFAULT '{}',
+    deleted BOOLEAN NOT NULL DEFAULT FALSE,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Incremental index refresh: rows changed since the last watermark
+CREATE INDEX IF NOT EXISTS idx_oracle_user_features_updated_at
+    ON oracle_user_features(updated_at);
+
+CREATE TRIGGER oracle_user_features_updated_at
+    BEFORE UPDATE ON oracle_user_features
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+COMMIT;
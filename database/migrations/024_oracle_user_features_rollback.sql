@@ -0,0 +1,3 @@
+-- Rollback migration 024: Remove profile compatibility feature table.
+
+DROP TABLE IF EXISTS oracle_user_features CASCADE;
@@ -583,10 +583,9 @@ class MemoryTab:
             return
 
         try:
-            from engines.memory import get_memory
+            from engines.memory import get_sessions
 
-            data = get_memory()
-            sessions = data.get("sessions", [])
+            sessions = get_sessions()
 
             with open(filepath, "w", newline="") as f:
                 writer = csv.writer(f)
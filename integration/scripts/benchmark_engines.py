@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""Framework Engine Benchmark -- per-call latency of the numerology engines.
+
+Times the framework engines in-process, with no server and no network:
+
+    fc60_encode            FC60StampEngine.encode
+    numerology_latin       NumerologyEngine.complete_profile (pythagorean)
+    numerology_persian     NumerologyEngine.complete_profile (abjad)
+    signal_combiner        SignalCombiner.combine_signals
+    universe_translator    UniverseTranslator.translate
+    master_orchestrator    MasterOrchestrator.generate_reading
+
+Inputs are deterministic corpora: fixed Latin and Persian names crossed
+with a date sweep, the same on every run. Each benchmark runs warm-up
+rounds, then timed rounds that each go through the corpus. A round is
+repeated as many times as needed to last at least ``--min-round-ms``. The
+report gives per-call median, mean, stdev, p95 and min over rounds, plus
+the coefficient of variation.
+
+Baselines are JSON files committed per release under
+``integration/reports/engine_baselines/<version>.json`` (``--save``).
+``--compare`` checks the current run against one and exits 1 when any
+benchmark's median regressed by more than ``--threshold`` percent
+(per-benchmark overrides with ``--threshold-for name=pct``).
+
+Usage:
+    python3 integration/scripts/benchmark_engines.py
+    python3 integration/scripts/benchmark_engines.py --rounds 30 --json
+    python3 integration/scripts/benchmark_engines.py --save integration/reports/engine_baselines/4.0.0.json
+    python3 integration/scripts/benchmark_engines.py --compare integration/reports/engine_baselines/4.0.0.json --threshold 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / "services" / "oracle"))
+
+import oracle_service  # noqa: E402, F401 — triggers sys.path shim
+from numerology_ai_framework.core.fc60_stamp_engine import FC60StampEngine  # noqa: E402
+from numerology_ai_framework.personal.numerology_engine import NumerologyEngine  # noqa: E402
+from numerology_ai_framework.synthesis.master_orchestrator import (  # noqa: E402
+    MasterOrchestrator,
+)
+from numerology_ai_framework.synthesis.signal_combiner import SignalCombiner  # noqa: E402
+from numerology_ai_framework.synthesis.universe_translator import (  # noqa: E402
+    UniverseTranslator,
+)
+
+DEFAULT_THRESHOLD_PCT = 10.0
+
+# ─── Corpora ────────────────────────────────────────────────────────────────
+
+LATIN_NAMES = (
+    "Ada Lovelace",
+    "Alan Mathison Turing",
+    "Grace Brewster Hopper",
+    "Leonhard Euler",
+    "Emmy Noether",
+    "Srinivasa Ramanujan",
+    "Sophie Germain",
+    "Carl Friedrich Gauss",
+)
+
+PERSIAN_NAMES = (
+    "علی رضایی",
+    "مریم میرزاخانی",
+    "حافظ شیرازی",
+    "فاطمه احمدی",
+    "محمد خوارزمی",
+    "سعدی شیرازی",
+    "زهرا کریمی",
+    "عمر خیام",
+)
+
+BIRTHDAYS = ((10, 12, 1815), (23, 6, 1912), (9, 12, 1906), (29, 2, 1984), (1, 1, 2000))
+
+
+def date_sweep(count: int = 12) -> list[datetime]:
+    """``count`` reading moments spread over 2020-2030 (every 307 days, 3 h 17 m apart)."""
+    start = datetime(2020, 1, 1, 0, 0, 0)
+    return [start + timedelta(days=307 * i, hours=3 * i, minutes=17 * i) for i in range(count)]
+
+
+def build_cases(names: tuple[str, ...], system: str) -> list[dict]:
+    """Names × birthdays × dates, with each date paired to every name once."""
+    dates = date_sweep()
+    cases = []
+    for i, name in enumerate(names):
+        for j, (day, month, year) in enumerate(BIRTHDAYS):
+            cases.append(
+                {
+                    "full_name": name,
+                    "birth_day": day,
+                    "birth_month": month,
+                    "birth_year": year,
+                    "current_date": dates[(i * len(BIRTHDAYS) + j) % len(dates)],
+                    "numerology_system": system,
+                }
+            )
+    return cases
+
+
+def _orchestrate(case: dict) -> dict:
+    when = case["current_date"]
+    return MasterOrchestrator.generate_reading(
+        **case,
+        current_hour=when.hour,
+        current_minute=when.minute,
+        current_second=when.second,
+    )
+
+
+def build_benchmarks() -> dict[str, tuple[Callable, list]]:
+    """Benchmark name -> (function of one corpus item, corpus)."""
+    latin = build_cases(LATIN_NAMES, "pythagorean")
+    persian = build_cases(PERSIAN_NAMES, "abjad")
+    # Downstream engines are fed real upstream output, computed once here
+    readings = [_orchestrate(case) for case in latin + persian]
+
+    def fc60(when: datetime) -> dict:
+        return FC60StampEngine.encode(
+            when.year, when.month, when.day, when.hour, when.minute, when.second
+        )
+
+    def numerology(case: dict) -> dict:
+        when = case["current_date"]
+        return NumerologyEngine.complete_profile(
+            full_name=case["full_name"],
+            birth_day=case["birth_day"],
+            birth_month=case["birth_month"],
+            birth_year=case["birth_year"],
+            current_year=when.year,
+            current_month=when.month,
+            current_day=when.day,
+            system=case["numerology_system"],
+        )
+
+    def combine(r: dict) -> dict:
+        return SignalCombiner.combine_signals(
+            r["reading"]["signals"], r["numerology"], r["moon"], r["ganzhi"]
+        )
+
+    def translate(r: dict) -> dict:
+        return UniverseTranslator.translate(
+            reading=r["reading"],
+            fc60_stamp=r["fc60_stamp"],
+            numerology_profile=r["numerology"],
+            person_name=r["person"]["name"],
+            current_date_str=r["current"]["date"],
+            confidence_override=r["confidence"]["score"],
+        )
+
+    return {
+        "fc60_encode": (fc60, date_sweep(120)),
+        "numerology_latin": (numerology, latin),
+        "numerology_persian": (numerology, persian),
+        "signal_combiner": (combine, readings),
+        "universe_translator": (translate, readings),
+        "master_orchestrator": (_orchestrate, latin + persian),
+    }
+
+
+# ─── Measurement ────────────────────────────────────────────────────────────
+
+
+def _run_round(fn: Callable, corpus: list, repeat: int) -> float:
+    """Seconds per call for ``repeat`` passes over the corpus."""
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for item in corpus:
+            fn(item)
+    return (time.perf_counter() - t0) / (repeat * len(corpus))
+
+
+def measure(fn: Callable, corpus: list, rounds: int, warmup: int, min_round_ms: float) -> dict:
+    """Warm up, calibrate the round length, then summarize per-call times over rounds."""
+    per_call = _run_round(fn, corpus, 1)
+    for _ in range(max(0, warmup - 1)):
+        per_call = _run_round(fn, corpus, 1)
+    repeat = max(1, math.ceil(min_round_ms / 1000 / (per_call * len(corpus))))
+
+    samples = sorted(_run_round(fn, corpus, repeat) * 1e6 for _ in range(rounds))
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+    median = statistics.median(samples)
+    return {
+        "median_us": round(median, 3),
+        "mean_us": round(mean, 3),
+        "stdev_us": round(stdev, 3),
+        "p95_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "min_us": round(samples[0], 3),
+        "cv_pct": round(stdev / mean * 100, 2) if mean else 0.0,
+        "ops_per_sec": round(1e6 / median, 1) if median else 0.0,
+        "corpus": len(corpus),
+        "calls_per_round": repeat * len(corpus),
+    }
+
+
+# ─── Baselines ──────────────────────────────────────────────────────────────
+
+
+def compare_baselines(
+    current: dict,
+    baseline: dict,
+    threshold_pct: float = DEFAULT_THRESHOLD_PCT,
+    overrides: dict[str, float] | None = None,
+) -> tuple[list[str], list[str]]:
+    """Compare median per-call times with a baseline.
+
+    Returns ``(report lines, names of benchmarks that regressed)``. A
+    benchmark regresses when its median grew by more than its threshold.
+    """
+    overrides = overrides or {}
+    previous = baseline.get("benchmarks", {})
+    lines: list[str] = []
+    regressions: list[str] = []
+    for name, data in current.items():
+        prev = previous.get(name)
+        if not prev or not prev.get("median_us"):
+            lines.append(f"  [{'NEW':>10s}] {name:22s}  {data['median_us']:.1f}us")
+            continue
+        limit = overrides.get(name, threshold_pct)
+        change_pct = (data["median_us"] - prev["median_us"]) / prev["median_us"] * 100
+        if change_pct > limit:
+            tag = "REGRESSION"
+            regressions.append(name)
+        elif change_pct < -limit:
+            tag = "IMPROVED"
+        else:
+            tag = "STABLE"
+        lines.append(
+            f"  [{tag:>10s}] {name:22s}  median: {prev['median_us']:.1f}us -> "
+            f"{data['median_us']:.1f}us  ({change_pct:+.1f}%, limit {limit:g}%)"
+        )
+    for name in previous:
+        if name not in current:
+            lines.append(f"  [{'MISSING':>10s}] {name:22s}  in baseline, not run")
+    return lines, regressions
+
+
+def _parse_overrides(values: list[str]) -> dict[str, float]:
+    overrides = {}
+    for value in values:
+        name, sep, pct = value.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"--threshold-for expects name=pct, got {value!r}")
+        overrides[name.strip()] = float(pct)
+    return overrides
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the numerology framework engines")
+    parser.add_argument("--rounds", type=int, default=20, help="Timed rounds (default 20)")
+    parser.add_argument("--warmup", type=int, default=3, help="Warm-up rounds (default 3)")
+    parser.add_argument(
+        "--min-round-ms", type=float, default=50.0, help="Minimum round length (default 50)"
+    )
+    parser.add_argument("--only", nargs="*", help="Run only these benchmarks")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    parser.add_argument("--save", metavar="PATH", help="Write results as a baseline file")
+    parser.add_argument("--compare", metavar="PATH", help="Baseline to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD_PCT,
+        help=f"Regression limit in percent of median (default {DEFAULT_THRESHOLD_PCT:g})",
+    )
+    parser.add_argument(
+        "--threshold-for",
+        action="append",
+        default=[],
+        metavar="NAME=PCT",
+        help="Per-benchmark regression limit (repeatable)",
+    )
+    args = parser.parse_args()
+    overrides = _parse_overrides(args.threshold_for)
+
+    benchmarks = build_benchmarks()
+    if args.only:
+        unknown = set(args.only) - set(benchmarks)
+        if unknown:
+            parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+        benchmarks = {name: benchmarks[name] for name in args.only}
+
+    results = {
+        name: measure(fn, corpus, args.rounds, args.warmup, args.min_round_ms)
+        for name, (fn, corpus) in benchmarks.items()
+    }
+    report = {
+        "measured_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "note": "Auto-generated by benchmark_engines.py",
+        "config": {
+            "rounds": args.rounds,
+            "warmup": args.warmup,
+            "min_round_ms": args.min_round_ms,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "benchmarks": results,
+    }
+
+    if args.save:
+        path = Path(args.save)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n")
+
+    regressions: list[str] = []
+    comparison: list[str] = []
+    if args.compare:
+        try:
+            baseline = json.loads(Path(args.compare).read_text())
+        except (FileNotFoundError, json.JSONDecodeError) as exc:
+            print(f"ERROR: Cannot load baseline: {exc}", file=sys.stderr)
+            return 2
+        comparison, regressions = compare_baselines(results, baseline, args.threshold, overrides)
+
+    if args.json:
+        if args.compare:
+            report["regressions"] = regressions
+        print(json.dumps(report, indent=2))
+    else:
+        print(
+            f"\n{'Benchmark':<22} {'Median us':>11} {'Mean us':>10} {'Stdev':>9} "
+            f"{'p95 us':>10} {'CV %':>7} {'Ops/s':>11}"
+        )
+        print("-" * 84)
+        for name, r in results.items():
+            print(
+                f"{name:<22} {r['median_us']:>11,.1f} {r['mean_us']:>10,.1f} "
+                f"{r['stdev_us']:>9,.1f} {r['p95_us']:>10,.1f} {r['cv_pct']:>7.1f} "
+                f"{r['ops_per_sec']:>11,.0f}"
+            )
+        if args.compare:
+            print(f"\nComparison against {args.compare}:")
+            for line in comparison:
+                print(line)
+
+    if regressions:
+        print(
+            f"\nFAIL: {len(regressions)} benchmark(s) regressed: {', '.join(regressions)}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Key Scoring Benchmark -- ScannerBrain candidates/sec per strategy.
+
+Compares the scalar path (one Python int per candidate: ``str(k)`` digit
+sums, base-60 loop, hex-string entropy) against the batched NumPy limb path
+(``ScannerBrain.generate_smart_keys``) for each key-generation strategy.
+Runs fully in-process; no server required.
+
+Usage:
+    python3 integration/scripts/benchmark_key_scoring.py
+    python3 integration/scripts/benchmark_key_scoring.py -n 20000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import secrets
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_PROJECT_ROOT / "services" / "oracle"))
+
+import oracle_service  # noqa: E402, F401 — triggers sys.path shim
+from engines import key_scoring  # noqa: E402
+from engines.scanner_brain import (  # noqa: E402
+    CANDIDATES_PER_PICK,
+    ENTROPY_ATTEMPTS,
+    ScannerBrain,
+)
+
+# Candidates scored per generated key, by strategy
+CANDIDATES_PER_KEY = {
+    "random": 1,
+    "numerology_guided": CANDIDATES_PER_PICK,
+    "entropy_targeted": ENTROPY_ATTEMPTS,
+    "pattern_replay": 1,
+    "time_aligned": CANDIDATES_PER_PICK,
+}
+
+
+def _scalar_candidate(strategy: str, target: int) -> None:
+    """Score one candidate the pre-batch way."""
+    from oracle_service.framework_bridge import digit_sum, numerology_reduce
+
+    key = secrets.randbits(256)
+    if strategy == "numerology_guided":
+        key_scoring.numerology_score(key)
+    elif strategy == "time_aligned":
+        key_scoring.numerology_score(key)
+        _ = numerology_reduce(digit_sum(key)) == target
+    elif strategy == "entropy_targeted":
+        key_scoring.key_entropy(key)
+
+
+def bench_scalar(strategy: str, keys: int) -> float:
+    """Candidates/sec scoring one Python int at a time."""
+    target = key_scoring.date_number(*time.localtime()[:3])
+    candidates = keys * CANDIDATES_PER_KEY[strategy]
+    t0 = time.perf_counter()
+    for _ in range(candidates):
+        _scalar_candidate(strategy, target)
+    return candidates / (time.perf_counter() - t0)
+
+
+def bench_batch(brain: ScannerBrain, strategy: str, keys: int, batch: int) -> float:
+    """Candidates/sec through generate_smart_keys in batches of ``batch`` keys."""
+    done = 0
+    t0 = time.perf_counter()
+    while done < keys:
+        brain.generate_smart_keys(min(batch, keys - done), strategy)
+        done += batch
+    return keys * CANDIDATES_PER_KEY[strategy] / (time.perf_counter() - t0)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ScannerBrain key scoring")
+    parser.add_argument("-n", type=int, default=10000, help="Keys per strategy (default 10000)")
+    parser.add_argument(
+        "--scalar-n", type=int, default=300, help="Keys for the slow scalar path (default 300)"
+    )
+    parser.add_argument("--batch", type=int, default=4096, help="Keys per batch (default 4096)")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        with patch("engines.scanner_brain.KNOWLEDGE_DIR", Path(tmpdir)):
+            brain = ScannerBrain()
+        brain._pattern_discoveries = [
+            {"key_hex": format(secrets.randbits(255), "x")} for _ in range(20)
+        ]
+        brain.generate_smart_keys(16, "numerology_guided")  # warm lookup tables
+
+        results = {}
+        for strategy in CANDIDATES_PER_KEY:
+            scalar = bench_scalar(strategy, args.scalar_n)
+            batched = bench_batch(brain, strategy, args.n, args.batch)
+            results[strategy] = {
+                "candidates_per_key": CANDIDATES_PER_KEY[strategy],
+                "scalar_candidates_per_sec": round(scalar),
+                "batch_candidates_per_sec": round(batched),
+                "speedup": round(batched / scalar, 1),
+            }
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{'Strategy':<20} {'Cand/key':>9} {'Scalar c/s':>13} {'Batch c/s':>13} {'Speedup':>9}")
+    print("-" * 68)
+    for strategy, r in results.items():
+        print(
+            f"{strategy:<20} {r['candidates_per_key']:>9} {r['scalar_candidates_per_sec']:>13,} "
+            f"{r['batch_candidates_per_sec']:>13,} {r['speedup']:>8.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
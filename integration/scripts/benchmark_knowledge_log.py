@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Knowledge Persistence Benchmark -- ScannerBrain bytes written and latency per finding.
+
+Compares persisting after every finding the pre-log way (rewriting
+strategy_log.json, pattern_discoveries.json and ai_insights.json,
+pretty-printed, through tmp + rename) against the append-only knowledge
+log (one compact event line per finding, snapshot every ``COMPACT_EVERY``
+events). Also times startup: loading the legacy JSON files versus
+snapshot + log replay. Runs fully in-process; no server required.
+
+Usage:
+    python3 integration/scripts/benchmark_knowledge_log.py
+    python3 integration/scripts/benchmark_knowledge_log.py -n 5000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import secrets
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_PROJECT_ROOT / "services" / "oracle"))
+
+import oracle_service  # noqa: E402, F401 — triggers sys.path shim
+from engines.scanner_brain import ScannerBrain  # noqa: E402
+
+
+def _entry() -> dict:
+    return {
+        "key_hex": format(secrets.randbits(256), "064x"),
+        "addresses": {"btc": "1" + secrets.token_hex(16), "eth": "0x" + secrets.token_hex(20)},
+        "has_balance": False,
+        "score": 0.75,
+    }
+
+
+def _legacy_save(brain: ScannerBrain, directory: Path) -> int:
+    """The pre-log _save_knowledge. Returns bytes written."""
+    written = 0
+    for name, content in (
+        ("strategy_log.json", json.dumps(brain._strategy_log, indent=2)),
+        (
+            "pattern_discoveries.json",
+            json.dumps(brain._pattern_discoveries[-500:], indent=2, default=str),
+        ),
+        ("ai_insights.json", json.dumps(brain._ai_insights[-200:], indent=2, default=str)),
+    ):
+        brain._atomic_write(directory / name, content)
+        written += len(content)
+    return written
+
+
+def _summary(latencies: list, total_bytes: int, n: int) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "bytes_per_finding": round(total_bytes / n, 1),
+        "mean_us": round(statistics.fmean(latencies) * 1e6, 1),
+        "p99_us": round(ordered[int(len(ordered) * 0.99) - 1] * 1e6, 1),
+        "total_mb": round(total_bytes / 1e6, 2),
+    }
+
+
+def bench_legacy(directory: Path, n: int) -> dict:
+    with patch("engines.scanner_brain.KNOWLEDGE_DIR", directory):
+        brain = ScannerBrain()
+    brain._knowledge_log = None  # in-memory only; persistence below
+    total, latencies = 0, []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        brain.record_finding(_entry())
+        total += _legacy_save(brain, directory)
+        latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    for name in ("strategy_log.json", "pattern_discoveries.json", "ai_insights.json"):
+        json.loads((directory / name).read_text())
+    result = _summary(latencies, total, n)
+    result["startup_ms"] = round((time.perf_counter() - t0) * 1e3, 2)
+    return result
+
+
+def bench_log(directory: Path, n: int) -> dict:
+    with patch("engines.scanner_brain.KNOWLEDGE_DIR", directory):
+        brain = ScannerBrain()
+        latencies = []
+        for _ in range(n):
+            t0 = time.perf_counter()
+            brain.record_finding(_entry())
+            latencies.append(time.perf_counter() - t0)
+        brain._knowledge_log.close()
+
+        t0 = time.perf_counter()
+        ScannerBrain()
+        startup = time.perf_counter() - t0
+    result = _summary(latencies, brain._knowledge_log.bytes_written, n)
+    result["startup_ms"] = round(startup * 1e3, 2)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ScannerBrain knowledge persistence")
+    parser.add_argument("-n", type=int, default=3000, help="Findings recorded (default 3000)")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    tmpdir = Path(tempfile.mkdtemp())
+    try:
+        results = {
+            "legacy_rewrite": bench_legacy(tmpdir / "legacy", args.n),
+            "append_log": bench_log(tmpdir / "log", args.n),
+        }
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    legacy, log = results["legacy_rewrite"], results["append_log"]
+    results["bytes_reduction"] = round(legacy["bytes_per_finding"] / log["bytes_per_finding"], 1)
+    results["latency_speedup"] = round(legacy["mean_us"] / log["mean_us"], 1)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(
+        f"\n{'Mode':<16} {'B/finding':>11} {'Mean us':>10} {'p99 us':>10} {'Total MB':>10} {'Startup ms':>11}"
+    )
+    print("-" * 72)
+    for mode in ("legacy_rewrite", "append_log"):
+        r = results[mode]
+        print(
+            f"{mode:<16} {r['bytes_per_finding']:>11,.1f} {r['mean_us']:>10,.1f} "
+            f"{r['p99_us']:>10,.1f} {r['total_mb']:>10,.2f} {r['startup_ms']:>11,.2f}"
+        )
+    print(
+        f"\n{results['bytes_reduction']}x fewer bytes, "
+        f"{results['latency_speedup']}x lower mean latency per finding"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
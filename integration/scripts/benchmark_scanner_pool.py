@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Scanner Pool Benchmark -- keys/sec scaling with worker processes.
+
+Runs ``ScannerPool`` for a fixed duration at 1, 2, 4, ... workers (up to the
+CPU count by default) and reports throughput, speedup over one worker and
+scaling efficiency (speedup / workers; 1.0 is linear). Worker startup is
+excluded: timing begins once every worker has reported ready.
+Runs fully in-process; no server required.
+
+Usage:
+    python3 integration/scripts/benchmark_scanner_pool.py
+    python3 integration/scripts/benchmark_scanner_pool.py --workers 1 2 4 8 -d 5 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import secrets
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_PROJECT_ROOT / "services" / "oracle"))
+
+import oracle_service  # noqa: E402, F401 — triggers sys.path shim
+from engines.scanner_brain import STRATEGIES, ScannerBrain  # noqa: E402
+from engines.scanner_pool import POOL_BATCH_SIZE, ScannerPool  # noqa: E402
+
+
+def _default_workers() -> list[int]:
+    cpus = os.cpu_count() or 1
+    counts, n = [], 1
+    while n < cpus:
+        counts.append(n)
+        n *= 2
+    return counts + [cpus]
+
+
+def bench(brain: ScannerBrain, strategy: str, workers: int, duration: float, batch: int) -> dict:
+    """One timed pool run."""
+    with ScannerPool(brain, workers=workers, batch_size=batch) as pool:
+        stats = pool.run(duration, strategy=strategy)
+    return {
+        "workers": workers,
+        "keys_tested": stats["keys_tested"],
+        "keys_per_sec": round(stats["keys_per_sec"]),
+        "findings": stats["findings"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ScannerPool worker scaling")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=None, help="Worker counts (default 1,2,4..cpus)"
+    )
+    parser.add_argument(
+        "--strategy",
+        choices=STRATEGIES,
+        nargs="+",
+        default=["random", "numerology_guided"],
+        help="Strategies to run (default random numerology_guided)",
+    )
+    parser.add_argument("-d", "--duration", type=float, default=3.0, help="Seconds per run")
+    parser.add_argument("--batch", type=int, default=POOL_BATCH_SIZE, help="Keys per batch")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+    worker_counts = args.workers or _default_workers()
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        with patch("engines.scanner_brain.KNOWLEDGE_DIR", Path(tmpdir)):
+            brain = ScannerBrain()
+        brain._pattern_discoveries = [
+            {"key_hex": format(secrets.randbits(255), "x")} for _ in range(20)
+        ]
+
+        results = {}
+        for strategy in args.strategy:
+            runs = [bench(brain, strategy, w, args.duration, args.batch) for w in worker_counts]
+            base = runs[0]["keys_per_sec"] / runs[0]["workers"] or 1
+            for run in runs:
+                run["speedup"] = round(run["keys_per_sec"] / base, 2)
+                run["efficiency"] = round(run["speedup"] / run["workers"], 2)
+            results[strategy] = runs
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps({"cpus": os.cpu_count(), "results": results}, indent=2))
+        return 0
+
+    print(f"\nCPUs: {os.cpu_count()}   duration: {args.duration}s per run")
+    print(f"\n{'Strategy':<20} {'Workers':>8} {'Keys/sec':>13} {'Speedup':>9} {'Efficiency':>11}")
+    print("-" * 65)
+    for strategy, runs in results.items():
+        for r in runs:
+            print(
+                f"{strategy:<20} {r['workers']:>8} {r['keys_per_sec']:>13,} "
+                f"{r['speedup']:>8.2f}x {r['efficiency']:>11.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Timezone Lookup Benchmark -- startup cost and per-call latency.
+
+Compares the old behaviour (new TimezoneFinder per call) against the shared
+lazily-initialized finder with per-point memoization, in both the
+default (file-backed) and in-memory preload modes. Runs fully in-process;
+no server required.
+
+Usage:
+    python3 integration/scripts/benchmark_timezone.py
+    python3 integration/scripts/benchmark_timezone.py -n 2000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_PROJECT_ROOT / "api"))
+
+from app.services import location_service  # noqa: E402
+from app.services.location_service import LocationService  # noqa: E402
+
+
+def _coords(n: int, seed: int = 60) -> list[tuple[float, float]]:
+    """Random land-ish coordinates, ~half repeated to exercise the memo."""
+    rng = random.Random(seed)
+    base = [(rng.uniform(-50, 65), rng.uniform(-120, 140)) for _ in range(n // 2 or 1)]
+    return base + [rng.choice(base) for _ in range(n - len(base))]
+
+
+def _pct(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def _summary(samples_s: list[float]) -> dict:
+    ms = [s * 1000 for s in samples_s]
+    return {
+        "calls": len(ms),
+        "mean_ms": round(statistics.mean(ms), 4),
+        "p50_ms": round(_pct(ms, 0.50), 4),
+        "p95_ms": round(_pct(ms, 0.95), 4),
+        "p99_ms": round(_pct(ms, 0.99), 4),
+    }
+
+
+def bench_legacy(coords: list[tuple[float, float]]) -> dict:
+    """Old path: construct TimezoneFinder on every call."""
+    from timezonefinder import TimezoneFinder
+
+    samples = []
+    for lat, lon in coords:
+        t0 = time.perf_counter()
+        TimezoneFinder().timezone_at(lat=lat, lng=lon)
+        samples.append(time.perf_counter() - t0)
+    return _summary(samples)
+
+
+def bench_shared(coords: list[tuple[float, float]], in_memory: bool) -> dict:
+    """New path: one shared finder + per-point LRU memo."""
+    location_service._tz_finder = None
+    location_service.reset_caches()
+
+    t0 = time.perf_counter()
+    if in_memory:
+        location_service.preload_timezone_finder(in_memory=True)
+    else:
+        location_service._get_finder()
+    startup_ms = (time.perf_counter() - t0) * 1000
+
+    samples = []
+    for lat, lon in coords:
+        t0 = time.perf_counter()
+        location_service._get_timezone(lat, lon)
+        samples.append(time.perf_counter() - t0)
+
+    svc = LocationService()
+    location_service.reset_caches()
+    t0 = time.perf_counter()
+    svc.timezones_for(coords)
+    batch_ms = (time.perf_counter() - t0) * 1000
+
+    info = location_service._timezone_at_key.cache_info()
+    return {
+        "startup_ms": round(startup_ms, 2),
+        **_summary(samples),
+        "batch_total_ms": round(batch_ms, 2),
+        "memo_hits": info.hits,
+        "memo_misses": info.misses,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark timezone lookups")
+    parser.add_argument("-n", type=int, default=500, help="Lookups per mode (default 500)")
+    parser.add_argument(
+        "--legacy-n", type=int, default=20, help="Lookups for the slow legacy mode (default 20)"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    try:
+        import timezonefinder  # noqa: F401
+    except ImportError:
+        print("timezonefinder is not installed — nothing to benchmark")
+        return 1
+
+    coords = _coords(args.n)
+    results = {
+        "legacy_per_call_finder": bench_legacy(coords[: args.legacy_n]),
+        "shared_lazy": bench_shared(coords, in_memory=False),
+        "shared_preload_in_memory": bench_shared(coords, in_memory=True),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{'Mode':<28} {'Startup':>10} {'Mean':>10} {'P50':>10} {'P95':>10} {'P99':>10}")
+    print("-" * 82)
+    for mode, r in results.items():
+        startup = f"{r['startup_ms']:.1f}ms" if "startup_ms" in r else "-"
+        print(
+            f"{mode:<28} {startup:>10} {r['mean_ms']:>8.3f}ms {r['p50_ms']:>8.3f}ms "
+            f"{r['p95_ms']:>8.3f}ms {r['p99_ms']:>8.3f}ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
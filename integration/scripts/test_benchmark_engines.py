@@ -0,0 +1,63 @@
+"""Unit tests for the engine benchmark's corpora, statistics and baseline gating."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from benchmark_engines import (
+    LATIN_NAMES,
+    PERSIAN_NAMES,
+    build_cases,
+    compare_baselines,
+    date_sweep,
+    measure,
+)
+
+
+def _baseline(**medians: float) -> dict:
+    return {"benchmarks": {name: {"median_us": us} for name, us in medians.items()}}
+
+
+class TestCorpora:
+    """The corpora are fixed so baselines stay comparable across runs."""
+
+    def test_cases_are_deterministic(self) -> None:
+        assert build_cases(LATIN_NAMES, "pythagorean") == build_cases(LATIN_NAMES, "pythagorean")
+        assert date_sweep(5) == date_sweep(5)
+
+    def test_persian_corpus_uses_abjad(self) -> None:
+        cases = build_cases(PERSIAN_NAMES, "abjad")
+        assert {c["numerology_system"] for c in cases} == {"abjad"}
+        assert len({c["current_date"] for c in cases}) == len(date_sweep())
+
+
+class TestMeasure:
+    def test_reports_per_call_statistics(self) -> None:
+        result = measure(lambda x: x * 2, list(range(10)), rounds=5, warmup=1, min_round_ms=1)
+        assert result["corpus"] == 10
+        assert result["calls_per_round"] % 10 == 0
+        assert result["min_us"] <= result["median_us"] <= result["p95_us"]
+        assert result["ops_per_sec"] > 0
+
+
+class TestBaselineComparison:
+    def test_regression_beyond_threshold_fails(self) -> None:
+        current = {"fast": {"median_us": 10.5}, "slow": {"median_us": 13.0}}
+        lines, regressions = compare_baselines(current, _baseline(fast=10.0, slow=10.0), 10.0)
+        assert regressions == ["slow"]
+        assert "STABLE" in lines[0] and "REGRESSION" in lines[1]
+
+    def test_improvement_and_per_benchmark_override(self) -> None:
+        current = {"a": {"median_us": 5.0}, "b": {"median_us": 14.0}}
+        lines, regressions = compare_baselines(
+            current, _baseline(a=10.0, b=10.0), 10.0, overrides={"b": 50.0}
+        )
+        assert regressions == []
+        assert "IMPROVED" in lines[0] and "STABLE" in lines[1]
+
+    def test_new_and_missing_benchmarks_do_not_fail(self) -> None:
+        lines, regressions = compare_baselines({"new": {"median_us": 1.0}}, _baseline(old=1.0))
+        assert regressions == []
+        assert "NEW" in lines[0] and "MISSING" in lines[1]
@@ -0,0 +1,138 @@
+"""Unit tests for the load generator's schedule, scenario mix and latency correction."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from loadgen import (
+    LoadResult,
+    RateProfile,
+    arrival_times,
+    build_plan,
+    build_report,
+    parse_mix,
+    resolve_scenarios,
+    run_load,
+    write_csv,
+)
+from perf_audit import compare_baselines
+
+
+class TestSchedule:
+    def test_constant_rate_is_evenly_spaced(self) -> None:
+        times = arrival_times(RateProfile("constant", rate=10, duration=2))
+        assert len(times) == 19
+        gaps = {round(b - a, 6) for a, b in zip(times, times[1:])}
+        assert gaps == {0.1}
+
+    def test_ramp_arrivals_get_denser(self) -> None:
+        times = arrival_times(RateProfile("ramp", rate=5, peak_rate=50, duration=10))
+        first = sum(1 for t in times if t < 2)
+        last = sum(1 for t in times if t >= 8)
+        assert last > 4 * first
+
+    def test_spike_only_inside_its_window(self) -> None:
+        profile = RateProfile("spike", rate=10, peak_rate=100, duration=10, spike_at=4, spike_for=2)
+        times = arrival_times(profile)
+        assert 190 <= sum(1 for t in times if 4 <= t < 6) <= 201
+        assert sum(1 for t in times if t < 4) <= 40
+
+    def test_poisson_is_seeded(self) -> None:
+        profile = RateProfile("constant", rate=50, duration=5)
+        assert arrival_times(profile, poisson=True, seed=3) == arrival_times(
+            profile, poisson=True, seed=3
+        )
+        assert 200 < len(arrival_times(profile, poisson=True, seed=3)) < 300
+
+
+class TestMix:
+    def test_parse_and_weighted_assignment(self) -> None:
+        mix = parse_mix("reading=3, daily=1")
+        assert mix == {"reading": 3.0, "daily": 1.0}
+        plan = build_plan([i / 100 for i in range(4000)], mix, seed=1)
+        readings = sum(1 for _, name in plan if name == "reading")
+        assert 2800 < readings < 3200
+
+    def test_rejects_unknown_and_empty_mixes(self) -> None:
+        with pytest.raises(ValueError, match="unknown scenario"):
+            parse_mix("reading=1,nope=2")
+        with pytest.raises(ValueError):
+            parse_mix("reading=0")
+
+    def test_user_placeholder_is_filled(self) -> None:
+        resolved = resolve_scenarios(["framework_time", "daily"], user_id=7)
+        assert resolved["framework_time"]["payload"]["user_id"] == 7
+        assert resolved["daily"]["payload"] is None
+
+
+class TestCoordinatedOmission:
+    def test_queueing_behind_a_slow_server_is_counted(self) -> None:
+        """A single-file server at 10ms/request fed every 2ms: service time stays
+        ~10ms, but latency from the intended send time keeps growing."""
+        server = asyncio.Lock()
+
+        async def send(name: str) -> int:
+            async with server:
+                await asyncio.sleep(0.01)
+            return 200
+
+        plan = [(i * 0.002, "reading") for i in range(40)]
+        result = asyncio.run(run_load(plan, send, max_inflight=1))
+        stats = result.stats["reading"]
+        assert stats.ok == 40
+        assert stats.uncorrected.quantile(0.99) < 0.05
+        assert stats.corrected.quantile(0.99) > 0.25
+        assert result.send_lag.quantile(0.99) > 0.2
+
+    def test_errors_and_timeouts_stay_in_the_tail(self) -> None:
+        async def send(name: str) -> int:
+            if name == "daily":
+                raise TimeoutError
+            return 503 if name == "name" else 200
+
+        plan = [(0.0, "reading"), (0.0, "name"), (0.001, "daily")]
+        result = asyncio.run(run_load(plan, send, timeout=2.0))
+        assert result.stats["name"].statuses == {"503": 1}
+        assert result.stats["name"].corrected.total == 1
+        daily = result.stats["daily"]
+        assert daily.statuses == {"TimeoutError": 1} and daily.errors == 1
+        assert daily.corrected.quantile(0.99) >= 1.9
+        assert daily.uncorrected.quantile(0.99) >= 1.9
+        assert result.stats["reading"].ok == 1
+
+
+class TestReport:
+    def _report(self) -> dict:
+        async def send(name: str) -> int:
+            return 200
+
+        plan = build_plan([i * 0.001 for i in range(20)], {"reading": 1, "daily": 1})
+        result: LoadResult = asyncio.run(run_load(plan, send))
+        return build_report(result, {"profile": "constant"})
+
+    def test_report_feeds_perf_audit_comparison(self, tmp_path) -> None:
+        report = self._report()
+        assert set(report["endpoints"]) == {"reading", "daily"}
+        entry = report["endpoints"]["reading"]
+        assert entry["min_ms"] <= entry["p50_ms"] <= entry["p95_ms"] <= entry["max_ms"]
+        assert entry["passed"] and "p95_ms" in entry["uncorrected"]
+
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps(report))
+        lines = compare_baselines(report["endpoints"], str(path))
+        assert len(lines) == 2 and all("STABLE" in line for line in lines)
+
+    def test_csv_has_a_row_per_scenario(self, tmp_path) -> None:
+        path = tmp_path / "load.csv"
+        write_csv(self._report(), str(path))
+        rows = list(csv.DictReader(path.open()))
+        assert [r["scenario"] for r in rows] == ["daily", "reading"]
+        assert rows[0]["uncorrected_p95_ms"]
+        assert sum(int(r["samples"]) for r in rows) == 20
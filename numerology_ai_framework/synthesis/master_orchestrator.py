@@ -18,6 +18,9 @@ Pipeline (10 steps):
 8. Reading via ReadingEngine
 9. Translation via UniverseTranslator
 10. Assemble final dict
+
+Each step runs in a ``framework.<step>`` tracing span when the NPS Oracle
+service's tracing module is importable (no-op otherwise).
 """
 
 import sys
@@ -40,6 +43,14 @@ from synthesis.universe_translator import UniverseTranslator
 from datetime import datetime
 from typing import Dict, Optional
 
+try:
+    from oracle_service.tracing import span as _span
+except ImportError:  # standalone framework: steps are not traced
+    from contextlib import nullcontext
+
+    def _span(name, **attributes):
+        return nullcontext()
+
 
 class MasterOrchestrator:
     """
@@ -88,152 +99,163 @@ class MasterOrchestrator:
             Complete reading dictionary with all calculated values
         """
         # Step 1: Validate + resolve current date/time
-        if current_date is None:
-            current_date = datetime.now()
-
-        year = current_date.year
-        month = current_date.month
-        day = current_date.day
-        hour = current_hour if current_hour is not None else current_date.hour
-        minute = current_minute if current_minute is not None else current_date.minute
-        second = current_second if current_second is not None else current_date.second
-        has_time = current_hour is not None or current_minute is not None
+        with _span("framework.validate"):
+            if current_date is None:
+                current_date = datetime.now()
+
+            year = current_date.year
+            month = current_date.month
+            day = current_date.day
+            hour = current_hour if current_hour is not None else current_date.hour
+            minute = current_minute if current_minute is not None else current_date.minute
+            second = current_second if current_second is not None else current_date.second
+            has_time = current_hour is not None or current_minute is not None
 
         # Step 2: FC60 stamp (Mode A)
-        fc60_stamp = FC60StampEngine.encode(
-            year,
-            month,
-            day,
-            hour,
-            minute,
-            second,
-            tz_hours,
-            tz_minutes,
-            has_time=has_time,
-        )
+        with _span("framework.fc60_stamp"):
+            fc60_stamp = FC60StampEngine.encode(
+                year,
+                month,
+                day,
+                hour,
+                minute,
+                second,
+                tz_hours,
+                tz_minutes,
+                has_time=has_time,
+            )
 
         if mode == "stamp_only":
             return {"fc60_stamp": fc60_stamp}
 
         # Step 3: Numerology
-        numerology = NumerologyEngine.complete_profile(
-            full_name=full_name,
-            birth_day=birth_day,
-            birth_month=birth_month,
-            birth_year=birth_year,
-            current_year=year,
-            current_month=month,
-            current_day=day,
-            mother_name=mother_name,
-            system=numerology_system,
-            gender=gender,
-        )
+        with _span("framework.numerology"):
+            numerology = NumerologyEngine.complete_profile(
+                full_name=full_name,
+                birth_day=birth_day,
+                birth_month=birth_month,
+                birth_year=birth_year,
+                current_year=year,
+                current_month=month,
+                current_day=day,
+                mother_name=mother_name,
+                system=numerology_system,
+                gender=gender,
+            )
 
         # Step 4: Moon phase
-        current_jdn = fc60_stamp["_jdn"]
-        moon_data = MoonEngine.full_moon_info(current_jdn)
+        with _span("framework.moon"):
+            current_jdn = fc60_stamp["_jdn"]
+            moon_data = MoonEngine.full_moon_info(current_jdn)
 
         # Step 5: Ganzhi (year + day + hour)
-        ganzhi_data = {
-            "year": GanzhiEngine.full_year_info(year),
-            "day": GanzhiEngine.full_day_info(current_jdn),
-        }
-        if has_time:
-            day_stem_idx = ganzhi_data["day"]["stem_index"]
-            stem_idx, branch_idx = GanzhiEngine.hour_ganzhi(hour, day_stem_idx)
-            ganzhi_data["hour"] = {
-                "stem_token": GanzhiEngine.STEMS[stem_idx],
-                "branch_token": GanzhiEngine.ANIMALS[branch_idx],
-                "animal_name": GanzhiEngine.ANIMAL_NAMES[branch_idx],
+        with _span("framework.ganzhi"):
+            ganzhi_data = {
+                "year": GanzhiEngine.full_year_info(year),
+                "day": GanzhiEngine.full_day_info(current_jdn),
             }
+            if has_time:
+                day_stem_idx = ganzhi_data["day"]["stem_index"]
+                stem_idx, branch_idx = GanzhiEngine.hour_ganzhi(hour, day_stem_idx)
+                ganzhi_data["hour"] = {
+                    "stem_token": GanzhiEngine.STEMS[stem_idx],
+                    "branch_token": GanzhiEngine.ANIMALS[branch_idx],
+                    "animal_name": GanzhiEngine.ANIMAL_NAMES[branch_idx],
+                }
 
         # Step 6: Heartbeat
-        birth_jdn = JulianDateEngine.gregorian_to_jdn(
-            birth_year, birth_month, birth_day
-        )
-        age_days = current_jdn - birth_jdn
-        age_years = int(age_days // 365.25)
-        heartbeat_data = HeartbeatEngine.heartbeat_profile(age_years, actual_bpm)
+        with _span("framework.heartbeat"):
+            birth_jdn = JulianDateEngine.gregorian_to_jdn(
+                birth_year, birth_month, birth_day
+            )
+            age_days = current_jdn - birth_jdn
+            age_years = int(age_days // 365.25)
+            heartbeat_data = HeartbeatEngine.heartbeat_profile(age_years, actual_bpm)
 
         # Step 7: Location (if coordinates given)
-        location_data = None
-        if latitude is not None and longitude is not None:
-            location_data = LocationEngine.location_signature(latitude, longitude)
+        with _span("framework.location"):
+            location_data = None
+            if latitude is not None and longitude is not None:
+                location_data = LocationEngine.location_signature(latitude, longitude)
 
         # Step 8: Reading
-        reading = ReadingEngine.generate_reading(
-            fc60_stamp=fc60_stamp,
-            numerology_profile=numerology,
-            moon_data=moon_data,
-            ganzhi_data=ganzhi_data,
-            heartbeat_data=heartbeat_data,
-            location_data=location_data,
-        )
+        with _span("framework.reading"):
+            reading = ReadingEngine.generate_reading(
+                fc60_stamp=fc60_stamp,
+                numerology_profile=numerology,
+                moon_data=moon_data,
+                ganzhi_data=ganzhi_data,
+                heartbeat_data=heartbeat_data,
+                location_data=location_data,
+            )
 
         # Step 9: Calculate confidence (before translation so we can pass it)
-        confidence_data = MasterOrchestrator._calculate_confidence(
-            numerology,
-            moon_data,
-            ganzhi_data,
-            heartbeat_data,
-            location_data,
-            reading,
-        )
+        with _span("framework.confidence"):
+            confidence_data = MasterOrchestrator._calculate_confidence(
+                numerology,
+                moon_data,
+                ganzhi_data,
+                heartbeat_data,
+                location_data,
+                reading,
+            )
 
         # Step 10: Translation (with unified confidence)
-        translation = UniverseTranslator.translate(
-            reading=reading,
-            fc60_stamp=fc60_stamp,
-            numerology_profile=numerology,
-            person_name=full_name,
-            current_date_str=current_date.strftime("%Y-%m-%d"),
-            confidence_override=confidence_data["score"],
-        )
+        with _span("framework.translation"):
+            translation = UniverseTranslator.translate(
+                reading=reading,
+                fc60_stamp=fc60_stamp,
+                numerology_profile=numerology,
+                person_name=full_name,
+                current_date_str=current_date.strftime("%Y-%m-%d"),
+                confidence_override=confidence_data["score"],
+            )
 
         # Step 10: Assemble final dict
-        # Preserve backward-compatible keys
-        birth_weekday = WeekdayCalculator.full_info(birth_jdn)
-        current_weekday = WeekdayCalculator.full_info(current_jdn)
-
-        result = {
-            # Backward-compatible keys
-            "person": {
-                "name": full_name,
-                "birthdate": f"{birth_year:04d}-{birth_month:02d}-{birth_day:02d}",
-                "age_years": age_years,
-                "age_days": age_days,
-            },
-            "birth": {
-                "jdn": birth_jdn,
-                "jdn_fc60": Base60Codec.encode_base60(birth_jdn),
-                "weekday": birth_weekday["name"],
-                "planet": birth_weekday["planet"],
-                "year_fc60": Base60Codec.encode_base60(birth_year),
-            },
-            "current": {
-                "date": current_date.strftime("%Y-%m-%d"),
-                "jdn": current_jdn,
-                "jdn_fc60": fc60_stamp["j60"],
-                "weekday": current_weekday["name"],
-                "planet": current_weekday["planet"],
-                "domain": current_weekday["domain"],
-                "year_fc60": fc60_stamp["y60"],
-            },
-            "numerology": numerology,
-            "patterns": MasterOrchestrator._detect_patterns(
-                numerology, current_weekday, reading
-            ),
-            "confidence": confidence_data,
-            "synthesis": translation.get("full_text", ""),
-            # New keys (v2.0)
-            "fc60_stamp": fc60_stamp,
-            "moon": moon_data,
-            "ganzhi": ganzhi_data,
-            "heartbeat": heartbeat_data,
-            "location": location_data,
-            "reading": reading,
-            "translation": translation,
-        }
+        with _span("framework.assemble"):
+            # Preserve backward-compatible keys
+            birth_weekday = WeekdayCalculator.full_info(birth_jdn)
+            current_weekday = WeekdayCalculator.full_info(current_jdn)
+
+            result = {
+                # Backward-compatible keys
+                "person": {
+                    "name": full_name,
+                    "birthdate": f"{birth_year:04d}-{birth_month:02d}-{birth_day:02d}",
+                    "age_years": age_years,
+                    "age_days": age_days,
+                },
+                "birth": {
+                    "jdn": birth_jdn,
+                    "jdn_fc60": Base60Codec.encode_base60(birth_jdn),
+                    "weekday": birth_weekday["name"],
+                    "planet": birth_weekday["planet"],
+                    "year_fc60": Base60Codec.encode_base60(birth_year),
+                },
+                "current": {
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "jdn": current_jdn,
+                    "jdn_fc60": fc60_stamp["j60"],
+                    "weekday": current_weekday["name"],
+                    "planet": current_weekday["planet"],
+                    "domain": current_weekday["domain"],
+                    "year_fc60": fc60_stamp["y60"],
+                },
+                "numerology": numerology,
+                "patterns": MasterOrchestrator._detect_patterns(
+                    numerology, current_weekday, reading
+                ),
+                "confidence": confidence_data,
+                "synthesis": translation.get("full_text", ""),
+                # New keys (v2.0)
+                "fc60_stamp": fc60_stamp,
+                "moon": moon_data,
+                "ganzhi": ganzhi_data,
+                "heartbeat": heartbeat_data,
+                "location": location_data,
+                "reading": reading,
+                "translation": translation,
+            }
 
         return result
 
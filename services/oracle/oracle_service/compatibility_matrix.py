@@ -0,0 +1,310 @@
+"""Compatibility Matrix — vectorized NxN scoring for MultiUserAnalyzer.
+
+``MultiUserAnalyzer.calculate_pairwise`` scores one pair at a time: it
+re-extracts comparison data and runs five Python scoring functions, which
+is fine for five users and far too slow for groups of hundreds. This module
+scores a whole group at once:
+
+1. Each user's life path, element, animal and moon phase is encoded as an
+   integer code, and their detected patterns as a row of a 0/1 incidence
+   matrix (``encode_features``).
+2. 2D lookup tables hold the life-path, element, animal and moon scores for
+   every pair of codes. They are built from the analyzer's own scalar scoring
+   functions, so matrix scores are identical to ``calculate_pairwise``.
+3. The weighted score matrix is one broadcasted table lookup per dimension
+   (``table[codes[:, None], codes[None, :]]``). Shared-pattern counts come
+   from ``P @ P.T``.
+
+Top-k strongest / most challenging pairs are selected with ``argpartition``
+over the upper triangle, and ``CompatibilityResult`` objects are built only
+for the pairs returned.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from oracle_service.models.reading_types import CompatibilityResult, ReadingResult
+
+LIFE_PATHS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 22, 33)
+ELEMENTS = ("Wood", "Fire", "Earth", "Metal", "Water")
+ANIMALS = (
+    "Rat",
+    "Ox",
+    "Tiger",
+    "Rabbit",
+    "Dragon",
+    "Snake",
+    "Horse",
+    "Goat",
+    "Monkey",
+    "Rooster",
+    "Dog",
+    "Pig",
+)
+
+
+def _analyzer():
+    from oracle_service.multi_user_analyzer import MultiUserAnalyzer
+
+    return MultiUserAnalyzer
+
+
+def _moon_scorer(phase_a: str, phase_b: str) -> float:
+    return _analyzer().score_moon_alignment({"phase_name": phase_a}, {"phase_name": phase_b})
+
+
+class FeatureVocabulary:
+    """Canonical values of one categorical dimension plus their score table.
+
+    Codes for canonical values are stable (their index in ``values``), so
+    encoded features can be stored and reused. Values outside the canonical
+    set are appended per batch and scored with the same scalar function.
+    """
+
+    def __init__(self, values: Sequence[Any], scorer: Callable[[Any, Any], float]):
+        self.values = tuple(values)
+        self.index = {v: i for i, v in enumerate(self.values)}
+        self.scorer = scorer
+        self._table: Optional[np.ndarray] = None
+
+    @property
+    def table(self) -> np.ndarray:
+        if self._table is None:
+            self._table = self._build(self.values)
+        return self._table
+
+    def _build(self, values: Sequence[Any]) -> np.ndarray:
+        return np.array([[self.scorer(a, b) for b in values] for a in values], dtype=np.float64)
+
+    def encode(self, values: Sequence[Any]) -> tuple[np.ndarray, np.ndarray]:
+        """Return (codes, table) for ``values``; extends the table if needed."""
+        extra: Dict[Any, int] = {}
+        codes = np.empty(len(values), dtype=np.int32)
+        for i, value in enumerate(values):
+            code = self.index.get(value)
+            if code is None:
+                code = extra.setdefault(value, len(self.values) + len(extra))
+            codes[i] = code
+        if not extra:
+            return codes, self.table
+        return codes, self._build(self.values + tuple(extra))
+
+
+_VOCABULARIES: Dict[str, FeatureVocabulary] = {}
+
+
+def vocabulary(name: str) -> FeatureVocabulary:
+    """Shared vocabulary for ``life_path``, ``element``, ``animal`` or ``moon``."""
+    vocab = _VOCABULARIES.get(name)
+    if vocab is None:
+        analyzer = _analyzer()
+        vocab = {
+            "life_path": lambda: FeatureVocabulary(
+                LIFE_PATHS, analyzer.score_life_path_compatibility
+            ),
+            "element": lambda: FeatureVocabulary(ELEMENTS, analyzer.score_element_compatibility),
+            "animal": lambda: FeatureVocabulary(ANIMALS, analyzer.score_animal_compatibility),
+            "moon": lambda: FeatureVocabulary(analyzer.PHASE_ORDER, _moon_scorer),
+        }[name]()
+        _VOCABULARIES[name] = vocab
+    return vocab
+
+
+def pattern_key(pattern: Any) -> tuple:
+    """Identity of a detected pattern, as compared by ``score_pattern_overlap``.
+
+    Accepts a pattern dict or an already-extracted ``(type, key)`` pair.
+    """
+    if isinstance(pattern, dict):
+        return (pattern.get("type"), pattern.get("number", pattern.get("animal")))
+    return tuple(pattern)
+
+
+@dataclass
+class CompatibilityFeatures:
+    """Integer-encoded comparison data for a group of users."""
+
+    user_ids: List[int]
+    life_path: np.ndarray
+    element: np.ndarray
+    animal: np.ndarray
+    moon: np.ndarray
+    patterns: np.ndarray  # (n_users, n_pattern_keys) 0/1 incidence
+    tables: Dict[str, np.ndarray]
+    elements: List[str]
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+
+def encode_features(comparisons: Sequence[Dict], user_ids: Sequence[int]) -> CompatibilityFeatures:
+    """Encode ``MultiUserAnalyzer._extract_comparison_data`` dicts."""
+    tables: Dict[str, np.ndarray] = {}
+    encoded: Dict[str, np.ndarray] = {}
+    for name in ("life_path", "element", "animal"):
+        encoded[name], tables[name] = vocabulary(name).encode([c[name] for c in comparisons])
+    encoded["moon"], tables["moon"] = vocabulary("moon").encode(
+        [(c.get("moon") or {}).get("phase_name", "") for c in comparisons]
+    )
+
+    pattern_columns: Dict[tuple, int] = {}
+    rows = []
+    for c in comparisons:
+        rows.append(
+            {
+                pattern_columns.setdefault(pattern_key(p), len(pattern_columns))
+                for p in c["patterns"]
+            }
+        )
+    incidence = np.zeros((len(comparisons), len(pattern_columns)), dtype=np.int32)
+    for i, cols in enumerate(rows):
+        if cols:
+            incidence[i, list(cols)] = 1
+
+    return CompatibilityFeatures(
+        user_ids=list(user_ids),
+        life_path=encoded["life_path"],
+        element=encoded["element"],
+        animal=encoded["animal"],
+        moon=encoded["moon"],
+        patterns=incidence,
+        tables=tables,
+        elements=[c["element"] for c in comparisons],
+    )
+
+
+def features_from_readings(readings: Sequence[ReadingResult]) -> CompatibilityFeatures:
+    analyzer = _analyzer()
+    comparisons = [analyzer._extract_comparison_data(r) for r in readings]
+    return encode_features(comparisons, [r.user_id for r in readings])
+
+
+def compact_comparison(reading: ReadingResult) -> Dict:
+    """JSON-safe comparison data for storage; scores the same as the reading."""
+    data = _analyzer()._extract_comparison_data(reading)
+    keys = {pattern_key(p) for p in data["patterns"]}
+    return {
+        "life_path": data["life_path"],
+        "element": data["element"],
+        "animal": data["animal"],
+        "moon": {"phase_name": (data["moon"] or {}).get("phase_name", "")},
+        "patterns": sorted((list(k) for k in keys), key=repr),
+    }
+
+
+def pattern_scores(shared: np.ndarray, has_a: np.ndarray, has_b: np.ndarray) -> np.ndarray:
+    """Vectorized ``score_pattern_overlap`` from shared-pattern counts."""
+    scores = np.where(shared >= 2, 0.9, np.where(shared == 1, 0.7, 0.4))
+    return np.where(has_a & has_b, scores, 0.5)
+
+
+def component_scores(
+    features: CompatibilityFeatures, rows: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """Per-dimension scores of ``rows`` (default: everyone) against every user."""
+    f = features
+    rows = np.arange(len(f)) if rows is None else np.asarray(rows)
+
+    def lookup(name: str, codes: np.ndarray) -> np.ndarray:
+        return f.tables[name][codes[rows][:, None], codes[None, :]]
+
+    has = f.patterns.any(axis=1)
+    return {
+        "life_path": lookup("life_path", f.life_path),
+        "element": lookup("element", f.element),
+        "animal": lookup("animal", f.animal),
+        "moon": lookup("moon", f.moon),
+        "pattern": pattern_scores(
+            f.patterns[rows] @ f.patterns.T, has[rows][:, None], has[None, :]
+        ),
+    }
+
+
+def weighted_score(components: Dict[str, np.ndarray]) -> np.ndarray:
+    """Overall compatibility from component scores (MultiUserAnalyzer weights)."""
+    analyzer = _analyzer()
+    c = components
+    return (
+        c["life_path"] * analyzer.WEIGHT_LIFE_PATH
+        + c["element"] * analyzer.WEIGHT_ELEMENT
+        + c["animal"] * analyzer.WEIGHT_ANIMAL
+        + c["moon"] * analyzer.WEIGHT_MOON
+        + c["pattern"] * analyzer.WEIGHT_PATTERN
+    )
+
+
+def score_row(features: CompatibilityFeatures, i: int) -> np.ndarray:
+    """Overall scores of user ``i`` against every user — O(N), no NxN matrix."""
+    return weighted_score(component_scores(features, np.array([i])))[0]
+
+
+def top_pair_indices(scores: np.ndarray, k: int, strongest: bool = True) -> List[tuple]:
+    """``(i, j)`` (i < j) of the ``k`` highest (or lowest) entries of a
+    symmetric score matrix, best-first (worst-first), ties in row order."""
+    rows, cols = np.triu_indices(scores.shape[0], 1)
+    if k <= 0 or rows.size == 0:
+        return []
+    values = scores[rows, cols]
+    keyed = -values if strongest else values
+    k = min(k, values.size)
+    picked = np.argpartition(keyed, k - 1)[:k] if k < values.size else np.arange(values.size)
+    picked = picked[np.lexsort((picked, keyed[picked]))]
+    return [(int(rows[p]), int(cols[p])) for p in picked]
+
+
+class CompatibilityMatrix:
+    """Full NxN component and weighted score matrices for a group."""
+
+    DIMENSIONS = ("life_path", "element", "animal", "moon", "pattern")
+
+    def __init__(self, features: CompatibilityFeatures):
+        self.features = features
+        self.components = component_scores(features)
+        self.overall = weighted_score(self.components)
+
+    @classmethod
+    def from_readings(cls, readings: Sequence[ReadingResult]) -> "CompatibilityMatrix":
+        return cls(features_from_readings(readings))
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    @property
+    def pair_count(self) -> int:
+        n = len(self)
+        return n * (n - 1) // 2
+
+    def harmony(self) -> float:
+        """Mean of the rounded pair scores, as reported per pair (0.0 for < 2 users)."""
+        if self.pair_count == 0:
+            return 0.0
+        pair_scores = np.round(self.overall[np.triu_indices(len(self), 1)], 4)
+        return float(pair_scores.sum()) / self.pair_count
+
+    def element_balance(self) -> Dict[str, int]:
+        return dict(Counter(self.features.elements))
+
+    def pair(self, i: int, j: int) -> CompatibilityResult:
+        """Materialize the CompatibilityResult for users ``i`` and ``j``."""
+        c = self.components
+        return _analyzer().build_compatibility(
+            self.features.user_ids[i],
+            self.features.user_ids[j],
+            *(float(c[name][i, j]) for name in self.DIMENSIONS),
+        )
+
+    def all_pairs(self) -> List[CompatibilityResult]:
+        """Every pair, in ``itertools.combinations`` order."""
+        rows, cols = np.triu_indices(len(self), 1)
+        return [self.pair(int(i), int(j)) for i, j in zip(rows, cols)]
+
+    def top_pairs(self, k: int, strongest: bool = True) -> List[CompatibilityResult]:
+        """The ``k`` most (or least) compatible pairs, best-first (worst-first)."""
+        return [self.pair(i, j) for i, j in top_pair_indices(self.overall, k, strongest)]
+
+    def row(self, i: int) -> np.ndarray:
+        """Overall scores of user ``i`` against every user (self included)."""
+        return self.overall[i]
@@ -85,6 +85,7 @@ class DailyScheduler:
         """
         from app.orm.oracle_user import OracleUser
         from app.services.oracle_reading import OracleReadingService
+        from oracle_service.work_scheduler import BATCH, priority
 
         stats = {"total_users": 0, "generated": 0, "cached": 0, "errors": 0}
         db = self.db_session_factory()
@@ -95,26 +96,28 @@ class DailyScheduler:
             logger.info("Generating daily readings for %d active users", len(active_users))
 
             svc = OracleReadingService(db)
-            for user in active_users:
-                try:
-                    result = await svc.create_daily_reading(
-                        user_id=user.id,
-                        date_str=None,  # today
-                        locale="en",
-                        numerology_system="auto",
-                        force_regenerate=False,
-                    )
-                    if result.get("_cached"):
-                        stats["cached"] += 1
-                    else:
-                        stats["generated"] += 1
-                except Exception:
-                    logger.warning(
-                        "Failed to generate daily for user %d",
-                        user.id,
-                        exc_info=True,
-                    )
-                    stats["errors"] += 1
+            # Batch class: bulk generation yields to interactive and bot readings
+            with priority(BATCH):
+                for user in active_users:
+                    try:
+                        result = await svc.create_daily_reading(
+                            user_id=user.id,
+                            date_str=None,  # today
+                            locale="en",
+                            numerology_system="auto",
+                            force_regenerate=False,
+                        )
+                        if result.get("_cached"):
+                            stats["cached"] += 1
+                        else:
+                            stats["generated"] += 1
+                    except Exception:
+                        logger.warning(
+                            "Failed to generate daily for user %d",
+                            user.id,
+                            exc_info=True,
+                        )
+                        stats["errors"] += 1
 
             db.commit()
             logger.info("Daily generation complete: %s", stats)
@@ -0,0 +1,547 @@
+"""
+Async AI Client — asyncio-native Messages API path
+===================================================
+Async counterpart to ai_client.generate() for callers running on an event
+loop. Instead of the process-wide ``_rate_lock`` + ``time.sleep`` limiter,
+requests are admitted by:
+  - A token bucket (burst capacity + steady refill rate)
+  - A concurrency cap of N in-flight requests
+  - Retry with full-jitter exponential backoff (honours Retry-After on 429)
+  - One overall deadline (default NPS_AI_TIMEOUT = 30s) that cancels the
+    in-flight HTTP request and any pending backoff when it expires
+  - A shared pooled httpx.AsyncClient (keep-alive connections reused)
+
+The response cache is shared with ai_client, so sync and async callers hit
+the same entries. Return shape matches ai_client.generate().
+
+generate_stream() uses the SSE stream and hands each text delta to a
+callback as it arrives, for progressive section delivery.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from engines import ai_client
+
+logger = logging.getLogger(__name__)
+
+# ════════════════════════════════════════════════════════════
+# Configuration (env vars)
+# ════════════════════════════════════════════════════════════
+
+_API_URL = "https://api.anthropic.com"
+_API_VERSION = "2023-06-01"
+
+_DEFAULT_MAX_CONCURRENCY = 4  # NPS_AI_MAX_CONCURRENCY
+_DEFAULT_RATE_PER_SEC = 4.0  # NPS_AI_RATE_PER_SEC — token refill rate
+_DEFAULT_MAX_RETRIES = 3  # NPS_AI_MAX_RETRIES
+_BACKOFF_BASE = 0.5  # seconds
+_BACKOFF_MAX = 8.0  # seconds
+_RETRY_AFTER_MAX = 10.0  # cap on server-requested waits
+_CONNECT_TIMEOUT = 10.0  # seconds; reads are bounded by the per-call deadline
+
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504, 529}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (ValueError, TypeError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (ValueError, TypeError):
+        return default
+
+
+def async_enabled() -> bool:
+    """Whether callers should prefer the async path (NPS_AI_ASYNC=true)."""
+    return os.environ.get("NPS_AI_ASYNC", "").lower() in ("1", "true", "yes")
+
+
+# ════════════════════════════════════════════════════════════
+# Token bucket
+# ════════════════════════════════════════════════════════════
+
+
+class TokenBucket:
+    """Asyncio token bucket.
+
+    Holds up to ``capacity`` tokens, refilled continuously at ``rate`` tokens
+    per second. ``acquire()`` takes one token, waiting (without blocking the
+    loop) until one is available. Waiters are served FIFO.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+
+# ════════════════════════════════════════════════════════════
+# Client
+# ════════════════════════════════════════════════════════════
+
+
+class _RetryableStatus(Exception):
+    def __init__(self, status: int, retry_after: float | None, message: str):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AsyncAIClient:
+    """Concurrency-limited async client for the Anthropic Messages API.
+
+    Parameters
+    ----------
+    api_key : str or None
+        Defaults to ANTHROPIC_API_KEY.
+    base_url : str or None
+        Defaults to ANTHROPIC_BASE_URL, then the public API.
+    max_concurrency : int
+        Maximum in-flight requests (also the connection-pool size).
+    rate_per_sec : float
+        Token refill rate; burst capacity equals ``max_concurrency``.
+    max_retries : int
+        Retries after the first attempt for 429/5xx/connection errors.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        max_concurrency: int | None = None,
+        rate_per_sec: float | None = None,
+        max_retries: int | None = None,
+        backoff_base: float = _BACKOFF_BASE,
+        backoff_max: float = _BACKOFF_MAX,
+    ):
+        self.api_key = api_key if api_key is not None else os.environ.get("ANTHROPIC_API_KEY", "")
+        self.base_url = (base_url or os.environ.get("ANTHROPIC_BASE_URL") or _API_URL).rstrip("/")
+        self.max_concurrency = max_concurrency or _env_int(
+            "NPS_AI_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY
+        )
+        rate = rate_per_sec or _env_float("NPS_AI_RATE_PER_SEC", _DEFAULT_RATE_PER_SEC)
+        self.max_retries = (
+            max_retries
+            if max_retries is not None
+            else _env_int("NPS_AI_MAX_RETRIES", _DEFAULT_MAX_RETRIES)
+        )
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.bucket = TokenBucket(rate, self.max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._http = None
+        self.in_flight = 0
+
+    def _get_http(self):
+        """Lazily create the pooled httpx.AsyncClient."""
+        if self._http is None:
+            import httpx
+
+            # No httpx read/write timeout (its 5 s default would cut off normal
+            # completions); the asyncio.timeout around each call is the bound.
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(None, connect=_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                headers={
+                    "x-api-key": self.api_key,
+                    "anthropic-version": _API_VERSION,
+                    "content-type": "application/json",
+                },
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _backoff(self, attempt: int, retry_after: float | None) -> float:
+        if retry_after is not None:
+            return min(retry_after, _RETRY_AFTER_MAX)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+    @staticmethod
+    def _payload(
+        prompt: str, system_prompt: str, max_tokens: int | None, temperature: float
+    ) -> dict:
+        if max_tokens is None:
+            max_tokens = _env_int("NPS_AI_MAX_TOKENS", ai_client._DEFAULT_MAX_TOKENS)
+        payload: dict = {
+            "model": os.environ.get("NPS_AI_MODEL", ai_client._DEFAULT_MODEL),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system_prompt:
+            payload["system"] = system_prompt
+        return payload
+
+    async def _send_once(self, payload: dict) -> str:
+        """One admitted request. Raises _RetryableStatus or httpx errors."""
+        import httpx
+
+        await self.bucket.acquire()
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                resp = await self._get_http().post("/v1/messages", json=payload)
+            finally:
+                self.in_flight -= 1
+
+        if resp.status_code in _RETRYABLE_STATUS:
+            raise _RetryableStatus(
+                resp.status_code,
+                _parse_retry_after(resp.headers.get("retry-after")),
+                f"HTTP {resp.status_code}",
+            )
+        if resp.status_code >= 400:
+            raise httpx.HTTPStatusError(
+                f"HTTP {resp.status_code}: {resp.text[:200]}", request=resp.request, response=resp
+            )
+
+        data = resp.json()
+        content = data.get("content") or []
+        return content[0].get("text", "") if content else ""
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        max_tokens: int | None = None,
+        temperature: float = 0.7,
+        use_cache: bool = True,
+        timeout: float | None = None,
+    ) -> dict:
+        """Async equivalent of ai_client.generate().
+
+        ``timeout`` bounds the whole call including retries and backoff
+        (default NPS_AI_TIMEOUT). Cancelling the awaiting task cancels the
+        in-flight request.
+        """
+        import httpx
+
+        key = ai_client._cache_key(prompt, system_prompt)
+        if use_cache:
+            cached = ai_client._read_cache(key)
+            if cached is not None:
+                return _result(True, cached, None, 0.0, cached=True)
+
+        if timeout is None:
+            timeout = float(_env_int("NPS_AI_TIMEOUT", ai_client._DEFAULT_TIMEOUT))
+        payload = self._payload(prompt, system_prompt, max_tokens, temperature)
+
+        start = time.monotonic()
+        retried = False
+        last_error = "Retry exhausted"
+        try:
+            async with asyncio.timeout(timeout):
+                for attempt in range(self.max_retries + 1):
+                    try:
+                        text = await self._send_once(payload)
+                    except (_RetryableStatus, httpx.TransportError) as exc:
+                        last_error = str(exc) or type(exc).__name__
+                        if attempt >= self.max_retries:
+                            break
+                        retried = True
+                        delay = self._backoff(attempt, getattr(exc, "retry_after", None))
+                        logger.warning(
+                            "Async AI retryable error (attempt %d): %s — retrying in %.2fs",
+                            attempt + 1,
+                            last_error,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    except httpx.HTTPError as exc:
+                        last_error = _redact(str(exc), self.api_key)
+                        logger.error("Async AI non-retryable error: %s", last_error)
+                        break
+
+                    if use_cache and text:
+                        ai_client._write_cache(key, text)
+                    return _result(True, text, None, time.monotonic() - start, retried=retried)
+        except TimeoutError:
+            last_error = f"AI request timed out after {timeout:.0f}s"
+            logger.warning(last_error)
+
+        return _result(False, "", last_error, time.monotonic() - start, retried=retried)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        on_text: Callable[[str], Awaitable[None]] | None = None,
+        max_tokens: int | None = None,
+        temperature: float = 0.7,
+        use_cache: bool = True,
+        timeout: float | None = None,
+    ) -> dict:
+        """Streaming generate(): ``on_text`` is awaited with each text delta.
+
+        Uses the Messages API SSE stream. Retries only happen before the
+        first delta is delivered; a failure mid-stream returns success=False
+        with the partial text in ``response``. A cache hit is delivered as
+        a single delta. Return shape matches generate().
+        """
+        import httpx
+
+        key = ai_client._cache_key(prompt, system_prompt)
+        if use_cache:
+            cached = ai_client._read_cache(key)
+            if cached is not None:
+                if on_text is not None:
+                    await on_text(cached)
+                return _result(True, cached, None, 0.0, cached=True)
+
+        if timeout is None:
+            timeout = float(_env_int("NPS_AI_TIMEOUT", ai_client._DEFAULT_TIMEOUT))
+        payload = self._payload(prompt, system_prompt, max_tokens, temperature)
+        payload["stream"] = True
+
+        start = time.monotonic()
+        retried = False
+        last_error = "Retry exhausted"
+        chunks: list[str] = []
+        try:
+            async with asyncio.timeout(timeout):
+                for attempt in range(self.max_retries + 1):
+                    try:
+                        async for delta in self._stream_once(payload):
+                            chunks.append(delta)
+                            if on_text is not None:
+                                await on_text(delta)
+                    except (_RetryableStatus, httpx.TransportError) as exc:
+                        last_error = str(exc) or type(exc).__name__
+                        if chunks or attempt >= self.max_retries:
+                            break
+                        retried = True
+                        delay = self._backoff(attempt, getattr(exc, "retry_after", None))
+                        logger.warning(
+                            "Async AI stream retryable error (attempt %d): %s — retrying in %.2fs",
+                            attempt + 1,
+                            last_error,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    except httpx.HTTPError as exc:
+                        last_error = _redact(str(exc), self.api_key)
+                        logger.error("Async AI stream non-retryable error: %s", last_error)
+                        break
+
+                    text = "".join(chunks)
+                    if use_cache and text:
+                        ai_client._write_cache(key, text)
+                    return _result(True, text, None, time.monotonic() - start, retried=retried)
+        except TimeoutError:
+            last_error = f"AI request timed out after {timeout:.0f}s"
+            logger.warning(last_error)
+
+        return _result(
+            False, "".join(chunks), last_error, time.monotonic() - start, retried=retried
+        )
+
+    async def _stream_once(self, payload: dict) -> AsyncIterator[str]:
+        """One admitted streaming request, yielding text deltas from SSE events."""
+        import httpx
+
+        await self.bucket.acquire()
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                async with self._get_http().stream("POST", "/v1/messages", json=payload) as resp:
+                    if resp.status_code in _RETRYABLE_STATUS:
+                        raise _RetryableStatus(
+                            resp.status_code,
+                            _parse_retry_after(resp.headers.get("retry-after")),
+                            f"HTTP {resp.status_code}",
+                        )
+                    if resp.status_code >= 400:
+                        body = (await resp.aread()).decode("utf-8", "replace")
+                        raise httpx.HTTPStatusError(
+                            f"HTTP {resp.status_code}: {body[:200]}",
+                            request=resp.request,
+                            response=resp,
+                        )
+                    async for line in resp.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        event = json.loads(line[5:].strip() or "{}")
+                        etype = event.get("type")
+                        if etype == "content_block_delta":
+                            delta = event.get("delta") or {}
+                            if delta.get("type") == "text_delta" and delta.get("text"):
+                                yield delta["text"]
+                        elif etype == "message_stop":
+                            return
+                        elif etype == "error":
+                            err = event.get("error") or {}
+                            if err.get("type") == "overloaded_error":
+                                raise _RetryableStatus(529, None, "HTTP 529 (stream)")
+                            raise httpx.HTTPError(f"Stream error: {err.get('type', 'unknown')}")
+            finally:
+                self.in_flight -= 1
+
+
+def _parse_retry_after(header: str | None) -> float | None:
+    if not header:
+        return None
+    try:
+        return float(header)
+    except ValueError:
+        return None
+
+
+def _redact(message: str, api_key: str) -> str:
+    if api_key and api_key in message:
+        return message.replace(api_key, "***")
+    return message
+
+
+def _result(
+    success: bool,
+    response: str,
+    error: str | None,
+    elapsed: float,
+    cached: bool = False,
+    retried: bool = False,
+) -> dict:
+    return {
+        "success": success,
+        "response": response,
+        "error": error,
+        "elapsed": elapsed,
+        "cached": cached,
+        "retried": retried,
+    }
+
+
+# ════════════════════════════════════════════════════════════
+# Module-level shared client
+# ════════════════════════════════════════════════════════════
+
+_shared_client: AsyncAIClient | None = None
+_shared_loop = None
+
+
+def get_async_client() -> AsyncAIClient:
+    """Return the shared client for the running event loop.
+
+    asyncio primitives and pooled connections are bound to one loop, so a
+    fresh client is created if the loop changes (e.g. between test runs).
+    """
+    global _shared_client, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_loop is not loop:
+        _shared_client = AsyncAIClient()
+        _shared_loop = loop
+    return _shared_client
+
+
+async def close_async_client() -> None:
+    """Close the shared client's connection pool (call on shutdown)."""
+    global _shared_client, _shared_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_loop = None
+
+
+async def generate_async(
+    prompt: str,
+    system_prompt: str = "",
+    max_tokens: int | None = None,
+    temperature: float = 0.7,
+    use_cache: bool = True,
+    timeout: float | None = None,
+) -> dict:
+    """Async ai_client.generate() through the shared limited client."""
+    if not ai_client.is_available():
+        return _result(False, "", "AI not available (no SDK or API key)", 0.0)
+    return await get_async_client().generate(
+        prompt,
+        system_prompt=system_prompt,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        use_cache=use_cache,
+        timeout=timeout,
+    )
+
+
+async def generate_reading_async(
+    user_prompt: str,
+    system_prompt: str,
+    locale: str = "en",
+    max_tokens: int = ai_client._DEFAULT_MAX_TOKENS_SINGLE,
+    use_cache: bool = True,
+    timeout: float | None = None,
+) -> dict:
+    """Async ai_client.generate_reading()."""
+    return await generate_async(
+        prompt=user_prompt,
+        system_prompt=system_prompt,
+        max_tokens=max_tokens,
+        use_cache=use_cache,
+        timeout=timeout,
+    )
+
+
+async def generate_reading_stream_async(
+    user_prompt: str,
+    system_prompt: str,
+    on_text: Callable[[str], Awaitable[None]] | None = None,
+    locale: str = "en",
+    max_tokens: int = ai_client._DEFAULT_MAX_TOKENS_SINGLE,
+    use_cache: bool = True,
+    timeout: float | None = None,
+) -> dict:
+    """Streaming generate_reading_async(); ``on_text`` receives each delta."""
+    if not ai_client.is_available():
+        return _result(False, "", "AI not available (no SDK or API key)", 0.0)
+    return await get_async_client().generate_stream(
+        user_prompt,
+        system_prompt=system_prompt,
+        on_text=on_text,
+        max_tokens=max_tokens,
+        use_cache=use_cache,
+        timeout=timeout,
+    )
@@ -10,7 +10,12 @@ Result classes:
 
 Public API:
   - interpret_reading(reading, reading_type, question, locale, use_cache)
+  - interpret_reading_async(...) — same, via the async AI client
+  - interpret_reading_stream(reading, on_section, ...) — streams sections as they complete
   - interpret_multi_user(readings, names, locale)
+
+Signal-identical readings can share one interpretation through the
+persistent fingerprint cache (engines.interpretation_cache, opt-in).
 """
 
 from __future__ import annotations
@@ -18,6 +23,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 
 from engines.ai_client import generate_reading, is_available
@@ -45,6 +51,9 @@ _SECTION_KEYS = [
     "footer",
 ]
 
+# Streamed in place of a section key: discard the sections sent so far
+SECTIONS_RESET = "reset"
+
 _SECTION_MARKERS_EN: dict[str, list[str]] = {
     "header": ["READING FOR", "reading for"],
     "universal_address": [
@@ -186,7 +195,89 @@ def interpret_reading(
         result.confidence_score = confidence_score
         return result
 
-    # Build prompts
+    interp_cache = _interp_cache_for(use_cache, question, category, inquiry_context)
+    if interp_cache is not None:
+        cached_text = interp_cache.get(reading, reading_type, locale)
+        if cached_text is not None:
+            elapsed_ms = (time.time() - start) * 1000
+            return _interpretation_from_cache(cached_text, locale, elapsed_ms, confidence_score)
+
+    user_prompt, system_prompt = _build_prompts(
+        reading, reading_type, question, locale, category, inquiry_context
+    )
+
+    # Call AI
+    ai_result = generate_reading(
+        user_prompt=user_prompt,
+        system_prompt=system_prompt,
+        locale=locale,
+        use_cache=use_cache,
+    )
+    if interp_cache is not None and ai_result["success"]:
+        interp_cache.put(reading, reading_type, locale, ai_result["response"])
+    elapsed_ms = (time.time() - start) * 1000
+    return _interpretation_from_result(ai_result, reading, locale, elapsed_ms, confidence_score)
+
+
+async def interpret_reading_async(
+    reading: dict,
+    reading_type: str = "daily",
+    question: str = "",
+    locale: str = "en",
+    use_cache: bool = True,
+    category: str | None = None,
+    inquiry_context: dict[str, str] | None = None,
+    timeout: float | None = None,
+) -> ReadingInterpretation:
+    """Async interpret_reading() via the concurrency-limited async AI client.
+
+    Parameters are the same as interpret_reading(); ``timeout`` bounds the
+    AI call (default NPS_AI_TIMEOUT) and falls back on expiry.
+    """
+    from engines.ai_client_async import generate_reading_async
+
+    confidence_score = _extract_confidence(reading)
+    start = time.time()
+
+    if not is_available():
+        logger.info("AI unavailable, using framework fallback for reading")
+        result = _build_fallback(reading, locale)
+        result.elapsed_ms = (time.time() - start) * 1000
+        result.confidence_score = confidence_score
+        return result
+
+    interp_cache = _interp_cache_for(use_cache, question, category, inquiry_context)
+    if interp_cache is not None:
+        cached_text = interp_cache.get(reading, reading_type, locale)
+        if cached_text is not None:
+            elapsed_ms = (time.time() - start) * 1000
+            return _interpretation_from_cache(cached_text, locale, elapsed_ms, confidence_score)
+
+    user_prompt, system_prompt = _build_prompts(
+        reading, reading_type, question, locale, category, inquiry_context
+    )
+    ai_result = await generate_reading_async(
+        user_prompt=user_prompt,
+        system_prompt=system_prompt,
+        locale=locale,
+        use_cache=use_cache,
+        timeout=timeout,
+    )
+    if interp_cache is not None and ai_result["success"]:
+        interp_cache.put(reading, reading_type, locale, ai_result["response"])
+    elapsed_ms = (time.time() - start) * 1000
+    return _interpretation_from_result(ai_result, reading, locale, elapsed_ms, confidence_score)
+
+
+def _build_prompts(
+    reading: dict,
+    reading_type: str,
+    question: str,
+    locale: str,
+    category: str | None,
+    inquiry_context: dict[str, str] | None,
+) -> tuple[str, str]:
+    """Build (user_prompt, system_prompt) for a single reading."""
     user_prompt = build_reading_prompt(
         reading,
         reading_type=reading_type,
@@ -195,17 +286,141 @@ def interpret_reading(
         category=category or "",
         inquiry_context=inquiry_context,
     )
-    system_prompt = get_system_prompt(locale)
+    return user_prompt, get_system_prompt(locale)
 
-    # Call AI
-    ai_result = generate_reading(
+
+async def interpret_reading_stream(
+    reading: dict,
+    on_section: Callable[[str, str], Awaitable[None]],
+    reading_type: str = "daily",
+    question: str = "",
+    locale: str = "en",
+    use_cache: bool = True,
+    category: str | None = None,
+    inquiry_context: dict[str, str] | None = None,
+    timeout: float | None = None,
+) -> ReadingInterpretation:
+    """Streaming interpret_reading_async().
+
+    ``on_section(key, text)`` is awaited for each section as soon as it is
+    complete in the model's output stream. The returned ReadingInterpretation
+    is parsed from the full text, as in interpret_reading(). Cache hits and
+    fallbacks are delivered section by section as well. If the model fails
+    after some sections went out, ``on_section(SECTIONS_RESET, "")`` tells
+    the receiver to discard them before the whole fallback is delivered.
+    """
+    from engines.ai_client_async import generate_reading_stream_async
+
+    confidence_score = _extract_confidence(reading)
+    start = time.time()
+
+    if not is_available():
+        logger.info("AI unavailable, using framework fallback for reading")
+        result = _build_fallback(reading, locale)
+        result.elapsed_ms = (time.time() - start) * 1000
+        result.confidence_score = confidence_score
+        await _emit_sections(result, on_section)
+        return result
+
+    interp_cache = _interp_cache_for(use_cache, question, category, inquiry_context)
+    if interp_cache is not None:
+        cached_text = interp_cache.get(reading, reading_type, locale)
+        if cached_text is not None:
+            elapsed_ms = (time.time() - start) * 1000
+            result = _interpretation_from_cache(cached_text, locale, elapsed_ms, confidence_score)
+            await _emit_sections(result, on_section)
+            return result
+
+    user_prompt, system_prompt = _build_prompts(
+        reading, reading_type, question, locale, category, inquiry_context
+    )
+    splitter = SectionStream(locale)
+
+    async def on_text(delta: str) -> None:
+        for key, text in splitter.feed(delta):
+            await on_section(key, text)
+
+    ai_result = await generate_reading_stream_async(
         user_prompt=user_prompt,
         system_prompt=system_prompt,
+        on_text=on_text,
         locale=locale,
         use_cache=use_cache,
+        timeout=timeout,
     )
+    if ai_result["success"]:
+        for key, text in splitter.finish():
+            await on_section(key, text)
+        if interp_cache is not None:
+            interp_cache.put(reading, reading_type, locale, ai_result["response"])
     elapsed_ms = (time.time() - start) * 1000
+    result = _interpretation_from_result(ai_result, reading, locale, elapsed_ms, confidence_score)
+    if not result.ai_generated:
+        if splitter.emitted:
+            await on_section(SECTIONS_RESET, "")
+        await _emit_sections(result, on_section)
+    return result
+
+
+async def _emit_sections(
+    result: ReadingInterpretation,
+    on_section: Callable[[str, str], Awaitable[None]],
+) -> None:
+    """Deliver a finished interpretation's non-empty sections in order.
+
+    A synthesis-only fallback has no sections; its full text goes out as
+    the message.
+    """
+    sections = [(key, getattr(result, key, "")) for key in _SECTION_KEYS]
+    if not any(text for _, text in sections) and result.full_text:
+        sections = [("message", result.full_text)]
+    for key, text in sections:
+        if text:
+            await on_section(key, text)
+
+
+def _interp_cache_for(
+    use_cache: bool,
+    question: str,
+    category: str | None,
+    inquiry_context: dict[str, str] | None,
+):
+    """Shared interpretation cache, if enabled and applicable to this request.
+
+    Question/category/inquiry readings depend on free-text input that the
+    fingerprint does not capture, so they always go to the model.
+    """
+    if not use_cache or question or category or inquiry_context:
+        return None
+    from engines.interpretation_cache import get_interpretation_cache
+
+    return get_interpretation_cache()
+
+
+def _interpretation_from_cache(
+    text: str,
+    locale: str,
+    elapsed_ms: float,
+    confidence_score: int,
+) -> ReadingInterpretation:
+    """Build a ReadingInterpretation from personalized cached text."""
+    return _interpretation_from_result(
+        {"success": True, "response": text, "cached": True},
+        {},
+        locale,
+        elapsed_ms,
+        confidence_score,
+    )
+
 
+def _interpretation_from_result(
+    ai_result: dict,
+    reading: dict,
+    locale: str,
+    elapsed_ms: float,
+    confidence_score: int,
+) -> ReadingInterpretation:
+    """Turn an ai_client result dict into a ReadingInterpretation (or fallback)."""
     if ai_result["success"]:
         sections = _parse_sections(ai_result["response"], locale)
         return ReadingInterpretation(
@@ -326,53 +541,93 @@ def _parse_sections(text: str, locale: str = "en") -> dict[str, str]:
     markers = _SECTION_MARKERS_FA if locale == "fa" else _SECTION_MARKERS_EN
     result: dict[str, str] = {key: "" for key in _SECTION_KEYS}
 
-    # Find positions of each section
-    found: list[tuple[int, str]] = []  # (position, section_key)
-    for section_key, marker_list in markers.items():
-        for marker in marker_list:
-            pos = text.find(marker)
-            if pos != -1:
-                found.append((pos, section_key))
-                break  # Use first match for each section
-
+    found = _find_sections(text, markers)
     if not found:
         # No sections found — put everything in message
         result["message"] = text.strip()
         return result
 
-    # Sort by position
-    found.sort(key=lambda x: x[0])
-
     # Extract text between markers
     for i, (pos, section_key) in enumerate(found):
-        if i + 1 < len(found):
-            next_pos = found[i + 1][0]
-            section_text = text[pos:next_pos]
-        else:
-            section_text = text[pos:]
-
-        # Strip the marker line itself
-        lines = section_text.split("\n")
-        # Remove first line (the marker) and divider lines
-        content_lines = []
-        for j, line in enumerate(lines):
-            if j == 0:
-                # Keep the first line if it contains more than just the marker
-                stripped = line.strip()
-                for marker in markers.get(section_key, []):
-                    stripped = stripped.replace(marker, "").strip()
-                if stripped and stripped != "---":
-                    content_lines.append(stripped)
-                continue
-            if line.strip() == "---":
-                continue
-            content_lines.append(line)
-
-        result[section_key] = "\n".join(content_lines).strip()
+        end = found[i + 1][0] if i + 1 < len(found) else len(text)
+        result[section_key] = _section_body(text[pos:end], markers.get(section_key, []))
 
     return result
 
 
+def _find_sections(text: str, markers: dict[str, list[str]]) -> list[tuple[int, str]]:
+    """(position, section_key) of each section header found, sorted by position."""
+    found: list[tuple[int, str]] = []
+    for section_key, marker_list in markers.items():
+        for marker in marker_list:
+            pos = text.find(marker)
+            if pos != -1:
+                found.append((pos, section_key))
+                break  # Use first match for each section
+    found.sort(key=lambda x: x[0])
+    return found
+
+
+def _section_body(section_text: str, section_markers: list[str]) -> str:
+    """Strip the marker line itself and divider lines from one section's text."""
+    lines = section_text.split("\n")
+    content_lines = []
+    for j, line in enumerate(lines):
+        if j == 0:
+            # Keep the first line if it contains more than just the marker
+            stripped = line.strip()
+            for marker in section_markers:
+                stripped = stripped.replace(marker, "").strip()
+            if stripped and stripped != "---":
+                content_lines.append(stripped)
+            continue
+        if line.strip() == "---":
+            continue
+        content_lines.append(line)
+    return "\n".join(content_lines).strip()
+
+
+class SectionStream:
+    """Incremental section splitter for streamed AI text.
+
+    ``feed()`` takes text deltas and returns the sections that became
+    complete, i.e. whose following section header has now arrived. Only
+    whole lines are scanned, so a header split across deltas is not matched
+    early. ``finish()`` returns the remaining sections once the stream ends.
+    """
+
+    def __init__(self, locale: str = "en"):
+        self.markers = _SECTION_MARKERS_FA if locale == "fa" else _SECTION_MARKERS_EN
+        self.text = ""
+        self.emitted: set[str] = set()
+
+    def feed(self, delta: str) -> list[tuple[str, str]]:
+        self.text += delta
+        complete = self.text[: self.text.rfind("\n") + 1]
+        found = _find_sections(complete, self.markers)
+        return self._emit(complete, found, upto=len(found) - 1)
+
+    def finish(self) -> list[tuple[str, str]]:
+        found = _find_sections(self.text, self.markers)
+        if not found:
+            if "message" in self.emitted or not self.text.strip():
+                return []
+            self.emitted.add("message")
+            return [("message", self.text.strip())]
+        return self._emit(self.text, found, upto=len(found))
+
+    def _emit(self, text: str, found: list[tuple[int, str]], upto: int) -> list[tuple[str, str]]:
+        out: list[tuple[str, str]] = []
+        for i in range(max(upto, 0)):
+            pos, key = found[i]
+            if key in self.emitted:
+                continue
+            end = found[i + 1][0] if i + 1 < len(found) else len(text)
+            self.emitted.add(key)
+            out.append((key, _section_body(text[pos:end], self.markers.get(key, []))))
+        return out
+
+
 # ════════════════════════════════════════════════════════════
 # Fallback
 # ════════════════════════════════════════════════════════════
@@ -0,0 +1,386 @@
+"""
+Interpretation Cache — persistent, fingerprint-keyed AI reading cache
+=====================================================================
+ai_client's cache is keyed on the raw prompt, which embeds the person's
+name, dates and FC60 stamp, so two readings with identical numerology
+signals never share an entry. This cache keys on a canonical fingerprint
+of the framework signals instead:
+
+  reading_type, locale, life path, personal year, moon phase,
+  ganzhi (year / day / hour), detected patterns, confidence level
+
+Stored text is a template: personal values (name and each part of it,
+dates in the common spellings, FC60 stamp, weekday, confidence %) are
+replaced with ``{{placeholders}}`` on write and filled back in for the
+requesting person on read. Text in which any personal value survives
+templating is not cached, so one person's details are never served to
+another.
+
+Storage is SQLite (WAL), so entries survive restarts and are shared by
+every worker on the host. Eviction is size-aware: when the stored text
+exceeds ``max_bytes``, least-recently-used entries are dropped.
+
+Disabled unless NPS_AI_INTERP_CACHE=true.
+  NPS_AI_INTERP_CACHE_PATH       SQLite file (default data/interpretation_cache.db)
+  NPS_AI_INTERP_CACHE_MAX_BYTES  size budget (default 50 MB)
+  NPS_AI_INTERP_CACHE_TTL        max entry age in seconds (default 30 days)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DEFAULT_PATH = DATA_DIR / "interpretation_cache.db"
+
+_DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+_DEFAULT_TTL = 30 * 86400
+_FINGERPRINT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interpretations (
+    fingerprint TEXT PRIMARY KEY,
+    template    TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    created     REAL NOT NULL,
+    last_used   REAL NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_interpretations_last_used ON interpretations(last_used);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('total_bytes', 0);
+"""
+
+
+# ════════════════════════════════════════════════════════════
+# Fingerprint + templating
+# ════════════════════════════════════════════════════════════
+
+
+def _get(d: dict, *path, default=None):
+    for key in path:
+        if not isinstance(d, dict):
+            return default
+        d = d.get(key)
+    return default if d is None else d
+
+
+def fingerprint(reading: dict, reading_type: str, locale: str) -> str:
+    """Canonical SHA-256 fingerprint of the signals an interpretation depends on."""
+    life_path = _get(reading, "numerology", "life_path")
+    if isinstance(life_path, dict):
+        life_path = life_path.get("number")
+    patterns = sorted(
+        (str(p.get("type", "")), str(p.get("strength", "")), str(p.get("message", "")))
+        for p in _get(reading, "patterns", "detected", default=[])
+        if isinstance(p, dict)
+    )
+    signals = {
+        "v": _FINGERPRINT_VERSION,
+        "reading_type": reading_type,
+        "locale": locale,
+        "life_path": life_path,
+        "personal_year": _get(reading, "numerology", "personal_year"),
+        "moon_phase": _get(reading, "moon", "phase_name"),
+        "ganzhi": [
+            _get(reading, "ganzhi", "year", "traditional_name"),
+            _get(reading, "ganzhi", "day", "gz_token"),
+            _get(reading, "ganzhi", "hour", "animal_name"),
+        ],
+        "patterns": patterns,
+        "confidence": _get(reading, "confidence", "level"),
+    }
+    canonical = json.dumps(signals, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+_MONTHS = (
+    "January February March April May June July August September October November December"
+).split()
+_PLACEHOLDER = re.compile(r"\{\{\w+\}\}")
+
+
+def _ordinal(day: int) -> str:
+    suffix = "th" if 11 <= day <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
+    return f"{day}{suffix}"
+
+
+def _date_spellings(iso: str) -> dict[str, str]:
+    """Other ways a ``YYYY-MM-DD`` date is commonly written, keyed by format."""
+    try:
+        y, m, d = (int(part) for part in iso.split("-"))
+        month = _MONTHS[m - 1]
+    except (ValueError, IndexError):
+        return {}
+    spellings = {
+        "dmy": f"{d:02d}/{m:02d}/{y}",
+        "mdy": f"{m:02d}/{d:02d}/{y}",
+        "dmy_short": f"{d}/{m}/{y}",
+        "mdy_short": f"{m}/{d}/{y}",
+        "ymd_slash": f"{y}/{m:02d}/{d:02d}",
+        "dmy_dot": f"{d:02d}.{m:02d}.{y}",
+        "long": f"{month} {d}, {y}",
+        "long_dmy": f"{d} {month} {y}",
+        "long_ordinal": f"{month} {_ordinal(d)}, {y}",
+        "abbr": f"{month[:3]} {d}, {y}",
+        "month_day": f"{month} {d}",
+        "day_month": f"{d} {month}",
+        "month_ordinal": f"{month} {_ordinal(d)}",
+        "ordinal_of_month": f"{_ordinal(d)} of {month}",
+    }
+    return {k: v for k, v in spellings.items() if v != iso}
+
+
+def personal_values(reading: dict) -> dict[str, str]:
+    """Per-person values substituted into cached templates."""
+    values = {
+        "name": _get(reading, "person", "name"),
+        "birthdate": _get(reading, "person", "birthdate"),
+        "date": _get(reading, "current", "date"),
+        "weekday": _get(reading, "current", "weekday"),
+        "fc60": _get(reading, "fc60_stamp", "fc60"),
+        "j60": _get(reading, "fc60_stamp", "j60"),
+    }
+    score = _get(reading, "confidence", "score")
+    if score is not None:
+        values["confidence"] = f"{score}%"
+    values = {k: str(v) for k, v in values.items() if v not in (None, "")}
+
+    parts = values.get("name", "").split()
+    if len(parts) > 1:
+        for i, part in enumerate(parts, 1):
+            values[f"name_{i}"] = part
+    for key in ("birthdate", "date"):
+        if key in values:
+            for fmt, spelling in _date_spellings(values[key]).items():
+                values[f"{key}_{fmt}"] = spelling
+    return values
+
+
+def _token_pattern(value: str) -> str:
+    return r"(?<!\w)" + re.escape(value) + r"(?!\w)"
+
+
+def templatize(text: str, values: dict[str, str]) -> str:
+    """Replace personal values with ``{{key}}`` placeholders (longest first).
+
+    Only whole tokens are replaced, so the name "Ali" leaves "Alignment" alone.
+    """
+    for key, value in sorted(values.items(), key=lambda kv: -len(kv[1])):
+        text = re.sub(_token_pattern(value), "{{" + key + "}}", text)
+    return text
+
+
+def leaked_values(template: str, values: dict[str, str]) -> list[str]:
+    """Keys of personal values still present in ``template``, ignoring case."""
+    return [
+        key
+        for key, value in values.items()
+        if re.search(_token_pattern(value), template, re.IGNORECASE)
+    ]
+
+
+def personalize(template: str, values: dict[str, str]) -> str | None:
+    """Fill placeholders; None if the template needs a value we don't have."""
+    text = template
+    for key, value in values.items():
+        text = text.replace("{{" + key + "}}", value)
+    if _PLACEHOLDER.search(text):
+        return None
+    return text
+
+
+# ════════════════════════════════════════════════════════════
+# SQLite store
+# ════════════════════════════════════════════════════════════
+
+
+class InterpretationCache:
+    """SQLite-backed template store with LRU size-budget eviction."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_PATH,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        ttl: float = _DEFAULT_TTL,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, reading: dict, reading_type: str, locale: str) -> str | None:
+        """Return personalized cached text for this reading, or None."""
+        fp = fingerprint(reading, reading_type, locale)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT template, created FROM interpretations WHERE fingerprint = ?", (fp,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl:
+                self._delete(fp)
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            text = personalize(row[0], personal_values(reading))
+            if text is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE interpretations SET last_used = ?, hits = hits + 1 WHERE fingerprint = ?",
+                (now, fp),
+            )
+            self._conn.commit()
+            self.hits += 1
+            return text
+
+    def put(self, reading: dict, reading_type: str, locale: str, text: str) -> None:
+        """Store ``text`` as a template under the reading's fingerprint."""
+        if not text:
+            return
+        fp = fingerprint(reading, reading_type, locale)
+        values = personal_values(reading)
+        template = templatize(text, values)
+        leaked = leaked_values(template, values)
+        if leaked:
+            logger.debug("Not caching interpretation: personal values remain (%s)", leaked)
+            return
+        size = len(template.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._delete(fp)
+            self._conn.execute(
+                "INSERT INTO interpretations (fingerprint, template, size, created, last_used)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (fp, template, size, now, now),
+            )
+            self._add_bytes(size)
+            self._evict_to_budget()
+            self._conn.commit()
+
+    def _delete(self, fp: str) -> None:
+        """Delete one entry and adjust the byte total. Caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT size FROM interpretations WHERE fingerprint = ?", (fp,)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM interpretations WHERE fingerprint = ?", (fp,))
+            self._add_bytes(-row[0])
+
+    def _add_bytes(self, delta: int) -> None:
+        self._conn.execute("UPDATE meta SET value = value + ? WHERE key = 'total_bytes'", (delta,))
+
+    def _total_bytes(self) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'total_bytes'").fetchone()
+        return row[0] if row else 0
+
+    def _evict_to_budget(self) -> None:
+        """Drop least-recently-used entries until under max_bytes."""
+        while self._total_bytes() > self.max_bytes:
+            victims = self._conn.execute(
+                "SELECT fingerprint, size FROM interpretations ORDER BY last_used ASC LIMIT 32"
+            ).fetchall()
+            if not victims:
+                break
+            over = self._total_bytes() - self.max_bytes
+            for fp, size in victims:
+                self._conn.execute("DELETE FROM interpretations WHERE fingerprint = ?", (fp,))
+                self._add_bytes(-size)
+                self.evictions += 1
+                over -= size
+                if over <= 0:
+                    break
+
+    def stats(self) -> dict:
+        """Hit rate (this process) plus store size (all processes)."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM interpretations").fetchone()[0]
+            total_bytes = self._total_bytes()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "total_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM interpretations")
+            self._conn.execute("UPDATE meta SET value = 0 WHERE key = 'total_bytes'")
+            self._conn.commit()
+            self.hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ════════════════════════════════════════════════════════════
+# Module-level instance
+# ════════════════════════════════════════════════════════════
+
+_instance: InterpretationCache | None = None
+_instance_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return os.environ.get("NPS_AI_INTERP_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def get_interpretation_cache() -> InterpretationCache | None:
+    """Shared cache instance, or None when disabled or the store can't open."""
+    global _instance
+    if not is_enabled():
+        return None
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                try:
+                    _instance = InterpretationCache(
+                        path=os.environ.get("NPS_AI_INTERP_CACHE_PATH") or DEFAULT_PATH,
+                        max_bytes=int(
+                            os.environ.get("NPS_AI_INTERP_CACHE_MAX_BYTES", _DEFAULT_MAX_BYTES)
+                        ),
+                        ttl=float(os.environ.get("NPS_AI_INTERP_CACHE_TTL", _DEFAULT_TTL)),
+                    )
+                except (sqlite3.Error, OSError, ValueError):
+                    logger.warning("Interpretation cache unavailable", exc_info=True)
+                    return None
+    return _instance
+
+
+def reset_interpretation_cache() -> None:
+    """Close and forget the shared instance. Useful for testing."""
+    global _instance
+    with _instance_lock:
+        if _instance is not None:
+            _instance.close()
+        _instance = None
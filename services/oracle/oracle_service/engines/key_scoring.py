@@ -0,0 +1,398 @@
+"""
+Key Scoring -- Batched statistics for 256-bit candidate keys
+=============================================================
+Candidate keys are held as NumPy arrays of four uint64 limbs (most
+significant first), so thousands of keys are generated, filtered and scored
+per call instead of one Python int at a time:
+
+- hex digit statistics and Shannon entropy from 64 nibbles per key
+- decimal digit sums (life path) and base-60 digits (FC60 animals and
+  elements), extracted by repeated long division of 32-bit half-limbs by
+  10^9 / 60^5 -- a few dozen vector ops for the whole batch
+- the numerology score (``NUMEROLOGY_FACTORS``) and the time-alignment score
+  used by ScannerBrain's strategies
+
+``numerology_score`` is the scalar reference; ``numerology_scores`` matches
+it key for key. ``select_*`` helpers pick the best candidate per group of
+``candidates_per_pick`` for each strategy.
+"""
+
+import math
+import secrets
+from functools import lru_cache
+
+import numpy as np
+
+# secp256k1 curve order
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+LIMBS = 4
+MASTER_NUMBERS = (11, 22, 33)
+POWER_NUMBERS = (1, 8, 9, 11, 22, 33)
+
+NUMEROLOGY_FACTORS = {
+    "master_number": 0.25,
+    "animal_repetition": 0.20,
+    "element_balance": 0.15,
+    "life_path_power": 0.15,
+    "moon_alignment": 0.10,
+    "ganzhi_match": 0.10,
+    "sacred_geometry": 0.05,
+}
+MOON_ALIGNMENT = {0: 0.9, 4: 1.0, 1: 0.6, 3: 0.6, 5: 0.7, 7: 0.5, 2: 0.5, 6: 0.4}
+FIBONACCI = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987, 1597, 2584]
+GOLDEN = 1.6180339887
+
+_DECIMAL_CHUNK = 10**9  # 9 decimal digits per division pass
+_BASE60_CHUNK = 60**5  # 5 base-60 digits per division pass
+_PASSES = 9  # 2**256 < 10**81 and < 60**45
+_MAX_DIGIT_SUM = 9 * 78  # 2**256 has at most 78 decimal digits
+_SMALL_KEY = FIBONACCI[-1] * 2  # sacred geometry can only apply below this
+
+
+# ─── Conversion ───
+
+
+def limbs_from_ints(keys):
+    """(n, 4) uint64 limbs (most significant first) from Python ints < 2**256."""
+    data = b"".join(int(k).to_bytes(32, "big") for k in keys)
+    return np.frombuffer(data, dtype=">u8").reshape(-1, LIMBS).astype(np.uint64)
+
+
+def ints_from_limbs(limbs):
+    """Python ints from (n, 4) uint64 limbs."""
+    raw = np.ascontiguousarray(limbs, dtype=">u8").tobytes()
+    return [int.from_bytes(raw[i : i + 32], "big") for i in range(0, len(raw), 32)]
+
+
+def random_limbs(count):
+    """``count`` uniform 256-bit values from the OS CSPRNG (like secrets.randbits)."""
+    data = secrets.token_bytes(32 * count)
+    return np.frombuffer(data, dtype=">u8").reshape(count, LIMBS).astype(np.uint64)
+
+
+_N_LIMBS = limbs_from_ints([N])[0]
+
+
+def valid_mask(limbs):
+    """True where 1 <= key < N (a usable secp256k1 private key)."""
+    less = np.zeros(len(limbs), dtype=bool)
+    equal = np.ones(len(limbs), dtype=bool)
+    for i in range(LIMBS):
+        less |= equal & (limbs[:, i] < _N_LIMBS[i])
+        equal &= limbs[:, i] == _N_LIMBS[i]
+    return less & limbs.any(axis=1)
+
+
+def random_keys(count):
+    """``count`` valid random private keys as limbs (invalid draws redrawn)."""
+    limbs = random_limbs(count)
+    return replace_invalid(limbs, valid_mask(limbs))
+
+
+def replace_invalid(limbs, ok):
+    """Swap rows where ``ok`` is False for fresh valid random keys."""
+    bad = np.flatnonzero(~ok)
+    while bad.size:
+        fresh = random_limbs(bad.size)
+        good = valid_mask(fresh)
+        limbs[bad[good]] = fresh[good]
+        bad = bad[~good]
+    return limbs
+
+
+# ─── Digit statistics ───
+
+
+def hex_nibbles(limbs):
+    """(n, 64) hex digits, most significant first (``format(key, '064x')``)."""
+    raw = np.ascontiguousarray(limbs, dtype=">u8").view(np.uint8).reshape(len(limbs), 32)
+    nibbles = np.empty((len(limbs), 64), dtype=np.uint8)
+    nibbles[:, 0::2] = raw >> 4
+    nibbles[:, 1::2] = raw & 0xF
+    return nibbles
+
+
+def _row_counts(values, buckets, rows_per_step=2048):
+    """Per-row histogram of small non-negative ints: (n, buckets).
+
+    One ``bincount`` per block of rows, offsetting each row into its own
+    bucket range; blocks keep the offset array cache-sized.
+    """
+    n = len(values)
+    out = np.empty((n, buckets), dtype=np.int64)
+    offsets = buckets * np.arange(rows_per_step, dtype=np.int64)[:, None]
+    for start in range(0, n, rows_per_step):
+        block = values[start : start + rows_per_step]
+        m = len(block)
+        flat = (block + offsets[:m]).ravel()
+        out[start : start + m] = np.bincount(flat, minlength=buckets * m).reshape(m, buckets)
+    return out
+
+
+def hex_digit_counts(limbs):
+    """(n, 16) occurrences of each hex digit in the 64-digit form."""
+    return _row_counts(hex_nibbles(limbs), 16)
+
+
+@lru_cache(maxsize=1)
+def _entropy_terms():
+    """-p*log2(p) for p = c/64, c = 0..64 (so entropy is a table lookup + sum)."""
+    p = np.arange(65) / 64.0
+    return -p * np.log2(np.where(p > 0, p, 1.0))
+
+
+def hex_entropy(limbs):
+    """Shannon entropy (bits) of the 64-digit hex form -- ScannerBrain._key_entropy."""
+    return _entropy_terms()[hex_digit_counts(limbs)].sum(axis=1)
+
+
+def _chunks(limbs, divisor):
+    """Remainders of repeated division by ``divisor`` (< 2**32): (passes, n),
+    least significant first.
+
+    Long division over 32-bit half-limbs; each pass divides out
+    log2(divisor) bits, so leading words that are already zero are skipped.
+    """
+    n = len(limbs)
+    # Word-major (8, n) so each step works on a contiguous row
+    words = np.empty((2 * LIMBS, n), dtype=np.uint64)
+    words[0::2] = limbs.T >> np.uint64(32)
+    words[1::2] = limbs.T & np.uint64(0xFFFFFFFF)
+    d = np.uint64(divisor)
+    bits = math.log2(divisor)
+    out = np.empty((_PASSES, n), dtype=np.uint64)
+    for p in range(_PASSES):
+        rem = np.zeros(n, dtype=np.uint64)
+        for i in range(min(int(p * bits) // 32, 2 * LIMBS - 1), 2 * LIMBS):
+            cur = (rem << np.uint64(32)) | words[i]
+            words[i], rem = np.divmod(cur, d)
+        out[p] = rem
+    return out
+
+
+@lru_cache(maxsize=1)
+def _digit_sums_below_1000():
+    return np.array([sum(map(int, str(i))) for i in range(1000)], dtype=np.int64)
+
+
+def decimal_digit_sums(limbs):
+    """Sum of decimal digits of each key (``framework_bridge.digit_sum``)."""
+    chunks = _chunks(limbs, _DECIMAL_CHUNK).astype(np.int64)
+    table = _digit_sums_below_1000()
+    total = table[chunks % 1000] + table[chunks // 1000 % 1000] + table[chunks // 1_000_000]
+    return total.sum(axis=0)
+
+
+def base60_digits(limbs):
+    """Base-60 digits, least significant first, and the digit count per key.
+
+    Returns:
+        (digits (n, 45) uint8 zero-padded, lengths (n,) int64); zero has one digit.
+    """
+    chunks = _chunks(limbs, _BASE60_CHUNK).astype(np.int64)
+    digits = np.empty((5 * _PASSES, len(limbs)), dtype=np.uint8)
+    for p in range(_PASSES):
+        rest = chunks[p]
+        for j in range(5):
+            rest, digits[5 * p + j] = np.divmod(rest, 60)
+    nonzero = digits != 0
+    top = nonzero[::-1].argmax(axis=0)
+    lengths = np.where(nonzero.any(axis=0), len(digits) - top, 1)
+    return np.ascontiguousarray(digits.T), lengths
+
+
+@lru_cache(maxsize=1)
+def _reduce_table():
+    """numerology_reduce for every possible 256-bit digit sum."""
+    from oracle_service.framework_bridge import numerology_reduce
+
+    return np.array([numerology_reduce(s) for s in range(_MAX_DIGIT_SUM + 1)], dtype=np.int64)
+
+
+def reduce_digit_sums(sums):
+    """``numerology_reduce`` of each digit sum (master numbers preserved)."""
+    return _reduce_table()[sums]
+
+
+# ─── Scores ───
+
+
+def _sacred_geometry(n):
+    if n in FIBONACCI:
+        return 1.0
+    if n > 1 and any(abs(n - round(f * GOLDEN)) <= 1 for f in FIBONACCI if f < n):
+        return 0.6
+    return 0.0
+
+
+def _context_factors(context):
+    """(moon_alignment, ganzhi year animal index or None) for a date context."""
+    if not context or "current_year" not in context:
+        return 0.5, None
+    moon = 0.5
+    if "current_month" in context and "current_day" in context:
+        from engines.timing_advisor import day_components
+
+        comp = day_components(
+            context["current_year"], context["current_month"], context["current_day"]
+        )
+        moon = MOON_ALIGNMENT.get(comp.phase_idx, 0.5)
+    return moon, (context["current_year"] - 4) % 12
+
+
+def numerology_score(key, context=None):
+    """Numerology sub-score for one key (scalar reference).
+
+    Args:
+        key: candidate integer.
+        context: optional dict with current_year / current_month / current_day
+            for the moon and ganzhi factors (0.5 each without it).
+
+    Returns:
+        (score 0.0-1.0, breakdown dict keyed like NUMEROLOGY_FACTORS).
+    """
+    from oracle_service.framework_bridge import digit_sum, is_master_number, numerology_reduce
+
+    digits = []
+    n = key
+    while n > 0:
+        n, d = divmod(n, 60)
+        digits.append(d)
+    digits = digits or [0]
+    animal_counts = {}
+    for d in digits:
+        animal_counts[d // 5] = animal_counts.get(d // 5, 0) + 1
+    moon, year_animal = _context_factors(context)
+
+    breakdown = {
+        "master_number": 1.0 if is_master_number(key) else 0.0,
+        "animal_repetition": max(animal_counts.values()) / len(digits) if len(digits) > 1 else 0.0,
+        "element_balance": len({d % 5 for d in digits}) / 5.0,
+        "life_path_power": 1.0 if numerology_reduce(digit_sum(key)) in POWER_NUMBERS else 0.3,
+        "moon_alignment": moon,
+        "ganzhi_match": 0.5
+        if year_animal is None
+        else (1.0 if (key % 60) // 5 == year_animal else 0.2),
+        "sacred_geometry": _sacred_geometry(key),
+    }
+    score = sum(NUMEROLOGY_FACTORS[k] * breakdown[k] for k in NUMEROLOGY_FACTORS)
+    return score, breakdown
+
+
+def numerology_breakdown(limbs, context=None, reduced=None):
+    """Vectorized ``numerology_score`` factors: {factor: (n,) float64}."""
+    n = len(limbs)
+    if reduced is None:
+        reduced = reduce_digit_sums(decimal_digit_sums(limbs))
+    digits, lengths = base60_digits(limbs)
+    # Padding digits are zeros (animal 0, element 0): take them back out
+    padding = digits.shape[1] - lengths
+    animal_counts = _row_counts(digits // 5, 12)
+    animal_counts[:, 0] -= padding
+    element_counts = _row_counts(digits % 5, 5)
+    element_counts[:, 0] -= padding
+    moon, year_animal = _context_factors(context)
+
+    small = (limbs[:, :3] == 0).all(axis=1) & (limbs[:, 3] < _SMALL_KEY)
+    master = np.isin(reduced, MASTER_NUMBERS) | (small & np.isin(limbs[:, 3], MASTER_NUMBERS))
+    sacred = np.zeros(n)
+    for i in np.flatnonzero(small):
+        sacred[i] = _sacred_geometry(int(limbs[i, 3]))
+    if year_animal is None:
+        ganzhi = np.full(n, 0.5)
+    else:
+        ganzhi = np.where(digits[:, 0] // 5 == year_animal, 1.0, 0.2)
+
+    return {
+        "master_number": master.astype(np.float64),
+        "animal_repetition": np.where(lengths > 1, animal_counts.max(axis=1) / lengths, 0.0),
+        "element_balance": (element_counts > 0).sum(axis=1) / 5.0,
+        "life_path_power": np.where(np.isin(reduced, POWER_NUMBERS), 1.0, 0.3),
+        "moon_alignment": np.full(n, moon),
+        "ganzhi_match": ganzhi,
+        "sacred_geometry": sacred,
+    }
+
+
+def numerology_scores(limbs, context=None, reduced=None):
+    """Vectorized ``numerology_score``: (n,) float64."""
+    breakdown = numerology_breakdown(limbs, context, reduced)
+    total = np.zeros(len(limbs))
+    for k, weight in NUMEROLOGY_FACTORS.items():
+        total += weight * breakdown[k]
+    return total
+
+
+def date_number(year, month, day):
+    """Reduced date number the time-aligned strategy matches keys against."""
+    from oracle_service.framework_bridge import numerology_reduce
+
+    return numerology_reduce(year + month + day)
+
+
+def alignment_scores(limbs, target_number, context=None):
+    """Time alignment: 0.7 x numerology score + 0.3 if the key reduces to ``target_number``."""
+    reduced = reduce_digit_sums(decimal_digit_sums(limbs))
+    base = numerology_scores(limbs, context, reduced)
+    return base * 0.7 + np.where(reduced == target_number, 0.3, 0.0)
+
+
+def score_batch(limbs, context=None):
+    """All batch statistics for ``limbs`` (benchmarks, diagnostics)."""
+    digit_sums = decimal_digit_sums(limbs)
+    reduced = reduce_digit_sums(digit_sums)
+    return {
+        "valid": valid_mask(limbs),
+        "hex_digit_counts": hex_digit_counts(limbs),
+        "hex_entropy": hex_entropy(limbs),
+        "digit_sum": digit_sums,
+        "reduced": reduced,
+        "numerology": numerology_scores(limbs, context, reduced),
+    }
+
+
+# ─── Per-strategy selection ───
+
+
+def _groups(count, group_size):
+    return np.arange(count)[:, None] * group_size
+
+
+def select_best(limbs, scores, group_size, min_score=None):
+    """Best-scoring valid key of each consecutive group of ``group_size``.
+
+    With ``min_score``, a group whose best falls below it yields its first
+    valid candidate instead (the numerology-guided rule). Groups with no
+    valid candidate get a fresh random key.
+    """
+    count = len(limbs) // group_size
+    valid = valid_mask(limbs[: count * group_size]).reshape(count, group_size)
+    grouped = np.where(valid, scores[: count * group_size].reshape(count, group_size), -np.inf)
+    best = grouped.argmax(axis=1)
+    if min_score is not None:
+        below = grouped[np.arange(count), best] < min_score
+        best = np.where(below, valid.argmax(axis=1), best)
+    picked = limbs[(_groups(count, group_size)[:, 0] + best)].copy()
+    return replace_invalid(picked, valid.any(axis=1))
+
+
+def select_first_in_range(limbs, values, lo, hi, group_size):
+    """First valid key per group whose ``values`` lie in [lo, hi]."""
+    count = len(limbs) // group_size
+    valid = valid_mask(limbs[: count * group_size])
+    inside = valid & (values[: count * group_size] >= lo) & (values[: count * group_size] <= hi)
+    inside = inside.reshape(count, group_size)
+    first = inside.argmax(axis=1)
+    picked = limbs[(_groups(count, group_size)[:, 0] + first)].copy()
+    return replace_invalid(picked, inside.any(axis=1))
+
+
+def key_entropy(key):
+    """Scalar hex-digit entropy of one key (reference for ``hex_entropy``)."""
+    hex_str = format(key, "064x")
+    counts = {}
+    for c in hex_str:
+        counts[c] = counts.get(c, 0) + 1
+    total = len(hex_str)
+    return -sum((cnt / total) * math.log2(cnt / total) for cnt in counts.values())
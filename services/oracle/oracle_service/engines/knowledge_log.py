@@ -0,0 +1,131 @@
+"""
+Knowledge Log — append-only event log with snapshot compaction.
+
+Persistence for ``ScannerBrain``. Layout under the knowledge directory:
+
+- ``knowledge.log`` — one compact JSON array per line,
+  ``[seq, kind, data]``, appended as knowledge changes
+- ``knowledge.snapshot.json`` — ``{"seq": n, "state": {...}}``, the full
+  state as of event ``n``
+
+Each change costs one short line write, so I/O per finding is constant
+regardless of how much knowledge has accumulated. ``compact(state)``
+writes a new snapshot (tmp + rename) and truncates the log. Replay skips
+events at or below the snapshot's ``seq``, so a crash between the two
+steps never applies an event twice. A torn last line is dropped on open.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+LOG_NAME = "knowledge.log"
+SNAPSHOT_NAME = "knowledge.snapshot.json"
+
+_SEPARATORS = (",", ":")
+
+
+class KnowledgeLog:
+    """Append-only ``[seq, kind, data]`` lines plus a compacted snapshot."""
+
+    def __init__(self, directory):
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = None
+        self._seq = 0
+        self._pending = 0  # events in the log past the snapshot
+        self.bytes_written = 0
+
+    @property
+    def log_path(self) -> Path:
+        return self._dir / LOG_NAME
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self._dir / SNAPSHOT_NAME
+
+    @property
+    def pending(self) -> int:
+        """Events appended since the last snapshot."""
+        return self._pending
+
+    def exists(self) -> bool:
+        return self.snapshot_path.exists() or self.log_path.exists()
+
+    def load(self):
+        """Return ``(snapshot state or None, [(kind, data), ...])`` to replay.
+
+        Also positions the log for appending after the last whole event.
+        """
+        with self._lock:
+            state, snap_seq = None, 0
+            if self.snapshot_path.exists():
+                try:
+                    snapshot = json.loads(self.snapshot_path.read_text())
+                    state, snap_seq = snapshot["state"], snapshot["seq"]
+                except (json.JSONDecodeError, KeyError, OSError) as e:
+                    logger.warning(f"Knowledge snapshot unreadable, replaying log only: {e}")
+
+            events = []
+            last_seq = snap_seq
+            if self.log_path.exists():
+                with open(self.log_path, "rb") as f:
+                    data = f.read()
+                end = data.rfind(b"\n") + 1
+                if end < len(data):
+                    logger.warning(f"Dropping torn knowledge log tail ({len(data) - end} bytes)")
+                    with open(self.log_path, "r+b") as f:
+                        f.truncate(end)
+                for line in data[:end].splitlines():
+                    try:
+                        seq, kind, payload = json.loads(line)
+                    except (json.JSONDecodeError, ValueError, TypeError):
+                        continue
+                    last_seq = max(last_seq, seq)
+                    if seq > snap_seq:
+                        events.append((kind, payload))
+
+            self._seq = last_seq
+            self._pending = len(events)
+            return state, events
+
+    def append(self, kind: str, data) -> None:
+        """Append one event line (flushed to the OS, not fsynced)."""
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.log_path, "a", encoding="utf-8")
+            self._seq += 1
+            line = json.dumps([self._seq, kind, data], separators=_SEPARATORS, default=str) + "\n"
+            self._file.write(line)
+            self._file.flush()
+            self._pending += 1
+            self.bytes_written += len(line)
+
+    def compact(self, state: dict) -> None:
+        """Snapshot ``state`` (which must include every appended event) and reset the log."""
+        with self._lock:
+            content = json.dumps(
+                {"seq": self._seq, "state": state}, separators=_SEPARATORS, default=str
+            )
+            tmp_path = self.snapshot_path.with_suffix(".tmp")
+            tmp_path.write_text(content)
+            os.replace(str(tmp_path), str(self.snapshot_path))
+            self.bytes_written += len(content)
+
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            with open(self.log_path, "w"):
+                pass
+            self._pending = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -11,6 +11,7 @@ import json
 import logging
 import os
 import threading
+import time
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -41,122 +42,327 @@ def weighted_score(avg_rating: float, sample_count: int) -> float:
     return avg_rating * confidence
 
 
-def recalculate_learning_metrics(db_session) -> dict:
-    """Query all feedback, compute aggregate metrics, update oracle_learning_data."""
-    try:
-        from sqlalchemy import func as sa_func
+WATERMARK_KEY = "watermark:feedback"
+EMPHASIS_KEY = "prompt_emphasis:active"
+PROMPT_CACHE_TTL = 60.0  # seconds; bounds staleness across API processes
+
+# Section aggregation over the JSONB object of each feedback row. Legacy rows
+# whose section_feedback is a JSON *string* are skipped here and folded in
+# Python (_legacy_section_counts).
+_SECTION_SQL = {
+    "postgresql": """
+        SELECT s.key, COUNT(*), SUM(CASE WHEN s.value = 'helpful' THEN 1 ELSE 0 END)
+        FROM oracle_reading_feedback f
+        CROSS JOIN LATERAL jsonb_each_text(f.section_feedback) AS s(key, value)
+        WHERE jsonb_typeof(f.section_feedback) = 'object'
+          AND f.id > :after AND f.id <= :upto
+        GROUP BY s.key
+    """,
+    "sqlite": """
+        SELECT s.key, COUNT(*), SUM(CASE WHEN s.value = 'helpful' THEN 1 ELSE 0 END)
+        FROM oracle_reading_feedback f,
+             json_each(CASE WHEN json_valid(f.section_feedback)
+                             AND json_type(f.section_feedback) = 'object'
+                            THEN f.section_feedback ELSE '{}' END) AS s
+        WHERE f.id > :after AND f.id <= :upto
+        GROUP BY s.key
+    """,
+}
+_LEGACY_SECTION_SQL = {
+    "postgresql": """
+        SELECT f.section_feedback #>> '{}' FROM oracle_reading_feedback f
+        WHERE jsonb_typeof(f.section_feedback) = 'string'
+          AND f.id > :after AND f.id <= :upto
+    """,
+    "sqlite": """
+        SELECT json_extract(f.section_feedback, '$') FROM oracle_reading_feedback f
+        WHERE json_valid(f.section_feedback) AND json_type(f.section_feedback) = 'text'
+          AND f.id > :after AND f.id <= :upto
+    """,
+}
 
-        # Late imports to avoid circular dependency at module level
-        import sys
+_prompt_cache: dict = {}  # {"emphasis": [...], "context": str, "at": monotonic time}
+_prompt_cache_lock = threading.Lock()
 
-        if "app.orm.oracle_feedback" in sys.modules:
-            OracleReadingFeedback = sys.modules["app.orm.oracle_feedback"].OracleReadingFeedback
-            OracleLearningData = sys.modules["app.orm.oracle_feedback"].OracleLearningData
-        else:
-            from app.orm.oracle_feedback import (
-                OracleLearningData,
-                OracleReadingFeedback,
-            )
 
-        if "app.orm.oracle_reading" in sys.modules:
-            OracleReading = sys.modules["app.orm.oracle_reading"].OracleReading
-        else:
-            from app.orm.oracle_reading import OracleReading
-
-        # Avg rating by reading type
-        type_rows = (
-            db_session.query(
-                OracleReading.sign_type,
-                sa_func.avg(OracleReadingFeedback.rating),
-                sa_func.count(OracleReadingFeedback.id),
-            )
-            .join(OracleReading, OracleReading.id == OracleReadingFeedback.reading_id)
-            .group_by(OracleReading.sign_type)
-            .all()
+def _orm():
+    """(OracleReadingFeedback, OracleLearningData, OracleReading), late-imported."""
+    # Late imports to avoid circular dependency at module level
+    import sys
+
+    if "app.orm.oracle_feedback" in sys.modules:
+        OracleReadingFeedback = sys.modules["app.orm.oracle_feedback"].OracleReadingFeedback
+        OracleLearningData = sys.modules["app.orm.oracle_feedback"].OracleLearningData
+    else:
+        from app.orm.oracle_feedback import (
+            OracleLearningData,
+            OracleReadingFeedback,
         )
 
-        result = {"avg_by_type": {}, "total_feedback": 0}
+    if "app.orm.oracle_reading" in sys.modules:
+        OracleReading = sys.modules["app.orm.oracle_reading"].OracleReading
+    else:
+        from app.orm.oracle_reading import OracleReading
 
-        for sign_type, avg_val, count in type_rows:
-            key = f"avg_rating:{sign_type}"
-            result["avg_by_type"][sign_type] = {"avg": float(avg_val), "count": count}
-            result["total_feedback"] += count
+    return OracleReadingFeedback, OracleLearningData, OracleReading
 
-            existing = (
-                db_session.query(OracleLearningData)
-                .filter(OracleLearningData.metric_key == key)
-                .first()
-            )
-            if existing:
-                existing.metric_value = float(avg_val)
-                existing.sample_count = count
-            else:
-                db_session.add(
-                    OracleLearningData(
-                        metric_key=key,
-                        metric_value=float(avg_val),
-                        sample_count=count,
-                    )
-                )
 
-        # Overall average
-        overall_avg = db_session.query(sa_func.avg(OracleReadingFeedback.rating)).scalar() or 0.0
-        overall_count = db_session.query(sa_func.count(OracleReadingFeedback.id)).scalar() or 0
+def invalidate_prompt_cache() -> None:
+    """Drop the cached prompt emphasis (call when feedback or metrics change)."""
+    with _prompt_cache_lock:
+        _prompt_cache.clear()
 
-        existing_overall = (
-            db_session.query(OracleLearningData)
-            .filter(OracleLearningData.metric_key == "avg_rating:overall")
-            .first()
+
+def _cached_prompt(field: str):
+    with _prompt_cache_lock:
+        if _prompt_cache and time.monotonic() - _prompt_cache["at"] < PROMPT_CACHE_TTL:
+            return _prompt_cache[field]
+    return None
+
+
+def _store_prompt_cache(emphasis: list[str]) -> str:
+    text = "\n".join(emphasis).strip()
+    context = (
+        "=== LEARNED USER PREFERENCES ===\n" + text + "\n=== END PREFERENCES ===\n" if text else ""
+    )
+    with _prompt_cache_lock:
+        _prompt_cache.update(emphasis=list(emphasis), context=context, at=time.monotonic())
+    return context
+
+
+def _insert_for(db_session):
+    dialect = db_session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Learning metric upsert not supported on {dialect}")
+    return insert
+
+
+def _upsert_metrics(db_session, OracleLearningData, rows: list[dict], fold: bool) -> None:
+    """Write metric rows in one ``INSERT ... ON CONFLICT (metric_key) DO UPDATE``.
+
+    With ``fold`` the incoming ``metric_value`` is a mean over ``sample_count``
+    new samples and is merged into the stored mean; otherwise it replaces it.
+    """
+    if not rows:
+        return
+    from sqlalchemy import func as sa_func
+
+    insert = _insert_for(db_session)
+    stmt = insert(OracleLearningData).values(rows)
+    table, new = OracleLearningData.__table__.c, stmt.excluded
+    if fold:
+        total = table.sample_count + new.sample_count
+        set_ = {
+            "metric_value": (
+                table.metric_value * table.sample_count + new.metric_value * new.sample_count
+            )
+            / total,
+            "sample_count": total,
+        }
+    else:
+        set_ = {"metric_value": new.metric_value, "sample_count": new.sample_count}
+    if "prompt_emphasis" in rows[0]:
+        set_["prompt_emphasis"] = new.prompt_emphasis
+    set_["updated_at"] = sa_func.now()
+
+    # Flush pending ORM changes first; expire loaded metric rows after
+    db_session.flush()
+    db_session.execute(stmt.on_conflict_do_update(index_elements=["metric_key"], set_=set_))
+    for obj in list(db_session.identity_map.values()):
+        if isinstance(obj, OracleLearningData):
+            db_session.expire(obj)
+
+
+def _legacy_section_counts(db_session, dialect, after, upto) -> dict:
+    from sqlalchemy import text
+
+    counts: dict[str, list[int]] = {}
+    params = {"after": after, "upto": upto}
+    for (raw,) in db_session.execute(text(_LEGACY_SECTION_SQL[dialect]), params):
+        try:
+            sf = json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if not isinstance(sf, dict):
+            continue
+        for section, value in sf.items():
+            entry = counts.setdefault(section, [0, 0])
+            entry[0] += 1
+            entry[1] += value == "helpful"
+    return counts
+
+
+def section_helpful_counts(db_session, after: int = 0, upto: int | None = None) -> dict:
+    """``{section: (total, helpful)}`` over feedback ids in ``(after, upto]``, aggregated in SQL."""
+    from sqlalchemy import text
+
+    if upto is None:
+        upto = 2**62
+    dialect = db_session.get_bind().dialect.name
+    params = {"after": after, "upto": upto}
+    counts = {
+        key: [total, int(helpful or 0)]
+        for key, total, helpful in db_session.execute(text(_SECTION_SQL[dialect]), params)
+    }
+    for section, (total, helpful) in _legacy_section_counts(
+        db_session, dialect, after, upto
+    ).items():
+        entry = counts.setdefault(section, [0, 0])
+        entry[0] += total
+        entry[1] += helpful
+    return {section: (total, helpful) for section, (total, helpful) in counts.items()}
+
+
+def _incremental_start(db_session, OracleReadingFeedback, OracleLearningData):
+    """Feedback id to fold from, or None if a full recompute is required.
+
+    Incremental folding is valid only while every already-folded row is
+    unchanged: none deleted (count check) and none updated since the
+    watermark was written (``updated_at`` check; the update triggers keep it
+    current).
+    """
+    from sqlalchemy import func as sa_func
+
+    watermark = OracleLearningData.metric_key == WATERMARK_KEY
+    mark = (
+        db_session.query(OracleLearningData.metric_value, OracleLearningData.sample_count)
+        .filter(watermark)
+        .first()
+    )
+    if mark is None:
+        return None
+    last_id, folded = int(mark[0]), mark[1]
+    # Compared in SQL so both timestamps keep the database's own representation
+    marked_at = db_session.query(OracleLearningData.updated_at).filter(watermark).scalar_subquery()
+
+    still_there = (
+        db_session.query(sa_func.count(OracleReadingFeedback.id))
+        .filter(OracleReadingFeedback.id <= last_id)
+        .scalar()
+    )
+    if still_there != folded:
+        return None
+    changed = db_session.query(
+        db_session.query(OracleReadingFeedback.id)
+        .filter(
+            OracleReadingFeedback.id <= last_id,
+            OracleReadingFeedback.updated_at >= marked_at,
         )
-        if existing_overall:
-            existing_overall.metric_value = float(overall_avg)
-            existing_overall.sample_count = overall_count
-        else:
-            db_session.add(
-                OracleLearningData(
-                    metric_key="avg_rating:overall",
-                    metric_value=float(overall_avg),
-                    sample_count=overall_count,
+        .exists()
+    ).scalar()
+    return None if changed else last_id
+
+
+def recalculate_learning_metrics(db_session, incremental: bool = False) -> dict:
+    """Aggregate feedback in SQL and bulk-upsert oracle_learning_data.
+
+    The full mode recomputes every metric from all feedback. With
+    ``incremental`` only feedback newer than the stored watermark
+    (``watermark:feedback``: last folded id and row count) is aggregated
+    and folded into the stored means; it falls back to the full mode when
+    there is no watermark or folded feedback was updated or deleted since.
+    """
+    try:
+        from sqlalchemy import func as sa_func
+
+        OracleReadingFeedback, OracleLearningData, OracleReading = _orm()
+
+        after = None
+        if incremental:
+            after = _incremental_start(db_session, OracleReadingFeedback, OracleLearningData)
+        mode = "incremental" if after is not None else "full"
+        after = after or 0
+
+        upto, total_rows = db_session.query(
+            sa_func.max(OracleReadingFeedback.id), sa_func.count(OracleReadingFeedback.id)
+        ).one()
+        upto = upto or 0
+        in_range = (OracleReadingFeedback.id > after, OracleReadingFeedback.id <= upto)
+
+        metrics: list[dict] = []
+        if upto > after:
+            # Avg rating by reading type
+            type_rows = (
+                db_session.query(
+                    OracleReading.sign_type,
+                    sa_func.avg(OracleReadingFeedback.rating),
+                    sa_func.count(OracleReadingFeedback.id),
                 )
+                .join(OracleReading, OracleReading.id == OracleReadingFeedback.reading_id)
+                .filter(*in_range)
+                .group_by(OracleReading.sign_type)
+                .all()
             )
+            for sign_type, avg_val, count in type_rows:
+                metrics.append(
+                    {
+                        "metric_key": f"avg_rating:{sign_type}",
+                        "metric_value": float(avg_val),
+                        "sample_count": count,
+                    }
+                )
 
-        # Section helpful percentages
-        all_feedback = db_session.query(OracleReadingFeedback.section_feedback).all()
-        section_totals: dict[str, int] = {}
-        section_helpful: dict[str, int] = {}
-        for (sf_text,) in all_feedback:
-            if not sf_text:
-                continue
-            try:
-                sf = json.loads(sf_text) if isinstance(sf_text, str) else sf_text
-            except (json.JSONDecodeError, TypeError):
-                continue
-            for section, value in sf.items():
-                section_totals[section] = section_totals.get(section, 0) + 1
-                if value == "helpful":
-                    section_helpful[section] = section_helpful.get(section, 0) + 1
-
-        for section, total_count in section_totals.items():
-            pct = section_helpful.get(section, 0) / total_count
-            key = f"section_helpful:{section}"
-            existing = (
-                db_session.query(OracleLearningData)
-                .filter(OracleLearningData.metric_key == key)
-                .first()
+            # Overall average
+            overall_avg, overall_count = (
+                db_session.query(
+                    sa_func.avg(OracleReadingFeedback.rating),
+                    sa_func.count(OracleReadingFeedback.id),
+                )
+                .filter(*in_range)
+                .one()
             )
-            if existing:
-                existing.metric_value = pct
-                existing.sample_count = total_count
-            else:
-                db_session.add(
-                    OracleLearningData(
-                        metric_key=key,
-                        metric_value=pct,
-                        sample_count=total_count,
-                    )
+            metrics.append(
+                {
+                    "metric_key": "avg_rating:overall",
+                    "metric_value": float(overall_avg or 0.0),
+                    "sample_count": overall_count or 0,
+                }
+            )
+
+            # Section helpful percentages
+            for section, (total, helpful) in section_helpful_counts(
+                db_session, after, upto
+            ).items():
+                metrics.append(
+                    {
+                        "metric_key": f"section_helpful:{section}",
+                        "metric_value": helpful / total,
+                        "sample_count": total,
+                    }
                 )
+        elif mode == "full":
+            metrics.append(
+                {"metric_key": "avg_rating:overall", "metric_value": 0.0, "sample_count": 0}
+            )
 
-        db_session.flush()
+        _upsert_metrics(db_session, OracleLearningData, metrics, fold=mode == "incremental")
+        _upsert_metrics(
+            db_session,
+            OracleLearningData,
+            [{"metric_key": WATERMARK_KEY, "metric_value": upto, "sample_count": total_rows}],
+            fold=False,
+        )
+        if metrics:
+            invalidate_prompt_cache()
+
+        result = {"avg_by_type": {}, "total_feedback": 0, "mode": mode, "folded": 0}
+        for key, value, count in db_session.query(
+            OracleLearningData.metric_key,
+            OracleLearningData.metric_value,
+            OracleLearningData.sample_count,
+        ).filter(OracleLearningData.metric_key.like("avg_rating:%")):
+            sign_type = key.split(":", 1)[1]
+            if sign_type == "overall":
+                continue
+            result["avg_by_type"][sign_type] = {"avg": float(value), "count": count}
+            result["total_feedback"] += count
+        for metric in metrics:
+            if metric["metric_key"] == "avg_rating:overall":
+                result["folded"] = metric["sample_count"]
         return result
 
     except ImportError as exc:
@@ -164,49 +370,72 @@ def recalculate_learning_metrics(db_session) -> dict:
         return {}
 
 
-def generate_prompt_emphasis(db_session) -> list[str]:
-    """Generate prompt emphasis strings based on feedback patterns."""
-    try:
-        import sys
+# (metric key, minimum samples, predicate) → emphasis line
+_EMPHASIS_RULES = [
+    # Rule: advice format avg > 4.0, samples >= 5
+    # (We use reading type as proxy since format-level tracking isn't separate)
+    # Check section helpful rates instead
+    (
+        "section_helpful:action_steps",
+        10,
+        lambda v: v > 0.8,
+        "Users value concrete action steps — make them specific and achievable.",
+    ),
+    (
+        "section_helpful:caution",
+        10,
+        lambda v: v < 0.5,
+        "Keep cautionary notes brief, constructive, and forward-looking.",
+    ),
+    (
+        "section_helpful:advice",
+        5,
+        lambda v: v > 0.8,
+        "Emphasize practical, actionable advice in your interpretations.",
+    ),
+    (
+        "section_helpful:universe_message",
+        5,
+        lambda v: v > 0.8,
+        "Lean into poetic, cosmic language — users respond well to it.",
+    ),
+]
 
-        if "app.orm.oracle_feedback" in sys.modules:
-            OracleLearningData = sys.modules["app.orm.oracle_feedback"].OracleLearningData
-        else:
-            from app.orm.oracle_feedback import OracleLearningData
 
-        emphasis: list[str] = []
+def generate_prompt_emphasis(db_session) -> list[str]:
+    """Generate prompt emphasis strings based on feedback patterns.
+
+    Cached in-process until feedback or metrics change (``invalidate_prompt_cache``)
+    or ``PROMPT_CACHE_TTL`` passes; a cache hit skips the database entirely.
+    """
+    cached = _cached_prompt("emphasis")
+    if cached is not None:
+        return list(cached)
+    try:
+        _, OracleLearningData, _ = _orm()
+
+        keys = [rule[0] for rule in _EMPHASIS_RULES] + [
+            "avg_rating:time",
+            "avg_rating:name",
+            "avg_rating:overall",
+        ]
+        metrics = {
+            key: (value, count)
+            for key, value, count in db_session.query(
+                OracleLearningData.metric_key,
+                OracleLearningData.metric_value,
+                OracleLearningData.sample_count,
+            ).filter(OracleLearningData.metric_key.in_(keys))
+        }
 
-        # Helper: read a metric
         def _get_metric(key: str):
-            row = (
-                db_session.query(OracleLearningData)
-                .filter(OracleLearningData.metric_key == key)
-                .first()
-            )
-            if row:
-                return row.metric_value, row.sample_count
-            return None, 0
-
-        # Rule: advice format avg > 4.0, samples >= 5
-        # (We use reading type as proxy since format-level tracking isn't separate)
-        # Check section helpful rates instead
-        action_val, action_count = _get_metric("section_helpful:action_steps")
-        if action_val is not None and action_count >= 10 and action_val > 0.8:
-            emphasis.append(
-                "Users value concrete action steps — make them specific and achievable."
-            )
-
-        caution_val, caution_count = _get_metric("section_helpful:caution")
-        if caution_val is not None and caution_count >= 10 and caution_val < 0.5:
-            emphasis.append("Keep cautionary notes brief, constructive, and forward-looking.")
-
-        advice_val, advice_count = _get_metric("section_helpful:advice")
-        if advice_val is not None and advice_count >= 5 and advice_val > 0.8:
-            emphasis.append("Emphasize practical, actionable advice in your interpretations.")
+            return metrics.get(key, (None, 0))
 
-        message_val, message_count = _get_metric("section_helpful:universe_message")
-        if message_val is not None and message_count >= 5 and message_val > 0.8:
-            emphasis.append("Lean into poetic, cosmic language — users respond well to it.")
+        emphasis: list[str] = []
+        for key, min_count, predicate, line in _EMPHASIS_RULES:
+            value, count = _get_metric(key)
+            if value is not None and count >= min_count and predicate(value):
+                emphasis.append(line)
 
         # Check if time readings score higher than name readings
         time_avg, time_count = _get_metric("avg_rating:time")
@@ -226,26 +455,20 @@ def generate_prompt_emphasis(db_session) -> list[str]:
             emphasis.append("Focus on warmth, encouragement, and personal connection.")
 
         # Store active emphasis
-        emphasis_text = "\n".join(emphasis) if emphasis else ""
-        existing = (
-            db_session.query(OracleLearningData)
-            .filter(OracleLearningData.metric_key == "prompt_emphasis:active")
-            .first()
+        _upsert_metrics(
+            db_session,
+            OracleLearningData,
+            [
+                {
+                    "metric_key": EMPHASIS_KEY,
+                    "metric_value": 0,
+                    "sample_count": overall_count or 0,
+                    "prompt_emphasis": "\n".join(emphasis) if emphasis else "",
+                }
+            ],
+            fold=False,
         )
-        if existing:
-            existing.prompt_emphasis = emphasis_text
-            existing.sample_count = overall_count or 0
-        else:
-            db_session.add(
-                OracleLearningData(
-                    metric_key="prompt_emphasis:active",
-                    metric_value=0,
-                    sample_count=overall_count or 0,
-                    prompt_emphasis=emphasis_text,
-                )
-            )
-
-        db_session.flush()
+        _store_prompt_cache(emphasis)
         return emphasis
 
     except ImportError as exc:
@@ -254,27 +477,20 @@ def generate_prompt_emphasis(db_session) -> list[str]:
 
 
 def get_prompt_context(db_session) -> str:
-    """Return the current prompt emphasis as a formatted string block."""
+    """Return the current prompt emphasis as a formatted string block (cached)."""
+    cached = _cached_prompt("context")
+    if cached is not None:
+        return cached
     try:
-        import sys
-
-        if "app.orm.oracle_feedback" in sys.modules:
-            OracleLearningData = sys.modules["app.orm.oracle_feedback"].OracleLearningData
-        else:
-            from app.orm.oracle_feedback import OracleLearningData
+        _, OracleLearningData, _ = _orm()
 
         row = (
-            db_session.query(OracleLearningData)
-            .filter(OracleLearningData.metric_key == "prompt_emphasis:active")
+            db_session.query(OracleLearningData.prompt_emphasis)
+            .filter(OracleLearningData.metric_key == EMPHASIS_KEY)
             .first()
         )
-        if row and row.prompt_emphasis and row.prompt_emphasis.strip():
-            return (
-                "=== LEARNED USER PREFERENCES ===\n"
-                + row.prompt_emphasis.strip()
-                + "\n=== END PREFERENCES ===\n"
-            )
-        return ""
+        text = (row[0] if row else None) or ""
+        return _store_prompt_cache([line for line in text.split("\n") if line.strip()])
     except ImportError:
         return ""
 
@@ -6,29 +6,275 @@ which factors actually correlate with correct answers.
 
 Storage: JSON files in data/ directory.
 No external dependencies.
+
+Solve history is an append-only JSONL log (one line per attempt). The last
+MAX_HISTORY records form the learning window; their statistics are kept as
+running aggregates (Welford means, an online Pearson co-moment, per-factor
+counters) that are updated in O(1) as records enter and leave the window,
+so the dashboard and weight functions never re-scan the history. The log
+is compacted back to the window once it reaches COMPACT_AT lines, and
+lines appended by other processes are picked up from the file tail.
 """
 
 import json
 import math
 import logging
+import os
+import threading
+from collections import Counter, deque
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).parent.parent / "data"
-HISTORY_FILE = DATA_DIR / "solve_history.json"
+HISTORY_LOG = DATA_DIR / "solve_history.jsonl"
+HISTORY_FILE = DATA_DIR / "solve_history.json"  # pre-log format, migrated on first load
 WEIGHTS_FILE = DATA_DIR / "factor_weights.json"
 SCAN_SESSIONS_FILE = DATA_DIR / "scan_sessions.json"
 
 # Minimum solves before learning kicks in
 MIN_SOLVES_FOR_LEARNING = 10
 
+# Learning window and log compaction threshold
+MAX_HISTORY = 10000
+COMPACT_AT = 2 * MAX_HISTORY
+
+FACTOR_CHECKS = {
+    "is_master_number": lambda r: r.get("is_master", False),
+    "high_math_score": lambda r: r.get("math_score", 0) > 0.6,
+    "high_numerology_score": lambda r: r.get("numerology_score", 0) > 0.6,
+    "power_reduced_number": lambda r: r.get("reduced_number", 0) in (1, 8, 9, 11, 22, 33),
+}
+
 
 def _ensure_data_dir():
     """Create data directory if it doesn't exist."""
     DATA_DIR.mkdir(exist_ok=True)
 
 
+# ════════════════════════════════════════════════════════════
+# Streaming statistics
+# ════════════════════════════════════════════════════════════
+
+
+class RunningMoments:
+    """Welford mean / variance of x (and co-moment with y) with removal.
+
+    ``add`` and ``remove`` are exact inverses, so the aggregates track a
+    sliding window without revisiting it.
+    """
+
+    __slots__ = ("n", "mean_x", "mean_y", "m2_x", "m2_y", "c_xy")
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = self.mean_y = 0.0
+        self.m2_x = self.m2_y = self.c_xy = 0.0
+
+    def add(self, x: float, y: float = 0.0) -> None:
+        self.n += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.n
+        self.mean_y += dy / self.n
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.c_xy += dx * (y - self.mean_y)
+
+    def remove(self, x: float, y: float = 0.0) -> None:
+        if self.n <= 1:
+            self.__init__()
+            return
+        self.n -= 1
+        mean_x = self.mean_x - (x - self.mean_x) / self.n  # mean before x was added
+        mean_y = self.mean_y - (y - self.mean_y) / self.n
+        self.m2_x -= (x - mean_x) * (x - self.mean_x)
+        self.m2_y -= (y - mean_y) * (y - self.mean_y)
+        self.c_xy -= (x - mean_x) * (y - self.mean_y)
+        self.mean_x, self.mean_y = mean_x, mean_y
+
+    @property
+    def variance(self) -> float:
+        return max(0.0, self.m2_x) / self.n if self.n else 0.0
+
+    def pearson(self) -> float:
+        if self.m2_x <= 0 or self.m2_y <= 0:
+            return 0.0
+        return self.c_xy / math.sqrt(self.m2_x * self.m2_y)
+
+
+_MEAN_FIELDS = {
+    "final_score": lambda r: r.get("final_score", 0),
+    "math_score": lambda r: r.get("math_score", 0.5),
+    "numerology_score": lambda r: r.get("numerology_score", 0.5),
+    "entropy_low": lambda r: r.get("math_breakdown", {}).get("entropy_low", 0.5),
+    "digit_balance": lambda r: r.get("math_breakdown", {}).get("digit_balance", 0.5),
+}
+
+
+class _OutcomeStats:
+    """Aggregates over the winners (or the losers) in the window."""
+
+    def __init__(self):
+        self.count = 0
+        self.moments = {name: RunningMoments() for name in _MEAN_FIELDS}
+        self.factors = Counter()
+        self.puzzle_types = Counter()
+
+    def update(self, record: dict, sign: int) -> None:
+        self.count += sign
+        for name, field in _MEAN_FIELDS.items():
+            moments = self.moments[name]
+            (moments.add if sign > 0 else moments.remove)(field(record))
+        for name, check in FACTOR_CHECKS.items():
+            if check(record):
+                self.factors[name] += sign
+        puzzle_type = record.get("puzzle_type", "unknown")
+        self.puzzle_types[puzzle_type] += sign
+        if self.puzzle_types[puzzle_type] <= 0:
+            del self.puzzle_types[puzzle_type]
+
+    def mean(self, name: str) -> float:
+        return self.moments[name].mean_x
+
+    def rate(self, factor: str) -> float:
+        return self.factors[factor] / self.count if self.count else 0.0
+
+
+class SolveStats:
+    """Running aggregates over the solve-history window."""
+
+    def __init__(self, records=()):
+        self.window = deque()
+        self.outcomes = {True: _OutcomeStats(), False: _OutcomeStats()}
+        self.score_vs_correct = RunningMoments()  # Pearson(final_score, was_correct)
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self.window)
+
+    @property
+    def winners(self) -> _OutcomeStats:
+        return self.outcomes[True]
+
+    @property
+    def losers(self) -> _OutcomeStats:
+        return self.outcomes[False]
+
+    def add(self, record: dict) -> None:
+        """Add a record, evicting the oldest beyond MAX_HISTORY."""
+        self.window.append(record)
+        self._update(record, 1)
+        while len(self.window) > MAX_HISTORY:
+            self._update(self.window.popleft(), -1)
+
+    def _update(self, record: dict, sign: int) -> None:
+        correct = bool(record.get("was_correct"))
+        self.outcomes[correct].update(record, sign)
+        point = (record.get("final_score", 0.5), 1.0 if correct else 0.0)
+        if sign > 0:
+            self.score_vs_correct.add(*point)
+        else:
+            self.score_vs_correct.remove(*point)
+
+
+# ════════════════════════════════════════════════════════════
+# Solve history log
+# ════════════════════════════════════════════════════════════
+
+_lock = threading.Lock()
+_stats = None  # SolveStats
+_log_state = None  # (log path, bytes ingested, lines in log, log inode)
+
+
+def _read_log() -> list:
+    records = []
+    with open(HISTORY_LOG, "rb") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def _migrate_legacy_history() -> None:
+    """Merge a pre-log solve_history.json into the JSONL log, ahead of its lines.
+
+    Keyed on the legacy file still existing, so records are kept even if
+    something already created the log.
+    """
+    if not HISTORY_FILE.exists():
+        return
+    try:
+        with open(HISTORY_FILE, "r") as f:
+            history = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return
+    logged = _read_log() if HISTORY_LOG.exists() else []
+    _write_log((history + logged)[-MAX_HISTORY:])
+    HISTORY_FILE.unlink()
+    logger.info(f"Migrated {len(history)} solve records to {HISTORY_LOG.name}")
+
+
+def _write_log(records) -> None:
+    """Atomically replace the log with ``records``."""
+    tmp_path = HISTORY_LOG.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    os.replace(tmp_path, HISTORY_LOG)
+
+
+def _sync() -> SolveStats:
+    """Bring the running stats up to date with the log. Caller holds _lock.
+
+    Only bytes appended since the last sync are read. A replaced log
+    (compaction, migration, reset; seen as a new inode) or a shrunken one
+    triggers a full reload, even if the new file is longer than the old offset.
+    """
+    global _stats, _log_state
+    if _log_state is not None and _log_state[0] != HISTORY_LOG:
+        _stats = _log_state = None
+    if _stats is None:
+        _migrate_legacy_history()
+        _stats, _log_state = SolveStats(), (HISTORY_LOG, 0, 0, None)
+
+    path, offset, lines, inode = _log_state
+    try:
+        st = HISTORY_LOG.stat()
+        size, current_inode = st.st_size, st.st_ino
+    except FileNotFoundError:
+        size, current_inode = 0, None
+    if size < offset or (offset and current_inode != inode):
+        _stats, offset, lines = SolveStats(), 0, 0
+    if size > offset:
+        with open(HISTORY_LOG, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partial line still being written
+                offset += len(line)
+                lines += 1
+                try:
+                    _stats.add(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    _log_state = (path, offset, lines, current_inode)
+    return _stats
+
+
+def _compact() -> None:
+    """Rewrite the log as the current window. Caller holds _lock."""
+    global _stats, _log_state
+    _write_log(_stats.window)
+    # Rebuild the aggregates from the window to shed floating-point drift
+    _stats = SolveStats(_stats.window)
+    st = HISTORY_LOG.stat()
+    _log_state = (HISTORY_LOG, st.st_size, len(_stats), st.st_ino)
+
+
 def record_solve(
     puzzle_type: str,
     candidate: int,
@@ -54,26 +300,24 @@ def record_solve(
         "metadata": metadata or {},
     }
 
-    history = _load_history()
-    history.append(record)
+    with _lock:
+        _sync()  # migrate a legacy history before the append creates the log
+        with open(HISTORY_LOG, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        _sync()
+        if _log_state[2] >= COMPACT_AT:
+            _compact()
 
-    # Keep last 10,000 records max
-    if len(history) > 10000:
-        history = history[-10000:]
 
-    with open(HISTORY_FILE, "w") as f:
-        json.dump(history, f, indent=2)
+def _solve_stats() -> SolveStats:
+    with _lock:
+        return _sync()
 
 
 def _load_history() -> list:
-    """Load solve history from disk."""
-    if not HISTORY_FILE.exists():
-        return []
-    try:
-        with open(HISTORY_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return []
+    """The solve-history window (last MAX_HISTORY records), oldest first."""
+    with _lock:
+        return list(_sync().window)
 
 
 def get_weights() -> dict:
@@ -92,8 +336,7 @@ def confidence_level() -> float:
     How confident is the learning engine? 0.0 = no data, 1.0 = very confident.
     0 solves -> 0.0, 10 solves -> 0.3, 50 -> 0.7, 100+ -> 1.0
     """
-    history = _load_history()
-    correct_count = sum(1 for r in history if r.get("was_correct"))
+    correct_count = _solve_stats().winners.count
     if correct_count < MIN_SOLVES_FOR_LEARNING:
         return 0.0
     return min(1.0, correct_count / 100.0)
@@ -104,10 +347,9 @@ def get_learned_score(n: int, context: dict = None) -> float:
     Score a candidate based on learned patterns.
     Returns 0.5 (neutral) if not enough data.
     """
-    history = _load_history()
-    winners = [r for r in history if r.get("was_correct")]
+    winners = _solve_stats().winners
 
-    if len(winners) < MIN_SOLVES_FOR_LEARNING:
+    if winners.count < MIN_SOLVES_FOR_LEARNING:
         return 0.5
 
     # LAZY IMPORT — math_analysis removed in Session 6; numerology via bridge
@@ -121,11 +363,8 @@ def get_learned_score(n: int, context: dict = None) -> float:
     candidate_entropy = entropy(n)
     candidate_balance = digit_balance(n)
 
-    winner_entropies = [r.get("math_breakdown", {}).get("entropy_low", 0.5) for r in winners]
-    winner_balances = [r.get("math_breakdown", {}).get("digit_balance", 0.5) for r in winners]
-
-    avg_winner_entropy = sum(winner_entropies) / len(winner_entropies)
-    avg_winner_balance = sum(winner_balances) / len(winner_balances)
+    avg_winner_entropy = winners.mean("entropy_low")
+    avg_winner_balance = winners.mean("digit_balance")
 
     # Normalize candidate values to 0-1 range
     max_entropy = 3.32
@@ -136,7 +375,7 @@ def get_learned_score(n: int, context: dict = None) -> float:
     balance_sim = 1.0 - abs(candidate_balance - avg_winner_balance)
 
     # Check numerology factors from history
-    winner_master_rate = sum(1 for r in winners if r.get("is_master", False)) / len(winners)
+    winner_master_rate = winners.rate("is_master_number")
     candidate_is_master = is_master_number(n)
     master_boost = 0.2 if candidate_is_master and winner_master_rate > 0.15 else 0.0
 
@@ -147,23 +386,16 @@ def get_learned_score(n: int, context: dict = None) -> float:
 
 
 def recalculate_weights():
-    """Analyze solve history and recalculate optimal weights."""
+    """Recalculate optimal weights from the running winner/loser aggregates."""
     _ensure_data_dir()
-    history = _load_history()
-
-    winners = [r for r in history if r.get("was_correct")]
-    losers = [r for r in history if not r.get("was_correct")]
+    stats = _solve_stats()
+    winners, losers = stats.winners, stats.losers
 
-    if len(winners) < MIN_SOLVES_FOR_LEARNING or len(losers) < MIN_SOLVES_FOR_LEARNING:
+    if winners.count < MIN_SOLVES_FOR_LEARNING or losers.count < MIN_SOLVES_FOR_LEARNING:
         return
 
-    winner_math_avg = sum(r.get("math_score", 0.5) for r in winners) / len(winners)
-    winner_num_avg = sum(r.get("numerology_score", 0.5) for r in winners) / len(winners)
-    loser_math_avg = sum(r.get("math_score", 0.5) for r in losers) / len(losers)
-    loser_num_avg = sum(r.get("numerology_score", 0.5) for r in losers) / len(losers)
-
-    math_gap = max(0.01, winner_math_avg - loser_math_avg)
-    num_gap = max(0.01, winner_num_avg - loser_num_avg)
+    math_gap = max(0.01, winners.mean("math_score") - losers.mean("math_score"))
+    num_gap = max(0.01, winners.mean("numerology_score") - losers.mean("numerology_score"))
     total_gap = math_gap + num_gap
 
     new_weights = {
@@ -181,29 +413,21 @@ def recalculate_weights():
 
 def get_factor_accuracy() -> dict:
     """For the Validation Dashboard. Returns factor accuracy analysis."""
-    history = _load_history()
-    winners = [r for r in history if r.get("was_correct")]
-    losers = [r for r in history if not r.get("was_correct")]
+    stats = _solve_stats()
+    winners, losers = stats.winners, stats.losers
 
     result = {
-        "total_solves": len(history),
-        "total_correct": len(winners),
+        "total_solves": len(stats),
+        "total_correct": winners.count,
         "factors": {},
     }
 
-    if not winners or not losers:
+    if not winners.count or not losers.count:
         return result
 
-    factor_checks = {
-        "is_master_number": lambda r: r.get("is_master", False),
-        "high_math_score": lambda r: r.get("math_score", 0) > 0.6,
-        "high_numerology_score": lambda r: r.get("numerology_score", 0) > 0.6,
-        "power_reduced_number": lambda r: r.get("reduced_number", 0) in (1, 8, 9, 11, 22, 33),
-    }
-
-    for name, check_fn in factor_checks.items():
-        winner_rate = sum(1 for w in winners if check_fn(w)) / len(winners)
-        loser_rate = sum(1 for entry in losers if check_fn(entry)) / len(losers)
+    for name in FACTOR_CHECKS:
+        winner_rate = winners.rate(name)
+        loser_rate = losers.rate(name)
         lift = (winner_rate / loser_rate - 1.0) if loser_rate > 0 else 0.0
 
         result["factors"][name] = {
@@ -217,55 +441,31 @@ def get_factor_accuracy() -> dict:
 
 def get_solve_stats() -> dict:
     """Summary statistics for the dashboard."""
-    history = _load_history()
-    winners = [r for r in history if r.get("was_correct")]
-    losers = [r for r in history if not r.get("was_correct")]
+    stats = _solve_stats()
+    winners, losers = stats.winners, stats.losers
 
     return {
-        "total_attempts": len(history),
-        "total_correct": len(winners),
-        "success_rate": len(winners) / max(1, len(history)),
-        "avg_winner_score": sum(r.get("final_score", 0) for r in winners) / max(1, len(winners)),
-        "avg_loser_score": sum(r.get("final_score", 0) for r in losers) / max(1, len(losers)),
-        "best_puzzle_type": _most_common_type(winners),
+        "total_attempts": len(stats),
+        "total_correct": winners.count,
+        "success_rate": winners.count / max(1, len(stats)),
+        "avg_winner_score": winners.mean("final_score") if winners.count else 0.0,
+        "avg_loser_score": losers.mean("final_score") if losers.count else 0.0,
+        "best_puzzle_type": (
+            winners.puzzle_types.most_common(1)[0][0] if winners.puzzle_types else "none"
+        ),
         "confidence": confidence_level(),
     }
 
 
-def _most_common_type(records: list) -> str:
-    """Find the most common puzzle_type in records."""
-    if not records:
-        return "none"
-    from collections import Counter
-
-    types = Counter(r.get("puzzle_type", "unknown") for r in records)
-    return types.most_common(1)[0][0]
-
-
 def pearson_correlation() -> float:
     """
     Calculate Pearson correlation between final_score and was_correct.
     Returns float from -1.0 to 1.0. Returns 0.0 if not enough data.
     """
-    history = _load_history()
-    if len(history) < MIN_SOLVES_FOR_LEARNING:
+    stats = _solve_stats()
+    if len(stats) < MIN_SOLVES_FOR_LEARNING:
         return 0.0
-
-    scores = [r.get("final_score", 0.5) for r in history]
-    correct = [1.0 if r.get("was_correct") else 0.0 for r in history]
-
-    n = len(scores)
-    mean_s = sum(scores) / n
-    mean_c = sum(correct) / n
-
-    numerator = sum((scores[i] - mean_s) * (correct[i] - mean_c) for i in range(n))
-    denom_s = math.sqrt(sum((scores[i] - mean_s) ** 2 for i in range(n)))
-    denom_c = math.sqrt(sum((correct[i] - mean_c) ** 2 for i in range(n)))
-
-    if denom_s == 0 or denom_c == 0:
-        return 0.0
-
-    return numerator / (denom_s * denom_c)
+    return stats.score_vs_correct.pearson()
 
 
 def export_history_csv(filepath: str = None) -> str:
@@ -419,9 +619,13 @@ def record_scan_to_memory(session_stats: dict):
 
 def reset_learning_data():
     """Delete all learning data."""
+    global _stats, _log_state
     _ensure_data_dir()
-    if HISTORY_FILE.exists():
-        HISTORY_FILE.unlink()
+    with _lock:
+        for path in (HISTORY_LOG, HISTORY_FILE):
+            if path.exists():
+                path.unlink()
+        _stats = _log_state = None
     if WEIGHTS_FILE.exists():
         WEIGHTS_FILE.unlink()
     if SCAN_SESSIONS_FILE.exists():
@@ -2,16 +2,39 @@
 In-memory cache engine with periodic disk flush.
 
 Stores scan session history, high-score discoveries, and score
-distribution data.  Everything lives in RAM for fast access and is
-flushed to ``data/scan_memory.json`` periodically (every 60 s while
+distribution data.  The hot working set lives in RAM for fast access and
+is flushed to ``data/scan_memory.json`` periodically (every 60 s while
 dirty) and on shutdown.
 
+Tiering: only the most recent ``_HOT_SESSIONS`` sessions and the top
+``_HOT_HIGH_SCORES`` high scores stay in RAM. Older sessions and
+lower-ranked high scores spill to a SQLite cold tier
+(``data/scan_memory_cold.db``), which is trimmed to the overall retention
+limits (``_MAX_SESSIONS`` / ``_MAX_HIGH_SCORES``). Summaries and
+recommendations combine both tiers.
+
+Recorders only queue spilled entries under ``_lock``; ``_write_spilled``
+commits them to SQLite afterwards under ``_cold_lock``. Queued entries
+stay visible to readers and are included in the JSON snapshot until
+committed. Cold rows are keyed by a hash of their content and inserted
+with ``INSERT OR IGNORE``, so entries re-spilled from a snapshot that
+predates a crash are not duplicated; on load, hot entries already in the
+cold tier are dropped.
+
+Size accounting: the serialized size of each hot section is tracked
+incrementally as entries enter and leave it, so the byte budget is
+checked without re-serializing the cache. ``flush_to_disk`` copies the
+hot sections under the lock (a shallow snapshot — entries are never
+mutated after insert) and serializes and writes outside it.
+
 Zero pip dependencies -- Python stdlib only.
 """
 
+import hashlib
 import json
 import logging
 import os
+import sqlite3
 import threading
 import time
 from pathlib import Path
@@ -22,14 +45,21 @@ from pathlib import Path
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 MEMORY_FILE = DATA_DIR / "scan_memory.json"
+COLD_FILE = DATA_DIR / "scan_memory_cold.db"
 
 # ---------------------------------------------------------------------------
 # Module-level state
 # ---------------------------------------------------------------------------
 
 _lock = threading.RLock()  # Reentrant lock for thread safety
-_cache = None  # None until first load, then dict
+_flush_lock = threading.Lock()  # Serializes disk writes (taken without _lock)
+_cold_lock = threading.Lock()  # Serializes cold-tier access; taken before _lock
+_cache = None  # None until first load, then dict (hot tier)
+_cold = None  # _ColdTier, opened with the cache
+_sizes = {}  # Serialized bytes per hot section
+_spilled = {"sessions": [], "high_scores": []}  # Left the hot tier, not yet in SQLite
 _dirty = False  # True if cache has unsaved changes
+_generation = 0  # Bumped on every change; flush clears _dirty only if unchanged
 _flush_timer = None  # threading.Timer for periodic flush
 
 log = logging.getLogger(__name__)
@@ -38,12 +68,35 @@ log = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 
-_MAX_SESSIONS = 1000
+_MAX_SESSIONS = 1000  # Retained across both tiers
 _MAX_HIGH_SCORES = 500
-_MAX_SIZE_BYTES = 10_000_000  # ~10 MB
+_HOT_SESSIONS = 100  # Kept in RAM
+_HOT_HIGH_SCORES = 50
+_MAX_SIZE_BYTES = 10_000_000  # ~10 MB hot-tier budget
 _FLUSH_INTERVAL = 60  # seconds
 _AGGRESSIVE_SESSION_TRIM = 500
 
+_SECTIONS = ("sessions", "high_scores")
+
+_COLD_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    key       TEXT NOT NULL UNIQUE,
+    timestamp TEXT,
+    mode      TEXT,
+    avg_speed REAL NOT NULL,
+    data      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_mode ON sessions(mode);
+CREATE TABLE IF NOT EXISTS high_scores (
+    id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    key   TEXT NOT NULL UNIQUE,
+    score REAL NOT NULL,
+    data  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_high_scores_score ON high_scores(score);
+"""
+
 # ===================================================================
 # Internal helpers
 # ===================================================================
@@ -67,13 +120,141 @@ def _default_memory() -> dict:
     }
 
 
+def _entry_size(entry) -> int:
+    """Serialized size of one list entry (plus its separator)."""
+    try:
+        return len(json.dumps(entry)) + 2
+    except (TypeError, ValueError):
+        return 0
+
+
+def _score(entry: dict) -> float:
+    return entry.get("score", 0)
+
+
+def _entry_key(entry: dict) -> str:
+    """Content hash identifying an entry in the cold tier."""
+    return hashlib.sha256(json.dumps(entry, sort_keys=True).encode()).hexdigest()
+
+
+class _ColdTier:
+    """SQLite store for sessions and high scores evicted from RAM."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_COLD_SCHEMA)
+        self._conn.commit()
+
+    def add_sessions(self, sessions: list) -> None:
+        """Append sessions (oldest first) and drop the oldest beyond the cap.
+
+        Sessions already stored are skipped.
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO sessions (key, timestamp, mode, avg_speed, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        _entry_key(s),
+                        s.get("timestamp"),
+                        s.get("mode"),
+                        s.get("avg_speed", 0) or 0,
+                        json.dumps(s),
+                    )
+                    for s in sessions
+                ],
+            )
+            self._conn.execute(
+                "DELETE FROM sessions WHERE id NOT IN"
+                " (SELECT id FROM sessions ORDER BY id DESC LIMIT ?)",
+                (_MAX_SESSIONS - _HOT_SESSIONS,),
+            )
+
+    def add_high_scores(self, entries: list) -> None:
+        """Add high scores and drop the lowest beyond the cap.
+
+        Entries already stored are skipped.
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO high_scores (key, score, data) VALUES (?, ?, ?)",
+                [(_entry_key(h), _score(h), json.dumps(h)) for h in entries],
+            )
+            self._conn.execute(
+                "DELETE FROM high_scores WHERE id NOT IN"
+                " (SELECT id FROM high_scores ORDER BY score DESC, id ASC LIMIT ?)",
+                (_MAX_HIGH_SCORES - _HOT_HIGH_SCORES,),
+            )
+
+    def contains(self, table: str, entries: list) -> list:
+        """Flags for which of ``entries`` are already stored in ``table``."""
+        known = set()
+        keys = [_entry_key(e) for e in entries]
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(
+                row[0]
+                for row in self._conn.execute(
+                    f"SELECT key FROM {table} WHERE key IN ({placeholders})", chunk
+                )
+            )
+        return [k in known for k in keys]
+
+    def session_stats(self) -> dict:
+        """Count, avg_speed sums and max, and modes of the cold sessions."""
+        count, speed_sum, nonzero_sum, nonzero_count, best = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(avg_speed), 0),"
+            " COALESCE(SUM(CASE WHEN avg_speed != 0 THEN avg_speed END), 0),"
+            " COUNT(CASE WHEN avg_speed != 0 THEN 1 END), COALESCE(MAX(avg_speed), 0)"
+            " FROM sessions"
+        ).fetchone()
+        modes = {
+            row[0]
+            for row in self._conn.execute(
+                "SELECT DISTINCT mode FROM sessions WHERE mode IS NOT NULL AND mode != ''"
+            )
+        }
+        return {
+            "count": count,
+            "speed_sum": speed_sum,
+            "nonzero_speed_sum": nonzero_sum,
+            "nonzero_speed_count": nonzero_count,
+            "best_speed": best,
+            "modes": modes,
+        }
+
+    def high_score_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM high_scores").fetchone()[0]
+
+    def sessions(self, limit: int) -> list:
+        """The newest ``limit`` cold sessions, oldest first."""
+        rows = self._conn.execute(
+            "SELECT data FROM sessions ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [json.loads(r[0]) for r in reversed(rows)]
+
+    def high_scores(self, limit: int) -> list:
+        rows = self._conn.execute(
+            "SELECT data FROM high_scores ORDER BY score DESC, id ASC LIMIT ?", (limit,)
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
 def _ensure_loaded() -> None:
     """Load the cache from disk on first access (or create a default).
 
     The caller should already hold ``_lock`` or this function acquires it
     itself -- safe either way because the lock is reentrant.
     """
-    global _cache
+    global _cache, _cold, _dirty
 
     with _lock:
         if _cache is not None:
@@ -104,40 +285,105 @@ def _ensure_loaded() -> None:
             if key not in _cache.get("lifetime_stats", {}):
                 _cache.setdefault("lifetime_stats", {})[key] = value
 
+        try:
+            _cold = _ColdTier(COLD_FILE)
+        except sqlite3.Error as exc:
+            log.warning(
+                "Cold tier unavailable (%s) -- keeping everything in RAM: %s", COLD_FILE, exc
+            )
+            _cold = None
+
+        if _cold is not None:
+            # A snapshot older than the last spill still holds entries that
+            # were committed to the cold tier before a crash
+            for section in _SECTIONS:
+                stored = _cold.contains(section, _cache[section])
+                if any(stored):
+                    _cache[section] = [e for e, cold in zip(_cache[section], stored) if not cold]
+                    _dirty = True
 
-def _trim_memory() -> None:
-    """Trim the cache to stay within size budgets.
+        _cache["high_scores"].sort(key=_score, reverse=True)
+        for section in _SECTIONS:
+            _sizes[section] = sum(_entry_size(e) for e in _cache[section])
 
-    Must be called while holding ``_lock``.
-    """
-    global _cache
+        # Files written before tiering hold up to _MAX_SESSIONS in RAM
+        if _spill():
+            _dirty = True
 
-    # Sessions: hard cap
-    if len(_cache.get("sessions", [])) > _MAX_SESSIONS:
-        _cache["sessions"] = _cache["sessions"][-_MAX_SESSIONS:]
 
-    # High scores: keep top N by score descending
-    hs = _cache.get("high_scores", [])
-    if len(hs) > _MAX_HIGH_SCORES:
-        hs.sort(key=lambda h: h.get("score", 0), reverse=True)
-        _cache["high_scores"] = hs[:_MAX_HIGH_SCORES]
+def _spill() -> bool:
+    """Queue entries beyond the hot caps (or byte budget) for the cold tier.
 
-    # Byte-size check -- aggressive trim if needed
-    try:
-        size = len(json.dumps(_cache))
-    except (TypeError, ValueError):
-        size = 0
+    Must be called while holding ``_lock``; ``_write_spilled`` commits the
+    queue after the lock is released. Returns True if anything moved.
+    """
+    sessions = _cache["sessions"]
+    high_scores = _cache["high_scores"]
+    hot_sessions = _HOT_SESSIONS if _cold is not None else _MAX_SESSIONS
+    hot_scores = _HOT_HIGH_SCORES if _cold is not None else _MAX_HIGH_SCORES
 
-    if size > _MAX_SIZE_BYTES:
+    if sum(_sizes.values()) > _MAX_SIZE_BYTES:
         log.warning(
             "Memory cache size %d exceeds limit %d -- aggressive trim",
-            size,
+            sum(_sizes.values()),
             _MAX_SIZE_BYTES,
         )
-        _cache["sessions"] = _cache["sessions"][-_AGGRESSIVE_SESSION_TRIM:]
-        hs = _cache.get("high_scores", [])
-        hs.sort(key=lambda h: h.get("score", 0), reverse=True)
-        _cache["high_scores"] = hs[:_AGGRESSIVE_SESSION_TRIM]
+        hot_sessions = min(hot_sessions, max(1, len(sessions) // 2), _AGGRESSIVE_SESSION_TRIM)
+        hot_scores = min(hot_scores, max(1, len(high_scores) // 2), _AGGRESSIVE_SESSION_TRIM)
+
+    moved = False
+    if len(sessions) > hot_sessions:
+        old = sessions[: len(sessions) - hot_sessions]
+        del sessions[: len(old)]
+        _sizes["sessions"] -= sum(_entry_size(e) for e in old)
+        if _cold is not None:
+            _spilled["sessions"].extend(old)
+        moved = True
+    if len(high_scores) > hot_scores:
+        low = high_scores[hot_scores:]
+        del high_scores[hot_scores:]
+        _sizes["high_scores"] -= sum(_entry_size(e) for e in low)
+        if _cold is not None:
+            _spilled["high_scores"].extend(low)
+        moved = True
+    return moved
+
+
+def _write_spilled() -> None:
+    """Commit queued spills to the cold tier. Must be called without ``_lock``.
+
+    Entries leave the queue only once committed, so a failed write is
+    retried on the next spill (re-inserts are ignored).
+    """
+    with _cold_lock:
+        with _lock:
+            if _cold is None:
+                return
+            sessions = list(_spilled["sessions"])
+            high_scores = list(_spilled["high_scores"])
+        if not sessions and not high_scores:
+            return
+
+        try:
+            if sessions:
+                _cold.add_sessions(sessions)
+            if high_scores:
+                _cold.add_high_scores(high_scores)
+        except sqlite3.Error as exc:
+            log.warning("Cold tier write failed -- keeping spilled entries queued: %s", exc)
+            return
+
+        with _lock:
+            del _spilled["sessions"][: len(sessions)]
+            del _spilled["high_scores"][: len(high_scores)]
+
+
+def _touch() -> None:
+    """Mark the cache changed. Must be called while holding ``_lock``."""
+    global _dirty, _generation
+    _cache["last_updated"] = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
+    _dirty = True
+    _generation += 1
 
 
 def _start_flush_timer() -> None:
@@ -175,14 +421,47 @@ def _auto_flush() -> None:
 def get_memory() -> dict:
     """Return the current memory cache (loads from disk on first call).
 
-    The returned dict is the *live* cache -- callers should treat it as
-    read-only unless they also set ``_dirty`` under ``_lock``.
+    The returned dict is the *live* hot tier -- recent sessions and top
+    high scores only (see ``get_sessions`` / ``get_high_scores`` for
+    both tiers). Callers should treat it as read-only.
     """
     with _lock:
         _ensure_loaded()
         return _cache
 
 
+def get_sessions(limit: int = _MAX_SESSIONS) -> list:
+    """The newest ``limit`` sessions across both tiers, oldest first."""
+    with _cold_lock, _lock:
+        _ensure_loaded()
+        recent = _spilled["sessions"] + _cache["sessions"]
+        hot = recent[-limit:] if limit > 0 else []
+        if _cold is None or len(hot) >= limit:
+            return hot
+        return _cold.sessions(limit - len(hot)) + hot
+
+
+def get_high_scores(limit: int = _MAX_HIGH_SCORES) -> list:
+    """The best ``limit`` high scores across both tiers, best first."""
+    with _cold_lock, _lock:
+        _ensure_loaded()
+        hot = list(_cache["high_scores"][:limit]) if limit > 0 else []
+        if _cold is None or len(hot) >= limit:
+            return hot
+        # Queued entries rank below every hot one but not necessarily below
+        # the stored ones
+        rest = limit - len(hot)
+        lower = _spilled["high_scores"] + _cold.high_scores(rest)
+        return hot + sorted(lower, key=_score, reverse=True)[:rest]
+
+
+def get_size_bytes() -> dict:
+    """Tracked serialized size of each hot section."""
+    with _lock:
+        _ensure_loaded()
+        return dict(_sizes)
+
+
 def record_session(session: dict) -> None:
     """Record a scan session.
 
@@ -190,15 +469,15 @@ def record_session(session: dict) -> None:
     ``keys_tested``, ``seeds_tested``, ``hits``, ``avg_speed``.
     A ``timestamp`` is added automatically if missing.
     """
-    global _dirty
-
     with _lock:
         _ensure_loaded()
 
+        session = dict(session)
         if "timestamp" not in session:
             session["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
 
         _cache["sessions"].append(session)
+        _sizes["sessions"] += _entry_size(session)
 
         # Update lifetime stats
         stats = _cache["lifetime_stats"]
@@ -207,17 +486,16 @@ def record_session(session: dict) -> None:
         stats["total_hits"] += session.get("hits", 0)
         stats["total_duration"] += session.get("duration", 0)
 
-        _cache["last_updated"] = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
-
-        _trim_memory()
-        _dirty = True
+        spilled = _spill()
+        _touch()
         _start_flush_timer()
 
+    if spilled:
+        _write_spilled()
+
 
 def record_high_score(key_hex: str, score: float, addresses: list) -> None:
     """Record a high-scoring key discovery."""
-    global _dirty
-
     with _lock:
         _ensure_loaded()
 
@@ -228,22 +506,29 @@ def record_high_score(key_hex: str, score: float, addresses: list) -> None:
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
         }
 
-        _cache["high_scores"].append(entry)
-
-        # Keep sorted descending by score, trim to max
-        _cache["high_scores"].sort(key=lambda h: h.get("score", 0), reverse=True)
-        if len(_cache["high_scores"]) > _MAX_HIGH_SCORES:
-            _cache["high_scores"] = _cache["high_scores"][:_MAX_HIGH_SCORES]
-
-        _cache["last_updated"] = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
-
-        _dirty = True
+        # Insert in descending score order (after equal scores)
+        high_scores = _cache["high_scores"]
+        lo, hi = 0, len(high_scores)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _score(high_scores[mid]) >= score:
+                lo = mid + 1
+            else:
+                hi = mid
+        high_scores.insert(lo, entry)
+        _sizes["high_scores"] += _entry_size(entry)
+
+        spilled = _spill()
+        _touch()
         _start_flush_timer()
 
+    if spilled:
+        _write_spilled()
+
 
 def record_score_distribution(score: float) -> None:
     """Track *score* in the appropriate 0.1-wide bucket."""
-    global _dirty
+    global _dirty, _generation
 
     with _lock:
         _ensure_loaded()
@@ -261,11 +546,39 @@ def record_score_distribution(score: float) -> None:
         dist[bucket_key] = dist.get(bucket_key, 0) + 1
 
         _dirty = True
+        _generation += 1
+
+
+def _cold_session_stats() -> dict:
+    """Session aggregates below the hot tier: queued spills plus SQLite.
+
+    Must be called while holding ``_cold_lock`` and ``_lock``.
+    """
+    if _cold is None:
+        return {
+            "count": 0,
+            "speed_sum": 0,
+            "nonzero_speed_sum": 0,
+            "nonzero_speed_count": 0,
+            "best_speed": 0,
+            "modes": set(),
+        }
+    stats = _cold.session_stats()
+    queued = _spilled["sessions"]
+    speeds = [s.get("avg_speed", 0) or 0 for s in queued]
+    nonzero = [v for v in speeds if v]
+    stats["count"] += len(queued)
+    stats["speed_sum"] += sum(speeds)
+    stats["nonzero_speed_sum"] += sum(nonzero)
+    stats["nonzero_speed_count"] += len(nonzero)
+    stats["best_speed"] = max([stats["best_speed"], *speeds])
+    stats["modes"] |= {s.get("mode") for s in queued if s.get("mode")}
+    return stats
 
 
 def get_recommendations() -> list:
     """Analyse memory and return a list of human-readable recommendations."""
-    with _lock:
+    with _cold_lock, _lock:
         _ensure_loaded()
 
         recs: list[str] = []
@@ -273,8 +586,9 @@ def get_recommendations() -> list:
         stats = _cache.get("lifetime_stats", {})
         dist = _cache.get("score_distribution", {})
         high_scores = _cache.get("high_scores", [])
+        cold = _cold_session_stats()
 
-        total_sessions = len(sessions)
+        total_sessions = len(sessions) + cold["count"]
         total_keys = stats.get("total_keys", 0)
         total_seeds = stats.get("total_seeds", 0)
         total_hits = stats.get("total_hits", 0)
@@ -288,10 +602,10 @@ def get_recommendations() -> list:
         # --- Speed trend ---
         if total_sessions >= 3:
             recent = sessions[-3:]
-            older = sessions[:-3] if total_sessions > 3 else []
             recent_avg = sum(s.get("avg_speed", 0) for s in recent) / len(recent)
-            if older:
-                older_avg = sum(s.get("avg_speed", 0) for s in older) / len(older)
+            if total_sessions > 3:
+                older_sum = cold["speed_sum"] + sum(s.get("avg_speed", 0) for s in sessions[:-3])
+                older_avg = older_sum / (total_sessions - 3)
                 if recent_avg > older_avg * 1.05:
                     recs.append("Your average speed is improving. Keep it up!")
                 elif recent_avg < older_avg * 0.90:
@@ -310,7 +624,7 @@ def get_recommendations() -> list:
             recs.append(f"Hit rate: {rate:.2e} -- every hit matters!")
 
         # --- Mode suggestion ---
-        modes = [s.get("mode") for s in sessions if s.get("mode")]
+        modes = {s.get("mode") for s in sessions if s.get("mode")} | cold["modes"]
         if modes and "both" not in modes:
             recs.append("Consider trying 'both' mode for better coverage.")
 
@@ -338,14 +652,18 @@ def get_recommendations() -> list:
 
 
 def get_summary() -> dict:
-    """Return summary statistics computed entirely from the in-RAM cache."""
-    with _lock:
+    """Return summary statistics from the hot cache plus cold-tier aggregates."""
+    with _cold_lock, _lock:
         _ensure_loaded()
 
         sessions = _cache.get("sessions", [])
         stats = _cache.get("lifetime_stats", {})
         high_scores = _cache.get("high_scores", [])
         dist = _cache.get("score_distribution", {})
+        cold = _cold_session_stats()
+        cold_high_scores = (
+            _cold.high_score_count() + len(_spilled["high_scores"]) if _cold is not None else 0
+        )
 
         total_keys = stats.get("total_keys", 0)
         total_seeds = stats.get("total_seeds", 0)
@@ -353,8 +671,9 @@ def get_summary() -> dict:
         total_duration = stats.get("total_duration", 0)
 
         speeds = [s.get("avg_speed", 0) for s in sessions if s.get("avg_speed")]
-        avg_speed = sum(speeds) / len(speeds) if speeds else 0.0
-        best_speed = max(speeds) if speeds else 0.0
+        speed_count = len(speeds) + cold["nonzero_speed_count"]
+        avg_speed = (sum(speeds) + cold["nonzero_speed_sum"]) / speed_count if speed_count else 0.0
+        best_speed = max(speeds + [cold["best_speed"]]) if speed_count else 0.0
 
         top_score = high_scores[0].get("score", 0) if high_scores else 0.0
 
@@ -363,49 +682,70 @@ def get_summary() -> dict:
             last_session_time = sessions[-1].get("timestamp", "")
 
         return {
-            "total_sessions": len(sessions),
+            "total_sessions": len(sessions) + cold["count"],
             "total_keys": total_keys,
             "total_seeds": total_seeds,
             "total_hits": total_hits,
             "avg_speed": round(avg_speed, 2),
             "best_speed": round(best_speed, 2),
             "total_duration_hours": round(total_duration / 3600, 2),
-            "high_score_count": len(high_scores),
+            "high_score_count": len(high_scores) + cold_high_scores,
             "top_score": top_score,
             "score_distribution": dict(dist),
             "last_session_time": last_session_time,
         }
 
 
+def _snapshot() -> dict:
+    """Shallow copy of the hot cache. Must be called while holding ``_lock``.
+
+    List entries are never mutated after insert, so copying the containers
+    is enough for serializing outside the lock. Spills not yet committed to
+    the cold tier are included; they are re-spilled on load.
+    """
+    snapshot = dict(_cache)
+    snapshot["sessions"] = _spilled["sessions"] + _cache["sessions"]
+    snapshot["high_scores"] = _cache["high_scores"] + _spilled["high_scores"]
+    snapshot["score_distribution"] = dict(_cache.get("score_distribution", {}))
+    snapshot["lifetime_stats"] = dict(_cache["lifetime_stats"])
+    return snapshot
+
+
 def flush_to_disk() -> None:
-    """Write the cache to disk atomically (temp-file + rename).
+    """Write the hot cache to disk atomically (temp-file + rename).
 
-    Only writes if there are unsaved changes (``_dirty is True``).
+    Only writes if there are unsaved changes (``_dirty is True``). The
+    snapshot is taken under ``_lock``; serialization and the write are not,
+    so recorders are never blocked on disk I/O.
     """
     global _dirty
 
-    with _lock:
-        if not _dirty or _cache is None:
-            return
+    with _flush_lock:
+        with _lock:
+            if not _dirty or _cache is None:
+                return
+            _cache["last_updated"] = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
+            snapshot = _snapshot()
+            generation = _generation
 
         try:
             DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-            _cache["last_updated"] = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
-
             tmp_path = MEMORY_FILE.with_suffix(".tmp")
-            data = json.dumps(_cache, indent=2, ensure_ascii=False)
+            data = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":"))
             tmp_path.write_text(data, encoding="utf-8")
             os.replace(str(tmp_path), str(MEMORY_FILE))
 
-            _dirty = False
+            with _lock:
+                if _generation == generation:
+                    _dirty = False
             log.info("Memory flushed to %s (%d bytes)", MEMORY_FILE, len(data))
         except OSError as exc:
             log.error("Failed to flush memory to disk: %s", exc)
 
 
 def shutdown() -> None:
-    """Cancel any pending flush timer and do a final flush."""
+    """Cancel any pending flush timer, commit queued spills and do a final flush."""
     global _flush_timer
 
     with _lock:
@@ -413,5 +753,24 @@ def shutdown() -> None:
             _flush_timer.cancel()
             _flush_timer = None
 
-        flush_to_disk()
-        log.info("Memory engine shut down")
+    _write_spilled()
+    flush_to_disk()
+    log.info("Memory engine shut down")
+
+
+def reset_memory() -> None:
+    """Close the cold tier and forget the cache (reloaded on next use). For tests."""
+    global _cache, _cold, _dirty, _generation, _flush_timer
+
+    with _cold_lock, _lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if _cold is not None:
+            _cold.close()
+        _cache = _cold = None
+        _sizes.clear()
+        for queued in _spilled.values():
+            queued.clear()
+        _dirty = False
+        _generation = 0
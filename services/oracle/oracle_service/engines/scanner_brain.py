@@ -4,21 +4,28 @@ Scanner Brain — Adaptive learning engine for the multi-chain scanner.
 Persists a knowledge base across sessions, selects scanning strategies
 adaptively, learns patterns from findings, and uses AI for mid-session
 adjustments and post-session analysis.
+
+Knowledge (strategy log, pattern discoveries, AI insights) is persisted
+through ``KnowledgeLog``: each change appends one compact event line, and
+every ``COMPACT_EVERY`` events the state is snapshotted and the log reset.
+Startup loads the snapshot and replays the events after it.
 """
 
 import json
 import logging
-import secrets
 import threading
 import time
 import uuid
 from pathlib import Path
 from random import random, choice
 
-logger = logging.getLogger(__name__)
+import numpy as np
 
-# secp256k1 curve order
-N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+from engines import key_scoring
+from engines.knowledge_log import KnowledgeLog
+from engines.key_scoring import N  # noqa: F401 — secp256k1 curve order, re-exported
+
+logger = logging.getLogger(__name__)
 
 STRATEGIES = [
     "random",
@@ -36,6 +43,18 @@ W_PATTERN_RATE = 0.25
 W_HIT_BONUS = 0.40
 W_EFFICIENCY = 0.05
 
+# Keys generated per strategy batch (generate_smart_key serves from it)
+KEY_BATCH_SIZE = 256
+CANDIDATES_PER_PICK = 10
+ENTROPY_ATTEMPTS = 20
+
+# Knowledge retention and persistence
+MAX_PATTERN_DISCOVERIES = 1000  # trimmed back to KEEP_PATTERN_DISCOVERIES when exceeded
+KEEP_PATTERN_DISCOVERIES = 500
+KEEP_AI_INSIGHTS = 200
+COMPACT_EVERY = 2000  # logged events between snapshots
+LEGACY_FILES = ("strategy_log.json", "pattern_discoveries.json", "ai_insights.json")
+
 
 class ScannerBrain:
     """Adaptive brain that makes the scanner smarter over time."""
@@ -52,7 +71,11 @@ class ScannerBrain:
         self._session_start_time = 0
 
         self._save_lock = threading.Lock()
-        self._dirty = False
+        self._dirty = False  # events logged since the last snapshot
+        self._knowledge_log = None
+
+        self._key_buffer = []
+        self._key_buffer_strategy = None
 
         self._load_knowledge()
 
@@ -110,9 +133,8 @@ class ScannerBrain:
         # Update strategy log
         self._update_strategy_log(stats)
 
-        # Save session file
+        # Save session file (knowledge changes are already in the log)
         self._save_session(session_data)
-        self._save_knowledge()
 
         # AI summary (async, returns placeholder if slow)
         summary = self._get_ai_session_summary(session_data)
@@ -179,7 +201,7 @@ class ScannerBrain:
         params = {"strategy": strategy_name}
 
         if strategy_name == "numerology_guided":
-            params["candidates_per_pick"] = 10
+            params["candidates_per_pick"] = CANDIDATES_PER_PICK
             params["min_score_threshold"] = 0.6
         elif strategy_name == "entropy_targeted":
             # Learned optimal entropy range from past findings
@@ -198,122 +220,92 @@ class ScannerBrain:
         return params
 
     def generate_smart_key(self) -> int:
-        """Generate a private key using the current strategy."""
+        """Generate a private key using the current strategy.
+
+        Keys are produced KEY_BATCH_SIZE at a time by ``generate_smart_keys``
+        and served from a buffer until it runs out or the strategy changes.
+        """
+        if self._key_buffer_strategy != self._current_strategy or not self._key_buffer:
+            self._key_buffer = self.generate_smart_keys(KEY_BATCH_SIZE)
+            self._key_buffer_strategy = self._current_strategy
+        return self._key_buffer.pop()
+
+    def generate_smart_keys(self, count, strategy=None) -> list:
+        """Generate ``count`` private keys with a strategy (default: current).
+
+        Candidates are drawn and scored as NumPy limb arrays
+        (engines.key_scoring), so the per-key cost is vectorized.
+        """
+        return key_scoring.ints_from_limbs(self.generate_key_limbs(count, strategy))
+
+    def generate_key_limbs(self, count, strategy=None):
+        """``generate_smart_keys`` as an (count, 4) uint64 limb array."""
+        strategy = strategy or self._current_strategy
         try:
-            if self._current_strategy == "numerology_guided":
-                return self._generate_numerology_biased_key()
-            elif self._current_strategy == "entropy_targeted":
-                return self._generate_entropy_targeted_key()
-            elif self._current_strategy == "pattern_replay":
-                return self._generate_pattern_replay_key()
-            elif self._current_strategy == "time_aligned":
-                return self._generate_time_aligned_key()
+            if strategy == "numerology_guided":
+                limbs = self._numerology_biased_keys(count)
+            elif strategy == "entropy_targeted":
+                limbs = self._entropy_targeted_keys(count)
+            elif strategy == "pattern_replay":
+                limbs = self._pattern_replay_keys(count)
+            elif strategy == "time_aligned":
+                limbs = self._time_aligned_keys(count)
             else:
-                return self._generate_random_key()
+                limbs = key_scoring.random_keys(count)
         except Exception as e:
-            logger.debug(f"Smart key generation failed ({self._current_strategy}): {e}")
-            return self._generate_random_key()
+            logger.debug(f"Smart key generation failed ({strategy}): {e}")
+            limbs = key_scoring.random_keys(count)
+        return limbs
 
     # ─── Key generation strategies ───
 
-    def _generate_random_key(self) -> int:
-        """Pure random key (baseline)."""
-        while True:
-            key = secrets.randbits(256)
-            if 1 <= key < N:
-                return key
-
-    def _generate_numerology_biased_key(self) -> int:
-        """Generate 10 candidates, pick highest numerology score."""
-        try:
-            from engines.scoring import numerology_score  # noqa: F811
-        except ImportError:
-            return self._generate_random_key()
-
-        candidates = []
-        for _ in range(10):
-            k = secrets.randbits(256)
-            if 1 <= k < N:
-                candidates.append(k)
-
-        if not candidates:
-            return self._generate_random_key()
-
-        best = max(candidates, key=lambda k: numerology_score(k)[0])
-        score = numerology_score(best)[0]
-        return best if score >= 0.6 else candidates[0]
+    def _numerology_biased_keys(self, count):
+        """Per key: 10 candidates, pick the highest numerology score.
+
+        A pick scoring below the threshold falls back to the group's first
+        candidate.
+        """
+        params = self.get_strategy_params("numerology_guided")
+        per_pick = params["candidates_per_pick"]
+        candidates = key_scoring.random_limbs(count * per_pick)
+        scores = key_scoring.numerology_scores(candidates)
+        return key_scoring.select_best(
+            candidates, scores, per_pick, min_score=params["min_score_threshold"]
+        )
 
-    def _generate_entropy_targeted_key(self) -> int:
-        """Reject keys outside learned optimal entropy range."""
+    def _entropy_targeted_keys(self, count):
+        """Per key: first of up to 20 candidates inside the learned entropy range."""
         lo, hi = self._learned_entropy_range()
-        for _ in range(20):  # max attempts
-            key = secrets.randbits(256)
-            if 1 <= key < N:
-                ent = self._key_entropy(key)
-                if lo <= ent <= hi:
-                    return key
-        return self._generate_random_key()
-
-    def _generate_pattern_replay_key(self) -> int:
-        """Generate keys near previously high-scoring ranges."""
+        candidates = key_scoring.random_limbs(count * ENTROPY_ATTEMPTS)
+        entropy = key_scoring.hex_entropy(candidates)
+        return key_scoring.select_first_in_range(candidates, entropy, lo, hi, ENTROPY_ATTEMPTS)
+
+    def _pattern_replay_keys(self, count):
+        """Keys near previously high-scoring ones (random low 128 bits flipped)."""
         refs = self._get_high_scoring_reference_keys()
         if not refs:
-            return self._generate_random_key()
-
-        ref = choice(refs)
-        # Perturb reference key by flipping random bits
-        mask = secrets.randbits(128)  # flip up to 128 low bits
-        key = ref ^ mask
-        if 1 <= key < N:
-            return key
-        return self._generate_random_key()
-
-    def _generate_time_aligned_key(self) -> int:
-        """Bias key toward current date/numerology alignment."""
-        try:
-            from engines.scoring import numerology_score
-            from engines.numerology import numerology_reduce
-        except ImportError:
-            return self._generate_random_key()
-
-        # Compute date-based seed bias
-        now = time.localtime()
-        date_num = now.tm_year + now.tm_mon + now.tm_mday
-        date_reduced = numerology_reduce(date_num)
+            return key_scoring.random_keys(count)
 
-        candidates = []
-        for _ in range(10):
-            k = secrets.randbits(256)
-            if 1 <= k < N:
-                candidates.append(k)
+        ref_limbs = key_scoring.limbs_from_ints(refs)
+        picks = ref_limbs[np.random.default_rng().integers(len(refs), size=count)]
+        masks = key_scoring.random_limbs(count)
+        masks[:, :2] = 0  # flip up to 128 low bits
+        keys = picks ^ masks
+        return key_scoring.replace_invalid(keys, key_scoring.valid_mask(keys))
 
-        if not candidates:
-            return self._generate_random_key()
-
-        # Prefer keys whose digit sum reduces to match the date number
-        def alignment_score(k):
-            digit_sum = sum(int(d) for d in str(k))
-            reduced = numerology_reduce(digit_sum)
-            base_score = numerology_score(k)[0]
-            alignment = 1.0 if reduced == date_reduced else 0.0
-            return base_score * 0.7 + alignment * 0.3
-
-        best = max(candidates, key=alignment_score)
-        return best
+    def _time_aligned_keys(self, count):
+        """Per key: 10 candidates, prefer digit sums reducing to today's date number."""
+        now = time.localtime()
+        target = key_scoring.date_number(now.tm_year, now.tm_mon, now.tm_mday)
+        candidates = key_scoring.random_limbs(count * CANDIDATES_PER_PICK)
+        scores = key_scoring.alignment_scores(candidates, target)
+        return key_scoring.select_best(candidates, scores, CANDIDATES_PER_PICK)
 
     # ─── Learning helpers ───
 
     def _key_entropy(self, key: int) -> float:
         """Compute a simple entropy measure for a key (digit distribution)."""
-        hex_str = format(key, "064x")
-        counts = {}
-        for c in hex_str:
-            counts[c] = counts.get(c, 0) + 1
-        total = len(hex_str)
-        import math
-
-        entropy = -sum((cnt / total) * math.log2(cnt / total) for cnt in counts.values())
-        return entropy
+        return key_scoring.key_entropy(key)
 
     def _learned_entropy_range(self) -> tuple:
         """Return (min, max) entropy from past high-scoring findings, or defaults."""
@@ -370,13 +362,10 @@ class ScannerBrain:
                 pass
 
         self._session_findings.append(finding)
-        self._pattern_discoveries.append(finding)
-
-        # Keep pattern discoveries bounded
-        if len(self._pattern_discoveries) > 1000:
-            self._pattern_discoveries = self._pattern_discoveries[-500:]
-
-        self._dirty = True
+        with self._save_lock:
+            self._apply_event("f", finding)
+            self._log_event("f", finding)
+        self._maybe_compact()
 
     def mid_session_check(self, stats) -> dict | None:
         """Every 50K keys: optionally ask AI for adjustments."""
@@ -399,15 +388,16 @@ class ScannerBrain:
         try:
             result = brain_mid_session_analysis(session_stats)
             if result and result.get("recommendation"):
-                self._ai_insights.append(
-                    {
-                        "timestamp": time.time(),
-                        "type": "mid_session",
-                        "recommendation": result.get("recommendation", ""),
-                        "confidence": result.get("confidence", 0),
-                    }
-                )
-                self._dirty = True
+                insight = {
+                    "timestamp": time.time(),
+                    "type": "mid_session",
+                    "recommendation": result.get("recommendation", ""),
+                    "confidence": result.get("confidence", 0),
+                }
+                with self._save_lock:
+                    self._apply_event("i", insight)
+                    self._log_event("i", insight)
+                self._maybe_compact()
                 return result
         except Exception as e:
             logger.debug(f"Brain mid-session check failed: {e}")
@@ -419,8 +409,9 @@ class ScannerBrain:
     def _update_strategy_log(self, stats):
         """Update strategy performance metrics after a session."""
         name = self._current_strategy
-        if name not in self._strategy_log:
-            self._strategy_log[name] = {
+        log = dict(
+            self._strategy_log.get(name)
+            or {
                 "runs": 0,
                 "total_keys": 0,
                 "high_scores": 0,
@@ -428,15 +419,19 @@ class ScannerBrain:
                 "hits": 0,
                 "last_used": 0,
             }
-
-        log = self._strategy_log[name]
+        )
         log["runs"] += 1
         log["total_keys"] += stats.get("keys_tested", 0)
         log["hits"] += stats.get("hits", 0)
         log["patterns"] += len(self._session_findings)
         log["high_scores"] += sum(1 for f in self._session_findings if f.get("score", 0) >= 0.7)
         log["last_used"] = time.time()
-        self._dirty = True
+
+        # The event carries the whole entry, so replaying it is idempotent
+        with self._save_lock:
+            self._apply_event("s", [name, log])
+            self._log_event("s", [name, log])
+        self._maybe_compact()
 
     # ─── AI helpers ───
 
@@ -486,52 +481,97 @@ class ScannerBrain:
 
     # ─── Persistence ───
 
+    def _apply_event(self, kind, data):
+        """Apply one knowledge event (live or replayed from the log)."""
+        if kind == "f":
+            self._pattern_discoveries.append(data)
+            if len(self._pattern_discoveries) > MAX_PATTERN_DISCOVERIES:
+                self._pattern_discoveries = self._pattern_discoveries[-KEEP_PATTERN_DISCOVERIES:]
+        elif kind == "i":
+            self._ai_insights.append(data)
+            if len(self._ai_insights) > 2 * KEEP_AI_INSIGHTS:
+                self._ai_insights = self._ai_insights[-KEEP_AI_INSIGHTS:]
+        elif kind == "s":
+            name, entry = data
+            self._strategy_log[name] = entry
+
+    def _log_event(self, kind, data):
+        """Append an applied event to the knowledge log. Caller holds ``_save_lock``."""
+        self._dirty = True
+        if self._knowledge_log is None:
+            return
+        try:
+            self._knowledge_log.append(kind, data)
+        except OSError as e:
+            logger.error(f"Failed to log knowledge event: {e}")
+
+    def _maybe_compact(self):
+        if self._knowledge_log is not None and self._knowledge_log.pending >= COMPACT_EVERY:
+            self._save_knowledge()
+
     def _load_knowledge(self):
-        """Load knowledge base from disk."""
+        """Load the knowledge snapshot and replay the log after it."""
         self._knowledge_dir.mkdir(parents=True, exist_ok=True)
         (self._knowledge_dir / "sessions").mkdir(exist_ok=True)
+        self._knowledge_log = KnowledgeLog(self._knowledge_dir)
 
-        # Strategy log
-        strat_path = self._knowledge_dir / "strategy_log.json"
-        if strat_path.exists():
-            try:
-                self._strategy_log = json.loads(strat_path.read_text())
-            except (json.JSONDecodeError, OSError) as e:
-                logger.debug(f"Failed to load strategy log: {e}")
+        if not self._knowledge_log.exists():
+            self._migrate_legacy_knowledge()
+            return
 
-        # Pattern discoveries
-        pattern_path = self._knowledge_dir / "pattern_discoveries.json"
-        if pattern_path.exists():
+        try:
+            state, events = self._knowledge_log.load()
+        except OSError as e:
+            logger.error(f"Failed to load knowledge log: {e}")
+            return
+        if state:
+            self._strategy_log = state.get("strategy_log", {})
+            self._pattern_discoveries = state.get("pattern_discoveries", [])
+            self._ai_insights = state.get("ai_insights", [])
+        for kind, data in events:
+            self._apply_event(kind, data)
+        self._dirty = bool(events)
+
+        if self._knowledge_log.pending >= COMPACT_EVERY:
+            self._save_knowledge()
+
+    def _migrate_legacy_knowledge(self):
+        """Read the pre-log JSON files into a first snapshot, then remove them."""
+        loaded = False
+        for name, attr in zip(
+            LEGACY_FILES, ("_strategy_log", "_pattern_discoveries", "_ai_insights")
+        ):
+            path = self._knowledge_dir / name
+            if not path.exists():
+                continue
             try:
-                self._pattern_discoveries = json.loads(pattern_path.read_text())
+                setattr(self, attr, json.loads(path.read_text()))
+                loaded = True
             except (json.JSONDecodeError, OSError) as e:
-                logger.debug(f"Failed to load pattern discoveries: {e}")
+                logger.debug(f"Failed to load {name}: {e}")
 
-        # AI insights
-        insights_path = self._knowledge_dir / "ai_insights.json"
-        if insights_path.exists():
-            try:
-                self._ai_insights = json.loads(insights_path.read_text())
-            except (json.JSONDecodeError, OSError) as e:
-                logger.debug(f"Failed to load AI insights: {e}")
+        if loaded:
+            self._save_knowledge()
+            if self._knowledge_log.snapshot_path.exists():
+                for name in LEGACY_FILES:
+                    (self._knowledge_dir / name).unlink(missing_ok=True)
+                logger.info("Migrated scanner knowledge to the knowledge log")
 
     def _save_knowledge(self):
-        """Save knowledge base to disk (atomic: write tmp then rename)."""
+        """Snapshot the knowledge base and reset the event log."""
         with self._save_lock:
             try:
                 self._knowledge_dir.mkdir(parents=True, exist_ok=True)
-
-                self._atomic_write(
-                    self._knowledge_dir / "strategy_log.json",
-                    json.dumps(self._strategy_log, indent=2),
-                )
-                self._atomic_write(
-                    self._knowledge_dir / "pattern_discoveries.json",
-                    json.dumps(self._pattern_discoveries[-500:], indent=2, default=str),
-                )
-                self._atomic_write(
-                    self._knowledge_dir / "ai_insights.json",
-                    json.dumps(self._ai_insights[-200:], indent=2, default=str),
+                if self._knowledge_log is None:
+                    self._knowledge_log = KnowledgeLog(self._knowledge_dir)
+                self._knowledge_log.compact(
+                    {
+                        "strategy_log": self._strategy_log,
+                        "pattern_discoveries": self._pattern_discoveries[
+                            -KEEP_PATTERN_DISCOVERIES:
+                        ],
+                        "ai_insights": self._ai_insights[-KEEP_AI_INSIGHTS:],
+                    }
                 )
                 self._dirty = False
             except Exception as e:
@@ -545,7 +585,7 @@ class ScannerBrain:
         try:
             self._atomic_write(
                 sessions_dir / filename,
-                json.dumps(session_data, indent=2, default=str),
+                json.dumps(session_data, separators=(",", ":"), default=str),
             )
         except Exception as e:
             logger.error(f"Failed to save session: {e}")
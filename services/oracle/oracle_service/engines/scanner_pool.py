@@ -0,0 +1,347 @@
+"""
+Scanner Pool — multiprocess key generation around one ScannerBrain.
+
+The brain stays in the coordinating process and is the only writer of
+learned state. Worker processes generate and score keys in parallel:
+
+- read-mostly state (reference keys for pattern_replay, the learned entropy
+  range) is published in a SharedMemory block under a sequence lock; workers
+  re-read it only when the sequence number changes
+- each worker batch sends one message back over a queue: keys tested, high
+  scores and the best-scoring keys as findings
+- ``poll()`` feeds those findings to ``ScannerBrain.record_finding`` and
+  republishes the shared state, and ``stop()`` returns session stats for
+  ``ScannerBrain.end_session`` (which applies ``_update_strategy_log``)
+
+Typical use::
+
+    brain.start_session(mode, chains, tokens)
+    with ScannerPool(brain, workers=8) as pool:
+        stats = pool.run(60)
+    brain.end_session(stats)
+"""
+
+import logging
+import multiprocessing as mp
+import os
+import queue
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from engines import key_scoring
+from engines.scanner_brain import ScannerBrain
+
+logger = logging.getLogger(__name__)
+
+POOL_BATCH_SIZE = 4096
+FINDING_SCORE = 0.7  # record_finding threshold for "interesting" keys
+MAX_FINDINGS_PER_BATCH = 8  # best keys sent per batch; the rest are only counted
+MAX_REFERENCE_KEYS = 20  # ScannerBrain._get_high_scoring_reference_keys cap
+READY_TIMEOUT = 60.0  # seconds for every worker to start (spawn imports numpy)
+
+# SharedMemory layout: uint64 [seq, n_refs], float64 [lo, hi], uint64 refs[20, 4]
+_HEADER = 16
+_REFS = _HEADER + 16
+_STATE_BYTES = _REFS + MAX_REFERENCE_KEYS * key_scoring.LIMBS * 8
+
+
+class SharedBrainState:
+    """Seqlock-guarded shared copy of the brain state workers read.
+
+    The coordinator creates the block and is the single writer; workers
+    attach by name. ``seq`` is odd while a write is in progress.
+    """
+
+    def __init__(self, name=None):
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=_STATE_BYTES)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        buf = self._shm.buf
+        self._header = np.ndarray((2,), dtype=np.uint64, buffer=buf, offset=0)
+        self._entropy = np.ndarray((2,), dtype=np.float64, buffer=buf, offset=_HEADER)
+        self._refs = np.ndarray(
+            (MAX_REFERENCE_KEYS, key_scoring.LIMBS), dtype=np.uint64, buffer=buf, offset=_REFS
+        )
+        if self._owner:
+            self._header[:] = 0
+            self._entropy[:] = (3.0, 4.0)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def seq(self) -> int:
+        return int(self._header[0])
+
+    def publish(self, reference_keys, entropy_range) -> None:
+        """Write new state (coordinator only)."""
+        refs = list(reference_keys)[:MAX_REFERENCE_KEYS]
+        self._header[0] += 1
+        self._header[1] = len(refs)
+        if refs:
+            self._refs[: len(refs)] = key_scoring.limbs_from_ints(refs)
+        self._entropy[:] = entropy_range
+        self._header[0] += 1
+
+    def read(self) -> tuple:
+        """Consistent (seq, reference limbs, entropy range) snapshot."""
+        while True:
+            seq = int(self._header[0])
+            if seq % 2:
+                time.sleep(0)
+                continue
+            n = int(self._header[1])
+            refs = self._refs[:n].copy()
+            entropy = (float(self._entropy[0]), float(self._entropy[1]))
+            if int(self._header[0]) == seq:
+                return seq, refs, entropy
+
+    def close(self) -> None:
+        self._header = self._entropy = self._refs = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+class _WorkerBrain(ScannerBrain):
+    """ScannerBrain key generation backed by SharedBrainState, no knowledge files."""
+
+    def __init__(self, state, strategy):
+        self._state = state
+        self._seq = -1
+        self._references = []
+        self._entropy_range = (3.0, 4.0)
+        self._current_strategy = strategy
+        self._strategy_log = {}
+        self._pattern_discoveries = []
+        self._key_buffer = []
+        self._key_buffer_strategy = None
+
+    def refresh(self) -> None:
+        if self._state.seq == self._seq:
+            return
+        self._seq, refs, self._entropy_range = self._state.read()
+        self._references = key_scoring.ints_from_limbs(refs)
+
+    def _learned_entropy_range(self) -> tuple:
+        return self._entropy_range
+
+    def _get_high_scoring_reference_keys(self) -> list:
+        return self._references
+
+
+def _worker_main(worker_id, state_name, strategy, batch_size, finding_score, results, go, stop):
+    """Worker process loop: report ready, wait for ``go``, then generate, score
+    and report batches until ``stop`` is set."""
+    state = SharedBrainState(state_name)
+    try:
+        brain = _WorkerBrain(state, strategy)
+        brain.refresh()
+        key_scoring.numerology_scores(brain.generate_key_limbs(16))  # build lookup tables
+        results.put((worker_id, 0, 0, []))  # ready
+        go.wait()
+        while not stop.is_set():
+            brain.refresh()
+            limbs = brain.generate_key_limbs(batch_size)
+            scores = key_scoring.numerology_scores(limbs)
+            high = np.flatnonzero(scores >= finding_score)
+            best = high[np.argsort(-scores[high], kind="stable")[:MAX_FINDINGS_PER_BATCH]]
+            findings = [
+                {"key_hex": f"{key:064x}", "score": round(float(scores[i]), 4)}
+                for i, key in zip(best, key_scoring.ints_from_limbs(limbs[best]))
+            ]
+            results.put((worker_id, len(limbs), len(high), findings))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        state.close()
+
+
+class ScannerPool:
+    """Coordinator for N key-generation worker processes."""
+
+    def __init__(
+        self,
+        brain,
+        workers=None,
+        batch_size=POOL_BATCH_SIZE,
+        finding_score=FINDING_SCORE,
+        start_method=None,
+    ):
+        self._brain = brain
+        self._workers = workers or os.cpu_count() or 1
+        self._batch_size = batch_size
+        self._finding_score = finding_score
+        self._ctx = mp.get_context(start_method)
+        self._processes = []
+        self._state = None
+        self._results = None
+        self._go = None
+        self._stop = None
+        self._strategy = None
+        self._started_at = 0.0
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._keys_tested = 0
+        self._high_scores = 0
+        self._findings = 0
+        self._per_worker = [0] * self._workers
+
+    @property
+    def running(self) -> bool:
+        return bool(self._processes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.running:
+            self.stop()
+
+    # ─── Lifecycle ───
+
+    def start(self, strategy=None) -> None:
+        """Spawn the workers with ``strategy`` (default: the brain's current one).
+
+        An explicit ``strategy`` also becomes the brain's current strategy, so
+        findings and the ``end_session`` strategy log credit the one that ran.
+        """
+        if self.running:
+            raise RuntimeError("ScannerPool already running")
+        self._strategy = strategy or self._brain._current_strategy
+        self._brain._current_strategy = self._strategy
+        self._reset_stats()
+        self._state = SharedBrainState()
+        self._publish()
+        self._results = self._ctx.Queue()
+        self._go = self._ctx.Event()
+        self._stop = self._ctx.Event()
+        for worker_id in range(self._workers):
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(
+                    worker_id,
+                    self._state.name,
+                    self._strategy,
+                    self._batch_size,
+                    self._finding_score,
+                    self._results,
+                    self._go,
+                    self._stop,
+                ),
+                name=f"scanner-worker-{worker_id}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+        self._wait_ready()
+        self._started_at = time.perf_counter()
+        self._go.set()
+        logger.info(f"Scanner pool started: {self._workers} workers strategy={self._strategy}")
+
+    def _wait_ready(self) -> None:
+        """Block until every worker reported ready, so throughput excludes startup."""
+        ready = set()
+        deadline = time.monotonic() + READY_TIMEOUT
+        while len(ready) < self._workers:
+            if time.monotonic() > deadline or not all(p.is_alive() for p in self._processes):
+                self._stop.set()
+                self._go.set()
+                for process in self._processes:
+                    process.join(timeout=5)
+                    if process.is_alive():
+                        process.terminate()
+                self._processes = []
+                self._state.close()
+                self._state = None
+                raise RuntimeError("Scanner pool workers failed to start")
+            try:
+                ready.add(self._results.get(timeout=0.1)[0])
+            except queue.Empty:
+                pass
+
+    def poll(self, timeout=0.1) -> int:
+        """Drain worker results; returns the number of batches processed.
+
+        Findings go through ``ScannerBrain.record_finding`` here, in the
+        coordinator, and the shared state is republished if any arrived.
+        """
+        batches = 0
+        recorded = False
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                wait = max(0.0, deadline - time.monotonic()) if batches == 0 else 0
+                message = self._results.get(timeout=wait) if wait else self._results.get_nowait()
+            except queue.Empty:
+                break
+            worker_id, tested, high, findings = message
+            batches += 1
+            self._keys_tested += tested
+            self._high_scores += high
+            self._per_worker[worker_id] += tested
+            for finding in findings:
+                self._brain.record_finding(finding)
+                self._findings += 1
+                recorded = True
+        if recorded:
+            self._publish()
+        return batches
+
+    def stop(self) -> dict:
+        """Stop the workers, drain their last batches and return session stats."""
+        if not self.running:
+            raise RuntimeError("ScannerPool not running")
+        self._stop.set()
+        while any(p.is_alive() for p in self._processes):
+            self.poll(timeout=0.05)
+        for process in self._processes:
+            process.join()
+        while self.poll(timeout=0):
+            pass
+        elapsed = time.perf_counter() - self._started_at
+
+        self._processes = []
+        self._results.close()
+        self._results.join_thread()
+        self._state.close()
+        self._state = None
+        return self.stats(elapsed)
+
+    def run(self, duration, strategy=None) -> dict:
+        """Start, poll for ``duration`` seconds, stop; returns session stats."""
+        self.start(strategy)
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            self.poll(timeout=min(0.1, max(0.0, deadline - time.monotonic())))
+        return self.stop()
+
+    # ─── Stats ───
+
+    def stats(self, elapsed=None) -> dict:
+        """Session stats in ``ScannerBrain.end_session`` form, plus pool detail."""
+        if elapsed is None:
+            elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {
+            "keys_tested": self._keys_tested,
+            "hits": 0,
+            "high_scores": self._high_scores,
+            "findings": self._findings,
+            "strategy": self._strategy,
+            "workers": self._workers,
+            "keys_per_worker": list(self._per_worker),
+            "elapsed": elapsed,
+            "keys_per_sec": self._keys_tested / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def _publish(self) -> None:
+        self._state.publish(
+            self._brain._get_high_scoring_reference_keys(),
+            self._brain._learned_entropy_range(),
+        )
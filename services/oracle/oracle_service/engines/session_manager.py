@@ -3,11 +3,22 @@ Session Manager for NPS.
 
 Tracks scan sessions with start/end times, stats, and provides
 aggregate session statistics.
+
+Each session is a JSON file in SESSIONS_DIR. A SQLite catalog beside them
+(``catalog.db``) holds one row per session plus running totals. The
+catalog is updated in the same locked step as the file write, so
+``list_sessions`` is an indexed query and ``get_session_stats`` reads a
+single row instead of opening every file. A missing catalog is rebuilt
+from the files on first use. To rebuild an existing one::
+
+    cd services/oracle && python -m oracle_service.engines.session_manager rebuild
 """
 
+import argparse
 import json
 import logging
 import os
+import sqlite3
 import threading
 import time
 from pathlib import Path
@@ -17,6 +28,155 @@ logger = logging.getLogger(__name__)
 _lock = threading.Lock()
 
 SESSIONS_DIR = Path(__file__).parent.parent / "data" / "sessions"
+CATALOG_NAME = "catalog.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id  TEXT PRIMARY KEY,
+    terminal_id TEXT NOT NULL,
+    started     REAL NOT NULL,
+    ended       REAL,
+    duration    REAL NOT NULL,
+    stats       TEXT NOT NULL,
+    keys        INTEGER NOT NULL,
+    seeds       INTEGER NOT NULL,
+    hits        INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS totals (
+    id       INTEGER PRIMARY KEY CHECK (id = 1),
+    sessions INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    keys     INTEGER NOT NULL,
+    seeds    INTEGER NOT NULL,
+    hits     INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (1, 0, 0, 0, 0, 0);
+"""
+
+_catalog = None  # (sessions dir, sqlite3 connection)
+
+
+# ─── Catalog ───
+
+
+def _session_files(directory):
+    """Yield (file stem, session dict) for every readable session file."""
+    for path in sorted(directory.glob("*.json")):
+        try:
+            with open(path) as f:
+                yield path.stem, json.load(f)
+        except (json.JSONDecodeError, IOError):
+            continue
+
+
+def _catalog_upsert(conn, session, stem):
+    """Insert or replace one session row and adjust the totals. Caller commits."""
+    stats = session.get("stats") or {}
+    row = (
+        session.get("session_id", stem),
+        session.get("terminal_id", ""),
+        session.get("started", 0),
+        session.get("ended"),
+        session.get("duration", 0),
+        json.dumps(stats),
+        stats.get("keys_tested", 0),
+        stats.get("seeds_tested", 0),
+        stats.get("hits", 0),
+    )
+    old = conn.execute(
+        "SELECT duration, keys, seeds, hits FROM sessions WHERE session_id = ?", (row[0],)
+    ).fetchone()
+    conn.execute("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+    added = 1 if old is None else 0
+    old = old or (0, 0, 0, 0)
+    conn.execute(
+        "UPDATE totals SET sessions = sessions + ?, duration = duration + ?,"
+        " keys = keys + ?, seeds = seeds + ?, hits = hits + ? WHERE id = 1",
+        (added, row[4] - old[0], row[6] - old[1], row[7] - old[2], row[8] - old[3]),
+    )
+
+
+def _rebuild(conn, directory):
+    """Replace the catalog contents with the session files in ``directory``."""
+    with conn:
+        conn.execute("DELETE FROM sessions")
+        conn.execute("UPDATE totals SET sessions = 0, duration = 0, keys = 0, seeds = 0, hits = 0")
+        count = 0
+        for stem, session in _session_files(directory):
+            _catalog_upsert(conn, session, stem)
+            count += 1
+    return count
+
+
+def _get_catalog():
+    """Catalog connection for SESSIONS_DIR (built from the files if new).
+
+    Returns None if the catalog cannot be opened; callers then fall back to
+    reading the session files. Caller holds ``_lock``.
+    """
+    global _catalog
+    if _catalog is not None and _catalog[0] == SESSIONS_DIR:
+        return _catalog[1]
+    if _catalog is not None:
+        _catalog[1].close()
+        _catalog = None
+    if not SESSIONS_DIR.exists():
+        return None
+
+    path = SESSIONS_DIR / CATALOG_NAME
+    try:
+        new = not path.exists()
+        conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+        if new:
+            count = _rebuild(conn, SESSIONS_DIR)
+            logger.info(f"Session catalog built: {count} sessions")
+    except sqlite3.Error as e:
+        logger.warning(f"Session catalog unavailable: {e}")
+        return None
+    _catalog = (SESSIONS_DIR, conn)
+    return conn
+
+
+def _record(session, path):
+    """Write a session file and its catalog row. Caller holds ``_lock``."""
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(session, f, indent=2)
+    os.replace(str(tmp_path), str(path))
+
+    conn = _get_catalog()
+    if conn is None:
+        return
+    try:
+        with conn:
+            _catalog_upsert(conn, session, path.stem)
+    except sqlite3.Error as e:
+        logger.warning(f"Session catalog update failed for {path.stem}: {e}")
+
+
+def rebuild_catalog():
+    """Rebuild the catalog from the session files. Returns the session count."""
+    with _lock:
+        SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+        conn = _get_catalog()
+        if conn is None:
+            raise RuntimeError(f"Cannot open session catalog in {SESSIONS_DIR}")
+        return _rebuild(conn, SESSIONS_DIR)
+
+
+def close_catalog():
+    """Close the catalog connection (reopened on next use)."""
+    global _catalog
+    with _lock:
+        if _catalog is not None:
+            _catalog[1].close()
+            _catalog = None
+
+
+# ─── Sessions ───
 
 
 def start_session(terminal_id, settings=None):
@@ -36,10 +196,7 @@ def start_session(terminal_id, settings=None):
 
     path = SESSIONS_DIR / f"{session_id}.json"
     with _lock:
-        tmp_path = path.with_suffix(".tmp")
-        with open(tmp_path, "w") as f:
-            json.dump(session, f, indent=2)
-        os.replace(str(tmp_path), str(path))
+        _record(session, path)
 
     logger.info(f"Session started: {session_id}")
     return session_id
@@ -60,10 +217,7 @@ def end_session(session_id, stats=None):
         session["duration"] = session["ended"] - session["started"]
         session["stats"] = stats or {}
 
-        tmp_path = path.with_suffix(".tmp")
-        with open(tmp_path, "w") as f:
-            json.dump(session, f, indent=2)
-        os.replace(str(tmp_path), str(path))
+        _record(session, path)
 
     logger.info(f"Session ended: {session_id} ({session['duration']:.1f}s)")
 
@@ -80,68 +234,87 @@ def get_session(session_id):
         return None
 
 
+def _summary(session, stem):
+    return {
+        "session_id": session.get("session_id", stem),
+        "terminal_id": session.get("terminal_id", ""),
+        "started": session.get("started", 0),
+        "ended": session.get("ended"),
+        "duration": session.get("duration", 0),
+        "stats": session.get("stats", {}),
+    }
+
+
 def list_sessions(limit=50):
     """List recent sessions, newest first."""
     if not SESSIONS_DIR.exists():
         return []
 
-    sessions = []
-    for path in sorted(SESSIONS_DIR.glob("*.json"), reverse=True):
-        if len(sessions) >= limit:
-            break
-        try:
-            with open(path) as f:
-                session = json.load(f)
-            sessions.append(
+    with _lock:
+        conn = _get_catalog()
+        if conn is not None:
+            rows = conn.execute(
+                "SELECT session_id, terminal_id, started, ended, duration, stats"
+                " FROM sessions ORDER BY session_id DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+            return [
                 {
-                    "session_id": session.get("session_id", path.stem),
-                    "terminal_id": session.get("terminal_id", ""),
-                    "started": session.get("started", 0),
-                    "ended": session.get("ended"),
-                    "duration": session.get("duration", 0),
-                    "stats": session.get("stats", {}),
+                    "session_id": row[0],
+                    "terminal_id": row[1],
+                    "started": row[2],
+                    "ended": row[3],
+                    "duration": row[4],
+                    "stats": json.loads(row[5]),
                 }
-            )
-        except (json.JSONDecodeError, IOError):
-            continue
+                for row in rows
+            ]
 
-    return sessions
+    sessions = [_summary(s, stem) for stem, s in _session_files(SESSIONS_DIR)]
+    return sessions[::-1][:limit]
 
 
 def get_session_stats():
     """Aggregate stats across all sessions."""
-    if not SESSIONS_DIR.exists():
-        return {
-            "total_sessions": 0,
-            "total_duration": 0,
-            "total_keys": 0,
-            "total_seeds": 0,
-            "total_hits": 0,
-        }
-
-    total_sessions = 0
-    total_duration = 0
-    total_keys = 0
-    total_seeds = 0
-    total_hits = 0
-
-    for path in SESSIONS_DIR.glob("*.json"):
-        try:
-            with open(path) as f:
-                session = json.load(f)
-            total_sessions += 1
-            total_duration += session.get("duration", 0)
-            stats = session.get("stats", {})
-            total_keys += stats.get("keys_tested", 0)
-            total_seeds += stats.get("seeds_tested", 0)
-            total_hits += stats.get("hits", 0)
-        except (json.JSONDecodeError, IOError):
-            continue
+    totals = (0, 0, 0, 0, 0)
+    if SESSIONS_DIR.exists():
+        with _lock:
+            conn = _get_catalog()
+            if conn is not None:
+                totals = conn.execute(
+                    "SELECT sessions, duration, keys, seeds, hits FROM totals WHERE id = 1"
+                ).fetchone()
+            else:
+                totals = [0, 0, 0, 0, 0]
+                for _, session in _session_files(SESSIONS_DIR):
+                    stats = session.get("stats", {})
+                    totals[0] += 1
+                    totals[1] += session.get("duration", 0)
+                    totals[2] += stats.get("keys_tested", 0)
+                    totals[3] += stats.get("seeds_tested", 0)
+                    totals[4] += stats.get("hits", 0)
 
     return {
-        "total_sessions": total_sessions,
-        "total_duration": total_duration,
-        "total_keys": total_keys,
-        "total_seeds": total_seeds,
-        "total_hits": total_hits,
+        "total_sessions": totals[0],
+        "total_duration": totals[1],
+        "total_keys": totals[2],
+        "total_seeds": totals[3],
+        "total_hits": totals[4],
     }
+
+
+def main(argv=None):
+    global SESSIONS_DIR
+    parser = argparse.ArgumentParser(description="Scanner session catalog")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--dir", type=Path, help=f"Sessions directory (default {SESSIONS_DIR})")
+    args = parser.parse_args(argv)
+    if args.dir is not None:
+        SESSIONS_DIR = args.dir
+    count = rebuild_catalog()
+    print(f"Rebuilt session catalog in {SESSIONS_DIR}: {count} sessions")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,21 +3,52 @@ Timing Advisor -- When to Scan
 ===============================
 Combines moon phase, FC60 current moment, and day/hour numerology
 to advise on optimal scanning times. Pure computation, no I/O.
+
+Day-level components (JDN, moon phase, weekday, day number) are cached per
+date in ``day_components``; hour scores are a fixed 24-entry table. A timing
+score is the mean of moon, day, hour and weekday scores, so ``plan_timing``
+scores any date range as one (days x 24) broadcast and ranks windows from a
+cumulative sum.
 """
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+POWER_NUMBERS = {1, 8, 9, 11, 22, 33}
+# Full Moon and New Moon are peak
+MOON_SCORES = {0: 0.9, 1: 0.5, 2: 0.6, 3: 0.7, 4: 1.0, 5: 0.7, 6: 0.6, 7: 0.4}
+# Jupiter (Thursday=4) and Venus (Friday=5) are traditionally favorable
+WEEKDAY_SCORES = {0: 0.7, 1: 0.5, 2: 0.6, 3: 0.6, 4: 0.9, 5: 0.8, 6: 0.5}
 
-def get_current_quality():
-    """Assess the current moment's quality for scanning.
+MAX_PLAN_DAYS = 366
+MAX_WINDOW_HOURS = 24
 
-    Returns:
-        dict with keys: quality, score (0-1), moon_phase, reasoning.
-        quality is one of 'excellent', 'good', 'fair', 'poor'.
-    """
+
+class DayComponents(NamedTuple):
+    """Hour-independent timing components of one (UTC) calendar day."""
+
+    jdn: int
+    phase_idx: int
+    phase_name: str
+    illumination: float
+    weekday_idx: int
+    planet: str
+    day_number: int
+    day_master: bool
+    moon_score: float
+    day_score: float
+    weekday_score: float
+
+
+@lru_cache(maxsize=4096)
+def day_components(year, month, day):
+    """Moon, day-number and weekday components of a day (cached per date)."""
     from oracle_service.framework_bridge import (
         compute_jdn,
         moon_phase,
@@ -28,78 +59,101 @@ def get_current_quality():
     )
     from oracle_service.framework_bridge import numerology_reduce, is_master_number
 
-    now = datetime.now(timezone.utc)
-    year, month, day = now.year, now.month, now.day
-    hour = now.hour
-
     jdn = compute_jdn(year, month, day)
     phase_idx, moon_age = moon_phase(jdn)
-    illum = moon_illumination(moon_age)
-    phase_name = MOON_PHASE_NAMES[phase_idx]
     wd_idx = weekday_from_jdn(jdn)
 
-    # Score components (each 0-1)
-    scores = []
-    reasoning = []
-
-    # 1. Moon phase score: Full Moon and New Moon are peak
-    moon_scores = {0: 0.9, 1: 0.5, 2: 0.6, 3: 0.7, 4: 1.0, 5: 0.7, 6: 0.6, 7: 0.4}
-    moon_s = moon_scores.get(phase_idx, 0.5)
-    scores.append(moon_s)
-    reasoning.append("Moon: {} ({:.0f}% illum, score {:.1f})".format(phase_name, illum, moon_s))
-
-    # 2. Day numerology
     day_sum = year + month + day
     day_reduced = numerology_reduce(day_sum)
     day_master = is_master_number(day_sum)
-    power_numbers = {1, 8, 9, 11, 22, 33}
-    if day_master or day_reduced in power_numbers:
+    if day_master or day_reduced in POWER_NUMBERS:
         day_s = 0.9
     elif day_reduced in {3, 5, 7}:
         day_s = 0.7
     else:
         day_s = 0.5
-    scores.append(day_s)
-    reasoning.append(
-        "Day number: {} (master={}, score {:.1f})".format(day_reduced, day_master, day_s)
+
+    return DayComponents(
+        jdn=jdn,
+        phase_idx=phase_idx,
+        phase_name=MOON_PHASE_NAMES[phase_idx],
+        illumination=moon_illumination(moon_age),
+        weekday_idx=wd_idx,
+        planet=WEEKDAY_PLANETS[wd_idx],
+        day_number=day_reduced,
+        day_master=day_master,
+        moon_score=MOON_SCORES.get(phase_idx, 0.5),
+        day_score=day_s,
+        weekday_score=WEEKDAY_SCORES.get(wd_idx, 0.5),
     )
 
-    # 3. Hour numerology
+
+@lru_cache(maxsize=24)
+def hour_components(hour):
+    """(reduced hour, master, hour score) for an hour of the day."""
+    from oracle_service.framework_bridge import numerology_reduce, is_master_number
+
     hour_reduced = numerology_reduce(hour) if hour > 0 else 1
     hour_master = is_master_number(hour)
-    if hour_master or hour_reduced in power_numbers:
+    if hour_master or hour_reduced in POWER_NUMBERS:
         hour_s = 0.85
     elif hour_reduced in {3, 5, 7}:
         hour_s = 0.65
     else:
         hour_s = 0.45
-    scores.append(hour_s)
-    reasoning.append("Hour {} (reduces to {}, score {:.1f})".format(hour, hour_reduced, hour_s))
+    return hour_reduced, hour_master, hour_s
+
+
+@lru_cache(maxsize=1)
+def _hour_scores():
+    scores = np.array([hour_components(h)[2] for h in range(24)], dtype=np.float64)
+    scores.setflags(write=False)
+    return scores
+
+
+def quality_label(score):
+    """Map a 0-1 timing score to 'excellent' / 'good' / 'fair' / 'poor'."""
+    if score >= 0.8:
+        return "excellent"
+    if score >= 0.65:
+        return "good"
+    if score >= 0.5:
+        return "fair"
+    return "poor"
+
+
+def get_current_quality():
+    """Assess the current moment's quality for scanning.
+
+    Returns:
+        dict with keys: quality, score (0-1), moon_phase, reasoning.
+        quality is one of 'excellent', 'good', 'fair', 'poor'.
+    """
+    now = datetime.now(timezone.utc)
+    comp = day_components(now.year, now.month, now.day)
+    hour = now.hour
+    hour_reduced, _, hour_s = hour_components(hour)
 
-    # 4. Weekday alignment
-    # Jupiter (Thursday=4) and Venus (Friday=5) are traditionally favorable
-    weekday_scores = {0: 0.7, 1: 0.5, 2: 0.6, 3: 0.6, 4: 0.9, 5: 0.8, 6: 0.5}
-    wd_s = weekday_scores.get(wd_idx, 0.5)
-    planet = WEEKDAY_PLANETS[wd_idx]
-    scores.append(wd_s)
-    reasoning.append("Weekday: {} (score {:.1f})".format(planet, wd_s))
+    # Score components (each 0-1)
+    scores = [comp.moon_score, comp.day_score, hour_s, comp.weekday_score]
+    reasoning = [
+        "Moon: {} ({:.0f}% illum, score {:.1f})".format(
+            comp.phase_name, comp.illumination, comp.moon_score
+        ),
+        "Day number: {} (master={}, score {:.1f})".format(
+            comp.day_number, comp.day_master, comp.day_score
+        ),
+        "Hour {} (reduces to {}, score {:.1f})".format(hour, hour_reduced, hour_s),
+        "Weekday: {} (score {:.1f})".format(comp.planet, comp.weekday_score),
+    ]
 
     # Aggregate
     total = sum(scores) / len(scores)
 
-    if total >= 0.8:
-        quality = "excellent"
-    elif total >= 0.65:
-        quality = "good"
-    elif total >= 0.5:
-        quality = "fair"
-    else:
-        quality = "poor"
-
     return {
-        "quality": quality,
+        "quality": quality_label(total),
         "score": round(total, 4),
-        "moon_phase": phase_name,
+        "moon_phase": comp.phase_name,
         "reasoning": "; ".join(reasoning),
     }
 
@@ -110,54 +164,113 @@ def get_optimal_hours_today():
     Returns:
         list of (hour, score) tuples sorted by score descending.
     """
-    from oracle_service.framework_bridge import (
-        compute_jdn,
-        moon_phase,
-        weekday_from_jdn,
-    )
-    from oracle_service.framework_bridge import numerology_reduce, is_master_number
+    today = datetime.now(timezone.utc).date()
+    row = hourly_scores(today, 1)[0]
+    results = [(hour, round(float(score), 4)) for hour, score in enumerate(row)]
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results
 
-    now = datetime.now(timezone.utc)
-    year, month, day = now.year, now.month, now.day
 
-    jdn = compute_jdn(year, month, day)
-    phase_idx, _ = moon_phase(jdn)
-    wd_idx = weekday_from_jdn(jdn)
+def hourly_scores(start, days):
+    """Score every UTC hour of ``days`` days from ``start`` in one pass.
 
-    # Base day score (constant across hours)
-    day_sum = year + month + day
-    day_reduced = numerology_reduce(day_sum)
-    power_numbers = {1, 8, 9, 11, 22, 33}
-    day_master = is_master_number(day_sum)
-    if day_master or day_reduced in power_numbers:
-        day_s = 0.9
-    elif day_reduced in {3, 5, 7}:
-        day_s = 0.7
-    else:
-        day_s = 0.5
+    Per-day components come from the ``day_components`` cache; the
+    (days x 24) grid is then a single broadcast of day columns against the
+    24 hour scores -- the same per-hour formula as ``get_current_quality``.
+
+    Returns:
+        float64 ndarray of shape (days, 24).
+    """
+    comps = [day_components(d.year, d.month, d.day) for d in _dates(start, days)]
+    moon_day = np.array([c.moon_score + c.day_score for c in comps], dtype=np.float64)
+    weekday = np.array([c.weekday_score for c in comps], dtype=np.float64)
+    return (moon_day[:, None] + _hour_scores()[None, :] + weekday[:, None]) / 4.0
 
-    moon_scores = {0: 0.9, 1: 0.5, 2: 0.6, 3: 0.7, 4: 1.0, 5: 0.7, 6: 0.6, 7: 0.4}
-    moon_s = moon_scores.get(phase_idx, 0.5)
 
-    weekday_scores = {0: 0.7, 1: 0.5, 2: 0.6, 3: 0.6, 4: 0.9, 5: 0.8, 6: 0.5}
-    wd_s = weekday_scores.get(wd_idx, 0.5)
+def plan_timing(start, days=90, window_hours=1, top_k=10):
+    """Multi-day timing plan: per-hour heatmap plus ranked windows.
 
-    results = []
-    for hour in range(24):
-        hour_reduced = numerology_reduce(hour) if hour > 0 else 1
-        hour_master = is_master_number(hour)
-        if hour_master or hour_reduced in power_numbers:
-            hour_s = 0.85
-        elif hour_reduced in {3, 5, 7}:
-            hour_s = 0.65
-        else:
-            hour_s = 0.45
+    Args:
+        start: first day (date) of the plan, UTC.
+        days: number of days (1 to MAX_PLAN_DAYS).
+        window_hours: length of each ranked window (1 to MAX_WINDOW_HOURS);
+            windows may cross midnight.
+        top_k: number of non-overlapping windows to return.
 
-        total = (moon_s + day_s + hour_s + wd_s) / 4.0
-        results.append((hour, round(total, 4)))
+    Returns:
+        dict with keys: start, days (per-day details), heatmap (days x 24
+        scores), windows (best first: start, end, score, quality).
 
-    results.sort(key=lambda x: x[1], reverse=True)
-    return results
+    Raises:
+        ValueError: If days or window_hours is out of range.
+    """
+    if not 1 <= days <= MAX_PLAN_DAYS:
+        raise ValueError("days must be between 1 and {}".format(MAX_PLAN_DAYS))
+    if not 1 <= window_hours <= MAX_WINDOW_HOURS:
+        raise ValueError("window_hours must be between 1 and {}".format(MAX_WINDOW_HOURS))
+
+    heatmap = hourly_scores(start, days)
+    best_hours = heatmap.argmax(axis=1)
+    day_details = []
+    for d, hour, row in zip(_dates(start, days), best_hours, heatmap):
+        comp = day_components(d.year, d.month, d.day)
+        day_details.append(
+            {
+                "date": d.isoformat(),
+                "moon_phase": comp.phase_name,
+                "weekday_planet": comp.planet,
+                "day_number": comp.day_number,
+                "best_hour": int(hour),
+                "best_score": round(float(row[hour]), 4),
+            }
+        )
+
+    origin = datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
+    windows = []
+    for offset, score in _ranked_windows(heatmap.ravel(), window_hours, top_k):
+        begin = origin + timedelta(hours=offset)
+        windows.append(
+            {
+                "start": begin.isoformat(),
+                "end": (begin + timedelta(hours=window_hours)).isoformat(),
+                "score": score,
+                "quality": quality_label(score),
+            }
+        )
+
+    return {
+        "start": start.isoformat(),
+        "days": day_details,
+        "heatmap": np.round(heatmap, 4).tolist(),
+        "windows": windows,
+    }
+
+
+def _dates(start, days):
+    return [start + timedelta(days=i) for i in range(days)]
+
+
+def _ranked_windows(hourly, width, top_k):
+    """Best non-overlapping ``width``-hour windows as (hour offset, mean score).
+
+    Window means come from one cumulative sum; ties go to the earlier window.
+    """
+    if top_k <= 0 or width > len(hourly):
+        return []
+    totals = np.concatenate(([0.0], np.cumsum(hourly)))
+    means = np.round((totals[width:] - totals[:-width]) / width, 4)
+    order = np.lexsort((np.arange(len(means)), -means))
+
+    taken = np.zeros(len(hourly), dtype=bool)
+    picked = []
+    for offset in order:
+        if taken[offset : offset + width].any():
+            continue
+        taken[offset : offset + width] = True
+        picked.append((int(offset), float(means[offset])))
+        if len(picked) == top_k:
+            break
+    return picked
 
 
 def get_cosmic_alignment(key_int):
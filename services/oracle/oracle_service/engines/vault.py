@@ -1,8 +1,10 @@
 """
 Findings Vault — Encrypted persistent storage for NPS.
 
-Append-only JSONL vault for wallet findings. Thread-safe writes, atomic
-file operations, per-session tracking, and CSV/JSON export.
+Append-only JSONL vault for wallet findings, stored as indexed segments
+(engines.vault_store) so recent findings and the summary are read without
+scanning the whole vault. Thread-safe writes, atomic file operations,
+per-session tracking, and streaming CSV/JSON export.
 
 Reuses engines.security for encrypt_dict / decrypt_dict.
 """
@@ -11,10 +13,13 @@ import csv
 import json
 import logging
 import os
+import textwrap
 import threading
 import time
 from pathlib import Path
 
+from engines.vault_store import SegmentStore
+
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).parent.parent / "data"
@@ -23,6 +28,8 @@ SESSIONS_DIR = FINDINGS_DIR / "sessions"
 SUMMARIES_DIR = FINDINGS_DIR / "summaries"
 
 _lock = threading.Lock()
+_store = None
+_store_lock = threading.Lock()
 _current_session = None
 _session_count = 0
 _total_findings = 0
@@ -32,12 +39,23 @@ SUMMARY_EVERY = 100
 
 
 def init_vault():
-    """Create vault directories if they don't exist."""
+    """Create vault directories if they don't exist and open the store."""
     for d in (FINDINGS_DIR, SESSIONS_DIR, SUMMARIES_DIR):
         d.mkdir(parents=True, exist_ok=True)
+    _get_store()
     logger.info("Vault initialized")
 
 
+def _get_store() -> SegmentStore:
+    """The segment store under FINDINGS_DIR (reopened if FINDINGS_DIR changes)."""
+    global _store
+    directory = FINDINGS_DIR / "segments"
+    with _store_lock:
+        if _store is None or _store.directory != directory:
+            _store = SegmentStore(directory, legacy_path=FINDINGS_DIR / "vault_live.jsonl")
+        return _store
+
+
 def start_session(session_name=None):
     """Start a new vault session. Returns session_id."""
     global _current_session, _session_count
@@ -85,12 +103,11 @@ def record_finding(finding: dict) -> bool:
     except ImportError:
         pass
 
+    store = _get_store()
     with _lock:
-        # Append to live vault (JSONL)
-        vault_path = FINDINGS_DIR / "vault_live.jsonl"
+        # Append to the live segment (JSONL + offset index)
         try:
-            with open(vault_path, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+            store.append(entry)
         except IOError as e:
             logger.error(f"Failed to write finding: {e}")
             return False
@@ -116,153 +133,92 @@ def record_finding(finding: dict) -> bool:
     return True
 
 
-def get_findings(decrypt_keys=False, limit=100) -> list:
-    """Read findings from the vault. Optionally decrypt sensitive fields."""
-    vault_path = FINDINGS_DIR / "vault_live.jsonl"
-    if not vault_path.exists():
-        return []
-
-    findings = []
+def _decrypted(findings):
+    """Decrypt sensitive fields entry by entry (entries that fail pass through)."""
     try:
-        with open(vault_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        findings.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-    except IOError:
-        return []
-
-    # Apply limit (most recent first)
-    findings = findings[-limit:]
-
-    if decrypt_keys:
+        from engines.security import decrypt_dict
+    except ImportError as e:
+        logger.warning(f"Could not decrypt findings: {e}")
+        yield from findings
+        return
+    for entry in findings:
         try:
-            from engines.security import decrypt_dict
+            yield decrypt_dict(entry)
+        except ValueError as e:
+            logger.warning(f"Could not decrypt finding: {e}")
+            yield entry
 
-            findings = [decrypt_dict(f) for f in findings]
-        except (ImportError, ValueError) as e:
-            logger.warning(f"Could not decrypt findings: {e}")
 
-    return findings
+def iter_findings(decrypt_keys=False, reverse=False):
+    """Stream every finding, oldest first (newest first with ``reverse``)."""
+    findings = _get_store().iter(reverse=reverse)
+    return _decrypted(findings) if decrypt_keys else findings
 
 
-def get_summary() -> dict:
-    """Return vault summary stats."""
-    vault_path = FINDINGS_DIR / "vault_live.jsonl"
+def get_findings(decrypt_keys=False, limit=100) -> list:
+    """Read the last ``limit`` findings (all if ``limit`` <= 0), oldest first.
 
-    total = 0
-    with_balance = 0
-    by_chain = {}
-    vault_size = 0
+    Reads only the tail of the newest segments, so the cost is O(limit).
+    """
+    try:
+        findings = _get_store().tail(limit)
+    except OSError:
+        return []
+    if decrypt_keys:
+        findings = list(_decrypted(findings))
+    return findings
 
-    if vault_path.exists():
-        vault_size = vault_path.stat().st_size
-        try:
-            with open(vault_path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                        total += 1
-                        chain = entry.get("chain", "unknown")
-                        by_chain[chain] = by_chain.get(chain, 0) + 1
-                        bal = entry.get("balance", 0)
-                        if isinstance(bal, (int, float)) and bal > 0:
-                            with_balance += 1
-                    except json.JSONDecodeError:
-                        continue
-        except IOError:
-            pass
 
+def get_summary() -> dict:
+    """Return vault summary stats (from the store's running counters)."""
+    summary = _get_store().summary()
     return {
-        "total": total,
-        "with_balance": with_balance,
-        "by_chain": by_chain,
-        "vault_size": vault_size,
+        "total": summary["total"],
+        "with_balance": summary["with_balance"],
+        "by_chain": summary["by_chain"],
+        "vault_size": summary["bytes"],
+        "segments": summary["segments"],
         "sessions": _session_count,
     }
 
 
 def export_csv(output_path=None, decrypt_keys=False) -> str:
-    """Export vault to CSV. Returns output path."""
+    """Export vault to CSV, streaming the segments. Returns output path."""
     if output_path is None:
         output_path = str(FINDINGS_DIR / "vault_export.csv")
 
-    findings = get_findings(decrypt_keys=decrypt_keys, limit=0)
-    # limit=0 means we need all — override
-    vault_path = FINDINGS_DIR / "vault_live.jsonl"
-    if vault_path.exists():
-        findings = []
-        with open(vault_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        findings.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-        if decrypt_keys:
-            try:
-                from engines.security import decrypt_dict
-
-                findings = [decrypt_dict(f) for f in findings]
-            except (ImportError, ValueError):
-                pass
-
-    if not findings:
-        # Write empty CSV with headers
-        with open(output_path, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", "session", "chain", "address", "balance"])
-        return output_path
-
-    # Collect all unique keys
+    # First pass: the union of keys across all findings
     all_keys = set()
-    for f in findings:
-        all_keys.update(f.keys())
-    fieldnames = sorted(all_keys)
+    for entry in iter_findings():
+        all_keys.update(entry.keys())
 
     with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        if not all_keys:
+            # Write empty CSV with headers
+            csv.writer(f).writerow(["timestamp", "session", "chain", "address", "balance"])
+            return output_path
+        writer = csv.DictWriter(f, fieldnames=sorted(all_keys), extrasaction="ignore")
         writer.writeheader()
-        writer.writerows(findings)
+        for entry in iter_findings(decrypt_keys=decrypt_keys):
+            writer.writerow(entry)
 
     return output_path
 
 
 def export_json(output_path=None, decrypt_keys=False) -> str:
-    """Export vault to JSON. Returns output path."""
+    """Export vault to a JSON array, streaming the segments. Returns output path."""
     if output_path is None:
         output_path = str(FINDINGS_DIR / "vault_export.json")
 
-    vault_path = FINDINGS_DIR / "vault_live.jsonl"
-    findings = []
-    if vault_path.exists():
-        with open(vault_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        findings.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-    if decrypt_keys:
-        try:
-            from engines.security import decrypt_dict
-
-            findings = [decrypt_dict(f) for f in findings]
-        except (ImportError, ValueError):
-            pass
-
-    # Atomic write
+    # Atomic write; same layout as json.dump(findings, f, indent=2)
     tmp_path = output_path + ".tmp"
     with open(tmp_path, "w") as f:
-        json.dump(findings, f, indent=2)
+        first = True
+        for entry in iter_findings(decrypt_keys=decrypt_keys):
+            f.write("[\n" if first else ",\n")
+            f.write(textwrap.indent(json.dumps(entry, indent=2), "  "))
+            first = False
+        f.write("[]" if first else "\n]")
     os.replace(tmp_path, output_path)
 
     return output_path
@@ -300,5 +256,7 @@ def shutdown():
 
         # Final summary
         _write_summary_unlocked()
+        if _store is not None:
+            _store.checkpoint()
 
     logger.info("Vault shutdown complete")
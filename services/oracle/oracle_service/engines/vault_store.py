@@ -0,0 +1,302 @@
+"""
+Vault Segment Store — indexed, append-only JSONL segments for the findings vault.
+
+Layout under ``<findings>/segments/``:
+
+- ``000001.jsonl`` ... — rolling JSONL segments (a new one starts once the
+  active segment reaches ``segment_bytes``)
+- ``000001.idx`` ... — sidecar offset index: one uint64 (native byte
+  order) per record, the byte offset where the record *ends* (record ``i`` spans
+  ``idx[i-1]..idx[i]``)
+- ``summary.json`` — counters (total, with_balance, by_chain, bytes) plus
+  the position they were checkpointed at
+
+Tail reads walk the segments newest-first and read only the last ``limit``
+index entries and the bytes they cover, so ``tail(limit)`` is O(limit) and
+``summary()`` is O(1). A record is indexed only after its line is written,
+so readers never see a partial record. On open, index entries missing
+after a crash are rebuilt from the active segment and counters past the
+checkpoint are replayed, so neither file needs to be written on every
+append to stay correct.
+
+A pre-segment ``vault_live.jsonl`` is adopted as segment 000000 on first
+open.
+"""
+
+import json
+import logging
+import os
+import threading
+from array import array
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_BYTES = 8 * 1024 * 1024
+CHECKPOINT_EVERY = 100  # appends between summary.json writes
+_OFFSET_BYTES = 8
+_SCAN_BLOCK = 4096  # records read per seek
+
+
+def _has_balance(entry: dict) -> bool:
+    bal = entry.get("balance", 0)
+    return isinstance(bal, (int, float)) and bal > 0
+
+
+class SegmentStore:
+    """Append-only findings log split into indexed JSONL segments."""
+
+    def __init__(self, directory, legacy_path=None, segment_bytes=SEGMENT_BYTES):
+        self._dir = Path(directory)
+        self._segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._dir.mkdir(parents=True, exist_ok=True)
+        if legacy_path is not None:
+            self._adopt_legacy(Path(legacy_path))
+
+        self._segments = sorted(int(p.stem) for p in self._dir.glob("*.jsonl"))
+        if not self._segments:
+            self._segments = [1]
+            self._data_path(1).touch()
+        self._sizes = {}  # sealed segment → record count
+        self._active_records, self._active_bytes = self._repair_index(self._segments[-1])
+        self._since_checkpoint = 0
+        self._load_summary()
+
+    # ─── Paths ───
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    def _data_path(self, segment: int) -> Path:
+        return self._dir / f"{segment:06d}.jsonl"
+
+    def _index_path(self, segment: int) -> Path:
+        return self._dir / f"{segment:06d}.idx"
+
+    @property
+    def _summary_path(self) -> Path:
+        return self._dir / "summary.json"
+
+    # ─── Open / recovery ───
+
+    def _adopt_legacy(self, legacy: Path) -> None:
+        if not legacy.exists() or any(self._dir.glob("*.jsonl")):
+            return
+        os.replace(legacy, self._data_path(0))
+        logger.info(f"Vault: adopted {legacy.name} as segment 000000")
+
+    def _read_index(self, segment: int, start: int = 0, stop: int | None = None) -> array:
+        """End offsets ``[start:stop]`` of ``segment``'s records."""
+        offsets = array("Q")
+        path = self._index_path(segment)
+        try:
+            with open(path, "rb") as f:
+                f.seek(start * _OFFSET_BYTES)
+                count = None if stop is None else max(0, stop - start)
+                raw = f.read() if count is None else f.read(count * _OFFSET_BYTES)
+        except FileNotFoundError:
+            return offsets
+        offsets.frombytes(raw[: len(raw) - len(raw) % _OFFSET_BYTES])
+        return offsets
+
+    def _repair_index(self, segment: int) -> tuple:
+        """Index any complete lines past the last indexed offset.
+
+        Returns (records, bytes) covered by the index; a trailing partial
+        line left by a crash is truncated away.
+        """
+        index_path = self._index_path(segment)
+        data_path = self._data_path(segment)
+        if index_path.exists() and index_path.stat().st_size % _OFFSET_BYTES:
+            with open(index_path, "r+b") as f:
+                f.truncate(index_path.stat().st_size // _OFFSET_BYTES * _OFFSET_BYTES)
+        records = index_path.stat().st_size // _OFFSET_BYTES if index_path.exists() else 0
+        end = self._read_index(segment, records - 1)[0] if records else 0
+
+        added = array("Q")
+        with open(data_path, "rb") as f:
+            f.seek(end)
+            position = end
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                position += len(line)
+                if line.strip():  # blank lines fold into the next record's span
+                    added.append(position)
+        if added:
+            with open(index_path, "ab") as f:
+                f.write(added.tobytes())
+            logger.info(f"Vault: indexed {len(added)} unindexed records in segment {segment:06d}")
+        covered = added[-1] if added else end
+        if data_path.stat().st_size > covered:
+            with open(data_path, "r+b") as f:
+                f.truncate(covered)
+        return records + len(added), covered
+
+    def _records_in(self, segment: int) -> int:
+        if segment == self._segments[-1]:
+            return self._active_records
+        if segment not in self._sizes:
+            path = self._index_path(segment)
+            if not path.exists():
+                self._repair_index(segment)
+            self._sizes[segment] = path.stat().st_size // _OFFSET_BYTES
+        return self._sizes[segment]
+
+    def _load_summary(self) -> None:
+        self._counters = {"total": 0, "with_balance": 0, "by_chain": {}, "bytes": 0}
+        position = (self._segments[0], 0)
+        try:
+            saved = json.loads(self._summary_path.read_text())
+            self._counters = saved["counters"]
+            position = tuple(saved["position"])
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            pass
+        if position[0] not in self._segments:
+            # Stale checkpoint (segments removed) — recount from scratch
+            self._counters = {"total": 0, "with_balance": 0, "by_chain": {}, "bytes": 0}
+            position = (self._segments[0], 0)
+
+        replayed = 0
+        for segment in self._segments:
+            if segment < position[0]:
+                continue
+            start = position[1] if segment == position[0] else 0
+            for entry, size in self._scan(segment, start):
+                self._count(entry, size)
+                replayed += 1
+        if replayed:
+            logger.info(f"Vault: replayed {replayed} records into summary counters")
+            self._checkpoint()
+
+    # ─── Writes ───
+
+    def append(self, entry: dict) -> None:
+        """Append one record (line write, then its index entry)."""
+        line = (json.dumps(entry) + "\n").encode()
+        with self._lock:
+            if self._active_bytes and self._active_bytes + len(line) > self._segment_bytes:
+                self._roll()
+            segment = self._segments[-1]
+            with open(self._data_path(segment), "ab") as f:
+                f.write(line)
+            self._active_bytes += len(line)
+            with open(self._index_path(segment), "ab") as f:
+                f.write(array("Q", [self._active_bytes]).tobytes())
+            self._active_records += 1
+            self._count(entry, len(line))
+            self._since_checkpoint += 1
+            if self._since_checkpoint >= CHECKPOINT_EVERY:
+                self._checkpoint()
+
+    def _roll(self) -> None:
+        sealed = self._segments[-1]
+        self._sizes[sealed] = self._active_records
+        self._segments.append(sealed + 1)
+        self._data_path(sealed + 1).touch()
+        self._active_records = self._active_bytes = 0
+
+    def _count(self, entry: dict, size: int) -> None:
+        counters = self._counters
+        counters["total"] += 1
+        counters["bytes"] += size
+        chain = entry.get("chain", "unknown")
+        counters["by_chain"][chain] = counters["by_chain"].get(chain, 0) + 1
+        if _has_balance(entry):
+            counters["with_balance"] += 1
+
+    def checkpoint(self) -> None:
+        """Persist the summary counters now (e.g. at shutdown)."""
+        with self._lock:
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        state = {
+            "counters": self._counters,
+            "position": [self._segments[-1], self._active_records],
+        }
+        tmp_path = self._summary_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(state))
+            os.replace(tmp_path, self._summary_path)
+            self._since_checkpoint = 0
+        except OSError as e:
+            logger.error(f"Failed to checkpoint vault summary: {e}")
+
+    # ─── Reads ───
+
+    def summary(self) -> dict:
+        """Counters: total, with_balance, by_chain, bytes, segments."""
+        with self._lock:
+            return {
+                "total": self._counters["total"],
+                "with_balance": self._counters["with_balance"],
+                "by_chain": dict(self._counters["by_chain"]),
+                "bytes": self._counters["bytes"],
+                "segments": len(self._segments),
+            }
+
+    def __len__(self) -> int:
+        return self._counters["total"]
+
+    def _scan(self, segment: int, start: int = 0, stop: int | None = None):
+        """Yield (entry, line bytes) for records ``[start:stop]`` of ``segment``."""
+        if stop is None:
+            stop = self._records_in(segment)
+        if stop <= start:
+            return
+        with open(self._data_path(segment), "rb") as f:
+            for block in range(start, stop, _SCAN_BLOCK):
+                bounds = self._read_index(
+                    segment, max(0, block - 1), min(stop, block + _SCAN_BLOCK)
+                )
+                begin = bounds[0] if block else 0
+                ends = bounds[1:] if block else bounds
+                f.seek(begin)
+                data = f.read(ends[-1] - begin)
+                position = 0
+                for end in ends:
+                    line = data[position : end - begin]
+                    position = end - begin
+                    try:
+                        yield json.loads(line), len(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+
+    def _snapshot(self) -> list:
+        """[(segment, records)] oldest-first, consistent at call time."""
+        with self._lock:
+            return [(s, self._records_in(s)) for s in self._segments]
+
+    def tail(self, limit: int) -> list:
+        """The last ``limit`` records, oldest-first (newest segments read first)."""
+        if limit <= 0:
+            return list(self.iter())
+        chunks = []
+        remaining = limit
+        for segment, records in reversed(self._snapshot()):
+            take = min(remaining, records)
+            if take:
+                chunks.append([e for e, _ in self._scan(segment, records - take, records)])
+                remaining -= take
+            if not remaining:
+                break
+        return [entry for chunk in reversed(chunks) for entry in chunk]
+
+    def iter(self, reverse: bool = False):
+        """Stream every record, oldest-first (or newest-first with ``reverse``)."""
+        snapshot = self._snapshot()
+        if not reverse:
+            for segment, records in snapshot:
+                for entry, _ in self._scan(segment, 0, records):
+                    yield entry
+            return
+        for segment, records in reversed(snapshot):
+            stop = records
+            while stop > 0:
+                start = max(0, stop - _SCAN_BLOCK)
+                block = [e for e, _ in self._scan(segment, start, stop)]
+                yield from reversed(block)
+                stop = start
@@ -22,6 +22,7 @@ from oracle_service.models.reading_types import (
 )
 from oracle_service.multi_user_analyzer import MultiUserAnalyzer
 from oracle_service.pattern_formatter import ConfidenceMapper, PatternFormatter
+from oracle_service.tracing import span
 from oracle_service.utils.script_detector import auto_select_system
 
 from numerology_ai_framework.core.base60_codec import Base60Codec
@@ -122,27 +123,29 @@ def generate_single_reading(
 
     t0 = time.perf_counter()
     try:
-        result = MasterOrchestrator.generate_reading(
-            full_name=full_name,
-            birth_day=birth_day,
-            birth_month=birth_month,
-            birth_year=birth_year,
-            current_date=current_date,
-            mother_name=mother_name,
-            gender=gender,
-            latitude=latitude,
-            longitude=longitude,
-            actual_bpm=heart_rate_bpm,
-            current_hour=current_hour,
-            current_minute=current_minute,
-            current_second=current_second,
-            tz_hours=tz_hours,
-            tz_minutes=tz_minutes,
-            numerology_system=numerology_system,
-            mode=mode,
-        )
+        with span("framework_bridge.orchestrate", mode=mode):
+            result = MasterOrchestrator.generate_reading(
+                full_name=full_name,
+                birth_day=birth_day,
+                birth_month=birth_month,
+                birth_year=birth_year,
+                current_date=current_date,
+                mother_name=mother_name,
+                gender=gender,
+                latitude=latitude,
+                longitude=longitude,
+                actual_bpm=heart_rate_bpm,
+                current_hour=current_hour,
+                current_minute=current_minute,
+                current_second=current_second,
+                tz_hours=tz_hours,
+                tz_minutes=tz_minutes,
+                numerology_system=numerology_system,
+                mode=mode,
+            )
         # Enrich with formatted patterns + confidence UI (Session 9)
-        result.update(_enrich_with_patterns(result))
+        with span("framework_bridge.enrich_patterns"):
+            result.update(_enrich_with_patterns(result))
         duration_ms = (time.perf_counter() - t0) * 1000
         logger.info("Framework reading generated in %.1fms", duration_ms)
         return result
@@ -0,0 +1,232 @@
+"""Group Compatibility — incrementally maintained state for persistent groups.
+
+``generate_multi_user_reading`` recomputes everything for every call: N
+framework readings, O(N²) pairwise scoring and an AI interpretation. A
+GroupState instead keeps what the group analysis needs between requests:
+
+- per-member comparison data (``compact_comparison`` — life path, element,
+  animal, moon phase, pattern keys), taken from one framework reading at the
+  group's fixed reading moment
+- the NxN pair score matrix, stored as integer basis points (the 4-decimal
+  ``overall_score`` × 10,000) so running totals never drift
+- running pair-score total and element counts
+
+Adding a member costs one framework reading plus one O(N) row of scores
+(``score_row``). Removing a member subtracts its row from the totals. Harmony,
+element balance and summary then read straight from the running totals, and
+top pairs are picked from the stored matrix. The state round-trips through
+``to_dict`` / ``from_dict`` for JSON storage; ``from_pairs`` rebuilds it from
+per-pair rows, and ``score_newcomer`` / ``group_harmony`` let a row store
+apply a join without loading the matrix.
+"""
+
+from collections import Counter
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from oracle_service.compatibility_matrix import (
+    CompatibilityMatrix,
+    compact_comparison,
+    encode_features,
+    score_row,
+    top_pair_indices,
+)
+from oracle_service.models.reading_types import CompatibilityResult, ReadingResult, UserProfile
+
+SCORE_SCALE = 10_000  # pair scores stored in basis points (4 decimals)
+
+
+def _basis_points(scores: Sequence[float]) -> np.ndarray:
+    """Round like ``CompatibilityResult.overall_score`` then scale to ints."""
+    return np.array([round(round(float(s), 4) * SCORE_SCALE) for s in scores], dtype=np.int32)
+
+
+def score_newcomer(
+    members: Sequence[int], comparisons: Sequence[Dict], member_id: int, comparison: Dict
+) -> np.ndarray:
+    """Basis-point scores of a joining member against each current member (O(N))."""
+    n = len(members)
+    features = encode_features(list(comparisons) + [comparison], list(members) + [member_id])
+    return _basis_points(score_row(features, n)[:n])
+
+
+def group_harmony(score_total: int, member_count: int) -> float:
+    """Mean pair score from the running basis-point total."""
+    pairs = member_count * (member_count - 1) // 2
+    if not pairs:
+        return 0.0
+    return score_total / SCORE_SCALE / pairs
+
+
+def member_comparison(profile: UserProfile, moment: datetime, locale: str = "en") -> Dict:
+    """Comparison data for one member, read at the group's reading moment.
+
+    Matches the per-user time reading ``generate_multi_user_reading`` makes
+    for the same ``target_date``.
+    """
+    from oracle_service.framework_bridge import generate_time_reading
+
+    reading = generate_time_reading(
+        profile, moment.hour, moment.minute, moment.second, moment, locale
+    )
+    return compact_comparison(reading)
+
+
+class GroupState:
+    """Members, pair score matrix and running totals of one group."""
+
+    def __init__(
+        self,
+        members: Optional[List[int]] = None,
+        comparisons: Optional[List[Dict]] = None,
+        scores: Optional[np.ndarray] = None,
+        score_total: Optional[int] = None,
+        element_counts: Optional[Dict[str, int]] = None,
+    ):
+        self.members: List[int] = list(members or [])
+        self.comparisons: List[Dict] = list(comparisons or [])
+        n = len(self.members)
+        if scores is None:
+            scores = np.zeros((n, n), dtype=np.int32)
+        self.scores = np.asarray(scores, dtype=np.int32).reshape(n, n)
+        if score_total is None:
+            score_total = int(np.triu(self.scores, 1).sum())
+        self.score_total = score_total
+        if element_counts is None:
+            element_counts = Counter(c["element"] for c in self.comparisons)
+        self.element_counts: Dict[str, int] = dict(element_counts)
+
+    # ── Construction / persistence ──
+
+    @classmethod
+    def from_comparisons(cls, members: Sequence[int], comparisons: Sequence[Dict]) -> "GroupState":
+        """Bulk-build with one vectorized NxN pass."""
+        matrix = CompatibilityMatrix(encode_features(comparisons, members))
+        n = len(members)
+        scores = _basis_points(matrix.overall.ravel()).reshape(n, n)
+        np.fill_diagonal(scores, 0)
+        return cls(members=members, comparisons=comparisons, scores=scores)
+
+    @classmethod
+    def from_readings(cls, readings: Sequence[ReadingResult]) -> "GroupState":
+        return cls.from_comparisons(
+            [r.user_id for r in readings], [compact_comparison(r) for r in readings]
+        )
+
+    @classmethod
+    def from_pairs(
+        cls,
+        members: Sequence[int],
+        comparisons: Sequence[Dict],
+        pairs: Iterable[Tuple[int, int, int]],
+        score_total: Optional[int] = None,
+        element_counts: Optional[Dict[str, int]] = None,
+    ) -> "GroupState":
+        """Rebuild from ``(member_a, member_b, basis_points)`` rows, one per pair."""
+        index = {m: i for i, m in enumerate(members)}
+        n = len(members)
+        scores = np.zeros((n, n), dtype=np.int32)
+        for a, b, score in pairs:
+            i, j = index[a], index[b]
+            scores[i, j] = scores[j, i] = score
+        return cls(members, comparisons, scores, score_total, element_counts)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "GroupState":
+        return cls(
+            members=data.get("members", []),
+            comparisons=data.get("comparisons", []),
+            scores=np.array(data.get("scores") or [], dtype=np.int32),
+            score_total=data.get("score_total"),
+            element_counts=data.get("element_counts"),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "members": list(self.members),
+            "comparisons": list(self.comparisons),
+            "scores": self.scores.tolist(),
+            "score_total": self.score_total,
+            "element_counts": dict(self.element_counts),
+        }
+
+    # ── Membership ──
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __contains__(self, member_id: int) -> bool:
+        return member_id in self.members
+
+    def add(self, member_id: int, comparison: Dict) -> None:
+        """Join: score the newcomer against everyone (O(N)) and update totals."""
+        if member_id in self.members:
+            raise ValueError(f"User {member_id} is already a group member")
+        n = len(self.members)
+        row = score_newcomer(self.members, self.comparisons, member_id, comparison)
+
+        grown = np.zeros((n + 1, n + 1), dtype=np.int32)
+        grown[:n, :n] = self.scores
+        grown[n, :n] = row
+        grown[:n, n] = row
+        self.scores = grown
+        self.score_total += int(row.sum())
+
+        self.members.append(member_id)
+        self.comparisons.append(comparison)
+        element = comparison["element"]
+        self.element_counts[element] = self.element_counts.get(element, 0) + 1
+
+    def remove(self, member_id: int) -> None:
+        """Leave: subtract the member's row from the totals (O(N))."""
+        if member_id not in self.members:
+            raise ValueError(f"User {member_id} is not a group member")
+        i = self.members.index(member_id)
+        self.score_total -= int(self.scores[i].sum())
+        self.scores = np.delete(np.delete(self.scores, i, axis=0), i, axis=1)
+
+        self.members.pop(i)
+        element = self.comparisons.pop(i)["element"]
+        self.element_counts[element] -= 1
+        if not self.element_counts[element]:
+            del self.element_counts[element]
+
+    # ── Analysis ──
+
+    @property
+    def pair_count(self) -> int:
+        n = len(self.members)
+        return n * (n - 1) // 2
+
+    @property
+    def harmony(self) -> float:
+        return group_harmony(self.score_total, len(self.members))
+
+    def pair(self, i: int, j: int) -> CompatibilityResult:
+        features = encode_features(
+            [self.comparisons[i], self.comparisons[j]], [self.members[i], self.members[j]]
+        )
+        return CompatibilityMatrix(features).pair(0, 1)
+
+    def top_pairs(self, k: int, strongest: bool = True) -> List[CompatibilityResult]:
+        """The ``k`` most (or least) compatible pairs from the stored matrix."""
+        return [self.pair(i, j) for i, j in top_pair_indices(self.scores, k, strongest)]
+
+    def analysis(self, top_k: int = 5) -> Dict:
+        """Current group analysis, read from the running totals."""
+        from oracle_service.multi_user_analyzer import MultiUserAnalyzer
+
+        harmony = self.harmony
+        return {
+            "members": list(self.members),
+            "member_count": len(self.members),
+            "pair_count": self.pair_count,
+            "group_harmony_score": round(harmony, 4),
+            "group_element_balance": dict(self.element_counts),
+            "group_summary": MultiUserAnalyzer.group_summary(harmony, self.element_counts),
+            "strongest_pairs": [asdict(p) for p in self.top_pairs(top_k)],
+            "challenging_pairs": [asdict(p) for p in self.top_pairs(top_k, strongest=False)],
+        }
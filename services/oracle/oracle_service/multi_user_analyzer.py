@@ -7,9 +7,8 @@ pairwise compatibility scores and group harmony.
 Scoring weights: LP(30%) + Element(25%) + Animal(20%) + Moon(15%) + Patterns(10%)
 """
 
-import itertools
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from oracle_service.models.reading_types import (
     CompatibilityResult,
@@ -96,6 +95,10 @@ class MultiUserAnalyzer:
     WEIGHT_MOON = 0.15
     WEIGHT_PATTERN = 0.10
 
+    # ── Group output ──
+    FULL_PAIRWISE_MAX = 12  # list every pair up to this group size (66 pairs)
+    TOP_PAIRS = 10  # strongest / most challenging pairs listed for larger groups
+
     @classmethod
     def score_life_path_compatibility(cls, lp_a: int, lp_b: int) -> float:
         """Score life path compatibility between two numbers.
@@ -241,6 +244,28 @@ class MultiUserAnalyzer:
         moon_score = cls.score_moon_alignment(data_a["moon"], data_b["moon"])
         pattern_score = cls.score_pattern_overlap(data_a["patterns"], data_b["patterns"])
 
+        return cls.build_compatibility(
+            reading_a.user_id,
+            reading_b.user_id,
+            lp_score,
+            elem_score,
+            animal_score,
+            moon_score,
+            pattern_score,
+        )
+
+    @classmethod
+    def build_compatibility(
+        cls,
+        user_a_id: int,
+        user_b_id: int,
+        lp_score: float,
+        elem_score: float,
+        animal_score: float,
+        moon_score: float,
+        pattern_score: float,
+    ) -> CompatibilityResult:
+        """Weight component scores into a CompatibilityResult."""
         overall = (
             lp_score * cls.WEIGHT_LIFE_PATH
             + elem_score * cls.WEIGHT_ELEMENT
@@ -269,8 +294,8 @@ class MultiUserAnalyzer:
             desc = "Challenging compatibility — growth through friction"
 
         return CompatibilityResult(
-            user_a_id=reading_a.user_id,
-            user_b_id=reading_b.user_id,
+            user_a_id=user_a_id,
+            user_b_id=user_b_id,
             overall_score=round(overall, 4),
             life_path_score=lp_score,
             element_score=elem_score,
@@ -283,26 +308,49 @@ class MultiUserAnalyzer:
         )
 
     @classmethod
-    def analyze_group(cls, readings: List[ReadingResult]) -> MultiUserResult:
+    def analyze_group(
+        cls, readings: List[ReadingResult], top_k: Optional[int] = None
+    ) -> MultiUserResult:
         """Analyze group compatibility from individual readings.
 
-        Generates all pairwise combinations, calculates compatibility for each,
-        and produces group harmony score + element balance.
+        Scores every pair at once with the vectorized CompatibilityMatrix and
+        produces group harmony score + element balance. Groups of up to
+        FULL_PAIRWISE_MAX users list every pair (in combination order); larger
+        groups, or any call with ``top_k``, list only the ``top_k`` strongest
+        pairs followed by the ``top_k`` most challenging ones.
         """
-        pairs = list(itertools.combinations(readings, 2))
-        pairwise = [cls.calculate_pairwise(a, b) for a, b in pairs]
+        from oracle_service.compatibility_matrix import CompatibilityMatrix
 
-        if pairwise:
-            harmony = sum(p.overall_score for p in pairwise) / len(pairwise)
+        matrix = CompatibilityMatrix.from_readings(readings)
+        if top_k is None and len(readings) <= cls.FULL_PAIRWISE_MAX:
+            pairwise = matrix.all_pairs()
         else:
-            harmony = 0.0
+            pairwise = cls._strongest_and_challenging(matrix, top_k or cls.TOP_PAIRS)
 
-        element_balance: Dict[str, int] = {}
-        for reading in readings:
-            data = cls._extract_comparison_data(reading)
-            elem = data["element"]
-            element_balance[elem] = element_balance.get(elem, 0) + 1
+        harmony = matrix.harmony()
+        element_balance = matrix.element_balance()
+        return MultiUserResult(
+            individual_readings=readings,
+            pairwise_compatibility=pairwise,
+            group_harmony_score=round(harmony, 4),
+            group_element_balance=element_balance,
+            group_summary=cls.group_summary(harmony, element_balance),
+        )
 
+    @staticmethod
+    def _strongest_and_challenging(matrix, k: int) -> List[CompatibilityResult]:
+        strongest = matrix.top_pairs(k)
+        seen = {(p.user_a_id, p.user_b_id) for p in strongest}
+        challenging = [
+            p
+            for p in matrix.top_pairs(k, strongest=False)
+            if (p.user_a_id, p.user_b_id) not in seen
+        ]
+        return strongest + challenging
+
+    @staticmethod
+    def group_summary(harmony: float, element_balance: Dict[str, int]) -> str:
+        """Human-readable summary for a harmony score and element mix."""
         if harmony >= 0.8:
             summary = "Exceptional group harmony — strong collective energy"
         elif harmony >= 0.6:
@@ -319,10 +367,4 @@ class MultiUserAnalyzer:
             elem_name = list(element_balance.keys())[0]
             summary += f". Uniform {elem_name} energy — focused but narrow."
 
-        return MultiUserResult(
-            individual_readings=readings,
-            pairwise_compatibility=pairwise,
-            group_harmony_score=round(harmony, 4),
-            group_element_balance=element_balance,
-            group_summary=summary,
-        )
+        return summary
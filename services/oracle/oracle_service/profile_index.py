@@ -0,0 +1,233 @@
+"""Profile Index — "most compatible profiles" search over all oracle users.
+
+A time reading's element, animal and moon phase describe the reading moment
+(the same for everyone read at that moment). To rank saved profiles against
+each other we instead read each profile at its own birth moment
+(``natal_comparison``): birth-year element and animal, birth moon phase, life
+path and natal patterns. These features only change when the profile does,
+so they are computed on profile create/update and kept in a column-oriented
+in-memory table:
+
+- integer codes per dimension (life path, element, animal, moon) plus the 2D
+  score tables from ``compatibility_matrix.vocabulary``
+- a 0/1 pattern incidence matrix (profiles × pattern keys)
+- an owner code per profile for ownership filtering
+
+``top_matches`` scores one profile against every other in a single vectorized
+pass (four table gathers plus a sum over the profile's own pattern columns),
+masks by owner and picks the top k with ``argpartition`` — no per-pair Python
+work. Scores are the weighted score ``MultiUserAnalyzer.calculate_pairwise``
+produces, and matches come back as the same ``CompatibilityResult``.
+
+Upserts and removals are O(1) amortized: arrays grow by doubling and
+removals swap the last row into the freed slot.
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Tuple
+
+import numpy as np
+
+from oracle_service.compatibility_matrix import (
+    _analyzer,
+    compact_comparison,
+    pattern_key,
+    pattern_scores,
+    vocabulary,
+    weighted_score,
+)
+from oracle_service.models.reading_types import CompatibilityResult, UserProfile
+
+_DIMENSIONS = ("life_path", "element", "animal", "moon")
+_INITIAL_CAPACITY = 1024
+
+
+def natal_comparison(profile: UserProfile, locale: str = "en") -> Dict:
+    """Profile-intrinsic comparison data: a time reading at birth (noon)."""
+    from oracle_service.framework_bridge import generate_time_reading
+
+    birth = datetime(profile.birth_year, profile.birth_month, profile.birth_day, 12)
+    return compact_comparison(generate_time_reading(profile, 12, 0, 0, birth, locale))
+
+
+class _Dimension:
+    """Growable value → code mapping with its pairwise score table."""
+
+    def __init__(self, name: str):
+        vocab = vocabulary(name)
+        self.scorer = vocab.scorer
+        self.values: List[Any] = list(vocab.values)
+        self.index = dict(vocab.index)
+        self.table = vocab.table
+
+    def code(self, value: Any) -> int:
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.index[value] = code
+            self.table = np.array(
+                [[self.scorer(a, b) for b in self.values] for a in self.values], dtype=np.float64
+            )
+        return code
+
+
+class ProfileCompatibilityIndex:
+    """Column-oriented natal feature table with vectorized top-k queries."""
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self._lock = threading.RLock()
+        self._dims = {name: _Dimension(name) for name in _DIMENSIONS}
+        self._pattern_columns: Dict[tuple, int] = {}
+        self._owners: Dict[Hashable, int] = {}
+        self._row: Dict[int, int] = {}  # profile id → row
+        self._size = 0
+        self._allocate(capacity, pattern_columns=8)
+
+    def _allocate(self, capacity: int, pattern_columns: int) -> None:
+        old_size = self._size
+        ids = np.zeros(capacity, dtype=np.int64)
+        owners = np.full(capacity, -1, dtype=np.int32)
+        codes = {name: np.zeros(capacity, dtype=np.int32) for name in _DIMENSIONS}
+        # Column-major: a query reads only the columns of the queried profile
+        patterns = np.zeros((capacity, pattern_columns), dtype=np.uint8, order="F")
+        pattern_counts = np.zeros(capacity, dtype=np.int16)
+        if old_size:
+            ids[:old_size] = self._ids[:old_size]
+            owners[:old_size] = self._owner_codes[:old_size]
+            for name in _DIMENSIONS:
+                codes[name][:old_size] = self._codes[name][:old_size]
+            patterns[:old_size, : self._patterns.shape[1]] = self._patterns[:old_size]
+            pattern_counts[:old_size] = self._pattern_counts[:old_size]
+        self._ids, self._owner_codes, self._codes = ids, owners, codes
+        self._patterns, self._pattern_counts = patterns, pattern_counts
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, profile_id: int) -> bool:
+        return profile_id in self._row
+
+    # ── Maintenance ──
+
+    def upsert(self, profile_id: int, comparison: Dict, owner: Hashable = None) -> None:
+        """Insert or replace a profile's natal features."""
+        with self._lock:
+            row = self._row.get(profile_id)
+            if row is None:
+                if self._size == len(self._ids):
+                    self._allocate(2 * len(self._ids), self._patterns.shape[1])
+                row = self._size
+                self._size += 1
+                self._row[profile_id] = row
+                self._ids[row] = profile_id
+
+            self._owner_codes[row] = self._owners.setdefault(owner, len(self._owners))
+            self._codes["life_path"][row] = self._dims["life_path"].code(comparison["life_path"])
+            self._codes["element"][row] = self._dims["element"].code(comparison["element"])
+            self._codes["animal"][row] = self._dims["animal"].code(comparison["animal"])
+            phase = (comparison.get("moon") or {}).get("phase_name", "")
+            self._codes["moon"][row] = self._dims["moon"].code(phase)
+
+            columns = {self._pattern_column(pattern_key(p)) for p in comparison["patterns"]}
+            self._patterns[row] = 0
+            self._patterns[row, list(columns)] = 1
+            self._pattern_counts[row] = len(columns)
+
+    def _pattern_column(self, key: tuple) -> int:
+        column = self._pattern_columns.get(key)
+        if column is None:
+            column = len(self._pattern_columns)
+            self._pattern_columns[key] = column
+            if column == self._patterns.shape[1]:
+                self._allocate(len(self._ids), 2 * self._patterns.shape[1])
+        return column
+
+    def remove(self, profile_id: int) -> bool:
+        """Drop a profile (swap-with-last). Returns False if it was not indexed."""
+        with self._lock:
+            row = self._row.pop(profile_id, None)
+            if row is None:
+                return False
+            last = self._size - 1
+            if row != last:
+                moved = int(self._ids[last])
+                self._ids[row] = moved
+                self._owner_codes[row] = self._owner_codes[last]
+                for name in _DIMENSIONS:
+                    self._codes[name][row] = self._codes[name][last]
+                self._patterns[row] = self._patterns[last]
+                self._pattern_counts[row] = self._pattern_counts[last]
+                self._row[moved] = row
+            self._patterns[last] = 0
+            self._pattern_counts[last] = 0
+            self._size = last
+            return True
+
+    # ── Queries ──
+
+    def scores_for(self, profile_id: int) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Overall and component scores of ``profile_id`` against every row."""
+        i = self._row[profile_id]
+        n = self._size
+        components = {
+            name: self._dims[name].table[self._codes[name][i], self._codes[name][:n]]
+            for name in _DIMENSIONS
+        }
+        columns = np.flatnonzero(self._patterns[i])
+        shared = self._patterns[:n, columns].sum(axis=1, dtype=np.int16)
+        has = self._pattern_counts[:n] > 0
+        components["pattern"] = pattern_scores(shared, has[i], has)
+        return weighted_score(components), components
+
+    def top_matches(
+        self,
+        profile_id: int,
+        k: int = 10,
+        owner: Hashable = None,
+        restrict_owner: bool = False,
+    ) -> List[CompatibilityResult]:
+        """The ``k`` most compatible other profiles, best first.
+
+        With ``restrict_owner`` only profiles owned by ``owner`` are candidates
+        (the non-admin rule of the ``list_users`` endpoint).
+
+        Raises:
+            KeyError: If ``profile_id`` is not indexed.
+        """
+        with self._lock:
+            overall, components = self.scores_for(profile_id)
+            candidates = np.ones(self._size, dtype=bool)
+            candidates[self._row[profile_id]] = False
+            if restrict_owner:
+                code = self._owners.get(owner)
+                if code is None:
+                    return []
+                candidates &= self._owner_codes[: self._size] == code
+
+            eligible = np.flatnonzero(candidates)
+            if k <= 0 or eligible.size == 0:
+                return []
+            # Rank on the reported (4-decimal) score so ties break by id
+            keyed = -np.round(overall[eligible], 4)
+            k = min(k, eligible.size)
+            if k < eligible.size:
+                picked = np.argpartition(keyed, k - 1)[:k]
+            else:
+                picked = np.arange(eligible.size)
+            ids = self._ids[eligible[picked]]
+            picked = picked[np.lexsort((ids, keyed[picked]))]
+
+            analyzer = _analyzer()
+            results = []
+            for p in picked:
+                row = int(eligible[p])
+                results.append(
+                    analyzer.build_compatibility(
+                        profile_id,
+                        int(self._ids[row]),
+                        *(float(components[name][row]) for name in _DIMENSIONS + ("pattern",)),
+                    )
+                )
+            return results
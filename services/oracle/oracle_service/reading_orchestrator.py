@@ -11,6 +11,8 @@ from datetime import datetime
 from typing import Any, Callable, Dict, Optional
 
 from oracle_service.models.reading_types import ReadingResult, UserProfile
+from oracle_service.tracing import span
+from oracle_service.work_scheduler import run_ai, run_framework
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +25,17 @@ class ReadingOrchestrator:
     - AI interpretation via Session 13 engine
     - Response formatting to API model structure
     - Progress callback for WebSocket updates
+    - Optional section callback: time readings stream AI sections as they
+      complete instead of waiting for the whole interpretation
     """
 
     def __init__(
         self,
         progress_callback: Optional[Callable] = None,
+        section_callback: Optional[Callable] = None,
     ):
         self.progress_callback = progress_callback
+        self.section_callback = section_callback
 
     async def _send_progress(
         self, step: int, total: int, message: str, reading_type: str = "time"
@@ -47,43 +53,63 @@ class ReadingOrchestrator:
         target_date: Optional[datetime] = None,
         locale: str = "en",
         inquiry_context: Optional[Dict[str, str]] = None,
+        include_ai: bool = True,
+        fallback_only: bool = False,
     ) -> Dict[str, Any]:
         """Full pipeline for time reading.
 
-        Returns dict matching FrameworkReadingResponse fields.
-        Blocking calls are offloaded to a thread pool to avoid stalling the
-        async event loop (the AI interpreter may use ``time.sleep`` in its
+        Returns dict matching FrameworkReadingResponse fields. With
+        ``include_ai=False`` the AI step is skipped and ``ai_interpretation``
+        is None (the caller enriches the reading later). With
+        ``fallback_only=True`` (load shedding) the AI call is skipped and the
+        framework fallback interpretation is returned instead.
+        Blocking calls are offloaded to the work scheduler's framework and
+        AI pools (priority class from the caller's context) to avoid stalling
+        the async event loop (the AI interpreter may use ``time.sleep`` in its
         rate limiter).
         """
-        import asyncio
-
-        loop = asyncio.get_running_loop()
         total_steps = 4
         start = time.perf_counter()
 
         # Step 1: Generate framework reading (blocking — offload)
         await self._send_progress(1, total_steps, "Generating reading...")
-        reading_result = await loop.run_in_executor(
-            None,
+        reading_result = await run_framework(
             lambda: self._call_framework_time(
                 user_profile, hour, minute, second, target_date, locale
             ),
         )
 
-        # Step 2: AI interpretation (blocking — offload)
+        # Step 2: AI interpretation (streamed, async client if enabled, else offload)
         await self._send_progress(2, total_steps, "Interpreting patterns...")
-        ai_sections = await loop.run_in_executor(
-            None,
-            lambda: self._call_ai_interpreter(
+        if not include_ai:
+            ai_sections = None
+        elif fallback_only:
+            ai_sections = self._shed_ai_sections(reading_result.framework_output, locale)
+        elif self.section_callback is not None:
+            ai_sections = await self._call_ai_interpreter_stream(
                 reading_result.framework_output,
                 locale,
                 inquiry_context=inquiry_context,
-            ),
-        )
+            )
+        elif self._use_async_ai():
+            ai_sections = await self._call_ai_interpreter_async(
+                reading_result.framework_output,
+                locale,
+                inquiry_context=inquiry_context,
+            )
+        else:
+            ai_sections = await run_ai(
+                lambda: self._call_ai_interpreter(
+                    reading_result.framework_output,
+                    locale,
+                    inquiry_context=inquiry_context,
+                ),
+            )
 
         # Step 3: Format response
         await self._send_progress(3, total_steps, "Formatting response...")
-        response = self._build_response(reading_result, ai_sections, locale)
+        with span("reading.format"):
+            response = self._build_response(reading_result, ai_sections, locale)
 
         # Step 4: Done
         elapsed = (time.perf_counter() - start) * 1000
@@ -104,7 +130,8 @@ class ReadingOrchestrator:
         """Invoke framework_bridge.generate_time_reading()."""
         from oracle_service.framework_bridge import generate_time_reading
 
-        return generate_time_reading(user, hour, minute, second, target_date, locale)
+        with span("framework_bridge", reading_type="time"):
+            return generate_time_reading(user, hour, minute, second, target_date, locale)
 
     def _call_ai_interpreter(
         self,
@@ -116,59 +143,166 @@ class ReadingOrchestrator:
         inquiry_context: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Invoke AI interpreter from Session 13."""
+        with span("ai.interpret", reading_type=reading_type, mode="sync"):
+            try:
+                from oracle_service.engines.ai_interpreter import interpret_reading
+
+                result = interpret_reading(
+                    framework_output,
+                    reading_type=reading_type,
+                    question=question,
+                    locale=locale,
+                    category=category,
+                    inquiry_context=inquiry_context,
+                )
+                return result.to_dict() if hasattr(result, "to_dict") else result
+            except Exception:
+                logger.warning("AI interpretation unavailable", exc_info=True)
+                return self._fallback_sections(framework_output, locale)
+
+    @staticmethod
+    def _use_async_ai() -> bool:
+        """True when NPS_AI_ASYNC selects the asyncio-native AI client."""
         try:
-            from oracle_service.engines.ai_interpreter import interpret_reading
+            from oracle_service.engines.ai_client_async import async_enabled
 
-            result = interpret_reading(
-                framework_output,
-                reading_type=reading_type,
-                question=question,
-                locale=locale,
-                category=category,
-                inquiry_context=inquiry_context,
-            )
-            return result.to_dict() if hasattr(result, "to_dict") else result
-        except Exception:
-            logger.warning("AI interpretation unavailable", exc_info=True)
-            # Fallback: use framework synthesis
-            synthesis = framework_output.get("synthesis", "")
-            translation = framework_output.get("translation", {})
-            if translation and isinstance(translation, dict):
-                return {
-                    "header": translation.get("header", ""),
-                    "universal_address": translation.get("universal_address", ""),
-                    "core_identity": translation.get("core_identity", ""),
-                    "right_now": translation.get("right_now", ""),
-                    "patterns": translation.get("patterns", ""),
-                    "message": translation.get("message", ""),
-                    "advice": translation.get("advice", ""),
-                    "caution": translation.get("caution", ""),
-                    "footer": translation.get("footer", ""),
-                    "full_text": translation.get("full_text", synthesis),
-                    "ai_generated": False,
-                    "locale": locale,
-                    "elapsed_ms": 0.0,
-                    "cached": False,
-                    "confidence_score": 0,
-                }
+            return async_enabled()
+        except ImportError:
+            return False
+
+    async def _call_ai_interpreter_async(
+        self,
+        framework_output: Dict[str, Any],
+        locale: str,
+        reading_type: str = "time",
+        question: str = "",
+        category: str | None = None,
+        inquiry_context: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Invoke the async AI interpreter without tying up an executor thread."""
+        with span("ai.interpret", reading_type=reading_type, mode="async"):
+            try:
+                from oracle_service.engines.ai_interpreter import interpret_reading_async
+
+                result = await interpret_reading_async(
+                    framework_output,
+                    reading_type=reading_type,
+                    question=question,
+                    locale=locale,
+                    category=category,
+                    inquiry_context=inquiry_context,
+                )
+                return result.to_dict() if hasattr(result, "to_dict") else result
+            except Exception:
+                logger.warning("AI interpretation unavailable", exc_info=True)
+                return self._fallback_sections(framework_output, locale)
+
+    async def _call_ai_interpreter_stream(
+        self,
+        framework_output: Dict[str, Any],
+        locale: str,
+        reading_type: str = "time",
+        inquiry_context: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Stream AI sections to ``section_callback`` as they complete.
+
+        The callback receives ``(section_key, text, index)``; a
+        ``SECTIONS_RESET`` key means the sections sent so far are not part of
+        the stored interpretation and should be discarded. The returned dict
+        is the full interpretation (persisted once by the caller) plus
+        ``time_to_first_section_ms``.
+        """
+        start = time.perf_counter()
+        first_section_ms: Optional[float] = None
+        index = 0
+
+        async def on_section(key: str, text: str) -> None:
+            nonlocal first_section_ms, index
+            if first_section_ms is None:
+                first_section_ms = (time.perf_counter() - start) * 1000
+            await self.section_callback(key, text, index)
+            index += 1
+
+        with span("ai.interpret", reading_type=reading_type, mode="stream"):
+            try:
+                from oracle_service.engines.ai_interpreter import interpret_reading_stream
+
+                result = await interpret_reading_stream(
+                    framework_output,
+                    on_section,
+                    reading_type=reading_type,
+                    locale=locale,
+                    inquiry_context=inquiry_context,
+                )
+                sections = result.to_dict() if hasattr(result, "to_dict") else result
+            except Exception:
+                logger.warning("Streaming AI interpretation unavailable", exc_info=True)
+                sections = self._fallback_sections(framework_output, locale)
+                if index:
+                    from oracle_service.engines.ai_interpreter import SECTIONS_RESET
+
+                    await on_section(SECTIONS_RESET, "")
+        sections["time_to_first_section_ms"] = (
+            round(first_section_ms, 1) if first_section_ms is not None else None
+        )
+        logger.info(
+            "Streamed %d AI sections (first after %s ms)",
+            index,
+            sections["time_to_first_section_ms"],
+        )
+        return sections
+
+    def _shed_ai_sections(self, framework_output: Dict[str, Any], locale: str) -> Dict[str, Any]:
+        """AI-free interpretation for load shedding: the interpreter's own fallback."""
+        with span("ai.fallback"):
+            try:
+                from oracle_service.engines.ai_interpreter import _build_fallback
+
+                return _build_fallback(framework_output, locale).to_dict()
+            except Exception:
+                logger.warning("Interpreter fallback unavailable", exc_info=True)
+                return self._fallback_sections(framework_output, locale)
+
+    @staticmethod
+    def _fallback_sections(framework_output: Dict[str, Any], locale: str) -> Dict[str, Any]:
+        """Fallback: use framework synthesis when AI interpretation fails."""
+        synthesis = framework_output.get("synthesis", "")
+        translation = framework_output.get("translation", {})
+        if translation and isinstance(translation, dict):
             return {
-                "header": "",
-                "universal_address": "",
-                "core_identity": "",
-                "right_now": "",
-                "patterns": "",
-                "message": synthesis or "Reading data available but AI interpretation unavailable.",
-                "advice": "",
-                "caution": "",
-                "footer": "",
-                "full_text": synthesis
-                or "Reading data available but AI interpretation unavailable.",
+                "header": translation.get("header", ""),
+                "universal_address": translation.get("universal_address", ""),
+                "core_identity": translation.get("core_identity", ""),
+                "right_now": translation.get("right_now", ""),
+                "patterns": translation.get("patterns", ""),
+                "message": translation.get("message", ""),
+                "advice": translation.get("advice", ""),
+                "caution": translation.get("caution", ""),
+                "footer": translation.get("footer", ""),
+                "full_text": translation.get("full_text", synthesis),
                 "ai_generated": False,
                 "locale": locale,
                 "elapsed_ms": 0.0,
                 "cached": False,
                 "confidence_score": 0,
             }
+        return {
+            "header": "",
+            "universal_address": "",
+            "core_identity": "",
+            "right_now": "",
+            "patterns": "",
+            "message": synthesis or "Reading data available but AI interpretation unavailable.",
+            "advice": "",
+            "caution": "",
+            "footer": "",
+            "full_text": synthesis or "Reading data available but AI interpretation unavailable.",
+            "ai_generated": False,
+            "locale": locale,
+            "elapsed_ms": 0.0,
+            "cached": False,
+            "confidence_score": 0,
+        }
 
     def generate_name_reading(
         self,
@@ -183,8 +317,12 @@ class ReadingOrchestrator:
         include_ai: bool = True,
         locale: str = "en",
         inquiry_context: Optional[Dict[str, str]] = None,
+        fallback_only: bool = False,
     ) -> Dict[str, Any]:
-        """Generate a name-based reading using the framework."""
+        """Generate a name-based reading using the framework.
+
+        ``fallback_only`` skips the AI call and uses the framework fallback text.
+        """
         from oracle_service.framework_bridge import generate_name_reading as fw_name
 
         start = time.perf_counter()
@@ -202,13 +340,16 @@ class ReadingOrchestrator:
         )
 
         # Build framework reading
-        reading_result = fw_name(user, name, locale=locale)
+        with span("framework_bridge", reading_type="name"):
+            reading_result = fw_name(user, name, locale=locale)
 
         fw = reading_result.framework_output
 
         # AI interpretation
         ai_text = None
-        if include_ai:
+        if include_ai and fallback_only:
+            ai_text = self._shed_ai_sections(fw, locale).get("full_text", "")
+        elif include_ai:
             ai_sections = self._call_ai_interpreter(
                 fw,
                 locale,
@@ -300,8 +441,12 @@ class ReadingOrchestrator:
         category: str | None = None,
         question_time: str | None = None,
         inquiry_context: Optional[Dict[str, str]] = None,
+        fallback_only: bool = False,
     ) -> Dict[str, Any]:
-        """Generate a question-based reading with question hashing."""
+        """Generate a question-based reading with question hashing.
+
+        ``fallback_only`` skips the AI call and uses the framework fallback text.
+        """
         from oracle_service.question_analyzer import question_number
         from oracle_service.framework_bridge import (
             generate_question_reading as fw_question,
@@ -325,13 +470,16 @@ class ReadingOrchestrator:
         )
 
         # Generate framework reading
-        reading_result = fw_question(user, question, locale=locale)
+        with span("framework_bridge", reading_type="question"):
+            reading_result = fw_question(user, question, locale=locale)
 
         fw = reading_result.framework_output
 
         # AI interpretation with question context
         ai_text = None
-        if include_ai:
+        if include_ai and fallback_only:
+            ai_text = self._shed_ai_sections(fw, locale).get("full_text", "")
+        elif include_ai:
             ai_sections = self._call_ai_interpreter(
                 fw,
                 locale,
@@ -423,22 +571,18 @@ class ReadingOrchestrator:
         Uses noon (12:00:00) as the reading time — neutral midday energy.
         Returns dict matching FrameworkReadingResponse fields + daily_insights.
         """
-        import asyncio
-
-        loop = asyncio.get_running_loop()
         total_steps = 4
         start = time.perf_counter()
 
         # Step 1: Generate framework reading via bridge (blocking — offload)
         await self._send_progress(1, total_steps, "Generating daily reading...", "daily")
-        reading_result = await loop.run_in_executor(
-            None, lambda: self._call_framework_daily(user_profile, target_date)
+        reading_result = await run_framework(
+            lambda: self._call_framework_daily(user_profile, target_date)
         )
 
         # Step 2: AI interpretation (blocking — offload)
         await self._send_progress(2, total_steps, "Interpreting today's energy...", "daily")
-        ai_sections = await loop.run_in_executor(
-            None,
+        ai_sections = await run_ai(
             lambda: self._call_ai_interpreter(
                 reading_result.framework_output,
                 locale,
@@ -466,7 +610,8 @@ class ReadingOrchestrator:
         """Invoke framework_bridge.generate_daily_reading()."""
         from oracle_service.framework_bridge import generate_daily_reading
 
-        return generate_daily_reading(user, target_date)
+        with span("framework_bridge", reading_type="daily"):
+            return generate_daily_reading(user, target_date)
 
     def _build_daily_response(
         self,
@@ -500,9 +645,6 @@ class ReadingOrchestrator:
         for pairwise compatibility + group analysis. Optionally invokes AI
         for group interpretation.
         """
-        import asyncio
-
-        loop = asyncio.get_running_loop()
         total_steps = 5
         start = time.perf_counter()
         n_users = len(user_profiles)
@@ -511,22 +653,19 @@ class ReadingOrchestrator:
         await self._send_progress(
             1, total_steps, f"Generating readings for {n_users} users...", "multi"
         )
-        individual_results = await loop.run_in_executor(
-            None, lambda: self._call_framework_multi(user_profiles, target_date)
+        individual_results = await run_framework(
+            lambda: self._call_framework_multi(user_profiles, target_date)
         )
 
         # Step 2: Run compatibility analysis (blocking — offload)
         await self._send_progress(2, total_steps, "Analyzing compatibility...", "multi")
-        multi_result = await loop.run_in_executor(
-            None, lambda: self._call_multi_analyzer(individual_results)
-        )
+        multi_result = await run_framework(lambda: self._call_multi_analyzer(individual_results))
 
         # Step 3: AI group interpretation (optional, blocking — offload)
         ai_sections = None
         if include_interpretation:
             await self._send_progress(3, total_steps, "Generating group interpretation...", "multi")
-            ai_sections = await loop.run_in_executor(
-                None,
+            ai_sections = await run_ai(
                 lambda: self._call_ai_group_interpreter(individual_results, multi_result, locale),
             )
         else:
@@ -564,7 +703,8 @@ class ReadingOrchestrator:
         """Invoke framework_bridge.generate_multi_user_reading()."""
         from oracle_service.framework_bridge import generate_multi_user_reading
 
-        return generate_multi_user_reading(users, target_date=target_date)
+        with span("framework_bridge", reading_type="multi"):
+            return generate_multi_user_reading(users, target_date=target_date)
 
     def _call_multi_analyzer(self, individual_results: list[ReadingResult]):
         """Invoke MultiUserAnalyzer.analyze_group() for compatibility scoring."""
@@ -0,0 +1,305 @@
+"""Tracing — lightweight per-request spans for the reading pipeline.
+
+End-to-end request timings do not say which pipeline stage dominates.
+This module adds nested timing spans that travel in a contextvar::
+
+    with start_trace("POST /api/oracle/readings") as trace:
+        ...
+        with span("framework.numerology", system="pythagorean"):
+            ...
+    trace.server_timing()   # "framework.numerology;dur=1.8, ..., total;dur=42.0"
+
+``span()`` is a no-op outside a trace: it does one contextvar lookup and
+returns a shared null context manager, so instrumented code costs nothing
+measurable when tracing is off (the API only opens traces with
+``TRACING_ENABLED``). Work offloaded through ``work_scheduler`` runs in a
+copy of the caller's context, so spans opened in pool threads attach to the
+request's trace.
+
+Finished traces go to the configured exporter (``set_exporter``):
+
+    JsonFileExporter   one OTLP/JSON ``ExportTraceServiceRequest`` per line
+    OtlpHttpExporter   POST to an OpenTelemetry collector (``/v1/traces``)
+                       from a background thread; drops traces when the
+                       queue is full rather than blocking requests
+
+``exporter_from_spec`` builds one from a setting such as
+``file:/var/log/nps/traces.jsonl`` or ``http://otel-collector:4318/v1/traces``.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "nps"
+SCOPE_NAME = "nps.tracing"
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "nps_trace_span", default=None
+)
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = (
+        "trace",
+        "name",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, trace: "Trace", name: str, parent_id: str, attributes: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns or time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class Trace:
+    """The spans of one request; ``root`` spans the whole request."""
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []  # finished spans, root last
+        self.root = Span(self, name, "", attributes)
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value: finished spans summed by name, plus total."""
+        totals: Dict[str, float] = {}
+        for s in self.spans:
+            if s is not self.root:
+                totals[s.name] = totals.get(s.name, 0.0) + s.duration_ms
+        parts = [f"{name};dur={ms:.1f}" for name, ms in totals.items()]
+        parts.append(f"total;dur={self.root.duration_ms:.1f}")
+        return ", ".join(parts)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON ``ExportTraceServiceRequest`` for this trace."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes({"service.name": SERVICE_NAME})},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": SCOPE_NAME},
+                            "spans": [self._otlp_span(s) for s in self.spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _otlp_span(self, s: Span) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 2 if s is self.root else 1,  # SERVER / INTERNAL
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": _otlp_attributes(s.attributes),
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+        }
+        if s.parent_id:
+            data["parentSpanId"] = s.parent_id
+        return data
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        result.append({"key": key, "value": typed})
+    return result
+
+
+class _NoopSpan:
+    """Shared context manager returned by ``span()`` outside a trace."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _SpanScope:
+    __slots__ = ("_parent", "_name", "_attributes", "_span", "_token")
+
+    def __init__(self, parent: Span, name: str, attributes: Dict[str, Any]):
+        self._parent = parent
+        self._name = name
+        self._attributes = attributes
+
+    def __enter__(self) -> Span:
+        parent = self._parent
+        self._span = Span(parent.trace, self._name, parent.span_id, self._attributes)
+        self._token = _current.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        s = self._span
+        s.end_ns = time.time_ns()
+        if exc_type is not None:
+            s.error = exc_type.__name__
+        _current.reset(self._token)
+        s.trace.spans.append(s)
+        return False
+
+
+def span(name: str, **attributes: Any):
+    """Time the enclosed block as a child of the current span (no-op without a trace)."""
+    parent = _current.get()
+    if parent is None:
+        return _NOOP
+    return _SpanScope(parent, name, attributes)
+
+
+def current_trace() -> Optional[Trace]:
+    s = _current.get()
+    return s.trace if s is not None else None
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Trace]:
+    """Open a trace for the enclosed block and export it when the block ends."""
+    trace = Trace(name, attributes)
+    token = _current.set(trace.root)
+    try:
+        yield trace
+    except BaseException as exc:
+        trace.root.error = type(exc).__name__
+        raise
+    finally:
+        _current.reset(token)
+        trace.root.end_ns = time.time_ns()
+        trace.spans.append(trace.root)
+        exporter = _exporter
+        if exporter is not None:
+            try:
+                exporter.export(trace)
+            except Exception as exc:
+                logger.debug("Trace export failed: %s", exc)
+
+
+# ─── Exporters ───────────────────────────────────────────────────────────────
+
+
+class JsonFileExporter:
+    """Append each trace as one line of OTLP/JSON."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(trace.to_otlp(), separators=(",", ":")) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def shutdown(self) -> None:
+        pass
+
+
+class OtlpHttpExporter:
+    """POST traces to an OTLP/HTTP JSON endpoint from a background thread."""
+
+    def __init__(self, endpoint: str, max_queue: int = 1024, timeout: float = 2.0):
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Trace]]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="nps-trace-export", daemon=True)
+        self._thread.start()
+
+    def export(self, trace: Trace) -> None:
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=self.timeout * 2)
+
+    def _post(self, payload: bytes) -> None:
+        request = urllib.request.Request(
+            self.endpoint,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def _run(self) -> None:
+        while True:
+            trace = self._queue.get()
+            if trace is None:
+                return
+            try:
+                self._post(json.dumps(trace.to_otlp(), separators=(",", ":")).encode())
+            except Exception as exc:
+                logger.debug("OTLP export to %s failed: %s", self.endpoint, exc)
+
+
+def exporter_from_spec(spec: str):
+    """Exporter for ``file:<path>`` or an ``http(s)://`` collector URL; None if empty."""
+    if not spec:
+        return None
+    if spec.startswith(("http://", "https://")):
+        return OtlpHttpExporter(spec)
+    return JsonFileExporter(spec[len("file:") :] if spec.startswith("file:") else spec)
+
+
+_exporter = None
+
+
+def set_exporter(exporter) -> None:
+    """Install the exporter for finished traces (None to stop exporting)."""
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.shutdown()
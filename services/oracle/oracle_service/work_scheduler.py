@@ -0,0 +1,357 @@
+"""Work Scheduler — priority-aware dispatch of blocking reading work.
+
+Interactive readings (web UI), Telegram bot requests and batch jobs
+(DailyScheduler, learning recalculation) all offload blocking framework and
+AI calls to threads. With a single shared default executor a nightly batch
+run fills every worker and interactive p99 suffers. This module puts a small
+scheduler in front of two dedicated pools — ``framework`` and ``ai`` — and
+dispatches queued work by priority class:
+
+    interactive  web UI / direct API calls (default)
+    bot          Telegram bot requests
+    batch        DailyScheduler, learning recalculation, other bulk work
+
+Each pool uses self-clocked weighted fair queuing (SCFQ): a job is tagged
+``max(virtual_time, last_tag[class]) + 1 / weight[class]`` and the lowest tag
+among classes that are under their concurrency cap runs next. Classes never
+starve, but under contention they share the pool in proportion to their
+weights, and a per-class cap keeps batch work from occupying every slot.
+
+The priority class travels in a contextvar, so callers set it once at the
+edge (request middleware, scheduler loop) with ``priority("batch")`` and every
+``run_framework`` / ``run_ai`` call underneath inherits it.
+
+Configuration via environment variables:
+    NPS_SCHED_FRAMEWORK_WORKERS=8        framework pool size
+    NPS_SCHED_AI_WORKERS=8               AI pool size
+    NPS_SCHED_WEIGHTS=interactive=8,bot=4,batch=1
+    NPS_SCHED_CAPS=batch=2               per-class running cap (per pool)
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+INTERACTIVE = "interactive"
+BOT = "bot"
+BATCH = "batch"
+PRIORITY_CLASSES = (INTERACTIVE, BOT, BATCH)
+
+DEFAULT_WEIGHTS = {INTERACTIVE: 8.0, BOT: 4.0, BATCH: 1.0}
+DEFAULT_CAPS = {BATCH: 2}
+
+_WAIT_SAMPLES = 1024  # recent queue-wait samples kept per class for percentiles
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "nps_priority_class", default=INTERACTIVE
+)
+
+
+def current_priority() -> str:
+    """Priority class of the current context (``interactive`` if unset)."""
+    return _priority.get()
+
+
+def normalize_priority(value: Optional[str], default: str = INTERACTIVE) -> str:
+    """Map a user-supplied class name to a known class, else ``default``."""
+    value = (value or "").strip().lower()
+    return value if value in PRIORITY_CLASSES else default
+
+
+@contextmanager
+def priority(cls: str) -> Iterator[None]:
+    """Run the enclosed block (and tasks it spawns) under priority ``cls``."""
+    token = _priority.set(normalize_priority(cls))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _parse_class_map(raw: Optional[str], cast: Callable[[str], Any]) -> dict:
+    """Parse ``"interactive=8,batch=1"`` into a dict, ignoring bad entries."""
+    result: dict = {}
+    for part in (raw or "").split(","):
+        name, sep, value = part.partition("=")
+        name = name.strip().lower()
+        if not sep or name not in PRIORITY_CLASSES:
+            continue
+        try:
+            result[name] = cast(value.strip())
+        except ValueError:
+            logger.warning("Ignoring invalid scheduler setting %r", part)
+    return result
+
+
+class _WaitStats:
+    """Queue-wait accounting for one priority class."""
+
+    __slots__ = (
+        "submitted",
+        "completed",
+        "cancelled",
+        "running",
+        "queued",
+        "total_ms",
+        "max_ms",
+        "samples",
+    )
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.running = 0
+        self.queued = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples: deque[float] = deque(maxlen=_WAIT_SAMPLES)
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.total_ms += wait_ms
+        self.max_ms = max(self.max_ms, wait_ms)
+        self.samples.append(wait_ms)
+
+    def to_dict(self) -> dict:
+        ordered = sorted(self.samples)
+        dispatched = self.submitted - self.queued - self.cancelled
+
+        def pct(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 2)
+
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "running": self.running,
+            "queued": self.queued,
+            "wait_ms_avg": round(self.total_ms / dispatched, 2) if dispatched else 0.0,
+            "wait_ms_p50": pct(0.50),
+            "wait_ms_p99": pct(0.99),
+            "wait_ms_max": round(self.max_ms, 2),
+        }
+
+
+class _Job:
+    __slots__ = ("fn", "future", "loop", "ctx", "enqueued", "tag")
+
+    def __init__(self, fn, future, loop, ctx, tag: float) -> None:
+        self.fn = fn
+        self.future = future
+        self.loop = loop
+        self.ctx = ctx
+        self.enqueued = time.perf_counter()
+        self.tag = tag
+
+
+class WorkPool:
+    """One thread pool with weighted fair queuing across priority classes."""
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        weights: Optional[dict] = None,
+        caps: Optional[dict] = None,
+    ) -> None:
+        self.name = name
+        self.workers = max(1, workers)
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.caps = {cls: min(self.workers, max(1, cap)) for cls, cap in (caps or {}).items()}
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._queues: dict[str, deque[_Job]] = {cls: deque() for cls in PRIORITY_CLASSES}
+        self._last_tag = dict.fromkeys(PRIORITY_CLASSES, 0.0)
+        self._virtual_time = 0.0
+        self._running = 0
+        self._stats = {cls: _WaitStats() for cls in PRIORITY_CLASSES}
+
+    async def run(self, fn: Callable[[], T], cls: Optional[str] = None) -> T:
+        """Queue ``fn`` under ``cls`` (default: context class) and await its result."""
+        cls = normalize_priority(cls or current_priority())
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            tag = max(self._virtual_time, self._last_tag[cls]) + 1.0 / self.weights[cls]
+            self._last_tag[cls] = tag
+            self._queues[cls].append(_Job(fn, future, loop, contextvars.copy_context(), tag))
+            self._stats[cls].submitted += 1
+            self._stats[cls].queued += 1
+        self._dispatch()
+        return await future
+
+    def _next_job(self) -> Optional[tuple[str, _Job]]:
+        """Pop the lowest-tag job among classes under their cap (lock held)."""
+        candidates = []
+        for cls, queue in self._queues.items():
+            while queue and queue[0].future.cancelled():
+                queue.popleft()
+                self._stats[cls].queued -= 1
+                self._stats[cls].cancelled += 1
+            if not queue:
+                continue
+            cap = self.caps.get(cls)
+            if cap is not None and self._stats[cls].running >= cap:
+                continue
+            candidates.append((queue[0].tag, PRIORITY_CLASSES.index(cls), cls))
+        if not candidates:
+            return None
+        _, _, cls = min(candidates)
+        return cls, self._queues[cls].popleft()
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._lock:
+                if self._running >= self.workers:
+                    return
+                picked = self._next_job()
+                if picked is None:
+                    return
+                cls, job = picked
+                stats = self._stats[cls]
+                stats.queued -= 1
+                stats.running += 1
+                stats.record_wait((time.perf_counter() - job.enqueued) * 1000)
+                self._running += 1
+                self._virtual_time = job.tag
+            self._executor.submit(self._execute, cls, job)
+
+    def _execute(self, cls: str, job: _Job) -> None:
+        try:
+            result, error = job.ctx.run(job.fn), None
+        except BaseException as exc:  # delivered to the awaiting coroutine
+            result, error = None, exc
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._stats[cls].running -= 1
+                self._stats[cls].completed += 1
+        self._dispatch()
+        try:
+            job.loop.call_soon_threadsafe(self._resolve, job.future, result, error)
+        except RuntimeError:  # loop closed while the job ran
+            pass
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Any, error: Optional[BaseException]) -> None:
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running": self._running,
+                "classes": {cls: s.to_dict() for cls, s in self._stats.items()},
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class WorkScheduler:
+    """The ``framework`` and ``ai`` pools plus their shared configuration."""
+
+    def __init__(
+        self,
+        framework_workers: int = 8,
+        ai_workers: int = 8,
+        weights: Optional[dict] = None,
+        caps: Optional[dict] = None,
+    ) -> None:
+        caps = DEFAULT_CAPS if caps is None else caps
+        self.framework = WorkPool("nps-framework", framework_workers, weights, caps)
+        self.ai = WorkPool("nps-ai", ai_workers, weights, caps)
+
+    @classmethod
+    def from_env(cls) -> "WorkScheduler":
+        return cls(
+            framework_workers=int(os.environ.get("NPS_SCHED_FRAMEWORK_WORKERS", "8")),
+            ai_workers=int(os.environ.get("NPS_SCHED_AI_WORKERS", "8")),
+            weights=_parse_class_map(os.environ.get("NPS_SCHED_WEIGHTS"), float),
+            caps=(
+                _parse_class_map(os.environ["NPS_SCHED_CAPS"], int)
+                if "NPS_SCHED_CAPS" in os.environ
+                else None
+            ),
+        )
+
+    def stats(self) -> dict:
+        """Per-pool, per-class queue depth, concurrency and queue-wait metrics."""
+        return {"framework": self.framework.stats(), "ai": self.ai.stats()}
+
+    def shutdown(self) -> None:
+        self.framework.shutdown()
+        self.ai.shutdown()
+
+
+_scheduler: Optional[WorkScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_work_scheduler() -> WorkScheduler:
+    """Process-wide scheduler, built from the environment on first use."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = WorkScheduler.from_env()
+                logger.info(
+                    "Work scheduler ready (framework=%d, ai=%d workers)",
+                    _scheduler.framework.workers,
+                    _scheduler.ai.workers,
+                )
+    return _scheduler
+
+
+def reset_work_scheduler() -> None:
+    """Drop the process-wide scheduler (tests / config reload)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.shutdown()
+        _scheduler = None
+
+
+async def run_framework(fn: Callable[[], T], cls: Optional[str] = None) -> T:
+    """Run blocking framework work on the scheduled framework pool."""
+    return await get_work_scheduler().framework.run(fn, cls)
+
+
+async def run_ai(fn: Callable[[], T], cls: Optional[str] = None) -> T:
+    """Run blocking AI work on the scheduled AI pool."""
+    return await get_work_scheduler().ai.run(fn, cls)
+
+
+__all__ = [
+    "BATCH",
+    "BOT",
+    "INTERACTIVE",
+    "PRIORITY_CLASSES",
+    "WorkPool",
+    "WorkScheduler",
+    "current_priority",
+    "get_work_scheduler",
+    "normalize_priority",
+    "priority",
+    "reset_work_scheduler",
+    "run_ai",
+    "run_framework",
+]
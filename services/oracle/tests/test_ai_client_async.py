@@ -0,0 +1,318 @@
+"""
+Tests for the async AI client
+==============================
+Runs AsyncAIClient against a local stub Messages API server (stdlib
+http.server on 127.0.0.1) that simulates latency and 429/503 responses.
+No real API calls.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+from engines import ai_client
+from engines.ai_client_async import AsyncAIClient, TokenBucket, generate_async
+
+
+def _run(coro):
+    """Run a coroutine on a private loop (leaves the global loop policy alone)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class _StubState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.script: list[tuple[int, dict]] = []  # queued (status, headers)
+        self.latency = 0.0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.bodies: list[dict] = []
+
+
+def _make_handler(state: _StubState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):  # silence
+            pass
+
+        def do_POST(self):
+            length = int(self.headers.get("content-length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            with state.lock:
+                state.requests += 1
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+                state.bodies.append(body)
+                status, headers = state.script.pop(0) if state.script else (200, {})
+            try:
+                time.sleep(state.latency)
+                if status == 200:
+                    prompt = body["messages"][0]["content"]
+                    payload = json.dumps(
+                        {"content": [{"type": "text", "text": f"echo: {prompt}"}]}
+                    ).encode()
+                else:
+                    payload = json.dumps({"error": {"type": "rate_limit_error"}}).encode()
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+    return Handler
+
+
+class _StubServerCase(unittest.TestCase):
+    def setUp(self):
+        ai_client.clear_cache()
+        self.state = _StubState()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self.state))
+        self.server.daemon_threads = True
+        self.server.block_on_close = False
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        ai_client.clear_cache()
+
+    def _client(self, **kwargs) -> AsyncAIClient:
+        kwargs.setdefault("max_concurrency", 4)
+        kwargs.setdefault("rate_per_sec", 100.0)
+        kwargs.setdefault("max_retries", 2)
+        kwargs.setdefault("backoff_base", 0.01)
+        return AsyncAIClient(api_key="test-key", base_url=self.base_url, **kwargs)
+
+
+class TestAsyncClientBasics(_StubServerCase):
+    def test_success_and_pooled_connection_reuse(self):
+        async def run():
+            client = self._client()
+            try:
+                r1 = await client.generate("hello", use_cache=False)
+                http = client._http
+                r2 = await client.generate("again", use_cache=False)
+                self.assertIs(client._http, http)
+                return r1, r2
+            finally:
+                await client.aclose()
+
+        r1, r2 = _run(run())
+        self.assertTrue(r1["success"])
+        self.assertEqual(r1["response"], "echo: hello")
+        self.assertFalse(r1["retried"])
+        self.assertEqual(r2["response"], "echo: again")
+
+    def test_cache_shared_with_sync_client(self):
+        async def run():
+            client = self._client()
+            try:
+                first = await client.generate("cached prompt", system_prompt="sys")
+                second = await client.generate("cached prompt", system_prompt="sys")
+                return first, second
+            finally:
+                await client.aclose()
+
+        first, second = _run(run())
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(self.state.requests, 1)
+        key = ai_client._cache_key("cached prompt", "sys")
+        self.assertEqual(ai_client._read_cache(key), "echo: cached prompt")
+
+
+class TestAsyncClientRetry(_StubServerCase):
+    def test_429_with_retry_after_then_success(self):
+        self.state.script = [(429, {"retry-after": "0.05"})]
+
+        async def run():
+            client = self._client()
+            try:
+                return await client.generate("retry me", use_cache=False)
+            finally:
+                await client.aclose()
+
+        result = _run(run())
+        self.assertTrue(result["success"])
+        self.assertTrue(result["retried"])
+        self.assertEqual(self.state.requests, 2)
+
+    def test_retries_exhausted(self):
+        self.state.script = [(503, {})] * 3
+
+        async def run():
+            client = self._client(max_retries=2)
+            try:
+                return await client.generate("always down", use_cache=False)
+            finally:
+                await client.aclose()
+
+        result = _run(run())
+        self.assertFalse(result["success"])
+        self.assertTrue(result["retried"])
+        self.assertIn("503", result["error"])
+        self.assertEqual(self.state.requests, 3)
+
+    def test_non_retryable_error_not_retried(self):
+        self.state.script = [(400, {})]
+
+        async def run():
+            client = self._client()
+            try:
+                return await client.generate("bad", use_cache=False)
+            finally:
+                await client.aclose()
+
+        result = _run(run())
+        self.assertFalse(result["success"])
+        self.assertFalse(result["retried"])
+        self.assertEqual(self.state.requests, 1)
+        self.assertNotIn("test-key", result["error"])
+
+    def test_backoff_is_jittered_and_capped(self):
+        client = AsyncAIClient(api_key="k", backoff_base=1.0, backoff_max=4.0)
+        delays = [client._backoff(5, None) for _ in range(50)]
+        self.assertTrue(all(0 <= d <= 4.0 for d in delays))
+        self.assertGreater(len(set(delays)), 1)
+        self.assertEqual(client._backoff(0, 3.0), 3.0)
+
+
+class TestAsyncClientConcurrency(_StubServerCase):
+    def test_concurrency_cap_and_parallelism(self):
+        self.state.latency = 0.2
+
+        async def run():
+            client = self._client(max_concurrency=3)
+            try:
+                start = time.monotonic()
+                results = await asyncio.gather(
+                    *(client.generate(f"p{i}", use_cache=False) for i in range(9))
+                )
+                return results, time.monotonic() - start
+            finally:
+                await client.aclose()
+
+        results, elapsed = _run(run())
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertLessEqual(self.state.max_in_flight, 3)
+        self.assertGreaterEqual(self.state.max_in_flight, 2)
+        # 9 requests, 3 at a time, 0.2s each ≈ 0.6s — far below 9 x 1s serial
+        self.assertLess(elapsed, 3.0)
+
+    def test_timeout_cancels_request(self):
+        self.state.latency = 2.0
+
+        async def run():
+            client = self._client()
+            try:
+                return await client.generate("slow", use_cache=False, timeout=0.3)
+            finally:
+                await client.aclose()
+
+        start = time.monotonic()
+        result = _run(run())
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertFalse(result["success"])
+        self.assertIn("timed out", result["error"])
+
+    def test_response_slower_than_httpx_default_timeout(self):
+        self.state.latency = 5.5  # past httpx's 5 s default read timeout
+
+        async def run():
+            client = self._client(max_retries=0)
+            try:
+                return await client.generate("slow but fine", use_cache=False, timeout=15)
+            finally:
+                await client.aclose()
+
+        result = _run(run())
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(result["response"], "echo: slow but fine")
+        self.assertEqual(self.state.requests, 1)
+
+    def test_caller_cancellation_propagates(self):
+        self.state.latency = 2.0
+
+        async def run():
+            client = self._client()
+            try:
+                task = asyncio.create_task(client.generate("cancel me", use_cache=False))
+                await asyncio.sleep(0.1)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+                return client.in_flight
+            finally:
+                await client.aclose()
+
+        self.assertEqual(_run(run()), 0)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_refill_rate(self):
+        async def run():
+            bucket = TokenBucket(rate=20.0, capacity=2)
+            start = time.monotonic()
+            for _ in range(6):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        elapsed = _run(run())
+        # 2 burst tokens free, 4 more at 20/s ≈ 0.2s
+        self.assertGreaterEqual(elapsed, 0.15)
+        self.assertLess(elapsed, 1.0)
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+
+class TestGenerateAsync(_StubServerCase):
+    def test_unavailable_short_circuits(self):
+        with patch("engines.ai_client.is_available", return_value=False):
+            result = _run(generate_async("x"))
+        self.assertFalse(result["success"])
+        self.assertEqual(self.state.requests, 0)
+
+    def test_interpret_reading_async_uses_stub(self):
+        from engines.ai_interpreter import interpret_reading_async
+
+        reading = {"confidence": {"score": 70}, "synthesis": "fallback text"}
+        with (
+            patch("engines.ai_interpreter.is_available", return_value=True),
+            patch("engines.ai_client.is_available", return_value=True),
+            patch.dict(
+                "os.environ", {"ANTHROPIC_BASE_URL": self.base_url, "ANTHROPIC_API_KEY": "k"}
+            ),
+            patch("engines.ai_interpreter.build_reading_prompt", return_value="READING FOR Bob"),
+        ):
+            result = _run(interpret_reading_async(reading, reading_type="time"))
+        self.assertTrue(result.ai_generated)
+        self.assertEqual(result.confidence_score, 70)
+        self.assertIn("echo: READING FOR Bob", result.full_text)
+
+
+if __name__ == "__main__":
+    unittest.main()
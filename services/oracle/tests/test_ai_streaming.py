@@ -0,0 +1,256 @@
+"""
+Tests for progressive AI section streaming
+===========================================
+A local fake model (stdlib http.server on 127.0.0.1) speaks the Messages
+API SSE protocol and streams a canned reading a few characters at a time
+with a per-token delay, so time-to-first-section can be measured against
+total generation time. No real API calls.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+from engines import ai_client
+from engines.ai_client_async import AsyncAIClient
+from engines.ai_interpreter import (
+    SECTIONS_RESET,
+    SectionStream,
+    _parse_sections,
+    interpret_reading_stream,
+)
+
+_READING = (
+    "READING FOR Alice\n"
+    "---\n"
+    "UNIVERSAL ADDRESS\n"
+    "FC60 stamp VE-OX-OXFI marks this moment.\n"
+    "CORE IDENTITY\n"
+    "Life path 7: the seeker.\n"
+    "RIGHT NOW\n"
+    "A waxing moon builds momentum.\n"
+    "THE MESSAGE\n"
+    "Trust the repetition you keep noticing.\n"
+    "TODAY'S ADVICE\n"
+    "Write it down.\n"
+    "CAUTION\n"
+    "Don't force it.\n"
+    "Confidence: 80%\n"
+)
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _make_handler(text: str, token_size: int, token_delay: float, fail_status: list[int]):
+    class FakeModel(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _event(self, payload: dict) -> None:
+            data = f"event: {payload['type']}\ndata: {json.dumps(payload)}\n\n".encode()
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))))
+            if fail_status:
+                status = fail_status.pop(0)
+                self.send_response(status)
+                self.send_header("content-length", "0")
+                self.end_headers()
+                return
+            assert body.get("stream") is True
+            self.send_response(200)
+            self.send_header("content-type", "text/event-stream")
+            self.send_header("transfer-encoding", "chunked")
+            self.end_headers()
+            try:
+                self._event({"type": "message_start", "message": {}})
+                for i in range(0, len(text), token_size):
+                    time.sleep(token_delay)
+                    self._event(
+                        {
+                            "type": "content_block_delta",
+                            "index": 0,
+                            "delta": {"type": "text_delta", "text": text[i : i + token_size]},
+                        }
+                    )
+                self._event({"type": "message_stop"})
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return FakeModel
+
+
+class _FakeModelCase(unittest.TestCase):
+    token_size = 8
+    token_delay = 0.002
+
+    def setUp(self):
+        ai_client.clear_cache()
+        self.fail_status: list[int] = []
+        handler = _make_handler(_READING, self.token_size, self.token_delay, self.fail_status)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        self.server.block_on_close = False
+        threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        ai_client.clear_cache()
+
+
+class TestSectionStream(unittest.TestCase):
+    def test_sections_emitted_once_next_header_arrives(self):
+        splitter = SectionStream("en")
+        self.assertEqual(splitter.feed("READING FOR Alice\n---\nUNIV"), [])
+        emitted = splitter.feed("ERSAL ADDRESS\nFC60 ...\nCORE IDENTITY\n")
+        self.assertEqual([k for k, _ in emitted], ["header", "universal_address"])
+        self.assertEqual(emitted[0][1], "Alice")
+
+    def test_char_by_char_matches_batch_parse(self):
+        splitter = SectionStream("en")
+        streamed = []
+        for ch in _READING:
+            streamed.extend(splitter.feed(ch))
+        streamed.extend(splitter.finish())
+        parsed = _parse_sections(_READING, "en")
+        self.assertEqual(dict(streamed), {k: v for k, v in parsed.items() if k in dict(streamed)})
+        self.assertEqual(len(streamed), len({k for k, v in parsed.items() if v}))
+
+    def test_unstructured_text_goes_to_message(self):
+        splitter = SectionStream("en")
+        self.assertEqual(splitter.feed("just some text\nmore"), [])
+        self.assertEqual(splitter.finish(), [("message", "just some text\nmore")])
+
+
+class TestStreamingClient(_FakeModelCase):
+    def test_deltas_arrive_incrementally(self):
+        deltas: list[str] = []
+
+        async def on_text(delta):
+            deltas.append(delta)
+
+        async def run():
+            client = AsyncAIClient(api_key="k", base_url=self.base_url, rate_per_sec=100.0)
+            try:
+                return await client.generate_stream("p", on_text=on_text, use_cache=False)
+            finally:
+                await client.aclose()
+
+        result = _run(run())
+        self.assertTrue(result["success"])
+        self.assertEqual(result["response"], _READING)
+        self.assertGreater(len(deltas), 10)
+        self.assertEqual("".join(deltas), _READING)
+
+    def test_retry_before_first_token(self):
+        self.fail_status.append(529)
+
+        async def run():
+            client = AsyncAIClient(
+                api_key="k", base_url=self.base_url, rate_per_sec=100.0, backoff_base=0.01
+            )
+            try:
+                return await client.generate_stream("p", use_cache=False)
+            finally:
+                await client.aclose()
+
+        result = _run(run())
+        self.assertTrue(result["success"])
+        self.assertTrue(result["retried"])
+
+
+class TestInterpretReadingStream(_FakeModelCase):
+    token_delay = 0.01
+
+    def test_first_section_long_before_completion(self):
+        events: list[tuple[float, str]] = []
+
+        async def on_section(key, text):
+            events.append((time.monotonic(), key))
+
+        with (
+            patch("engines.ai_interpreter.is_available", return_value=True),
+            patch("engines.ai_client.is_available", return_value=True),
+            patch.dict(
+                "os.environ", {"ANTHROPIC_BASE_URL": self.base_url, "ANTHROPIC_API_KEY": "k"}
+            ),
+            patch("engines.ai_interpreter.build_reading_prompt", return_value="prompt"),
+        ):
+            start = time.monotonic()
+            result = _run(
+                interpret_reading_stream({"confidence": {"score": 80}}, on_section, "time")
+            )
+            total = time.monotonic() - start
+
+        self.assertTrue(result.ai_generated)
+        self.assertEqual(result.core_identity, "Life path 7: the seeker.")
+        keys = [k for _, k in events]
+        self.assertEqual(keys[:3], ["header", "universal_address", "core_identity"])
+        self.assertEqual(len(keys), len(set(keys)))
+        first_section = events[0][0] - start
+        self.assertLess(first_section, total / 2)
+
+    def test_fallback_still_delivers_sections(self):
+        sections: list[str] = []
+
+        async def on_section(key, text):
+            sections.append(key)
+
+        with patch("engines.ai_interpreter.is_available", return_value=False):
+            result = _run(
+                interpret_reading_stream({"synthesis": "Framework text."}, on_section, "time")
+            )
+        self.assertFalse(result.ai_generated)
+        self.assertIn("message", sections)
+
+    def test_failure_mid_stream_resets_before_fallback(self):
+        received: list[tuple[str, str]] = []
+
+        async def on_section(key, text):
+            received.append((key, text))
+
+        async def broken_stream(on_text, **kwargs):
+            await on_text(_READING[: _READING.index("RIGHT NOW")])
+            return {"success": False, "error": "connection dropped"}
+
+        reading = {"translation": {"header": "Framework header", "message": "Framework message"}}
+        with (
+            patch("engines.ai_interpreter.is_available", return_value=True),
+            patch("engines.ai_interpreter.build_reading_prompt", return_value="prompt"),
+            patch("engines.ai_client_async.generate_reading_stream_async", broken_stream),
+        ):
+            result = _run(interpret_reading_stream(reading, on_section, "time", use_cache=False))
+
+        self.assertFalse(result.ai_generated)
+        keys = [k for k, _ in received]
+        reset = keys.index(SECTIONS_RESET)
+        self.assertEqual(keys[:reset], ["header", "universal_address"])
+        # Everything after the reset is exactly the stored fallback
+        self.assertEqual(
+            received[reset + 1 :],
+            [("header", "Framework header"), ("message", "Framework message")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""Tests for CompatibilityMatrix — vectorized group scoring.
+
+Covers: parity with MultiUserAnalyzer.calculate_pairwise, unknown values,
+top-k selection, harmony, and large-group analyze_group output.
+"""
+
+import itertools
+import random
+import time
+import unittest
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from oracle_service.compatibility_matrix import ANIMALS, ELEMENTS, LIFE_PATHS, CompatibilityMatrix
+from oracle_service.models.reading_types import ReadingResult, ReadingType
+from oracle_service.multi_user_analyzer import MultiUserAnalyzer
+
+_PATTERNS = [
+    {"type": "number_repeat", "number": 7},
+    {"type": "number_repeat", "number": 3},
+    {"type": "animal_repeat", "animal": "Rat"},
+    {"type": "animal_repeat", "animal": "Horse"},
+    {"type": "master_number", "number": 11},
+]
+
+
+def _random_reading(rng: random.Random, user_id: int) -> ReadingResult:
+    return ReadingResult(
+        reading_type=ReadingType.TIME,
+        user_id=user_id,
+        framework_output={
+            "numerology": {"life_path": {"number": rng.choice(LIFE_PATHS)}},
+            "ganzhi": {
+                "year": {"element": rng.choice(ELEMENTS), "animal_name": rng.choice(ANIMALS)}
+            },
+            "moon": {"phase_name": rng.choice(MultiUserAnalyzer.PHASE_ORDER)},
+            "patterns": {"detected": rng.sample(_PATTERNS, rng.randint(0, 3))},
+        },
+    )
+
+
+def _group(n: int, seed: int = 7) -> list[ReadingResult]:
+    rng = random.Random(seed)
+    return [_random_reading(rng, i) for i in range(1, n + 1)]
+
+
+class TestMatrixParity(unittest.TestCase):
+    """Matrix scores are identical to the scalar pairwise path."""
+
+    def test_every_pair_matches_calculate_pairwise(self):
+        readings = _group(40)
+        matrix = CompatibilityMatrix.from_readings(readings)
+        pairs = matrix.all_pairs()
+
+        expected = [
+            MultiUserAnalyzer.calculate_pairwise(a, b)
+            for a, b in itertools.combinations(readings, 2)
+        ]
+        self.assertEqual(len(pairs), len(expected))
+        for got, want in zip(pairs, expected):
+            self.assertEqual(got, want)
+
+    def test_unknown_values_extend_tables(self):
+        readings = _group(3)
+        readings[0].framework_output["ganzhi"]["year"]["element"] = "Aether"
+        readings[1].framework_output["numerology"]["life_path"]["number"] = 44
+        readings[2].framework_output["moon"] = {}
+
+        pairs = CompatibilityMatrix.from_readings(readings).all_pairs()
+        expected = [
+            MultiUserAnalyzer.calculate_pairwise(a, b)
+            for a, b in itertools.combinations(readings, 2)
+        ]
+        self.assertEqual(pairs, expected)
+
+    def test_harmony_matches_scalar_average(self):
+        readings = _group(25)
+        matrix = CompatibilityMatrix.from_readings(readings)
+        scalar = [
+            MultiUserAnalyzer.calculate_pairwise(a, b).overall_score
+            for a, b in itertools.combinations(readings, 2)
+        ]
+        self.assertAlmostEqual(matrix.harmony(), sum(scalar) / len(scalar), places=9)
+
+    def test_single_user_has_no_pairs(self):
+        matrix = CompatibilityMatrix.from_readings(_group(1))
+        self.assertEqual(matrix.harmony(), 0.0)
+        self.assertEqual(matrix.top_pairs(5), [])
+
+
+class TestTopPairs(unittest.TestCase):
+    """Top-k selection over the upper triangle."""
+
+    def setUp(self):
+        self.readings = _group(60)
+        self.matrix = CompatibilityMatrix.from_readings(self.readings)
+        self.all_scores = sorted(p.overall_score for p in self.matrix.all_pairs())
+
+    def test_strongest_pairs_sorted_best_first(self):
+        top = self.matrix.top_pairs(15)
+        scores = [p.overall_score for p in top]
+        self.assertEqual(len(top), 15)
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(scores, self.all_scores[::-1][:15])
+
+    def test_challenging_pairs_sorted_worst_first(self):
+        bottom = self.matrix.top_pairs(15, strongest=False)
+        self.assertEqual([p.overall_score for p in bottom], self.all_scores[:15])
+
+    def test_k_larger_than_pair_count(self):
+        matrix = CompatibilityMatrix.from_readings(_group(4))
+        self.assertEqual(len(matrix.top_pairs(100)), 6)
+
+
+class TestLargeGroupAnalysis(unittest.TestCase):
+    """analyze_group on groups beyond the full-pairwise limit."""
+
+    def test_small_group_lists_every_pair(self):
+        result = MultiUserAnalyzer.analyze_group(_group(MultiUserAnalyzer.FULL_PAIRWISE_MAX))
+        n = MultiUserAnalyzer.FULL_PAIRWISE_MAX
+        self.assertEqual(len(result.pairwise_compatibility), n * (n - 1) // 2)
+
+    def test_large_group_lists_top_k_only(self):
+        result = MultiUserAnalyzer.analyze_group(_group(50), top_k=5)
+        pairs = result.pairwise_compatibility
+        self.assertEqual(len(pairs), 10)
+        self.assertGreaterEqual(pairs[4].overall_score, pairs[5].overall_score)
+        self.assertEqual(sum(result.group_element_balance.values()), 50)
+
+    def test_large_group_is_fast(self):
+        readings = _group(500)
+        start = time.perf_counter()
+        result = MultiUserAnalyzer.analyze_group(readings)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(result.pairwise_compatibility), 2 * MultiUserAnalyzer.TOP_PAIRS)
+        # 124,750 pairs; the scalar path takes several seconds
+        self.assertLess(elapsed, 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
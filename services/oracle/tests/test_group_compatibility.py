@@ -0,0 +1,175 @@
+"""Tests for GroupState — incremental group compatibility.
+
+Covers: join/leave parity with a full recompute, running totals,
+persistence round-trips (JSON and pair rows), top pairs, and member reading helper.
+"""
+
+import json
+import random
+import unittest
+from datetime import datetime
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from oracle_service.compatibility_matrix import ANIMALS, ELEMENTS, LIFE_PATHS, compact_comparison
+from oracle_service.group_compatibility import (
+    GroupState,
+    group_harmony,
+    member_comparison,
+    score_newcomer,
+)
+from oracle_service.models.reading_types import ReadingResult, ReadingType, UserProfile
+from oracle_service.multi_user_analyzer import MultiUserAnalyzer
+
+_PATTERNS = [
+    {"type": "number_repeat", "number": 7},
+    {"type": "number_repeat", "number": 3},
+    {"type": "animal_repeat", "animal": "Rat"},
+    {"type": "master_number", "number": 11},
+]
+
+
+def _group(n: int, seed: int = 11) -> list[ReadingResult]:
+    rng = random.Random(seed)
+    return [
+        ReadingResult(
+            reading_type=ReadingType.TIME,
+            user_id=i,
+            framework_output={
+                "numerology": {"life_path": {"number": rng.choice(LIFE_PATHS)}},
+                "ganzhi": {
+                    "year": {"element": rng.choice(ELEMENTS), "animal_name": rng.choice(ANIMALS)}
+                },
+                "moon": {"phase_name": rng.choice(MultiUserAnalyzer.PHASE_ORDER)},
+                "patterns": {"detected": rng.sample(_PATTERNS, rng.randint(0, 3))},
+            },
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _built_incrementally(readings: list[ReadingResult]) -> GroupState:
+    state = GroupState()
+    for r in readings:
+        state.add(r.user_id, compact_comparison(r))
+    return state
+
+
+class TestIncrementalUpdates(unittest.TestCase):
+    """Join/leave keep the state identical to a full recompute."""
+
+    def test_joins_match_bulk_build(self):
+        readings = _group(30)
+        incremental = _built_incrementally(readings)
+        bulk = GroupState.from_readings(readings)
+
+        self.assertEqual(incremental.to_dict(), bulk.to_dict())
+
+    def test_harmony_matches_analyze_group(self):
+        readings = _group(12)
+        state = _built_incrementally(readings)
+        result = MultiUserAnalyzer.analyze_group(readings)
+
+        self.assertAlmostEqual(state.harmony, result.group_harmony_score, places=4)
+        self.assertEqual(state.element_counts, result.group_element_balance)
+        self.assertEqual(state.analysis()["group_summary"], result.group_summary)
+
+    def test_leave_matches_rebuild_without_member(self):
+        readings = _group(20)
+        state = _built_incrementally(readings)
+        state.remove(7)
+        state.remove(1)
+
+        remaining = [r for r in readings if r.user_id not in (1, 7)]
+        self.assertEqual(state.to_dict(), GroupState.from_readings(remaining).to_dict())
+
+    def test_duplicate_join_and_unknown_leave_rejected(self):
+        readings = _group(2)
+        state = _built_incrementally(readings)
+        with self.assertRaises(ValueError):
+            state.add(1, compact_comparison(readings[0]))
+        with self.assertRaises(ValueError):
+            state.remove(99)
+
+    def test_last_member_of_element_drops_key(self):
+        readings = _group(3)
+        state = _built_incrementally(readings)
+        element = state.comparisons[0]["element"]
+        before = state.element_counts[element]
+        state.remove(1)
+        self.assertEqual(state.element_counts.get(element, 0), before - 1)
+        self.assertNotIn(0, state.element_counts.values())
+
+
+class TestPersistence(unittest.TestCase):
+    """to_dict / from_dict round-trip through JSON; from_pairs from pair rows."""
+
+    def test_json_round_trip(self):
+        state = _built_incrementally(_group(10))
+        restored = GroupState.from_dict(json.loads(json.dumps(state.to_dict())))
+
+        self.assertEqual(restored.to_dict(), state.to_dict())
+        self.assertEqual(restored.analysis(), state.analysis())
+
+    def test_pair_rows_round_trip(self):
+        state = _built_incrementally(_group(10))
+        n = len(state)
+        rows = [
+            (state.members[i], state.members[j], int(state.scores[i, j]))
+            for i in range(n)
+            for j in range(i + 1, n)
+        ]
+        restored = GroupState.from_pairs(
+            state.members, state.comparisons, reversed(rows), state.score_total
+        )
+        self.assertEqual(restored.to_dict(), state.to_dict())
+
+    def test_newcomer_scores_update_totals(self):
+        readings = _group(8)
+        state = _built_incrementally(readings[:7])
+        newcomer = compact_comparison(readings[7])
+        row = score_newcomer(state.members, state.comparisons, 8, newcomer)
+        full = GroupState.from_readings(readings)
+        self.assertEqual(row.tolist(), full.scores[7, :7].tolist())
+        self.assertAlmostEqual(group_harmony(state.score_total + int(row.sum()), 8), full.harmony)
+
+    def test_empty_state(self):
+        restored = GroupState.from_dict(GroupState().to_dict())
+        analysis = restored.analysis()
+        self.assertEqual(analysis["member_count"], 0)
+        self.assertEqual(analysis["group_harmony_score"], 0.0)
+        self.assertEqual(analysis["strongest_pairs"], [])
+
+
+class TestAnalysis(unittest.TestCase):
+    """Top pairs are materialized from stored comparison data."""
+
+    def test_top_pairs_match_calculate_pairwise(self):
+        readings = _group(15)
+        by_id = {r.user_id: r for r in readings}
+        analysis = _built_incrementally(readings).analysis(top_k=3)
+
+        self.assertEqual(len(analysis["strongest_pairs"]), 3)
+        for pair in analysis["strongest_pairs"] + analysis["challenging_pairs"]:
+            expected = MultiUserAnalyzer.calculate_pairwise(
+                by_id[pair["user_a_id"]], by_id[pair["user_b_id"]]
+            )
+            self.assertEqual(pair["overall_score"], expected.overall_score)
+            self.assertEqual(pair["strengths"], expected.strengths)
+
+    def test_member_comparison_from_profile(self):
+        profile = UserProfile(
+            user_id=5,
+            full_name="Test User",
+            birth_day=15,
+            birth_month=6,
+            birth_year=1990,
+        )
+        comparison = member_comparison(profile, datetime(2026, 3, 1, 12, 30))
+        self.assertIn(comparison["element"], ELEMENTS)
+        self.assertIn("phase_name", comparison["moon"])
+        json.dumps(comparison)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+"""
+Tests for the persistent interpretation cache
+==============================================
+Fingerprinting, templating round-trip, LRU size eviction, persistence across
+instances, and the ai_interpreter integration. Each test uses its own
+temporary SQLite file.
+"""
+
+import copy
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+from engines import interpretation_cache
+from engines.interpretation_cache import (
+    InterpretationCache,
+    fingerprint,
+    leaked_values,
+    personal_values,
+    personalize,
+    templatize,
+)
+
+
+def _reading(name="Alice", date="2026-03-01", fc60="VE-OX-OXFI", level="high", score=80):
+    return {
+        "person": {"name": name, "birthdate": "1990-05-17"},
+        "current": {"date": date, "weekday": "Sunday"},
+        "fc60_stamp": {"fc60": fc60, "j60": "TIFI-DRMT"},
+        "numerology": {"life_path": {"number": 7}, "personal_year": 3},
+        "moon": {"phase_name": "Waxing Gibbous"},
+        "ganzhi": {
+            "year": {"traditional_name": "Fire Horse"},
+            "day": {"gz_token": "JI-SI"},
+            "hour": {"animal_name": "Rat"},
+        },
+        "patterns": {"detected": [{"type": "repeat", "strength": "high", "message": "7 x3"}]},
+        "confidence": {"level": level, "score": score},
+    }
+
+
+class _TmpCacheCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "interp.db"
+        self.cache = InterpretationCache(self.path, max_bytes=10_000)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_personal_fields_do_not_change_fingerprint(self):
+        a = fingerprint(_reading(), "daily", "en")
+        b = fingerprint(_reading(name="Bob", date="2026-03-09", fc60="LU-DR-DRWA"), "daily", "en")
+        self.assertEqual(a, b)
+
+    def test_signals_change_fingerprint(self):
+        base = fingerprint(_reading(), "daily", "en")
+        self.assertNotEqual(base, fingerprint(_reading(level="low"), "daily", "en"))
+        self.assertNotEqual(base, fingerprint(_reading(), "time", "en"))
+        self.assertNotEqual(base, fingerprint(_reading(), "daily", "fa"))
+        moved = _reading()
+        moved["moon"]["phase_name"] = "Full Moon"
+        self.assertNotEqual(base, fingerprint(moved, "daily", "en"))
+
+    def test_pattern_order_is_canonical(self):
+        a = _reading()
+        a["patterns"]["detected"].append({"type": "sum", "strength": "low", "message": "x"})
+        b = copy.deepcopy(a)
+        b["patterns"]["detected"].reverse()
+        self.assertEqual(fingerprint(a, "daily", "en"), fingerprint(b, "daily", "en"))
+
+    def test_sparse_reading(self):
+        self.assertEqual(len(fingerprint({}, "daily", "en")), 64)
+
+
+class TestTemplating(unittest.TestCase):
+    def test_round_trip_with_new_person(self):
+        text = "READING FOR Alice\nDate: 2026-03-01 (Sunday)\nFC60: VE-OX-OXFI\nConfidence 80%"
+        template = templatize(text, personal_values(_reading()))
+        self.assertNotIn("Alice", template)
+        self.assertIn("{{name}}", template)
+        out = personalize(
+            template, personal_values(_reading(name="Bob", date="2026-03-09", fc60="LU-DR-DRWA"))
+        )
+        self.assertEqual(
+            out, "READING FOR Bob\nDate: 2026-03-09 (Sunday)\nFC60: LU-DR-DRWA\nConfidence 80%"
+        )
+
+    def test_missing_value_is_unusable(self):
+        template = templatize("Hello Alice", personal_values(_reading()))
+        self.assertIsNone(personalize(template, {}))
+
+    def test_nothing_personal_survives(self):
+        values = personal_values(_reading(name="Al Smith"))
+        text = (
+            "Dear Al Smith. Al, born May 17, 1990 (17/05/1990), your May 17th "
+            "birthday and FC60 VE-OX-OXFI point to Smith family ties."
+        )
+        template = templatize(text, values)
+        for secret in ("Al", "Smith", "May 17", "17/05/1990", "1990", "VE-OX-OXFI"):
+            self.assertNotRegex(template, rf"(?<!\w){secret}(?!\w)")
+        self.assertEqual(leaked_values(template, values), [])
+        out = personalize(template, personal_values(_reading(name="Bo Chen")))
+        self.assertNotIn("Al", out.split())
+        self.assertIn("Dear Bo Chen. Bo, born May 17, 1990", out)
+
+    def test_leftover_personal_value_is_not_cached(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = InterpretationCache(Path(tmp) / "c.db")
+            try:
+                cache.put(_reading(name="Al"), "daily", "en", "READING FOR AL — all good")
+                self.assertIsNone(cache.get(_reading(name="Bo"), "daily", "en"))
+                self.assertEqual(cache.stats()["entries"], 0)
+            finally:
+                cache.close()
+
+    def test_only_whole_tokens_are_replaced(self):
+        values = personal_values(_reading(name="Ali"))
+        template = templatize("Ali, Alignment favours you. Ali's path is clear.", values)
+        self.assertEqual(template, "{{name}}, Alignment favours you. {{name}}'s path is clear.")
+        out = personalize(template, personal_values(_reading(name="Bob")))
+        self.assertEqual(out, "Bob, Alignment favours you. Bob's path is clear.")
+
+
+class TestInterpretationCache(_TmpCacheCase):
+    def test_hit_for_signal_identical_reading(self):
+        self.cache.put(_reading(), "daily", "en", "READING FOR Alice — all good")
+        self.assertIsNone(self.cache.get(_reading(level="low"), "daily", "en"))
+        text = self.cache.get(_reading(name="Bob"), "daily", "en")
+        self.assertEqual(text, "READING FOR Bob — all good")
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["entries"], 1)
+
+    def test_persists_across_instances(self):
+        self.cache.put(_reading(), "daily", "en", "READING FOR Alice")
+        other = InterpretationCache(self.path)
+        try:
+            self.assertEqual(other.get(_reading(name="Carol"), "daily", "en"), "READING FOR Carol")
+        finally:
+            other.close()
+
+    def test_overwrite_keeps_byte_total_exact(self):
+        self.cache.put(_reading(), "daily", "en", "x" * 100)
+        self.cache.put(_reading(), "daily", "en", "y" * 40)
+        self.assertEqual(self.cache.stats()["total_bytes"], 40)
+
+    def test_lru_eviction_under_budget(self):
+        for i, level in enumerate(["a", "b", "c", "d"]):
+            self.cache.put(_reading(level=level), "daily", "en", str(i) * 3000)
+            if level == "b":
+                self.cache.get(_reading(level="a"), "daily", "en")  # refresh "a"
+        stats = self.cache.stats()
+        self.assertLessEqual(stats["total_bytes"], 10_000)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertIsNotNone(self.cache.get(_reading(level="a"), "daily", "en"))
+        self.assertIsNone(self.cache.get(_reading(level="b"), "daily", "en"))
+
+    def test_expired_entry_is_a_miss(self):
+        self.cache.ttl = 0
+        self.cache.put(_reading(), "daily", "en", "old")
+        self.assertIsNone(self.cache.get(_reading(), "daily", "en"))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+
+class TestModuleInstance(unittest.TestCase):
+    def tearDown(self):
+        interpretation_cache.reset_interpretation_cache()
+
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {"NPS_AI_INTERP_CACHE": ""}):
+            self.assertIsNone(interpretation_cache.get_interpretation_cache())
+
+    def test_enabled_via_env(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                "NPS_AI_INTERP_CACHE": "true",
+                "NPS_AI_INTERP_CACHE_PATH": str(Path(tmp) / "c.db"),
+            }
+            with patch.dict(os.environ, env):
+                cache = interpretation_cache.get_interpretation_cache()
+                self.assertIsInstance(cache, InterpretationCache)
+                self.assertIs(cache, interpretation_cache.get_interpretation_cache())
+            interpretation_cache.reset_interpretation_cache()
+
+
+class TestInterpreterIntegration(_TmpCacheCase):
+    def test_second_signal_identical_reading_skips_model(self):
+        from engines.ai_interpreter import interpret_reading
+
+        response = "READING FOR Alice\n\nTHE MESSAGE\nTrust the 7s."
+        with (
+            patch("engines.ai_interpreter.is_available", return_value=True),
+            patch("engines.interpretation_cache.get_interpretation_cache", return_value=self.cache),
+            patch(
+                "engines.ai_interpreter.generate_reading",
+                return_value={"success": True, "response": response, "cached": False},
+            ) as gen,
+        ):
+            first = interpret_reading(_reading(), reading_type="daily")
+            second = interpret_reading(_reading(name="Bob"), reading_type="daily")
+            asked = interpret_reading(_reading(name="Bob"), reading_type="daily", question="Why?")
+
+        self.assertEqual(gen.call_count, 2)
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertTrue(second.ai_generated)
+        self.assertIn("READING FOR Bob", second.full_text)
+        self.assertFalse(asked.cached)
+
+
+if __name__ == "__main__":
+    unittest.main()
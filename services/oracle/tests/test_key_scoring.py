@@ -0,0 +1,183 @@
+"""Tests for key_scoring — batched 256-bit key statistics — and ScannerBrain batches.
+
+Covers: limb round-trip and validity, vectorized digit sums / entropy /
+numerology parity with the scalar references, per-group selection rules,
+and ScannerBrain.generate_smart_keys for every strategy.
+"""
+
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from engines import key_scoring as ks
+from engines.scanner_brain import STRATEGIES, ScannerBrain
+from oracle_service.framework_bridge import digit_sum, numerology_reduce
+
+CONTEXT = {"current_year": 2026, "current_month": 3, "current_day": 5}
+
+
+def _keys(n: int = 1500, seed: int = 7) -> list[int]:
+    rng = random.Random(seed)
+    edge = [0, 1, 11, 22, 33, 34, 55, 59, 60, 89, 144, 2584, 3600, 5000, ks.N - 1, ks.N]
+    return [rng.getrandbits(256) for _ in range(n)] + edge + [2**256 - 1, 10**77]
+
+
+class TestLimbs(unittest.TestCase):
+    """Conversion between Python ints and uint64 limb arrays."""
+
+    def test_round_trip(self):
+        keys = _keys()
+        limbs = ks.limbs_from_ints(keys)
+        self.assertEqual(limbs.shape, (len(keys), 4))
+        self.assertEqual(limbs.dtype, np.uint64)
+        self.assertEqual(ks.ints_from_limbs(limbs), keys)
+
+    def test_valid_mask(self):
+        keys = _keys()
+        expected = [1 <= k < ks.N for k in keys]
+        self.assertEqual(ks.valid_mask(ks.limbs_from_ints(keys)).tolist(), expected)
+
+    def test_random_keys_are_valid(self):
+        limbs = ks.random_keys(500)
+        self.assertTrue(ks.valid_mask(limbs).all())
+        self.assertEqual(len(set(ks.ints_from_limbs(limbs))), 500)
+
+
+class TestDigitStatistics(unittest.TestCase):
+    """Vectorized statistics equal the scalar definitions."""
+
+    def setUp(self):
+        self.keys = _keys()
+        self.limbs = ks.limbs_from_ints(self.keys)
+
+    def test_decimal_digit_sums(self):
+        sums = ks.decimal_digit_sums(self.limbs)
+        self.assertEqual(sums.tolist(), [digit_sum(k) for k in self.keys])
+        reduced = ks.reduce_digit_sums(sums)
+        self.assertEqual(reduced.tolist(), [numerology_reduce(digit_sum(k)) for k in self.keys])
+
+    def test_hex_digit_counts_and_entropy(self):
+        counts = ks.hex_digit_counts(self.limbs)
+        self.assertEqual(
+            counts[0].tolist(), [format(self.keys[0], "064x").count(c) for c in "0123456789abcdef"]
+        )
+        np.testing.assert_allclose(
+            ks.hex_entropy(self.limbs), [ks.key_entropy(k) for k in self.keys], atol=1e-12
+        )
+
+    def test_base60_digits(self):
+        digits, lengths = ks.base60_digits(self.limbs)
+        for key, row, length in zip(self.keys, digits, lengths):
+            expected = []
+            n = key
+            while n:
+                n, d = divmod(n, 60)
+                expected.append(d)
+            self.assertEqual(row[:length].tolist(), expected or [0])
+
+    def test_numerology_scores_match_scalar(self):
+        for context in (None, CONTEXT):
+            vectorized = ks.numerology_scores(self.limbs, context)
+            scalar = [ks.numerology_score(k, context)[0] for k in self.keys]
+            np.testing.assert_allclose(vectorized, scalar, atol=1e-12)
+
+    def test_alignment_scores(self):
+        target = ks.date_number(2026, 3, 5)
+        scores = ks.alignment_scores(self.limbs, target)
+        for key, score in zip(self.keys[:200], scores[:200]):
+            reduced = numerology_reduce(digit_sum(key))
+            expected = ks.numerology_score(key)[0] * 0.7 + (0.3 if reduced == target else 0.0)
+            self.assertAlmostEqual(score, expected, places=12)
+
+
+class TestSelection(unittest.TestCase):
+    """Per-group selection rules."""
+
+    def test_select_best_per_group(self):
+        keys = list(range(1, 21))
+        limbs = ks.limbs_from_ints(keys)
+        scores = np.array([k % 7 for k in keys], dtype=float)
+        picked = ks.ints_from_limbs(ks.select_best(limbs, scores, 10))
+        self.assertEqual(picked, [6, 13])
+
+    def test_min_score_falls_back_to_first_candidate(self):
+        limbs = ks.limbs_from_ints([5, 6, 7, 8])
+        scores = np.array([0.1, 0.5, 0.2, 0.9])
+        picked = ks.ints_from_limbs(ks.select_best(limbs, scores, 2, min_score=0.6))
+        self.assertEqual(picked, [5, 8])
+
+    def test_invalid_candidates_never_selected(self):
+        limbs = ks.limbs_from_ints([0, ks.N, 3, 4])
+        scores = np.array([9.0, 9.0, 1.0, 2.0])
+        picked = ks.ints_from_limbs(ks.select_best(limbs, scores, 2))
+        self.assertTrue(1 <= picked[0] < ks.N)
+        self.assertEqual(picked[1], 4)
+
+    def test_select_first_in_range(self):
+        limbs = ks.limbs_from_ints([1, 2, 3, 4, 5, 6])
+        values = np.array([0.0, 3.5, 3.6, 9.0, 9.0, 9.0])
+        picked = ks.select_first_in_range(limbs, values, 3.0, 4.0, 3)
+        self.assertEqual(ks.ints_from_limbs(picked)[0], 2)
+        self.assertTrue(ks.valid_mask(picked).all())  # second group replaced
+
+
+class TestScannerBrainBatches(unittest.TestCase):
+    """generate_smart_keys for each strategy."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        with patch("engines.scanner_brain.KNOWLEDGE_DIR", Path(self._tmpdir)):
+            self.brain = ScannerBrain()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_every_strategy_yields_valid_keys(self):
+        self.brain._pattern_discoveries = [{"key_hex": format(2**200 + i, "x")} for i in range(5)]
+        for strategy in STRATEGIES:
+            keys = self.brain.generate_smart_keys(300, strategy)
+            self.assertEqual(len(keys), 300, strategy)
+            self.assertTrue(all(1 <= k < ks.N for k in keys), strategy)
+
+    def test_numerology_guided_improves_scores(self):
+        guided = ks.limbs_from_ints(self.brain.generate_smart_keys(2000, "numerology_guided"))
+        baseline = ks.random_keys(2000)
+        self.assertGreater(
+            ks.numerology_scores(guided).mean(), ks.numerology_scores(baseline).mean()
+        )
+
+    def test_entropy_targeted_respects_range(self):
+        lo, hi = self.brain._learned_entropy_range()
+        keys = self.brain.generate_smart_keys(500, "entropy_targeted")
+        inside = [lo <= ks.key_entropy(k) <= hi for k in keys]
+        self.assertGreater(sum(inside) / len(inside), 0.95)
+
+    def test_pattern_replay_keeps_high_bits(self):
+        ref = 2**255 + 12345
+        self.brain._pattern_discoveries = [{"key_hex": format(ref, "x")}]
+        for key in self.brain.generate_smart_keys(100, "pattern_replay"):
+            self.assertEqual(key >> 128, ref >> 128)
+
+    def test_generate_smart_key_serves_from_batch(self):
+        self.brain._current_strategy = "numerology_guided"
+        with patch.object(
+            self.brain, "generate_smart_keys", wraps=self.brain.generate_smart_keys
+        ) as gen:
+            keys = [self.brain.generate_smart_key() for _ in range(300)]
+        self.assertEqual(gen.call_count, 2)
+        self.assertEqual(len(set(keys)), 300)
+
+        self.brain._current_strategy = "random"
+        self.brain.generate_smart_key()
+        self.assertEqual(self.brain._key_buffer_strategy, "random")
+
+
+if __name__ == "__main__":
+    unittest.main()
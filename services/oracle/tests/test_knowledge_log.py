@@ -0,0 +1,153 @@
+"""Tests for the ScannerBrain knowledge log.
+
+Covers: KnowledgeLog append/compact/load including the seq check after a
+crash between snapshot and truncate and a torn last line, and
+ScannerBrain persistence through it — constant-size appends per finding,
+restart replay, automatic compaction, and migration of the pre-log JSON
+files.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from engines import scanner_brain
+from engines.knowledge_log import KnowledgeLog
+from engines.scanner_brain import ScannerBrain
+
+
+def _finding(i: int) -> dict:
+    return {"key_hex": format(2**200 + i, "064x"), "score": 0.8, "addresses": {"btc": f"a{i}"}}
+
+
+class TestKnowledgeLog(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.dir = Path(self._tmpdir)
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_append_compact_and_replay(self):
+        log = KnowledgeLog(self.dir)
+        for i in range(3):
+            log.append("f", {"i": i})
+        log.compact({"items": [0, 1, 2]})
+        log.append("f", {"i": 3})
+        log.close()
+
+        state, events = KnowledgeLog(self.dir).load()
+        self.assertEqual(state, {"items": [0, 1, 2]})
+        self.assertEqual(events, [("f", {"i": 3})])
+
+    def test_skips_events_already_in_snapshot(self):
+        log = KnowledgeLog(self.dir)
+        for i in range(4):
+            log.append("f", {"i": i})
+        saved = log.log_path.read_bytes()
+        log.compact({"items": 4})
+        log.close()
+        # Crash after the snapshot rename but before the log was truncated
+        log.log_path.write_bytes(saved)
+
+        reopened = KnowledgeLog(self.dir)
+        state, events = reopened.load()
+        self.assertEqual((state, events), ({"items": 4}, []))
+        reopened.append("f", {"i": 4})
+        reopened.close()
+        self.assertEqual(KnowledgeLog(self.dir).load()[1], [("f", {"i": 4})])
+
+    def test_drops_torn_tail(self):
+        log = KnowledgeLog(self.dir)
+        log.append("f", {"i": 0})
+        log.close()
+        with open(log.log_path, "a") as f:
+            f.write('[2,"f",{"i"')
+
+        reopened = KnowledgeLog(self.dir)
+        self.assertEqual(reopened.load(), (None, [("f", {"i": 0})]))
+        reopened.append("f", {"i": 1})
+        reopened.close()
+        self.assertEqual(KnowledgeLog(self.dir).load()[1], [("f", {"i": 0}), ("f", {"i": 1})])
+
+
+class TestScannerBrainPersistence(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.dir = Path(self._tmpdir) / "knowledge"
+        self._patch = patch.object(scanner_brain, "KNOWLEDGE_DIR", self.dir)
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_constant_bytes_per_finding(self):
+        brain = ScannerBrain()
+        sizes = []
+        for i in range(300):
+            before = brain._knowledge_log.bytes_written
+            brain.record_finding(_finding(i))
+            sizes.append(brain._knowledge_log.bytes_written - before)
+        self.assertLess(max(sizes) - min(sizes), 16)
+        self.assertFalse(brain._knowledge_log.snapshot_path.exists())
+
+    def test_restart_replays_knowledge(self):
+        brain = ScannerBrain()
+        brain.start_session("both", ["btc"], [])
+        for i in range(20):
+            brain.record_finding(_finding(i))
+        brain.end_session({"keys_tested": 1000, "hits": 0})
+        strategy = brain._current_strategy
+
+        restarted = ScannerBrain()
+        self.assertEqual(restarted._strategy_log, brain._strategy_log)
+        self.assertEqual(restarted._strategy_log[strategy]["patterns"], 20)
+        self.assertEqual(
+            [p["key_hex"] for p in restarted._pattern_discoveries],
+            [p["key_hex"] for p in brain._pattern_discoveries],
+        )
+
+    def test_compacts_every_n_events(self):
+        with (
+            patch.object(scanner_brain, "COMPACT_EVERY", 50),
+            patch.object(scanner_brain, "MAX_PATTERN_DISCOVERIES", 60),
+            patch.object(scanner_brain, "KEEP_PATTERN_DISCOVERIES", 30),
+        ):
+            brain = ScannerBrain()
+            for i in range(120):
+                brain.record_finding(_finding(i))
+            self.assertEqual(brain._knowledge_log.pending, 20)
+            self.assertEqual(len(brain._knowledge_log.log_path.read_text().splitlines()), 20)
+
+            restarted = ScannerBrain()
+        # The snapshot keeps the newest KEEP_PATTERN_DISCOVERIES, then the log replays on top
+        replayed = [p["key_hex"] for p in restarted._pattern_discoveries]
+        self.assertEqual(
+            replayed, [p["key_hex"] for p in brain._pattern_discoveries][-len(replayed) :]
+        )
+        self.assertEqual(replayed[-1], _finding(119)["key_hex"])
+        self.assertGreaterEqual(len(replayed), 30)
+
+    def test_migrates_legacy_files(self):
+        self.dir.mkdir(parents=True)
+        strategy_log = {"random": {"runs": 3, "total_keys": 10, "high_scores": 1, "patterns": 2}}
+        (self.dir / "strategy_log.json").write_text(json.dumps(strategy_log, indent=2))
+        (self.dir / "pattern_discoveries.json").write_text(json.dumps([_finding(1)], indent=2))
+
+        brain = ScannerBrain()
+        self.assertEqual(brain._strategy_log, strategy_log)
+        self.assertEqual(len(brain._pattern_discoveries), 1)
+        self.assertFalse((self.dir / "strategy_log.json").exists())
+        self.assertTrue(brain._knowledge_log.snapshot_path.exists())
+
+        self.assertEqual(ScannerBrain()._strategy_log, strategy_log)
+
+
+if __name__ == "__main__":
+    unittest.main()
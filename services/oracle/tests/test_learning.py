@@ -0,0 +1,222 @@
+"""Tests for engines.learning — append-only solve history and running stats.
+
+Covers: RunningMoments add/remove against direct formulas, dashboard and
+weight functions against full-history recomputation (including window
+eviction and log compaction), pickup of lines appended by another
+process, migration of the pre-log JSON history, and reset.
+"""
+
+import json
+import math
+import random
+import shutil
+import statistics
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from engines import learning
+from engines.learning import RunningMoments
+
+
+def _score(rng: random.Random, correct: bool) -> dict:
+    bias = 0.15 if correct else 0.0
+    return {
+        "final_score": rng.random() * 0.8 + bias,
+        "math_score": rng.random() * 0.8 + bias,
+        "math_breakdown": {"entropy_low": rng.random(), "digit_balance": rng.random()},
+        "numerology_score": rng.random() * 0.9 + bias / 2,
+        "numerology_breakdown": {},
+        "fc60_token": "TK",
+        "reduced_number": rng.choice([1, 2, 3, 8, 9, 11, 22]),
+        "is_master": rng.random() < 0.2,
+    }
+
+
+def _expected(history: list) -> dict:
+    """The pre-log full-scan definitions."""
+    winners = [r for r in history if r["was_correct"]]
+    losers = [r for r in history if not r["was_correct"]]
+    scores = [r["final_score"] for r in history]
+    correct = [1.0 if r["was_correct"] else 0.0 for r in history]
+    ms, mc = statistics.fmean(scores), statistics.fmean(correct)
+    num = sum((s - ms) * (c - mc) for s, c in zip(scores, correct))
+    den = math.sqrt(sum((s - ms) ** 2 for s in scores) * sum((c - mc) ** 2 for c in correct))
+    return {
+        "winners": winners,
+        "losers": losers,
+        "pearson": num / den,
+        "avg_winner_score": statistics.fmean(r["final_score"] for r in winners),
+        "avg_loser_score": statistics.fmean(r["final_score"] for r in losers),
+        "master_rate": sum(r["is_master"] for r in winners) / len(winners),
+    }
+
+
+class TestRunningMoments(unittest.TestCase):
+    def test_add_remove_matches_direct(self):
+        rng = random.Random(1)
+        points = [(rng.gauss(3, 2), rng.gauss(-1, 5)) for _ in range(500)]
+        moments = RunningMoments()
+        for x, y in points:
+            moments.add(x, y)
+        for x, y in points[:200]:
+            moments.remove(x, y)
+        xs, ys = [p[0] for p in points[200:]], [p[1] for p in points[200:]]
+        self.assertEqual(moments.n, 300)
+        self.assertAlmostEqual(moments.mean_x, statistics.fmean(xs), places=9)
+        self.assertAlmostEqual(moments.mean_y, statistics.fmean(ys), places=9)
+        self.assertAlmostEqual(moments.variance, statistics.pvariance(xs), places=8)
+        self.assertAlmostEqual(moments.pearson(), statistics.correlation(xs, ys), places=9)
+
+    def test_remove_last_resets(self):
+        moments = RunningMoments()
+        moments.add(2.0, 1.0)
+        moments.remove(2.0, 1.0)
+        self.assertEqual((moments.n, moments.mean_x, moments.m2_x), (0, 0.0, 0.0))
+
+
+class TestSolveHistory(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        root = Path(self._tmpdir)
+        self._patches = [
+            patch.object(learning, "DATA_DIR", root),
+            patch.object(learning, "HISTORY_LOG", root / "solve_history.jsonl"),
+            patch.object(learning, "HISTORY_FILE", root / "solve_history.json"),
+            patch.object(learning, "WEIGHTS_FILE", root / "factor_weights.json"),
+            patch.object(learning, "_stats", None),
+            patch.object(learning, "_log_state", None),
+        ]
+        for p in self._patches:
+            p.start()
+        self.rng = random.Random(42)
+
+    def tearDown(self):
+        for p in reversed(self._patches):
+            p.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _solve(self, n: int) -> list:
+        records = []
+        for i in range(n):
+            correct = self.rng.random() < 0.35
+            score = _score(self.rng, correct)
+            learning.record_solve(self.rng.choice("abc"), i, score, correct)
+            records.append({**score, "was_correct": correct, "puzzle_type": "?"})
+        return records
+
+    def _assert_matches(self, history: list):
+        exp = _expected(history)
+        stats = learning.get_solve_stats()
+        self.assertEqual(stats["total_attempts"], len(history))
+        self.assertEqual(stats["total_correct"], len(exp["winners"]))
+        self.assertAlmostEqual(stats["avg_winner_score"], exp["avg_winner_score"], places=9)
+        self.assertAlmostEqual(stats["avg_loser_score"], exp["avg_loser_score"], places=9)
+        self.assertAlmostEqual(learning.pearson_correlation(), exp["pearson"], places=9)
+        factors = learning.get_factor_accuracy()["factors"]
+        self.assertAlmostEqual(
+            factors["is_master_number"]["winner_rate"], round(exp["master_rate"], 4)
+        )
+
+    def test_stats_match_full_scan(self):
+        history = self._solve(300)
+        self._assert_matches(history)
+        self.assertEqual(learning._load_history()[-1]["candidate"], 299)
+        self.assertEqual(len(learning.HISTORY_LOG.read_text().splitlines()), 300)
+
+    def test_window_eviction_and_compaction(self):
+        with patch.object(learning, "MAX_HISTORY", 100), patch.object(learning, "COMPACT_AT", 250):
+            history = self._solve(260)
+            # Compacted at 250 lines back to the 100-record window, then 10 more appended
+            self.assertEqual(len(learning.HISTORY_LOG.read_text().splitlines()), 110)
+            self._assert_matches(history[-100:])
+            self.assertEqual(learning._load_history()[0]["candidate"], 160)
+
+            # A fresh process (no in-memory state) sees the same window
+            learning._stats = learning._log_state = None
+            self._assert_matches(history[-100:])
+
+    def test_weights_from_aggregates(self):
+        history = self._solve(200)
+        learning.recalculate_weights()
+        weights = learning.get_weights()
+        exp = _expected(history)
+        mean = statistics.fmean
+        math_gap = max(
+            0.01,
+            mean(r["math_score"] for r in exp["winners"])
+            - mean(r["math_score"] for r in exp["losers"]),
+        )
+        num_gap = max(
+            0.01,
+            mean(r["numerology_score"] for r in exp["winners"])
+            - mean(r["numerology_score"] for r in exp["losers"]),
+        )
+        self.assertAlmostEqual(weights["math_weight"], 0.7 * math_gap / (math_gap + num_gap))
+        self.assertAlmostEqual(sum(weights.values()), 1.0)
+
+    def test_picks_up_lines_from_other_writers(self):
+        history = self._solve(50)
+        self.assertEqual(learning.get_solve_stats()["total_attempts"], 50)
+        extra = {**_score(self.rng, True), "was_correct": True, "puzzle_type": "x"}
+        with open(learning.HISTORY_LOG, "a") as f:
+            f.write(json.dumps(extra) + "\n")
+            f.write('{"partial": ')  # still being written
+        self._assert_matches(history + [extra])
+
+    def test_migrates_legacy_json_history(self):
+        legacy = [
+            {**_score(self.rng, i % 3 == 0), "was_correct": i % 3 == 0, "puzzle_type": "p"}
+            for i in range(40)
+        ]
+        learning.HISTORY_FILE.write_text(json.dumps(legacy, indent=2))
+        self._assert_matches(legacy)
+        self.assertFalse(learning.HISTORY_FILE.exists())
+        self.assertEqual(learning.get_solve_stats()["best_puzzle_type"], "p")
+
+    def test_first_call_after_upgrade_is_record_solve(self):
+        legacy = [
+            {**_score(self.rng, i % 2 == 0), "was_correct": i % 2 == 0, "puzzle_type": "p"}
+            for i in range(50)
+        ]
+        learning.HISTORY_FILE.write_text(json.dumps(legacy))
+        history = legacy + self._solve(1)
+        self._assert_matches(history)
+        self.assertFalse(learning.HISTORY_FILE.exists())
+        self.assertEqual(len(learning.HISTORY_LOG.read_text().splitlines()), 51)
+
+    def test_legacy_file_merged_into_existing_log(self):
+        logged = self._solve(12)
+        legacy = self._other_records(4)
+        learning.HISTORY_FILE.write_text(json.dumps(legacy))
+        learning._stats = learning._log_state = None  # fresh process
+        self._assert_matches(legacy + logged)
+
+    def test_detects_compaction_by_other_process_at_same_length(self):
+        history = self._solve(30)
+        self.assertEqual(learning.get_solve_stats()["total_attempts"], 30)
+        # Another process compacts to a different window of at least the same size
+        replacement = history[10:] + self._other_records(15)
+        learning._write_log(replacement)
+        self.assertGreaterEqual(learning.HISTORY_LOG.stat().st_size, learning._log_state[1])
+        self._assert_matches(replacement)
+
+    def _other_records(self, n: int) -> list:
+        return [
+            {**_score(self.rng, True), "was_correct": True, "puzzle_type": "z"} for _ in range(n)
+        ]
+
+    def test_reset(self):
+        self._solve(20)
+        learning.reset_learning_data()
+        self.assertFalse(learning.HISTORY_LOG.exists())
+        stats = learning.get_solve_stats()
+        self.assertEqual((stats["total_attempts"], stats["best_puzzle_type"]), (0, "none"))
+        self.assertEqual(learning.confidence_level(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
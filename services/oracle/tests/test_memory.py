@@ -0,0 +1,223 @@
+"""Tests for engines.memory — hot cache, SQLite cold tier, and flushing.
+
+Covers: spilling old sessions and low high scores to the cold tier with
+overall retention limits, summaries and recommendations across both
+tiers, incremental section sizes against a full re-serialization, the
+byte-budget trim, off-lock flush with the dirty/generation check,
+loading a pre-tiering memory file, cold-tier writes made outside the lock,
+and no duplicates when a stale snapshot is reloaded after a crash.
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from engines import memory
+
+
+def _session(i: int, mode: str = "random") -> dict:
+    return {
+        "mode": mode,
+        "duration": 10,
+        "keys_tested": 100,
+        "seeds_tested": 1,
+        "hits": 0,
+        "avg_speed": float(i + 1),
+        "timestamp": f"t{i:05d}",
+    }
+
+
+class TestMemory(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        root = Path(self._tmpdir)
+        self._patches = [
+            patch.object(memory, "DATA_DIR", root),
+            patch.object(memory, "MEMORY_FILE", root / "scan_memory.json"),
+            patch.object(memory, "COLD_FILE", root / "scan_memory_cold.db"),
+            patch.object(memory, "_HOT_SESSIONS", 10),
+            patch.object(memory, "_HOT_HIGH_SCORES", 5),
+            patch.object(memory, "_MAX_SESSIONS", 30),
+            patch.object(memory, "_MAX_HIGH_SCORES", 20),
+            patch.object(memory, "_start_flush_timer", lambda: None),
+        ]
+        for p in self._patches:
+            p.start()
+        memory.reset_memory()
+
+    def tearDown(self):
+        memory.reset_memory()
+        for p in reversed(self._patches):
+            p.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_sessions_spill_to_cold_tier(self):
+        for i in range(25):
+            memory.record_session(_session(i, mode="both" if i == 0 else "random"))
+
+        self.assertEqual(len(memory.get_memory()["sessions"]), 10)
+        self.assertEqual(
+            [s["timestamp"] for s in memory.get_sessions(12)][:2], ["t00013", "t00014"]
+        )
+        self.assertEqual(len(memory.get_sessions()), 25)
+
+        summary = memory.get_summary()
+        self.assertEqual(summary["total_sessions"], 25)
+        self.assertEqual(summary["total_keys"], 2500)
+        self.assertEqual(summary["avg_speed"], 13.0)
+        self.assertEqual(summary["best_speed"], 25.0)
+        self.assertEqual(summary["last_session_time"], "t00024")
+
+        # "both" only exists in the cold tier and still counts
+        recs = memory.get_recommendations()
+        self.assertNotIn("Consider trying 'both' mode for better coverage.", recs)
+        self.assertIn("Your average speed is improving. Keep it up!", recs)
+
+        # Cold tier is trimmed to the overall retention limit
+        for i in range(25, 50):
+            memory.record_session(_session(i))
+        sessions = memory.get_sessions()
+        self.assertEqual(len(sessions), 30)
+        self.assertEqual(sessions[0]["timestamp"], "t00020")
+        self.assertEqual(memory.get_summary()["total_sessions"], 30)
+
+    def test_high_scores_ranked_across_tiers(self):
+        scores = [(i * 37) % 23 / 23 for i in range(23)]
+        for i, score in enumerate(scores):
+            memory.record_high_score(f"{i:064x}", score, [])
+
+        hot = memory.get_memory()["high_scores"]
+        self.assertEqual([h["score"] for h in hot], sorted(scores, reverse=True)[:5])
+        merged = memory.get_high_scores()
+        self.assertEqual([h["score"] for h in merged], sorted(scores, reverse=True)[:20])
+        self.assertEqual(memory.get_summary()["high_score_count"], 20)
+        self.assertEqual(memory.get_summary()["top_score"], max(scores))
+
+    def test_incremental_sizes_track_serialization(self):
+        for i in range(15):
+            memory.record_session(_session(i))
+            memory.record_high_score("ab" * 32, i / 15, ["addr"])
+        cache = memory.get_memory()
+        sizes = memory.get_size_bytes()
+        for section in memory._SECTIONS:
+            # Each entry is counted with its ", " separator, matching "[...]"
+            self.assertEqual(sizes[section], len(json.dumps(cache[section])))
+
+    def test_byte_budget_spills_more(self):
+        with patch.object(memory, "_MAX_SIZE_BYTES", 1000):
+            for i in range(10):
+                memory.record_session(_session(i))
+        self.assertLess(len(memory.get_memory()["sessions"]), 10)
+        self.assertLessEqual(sum(memory.get_size_bytes().values()), 1000)
+        self.assertEqual(len(memory.get_sessions()), 10)
+
+    def test_flush_writes_snapshot_and_clears_dirty(self):
+        memory.record_session(_session(0))
+        memory.flush_to_disk()
+        self.assertFalse(memory._dirty)
+        saved = json.loads(memory.MEMORY_FILE.read_text())
+        self.assertEqual(saved["sessions"][0]["timestamp"], "t00000")
+
+        # A change made while serializing keeps the cache dirty
+        real_dumps = json.dumps
+
+        def dumps_and_record(obj, **kwargs):
+            if isinstance(obj, dict) and "sessions" in obj:
+                memory.record_session(_session(1))
+            return real_dumps(obj, **kwargs)
+
+        memory.record_session(_session(2))
+        with patch.object(memory.json, "dumps", side_effect=dumps_and_record):
+            memory.flush_to_disk()
+        self.assertTrue(memory._dirty)
+        memory.flush_to_disk()
+        self.assertEqual(len(json.loads(memory.MEMORY_FILE.read_text())["sessions"]), 3)
+
+    def test_loads_pre_tiering_file(self):
+        legacy = memory._default_memory()
+        legacy["sessions"] = [_session(i) for i in range(25)]
+        legacy["high_scores"] = [
+            {"key_hex": "k", "score": s / 10, "addresses": []} for s in range(8)
+        ]
+        memory.MEMORY_FILE.write_text(json.dumps(legacy, indent=2))
+
+        self.assertEqual(len(memory.get_memory()["sessions"]), 10)
+        self.assertEqual(memory.get_memory()["high_scores"][0]["score"], 0.7)
+        self.assertEqual(memory.get_summary()["total_sessions"], 25)
+        self.assertEqual(memory.get_summary()["high_score_count"], 8)
+        self.assertTrue(memory._dirty)
+
+        memory.flush_to_disk()
+        memory.reset_memory()
+        self.assertEqual(memory.get_summary()["total_sessions"], 25)
+
+    def test_cold_writes_happen_outside_the_lock(self):
+        lock_free = []
+        real_add = memory._ColdTier.add_sessions
+
+        def add_sessions(tier, sessions):
+            def probe():
+                acquired = memory._lock.acquire(timeout=1)
+                lock_free.append(acquired)
+                if acquired:
+                    memory._lock.release()
+
+            t = threading.Thread(target=probe)
+            t.start()
+            t.join()
+            real_add(tier, sessions)
+
+        with patch.object(memory._ColdTier, "add_sessions", add_sessions):
+            for i in range(12):
+                memory.record_session(_session(i))
+        self.assertEqual(lock_free, [True, True])
+        self.assertEqual(memory._spilled["sessions"], [])
+        self.assertEqual(len(memory.get_sessions()), 12)
+
+    def test_queued_spills_visible_until_written(self):
+        with patch.object(memory, "_write_spilled", lambda: None):
+            for i in range(15):
+                memory.record_session(_session(i))
+            for i in range(8):
+                memory.record_high_score(f"{i:064x}", i / 10, [])
+        self.assertEqual(len(memory._spilled["sessions"]), 5)
+        self.assertEqual(len(memory.get_sessions()), 15)
+        self.assertEqual(memory.get_summary()["total_sessions"], 15)
+        self.assertEqual(memory.get_summary()["high_score_count"], 8)
+        self.assertEqual(
+            [h["score"] for h in memory.get_high_scores()], [i / 10 for i in range(7, -1, -1)]
+        )
+
+        # A flush taken before the write still persists the queued entries
+        memory.flush_to_disk()
+        memory.reset_memory()
+        self.assertEqual(len(memory.get_sessions()), 15)
+
+    def test_stale_snapshot_after_crash_is_not_duplicated(self):
+        for i in range(10):
+            memory.record_session(_session(i))
+        memory.flush_to_disk()
+        # Spills t00000-t00004 to SQLite; the snapshot on disk still holds them
+        for i in range(10, 15):
+            memory.record_session(_session(i))
+        memory.reset_memory()  # crash: no final flush
+
+        stamps = [s["timestamp"] for s in memory.get_sessions()]
+        self.assertEqual(stamps, [f"t{i:05d}" for i in range(10)])
+        self.assertEqual(len(memory.get_memory()["sessions"]), 5)
+
+        for i in range(15, 25):
+            memory.record_session(_session(i))
+        stamps = [s["timestamp"] for s in memory.get_sessions()]
+        self.assertEqual(len(stamps), len(set(stamps)))
+        self.assertEqual(memory.get_summary()["total_sessions"], 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""Tests for ProfileCompatibilityIndex — "most compatible profiles" search.
+
+Covers: parity with calculate_pairwise, ownership filtering, upsert/remove
+bookkeeping, growth, natal comparison helper, and query latency at 100k.
+"""
+
+import random
+import time
+import unittest
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from oracle_service.compatibility_matrix import ANIMALS, ELEMENTS, LIFE_PATHS
+from oracle_service.models.reading_types import ReadingResult, ReadingType, UserProfile
+from oracle_service.multi_user_analyzer import MultiUserAnalyzer
+from oracle_service.profile_index import ProfileCompatibilityIndex, natal_comparison
+
+_PATTERNS = [
+    ["number_repeat", 7],
+    ["number_repeat", 3],
+    ["animal_repeat", "Rat"],
+    ["master_number", 11],
+    ["master_number", 22],
+]
+
+
+def _comparisons(n: int, seed: int = 5) -> dict:
+    rng = random.Random(seed)
+    return {
+        i: {
+            "life_path": rng.choice(LIFE_PATHS),
+            "element": rng.choice(ELEMENTS),
+            "animal": rng.choice(ANIMALS),
+            "moon": {"phase_name": rng.choice(MultiUserAnalyzer.PHASE_ORDER)},
+            "patterns": sorted(rng.sample(_PATTERNS, rng.randint(0, 3))),
+        }
+        for i in range(1, n + 1)
+    }
+
+
+def _reading(user_id: int, comparison: dict) -> ReadingResult:
+    return ReadingResult(
+        reading_type=ReadingType.TIME,
+        user_id=user_id,
+        framework_output={
+            "numerology": {"life_path": {"number": comparison["life_path"]}},
+            "ganzhi": {
+                "year": {"element": comparison["element"], "animal_name": comparison["animal"]}
+            },
+            "moon": comparison["moon"],
+            "patterns": {
+                "detected": [
+                    {"type": t, "animal" if t == "animal_repeat" else "number": v}
+                    for t, v in comparison["patterns"]
+                ]
+            },
+        },
+    )
+
+
+def _index(comparisons: dict, owners: dict | None = None) -> ProfileCompatibilityIndex:
+    index = ProfileCompatibilityIndex(capacity=4)
+    for pid, comparison in comparisons.items():
+        index.upsert(pid, comparison, owner=(owners or {}).get(pid))
+    return index
+
+
+class TestScores(unittest.TestCase):
+    """Index scores equal the scalar pairwise scorer."""
+
+    def test_top_matches_match_calculate_pairwise(self):
+        comparisons = _comparisons(40)
+        index = _index(comparisons)
+        matches = index.top_matches(1, k=39)
+
+        self.assertEqual(len(matches), 39)
+        for match in matches:
+            expected = MultiUserAnalyzer.calculate_pairwise(
+                _reading(1, comparisons[1]),
+                _reading(match.user_b_id, comparisons[match.user_b_id]),
+            )
+            self.assertEqual(match.user_a_id, 1)
+            self.assertEqual(match.overall_score, expected.overall_score)
+            self.assertEqual(match.pattern_score, expected.pattern_score)
+            self.assertEqual(match.strengths, expected.strengths)
+
+    def test_sorted_best_first_with_id_tiebreak(self):
+        index = _index(_comparisons(60))
+        matches = index.top_matches(3, k=59)
+        keys = [(-m.overall_score, m.user_b_id) for m in matches]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_partial_top_k_is_prefix_of_full_ranking(self):
+        index = _index(_comparisons(200))
+        full = [m.user_b_id for m in index.top_matches(9, k=199)]
+        self.assertEqual([m.user_b_id for m in index.top_matches(9, k=10)], full[:10])
+
+
+class TestOwnership(unittest.TestCase):
+    """restrict_owner limits candidates to the owner's profiles."""
+
+    def test_restrict_owner(self):
+        comparisons = _comparisons(20)
+        owners = {pid: "alice" if pid % 2 else "bob" for pid in comparisons}
+        index = _index(comparisons, owners)
+
+        matches = index.top_matches(1, k=20, owner="alice", restrict_owner=True)
+        self.assertEqual({m.user_b_id for m in matches}, {p for p in owners if p % 2} - {1})
+        self.assertEqual(len(index.top_matches(1, k=20)), 19)
+
+    def test_unknown_owner_has_no_candidates(self):
+        index = _index(_comparisons(5), {i: "alice" for i in range(1, 6)})
+        self.assertEqual(index.top_matches(1, owner="mallory", restrict_owner=True), [])
+
+
+class TestMaintenance(unittest.TestCase):
+    """Upsert replaces in place; remove swaps the last row in."""
+
+    def test_remove_matches_rebuild(self):
+        comparisons = _comparisons(30)
+        index = _index(comparisons)
+        for pid in (1, 30, 12):
+            self.assertTrue(index.remove(pid))
+        self.assertFalse(index.remove(12))
+
+        remaining = {p: c for p, c in comparisons.items() if p not in (1, 30, 12)}
+        rebuilt = _index(remaining)
+        self.assertEqual(len(index), 27)
+        self.assertNotIn(12, index)
+        self.assertEqual(index.top_matches(5, k=26), rebuilt.top_matches(5, k=26))
+
+    def test_upsert_replaces_features(self):
+        comparisons = _comparisons(10)
+        index = _index(comparisons)
+        comparisons[4] = dict(comparisons[6])
+        index.upsert(4, comparisons[4])
+
+        self.assertEqual(len(index), 10)
+        self.assertEqual(index.top_matches(4, k=9), _index(comparisons).top_matches(4, k=9))
+
+    def test_growth_and_new_pattern_columns(self):
+        comparisons = _comparisons(100)
+        for i, pid in enumerate(comparisons):
+            comparisons[pid]["patterns"].append(["number_repeat", 100 + i % 20])
+        index = _index(comparisons)
+        self.assertEqual(len(index), 100)
+        self.assertEqual(len(index.top_matches(50, k=99)), 99)
+
+    def test_unknown_profile_raises(self):
+        with self.assertRaises(KeyError):
+            _index(_comparisons(3)).top_matches(99)
+
+
+class TestNatalComparison(unittest.TestCase):
+    """natal_comparison reads the profile at its own birth moment."""
+
+    def test_depends_on_birth_date(self):
+        a = natal_comparison(UserProfile(1, "A", 15, 6, 1990))
+        b = natal_comparison(UserProfile(2, "B", 2, 2, 1985))
+        self.assertIn(a["element"], ELEMENTS)
+        self.assertIn(a["animal"], ANIMALS)
+        self.assertNotEqual((a["animal"], a["life_path"]), (b["animal"], b["life_path"]))
+
+
+class TestScale(unittest.TestCase):
+    """A top-k query over 100k profiles is a single vectorized pass."""
+
+    def test_query_latency_100k(self):
+        rng = random.Random(3)
+        base = list(_comparisons(500).values())
+        index = ProfileCompatibilityIndex()
+        for pid in range(1, 100_001):
+            index.upsert(pid, rng.choice(base), owner=pid % 7)
+
+        start = time.perf_counter()
+        matches = index.top_matches(42, k=10)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self.assertEqual(len(matches), 10)
+        self.assertLess(elapsed_ms, 250)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import asyncio
 from unittest.mock import MagicMock, patch
 
 
+from oracle_service.engines.ai_interpreter import SECTIONS_RESET
 from oracle_service.models.reading_types import ReadingResult, ReadingType, UserProfile
 from oracle_service.reading_orchestrator import ReadingOrchestrator
 
@@ -203,3 +204,112 @@ class TestProgressCallbackOptional:
         )
         assert result is not None
         assert result["reading_type"] == "time"
+
+
+class TestAsyncAIPath:
+    @patch.object(ReadingOrchestrator, "_call_ai_interpreter")
+    @patch.object(ReadingOrchestrator, "_call_ai_interpreter_async")
+    @patch.object(ReadingOrchestrator, "_call_framework_time")
+    def test_nps_ai_async_uses_async_interpreter(self, mock_fw, mock_ai_async, mock_ai):
+        mock_fw.return_value = _make_reading_result()
+        mock_ai_async.return_value = {"full_text": "async ok"}
+
+        orch = ReadingOrchestrator()
+        loop = asyncio.new_event_loop()
+        try:
+            with patch.dict("os.environ", {"NPS_AI_ASYNC": "true"}):
+                result = loop.run_until_complete(
+                    orch.generate_time_reading(_make_user_profile(), 14, 30, 0)
+                )
+        finally:
+            loop.close()
+        mock_ai_async.assert_awaited_once()
+        mock_ai.assert_not_called()
+        assert result["reading_type"] == "time"
+
+
+class TestStreamingSections:
+    @patch.object(ReadingOrchestrator, "_call_ai_interpreter")
+    @patch.object(ReadingOrchestrator, "_call_framework_time")
+    def test_section_callback_streams_and_reports_ttfs(self, mock_fw, mock_ai):
+        mock_fw.return_value = _make_reading_result()
+        received = []
+
+        async def section_cb(key, text, index):
+            received.append((index, key, text))
+
+        async def fake_stream(framework_output, on_section, **kwargs):
+            await on_section("header", "Test User")
+            await on_section("message", "Keep going.")
+            result = MagicMock()
+            result.to_dict.return_value = {"full_text": "Test User\nKeep going."}
+            return result
+
+        orch = ReadingOrchestrator(section_callback=section_cb)
+        loop = asyncio.new_event_loop()
+        try:
+            with patch(
+                "oracle_service.engines.ai_interpreter.interpret_reading_stream", fake_stream
+            ):
+                result = loop.run_until_complete(
+                    orch.generate_time_reading(_make_user_profile(), 14, 30, 0)
+                )
+        finally:
+            loop.close()
+        mock_ai.assert_not_called()
+        assert received == [(0, "header", "Test User"), (1, "message", "Keep going.")]
+        ai = result["ai_interpretation"]
+        assert ai["full_text"] == "Test User\nKeep going."
+        assert ai["time_to_first_section_ms"] is not None
+
+    @patch.object(ReadingOrchestrator, "_call_framework_time")
+    def test_stream_error_after_sections_sends_reset(self, mock_fw):
+        mock_fw.return_value = _make_reading_result()
+        received = []
+
+        async def section_cb(key, text, index):
+            received.append(key)
+
+        async def failing_stream(framework_output, on_section, **kwargs):
+            await on_section("header", "Test User")
+            raise RuntimeError("stream broke")
+
+        orch = ReadingOrchestrator(section_callback=section_cb)
+        loop = asyncio.new_event_loop()
+        try:
+            with patch(
+                "oracle_service.engines.ai_interpreter.interpret_reading_stream", failing_stream
+            ):
+                result = loop.run_until_complete(
+                    orch.generate_time_reading(_make_user_profile(), 14, 30, 0)
+                )
+        finally:
+            loop.close()
+        assert received == ["header", SECTIONS_RESET]
+        assert result["ai_interpretation"]["ai_generated"] is False
+
+
+class TestFallbackOnly:
+    @patch.object(ReadingOrchestrator, "_call_ai_interpreter")
+    @patch.object(ReadingOrchestrator, "_call_framework_time")
+    def test_time_reading_skips_ai_and_uses_framework_fallback(self, mock_fw, mock_ai):
+        mock_fw.return_value = _make_reading_result()
+
+        orch = ReadingOrchestrator()
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(
+                orch.generate_time_reading(_make_user_profile(), 14, 30, 0, fallback_only=True)
+            )
+        finally:
+            loop.close()
+        mock_ai.assert_not_called()
+        ai = result["ai_interpretation"]
+        assert ai["full_text"] == "Framework synthesis text for fallback."
+        assert ai["ai_generated"] is False
+
+    @patch.object(ReadingOrchestrator, "_call_ai_interpreter")
+    def test_name_reading_skips_ai(self, mock_ai):
+        result = ReadingOrchestrator().generate_name_reading("Alice", fallback_only=True)
+        mock_ai.assert_not_called()
+        assert result["ai_interpretation"]
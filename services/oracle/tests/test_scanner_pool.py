@@ -0,0 +1,132 @@
+"""Tests for scanner_pool — multiprocess key generation around one ScannerBrain.
+
+Covers: SharedBrainState publish/attach/read, worker brains following the
+published state, and ScannerPool runs feeding findings and stats back to
+the coordinating brain.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from engines import key_scoring as ks
+from engines.scanner_pool import (
+    MAX_FINDINGS_PER_BATCH,
+    MAX_REFERENCE_KEYS,
+    ScannerPool,
+    SharedBrainState,
+    _WorkerBrain,
+)
+from engines.scanner_brain import ScannerBrain
+
+
+class TestSharedBrainState(unittest.TestCase):
+    """Seqlock-guarded shared memory block."""
+
+    def setUp(self):
+        self.state = SharedBrainState()
+
+    def tearDown(self):
+        self.state.close()
+
+    def test_defaults(self):
+        seq, refs, entropy = self.state.read()
+        self.assertEqual(seq, 0)
+        self.assertEqual(len(refs), 0)
+        self.assertEqual(entropy, (3.0, 4.0))
+
+    def test_attached_reader_sees_publish(self):
+        keys = [2**255 + i for i in range(MAX_REFERENCE_KEYS + 5)]
+        self.state.publish(keys, (3.2, 3.9))
+        reader = SharedBrainState(self.state.name)
+        try:
+            seq, refs, entropy = reader.read()
+            self.assertEqual(seq, 2)
+            self.assertEqual(ks.ints_from_limbs(refs), keys[:MAX_REFERENCE_KEYS])
+            self.assertEqual(entropy, (3.2, 3.9))
+        finally:
+            reader.close()
+
+    def test_worker_brain_refreshes_on_new_seq(self):
+        worker = _WorkerBrain(self.state, "pattern_replay")
+        worker.refresh()
+        self.assertEqual(worker._get_high_scoring_reference_keys(), [])
+        self.state.publish([2**200], (3.5, 3.6))
+        worker.refresh()
+        self.assertEqual(worker._get_high_scoring_reference_keys(), [2**200])
+        self.assertEqual(worker._learned_entropy_range(), (3.5, 3.6))
+        keys = ks.ints_from_limbs(worker.generate_key_limbs(50))
+        self.assertTrue(all(k >> 128 == 2**200 >> 128 for k in keys))
+
+
+class TestScannerPool(unittest.TestCase):
+    """Coordinator + worker processes."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        with patch("engines.scanner_brain.KNOWLEDGE_DIR", Path(self._tmpdir)):
+            self.brain = ScannerBrain()
+        self.brain.start_session("test", ["btc"], [])
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_run_reports_stats_and_records_findings(self):
+        # Low threshold so every batch carries findings
+        with ScannerPool(self.brain, workers=2, batch_size=512, finding_score=0.0) as pool:
+            stats = pool.run(0.5, strategy="random")
+        self.assertEqual(stats["workers"], 2)
+        self.assertEqual(stats["strategy"], "random")
+        self.assertGreater(stats["keys_tested"], 0)
+        self.assertEqual(stats["keys_tested"] % 512, 0)
+        self.assertEqual(sum(stats["keys_per_worker"]), stats["keys_tested"])
+        self.assertTrue(all(n > 0 for n in stats["keys_per_worker"]))
+        self.assertEqual(stats["high_scores"], stats["keys_tested"])
+        batches = stats["keys_tested"] // 512
+        self.assertEqual(stats["findings"], batches * MAX_FINDINGS_PER_BATCH)
+        self.assertEqual(len(self.brain._session_findings), stats["findings"])
+        self.assertTrue(all("entropy" in f for f in self.brain._session_findings))
+        self.assertFalse(pool.running)
+
+    def test_end_session_updates_strategy_log(self):
+        self.brain._current_strategy = "numerology_guided"
+        with ScannerPool(self.brain, workers=1, batch_size=256) as pool:
+            stats = pool.run(0.3)
+        self.assertEqual(stats["strategy"], "numerology_guided")
+        self.brain.end_session(stats)
+        log = self.brain._strategy_log["numerology_guided"]
+        self.assertEqual(log["runs"], 1)
+        self.assertEqual(log["total_keys"], stats["keys_tested"])
+
+    def test_explicit_strategy_is_credited(self):
+        self.brain._current_strategy = "numerology_guided"
+        with ScannerPool(self.brain, workers=1, batch_size=256, finding_score=0.0) as pool:
+            stats = pool.run(0.3, strategy="entropy_targeted")
+        self.brain.end_session(stats)
+        self.assertEqual(
+            {f["strategy"] for f in self.brain._session_findings}, {"entropy_targeted"}
+        )
+        self.assertNotIn("numerology_guided", self.brain._strategy_log)
+        log = self.brain._strategy_log["entropy_targeted"]
+        self.assertEqual(log["runs"], 1)
+        self.assertEqual(log["total_keys"], stats["keys_tested"])
+        self.assertEqual(log["patterns"], len(self.brain._session_findings))
+
+    def test_start_twice_raises(self):
+        pool = ScannerPool(self.brain, workers=1, batch_size=64)
+        pool.start("random")
+        try:
+            with self.assertRaises(RuntimeError):
+                pool.start("random")
+        finally:
+            pool.stop()
+        with self.assertRaises(RuntimeError):
+            pool.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Tests for session_manager — session files plus the SQLite catalog.
+
+Covers: catalog rows and running totals through start/end, newest-first
+listing with limit, building the catalog for a pre-existing directory,
+the rebuild command, and the file-scan fallback without a catalog.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from engines import session_manager as sm
+
+
+def _write_session(directory: Path, session_id: str, keys: int, duration: float = 10.0):
+    session = {
+        "session_id": session_id,
+        "terminal_id": session_id.split("_")[0],
+        "started": 1000.0,
+        "ended": 1000.0 + duration,
+        "duration": duration,
+        "settings": {},
+        "stats": {"keys_tested": keys, "seeds_tested": 1, "hits": 0},
+    }
+    (directory / f"{session_id}.json").write_text(json.dumps(session))
+
+
+class TestSessionCatalog(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.dir = Path(self._tmpdir) / "sessions"
+        self._patch = patch.object(sm, "SESSIONS_DIR", self.dir)
+        self._patch.start()
+
+    def tearDown(self):
+        sm.close_catalog()
+        self._patch.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_start_and_end_update_totals(self):
+        with patch.object(sm.time, "strftime", side_effect=["20260101_000000", "20260102_000000"]):
+            first = sm.start_session("t1")
+            second = sm.start_session("t1")
+        sm.end_session(first, {"keys_tested": 500, "seeds_tested": 7, "hits": 1})
+
+        stats = sm.get_session_stats()
+        self.assertEqual(stats["total_sessions"], 2)
+        self.assertEqual(stats["total_keys"], 500)
+        self.assertEqual(stats["total_seeds"], 7)
+        self.assertEqual(stats["total_hits"], 1)
+        self.assertGreaterEqual(stats["total_duration"], 0)
+
+        # Re-ending replaces the row rather than adding to it
+        sm.end_session(first, {"keys_tested": 800})
+        stats = sm.get_session_stats()
+        self.assertEqual(stats["total_sessions"], 2)
+        self.assertEqual(stats["total_keys"], 800)
+        self.assertEqual(stats["total_seeds"], 0)
+
+        listed = sm.list_sessions()
+        self.assertEqual([s["session_id"] for s in listed], [second, first])
+        self.assertEqual(listed[1]["stats"], {"keys_tested": 800})
+        self.assertIsNone(listed[0]["ended"])
+
+    def test_existing_directory_is_cataloged_on_first_use(self):
+        self.dir.mkdir(parents=True)
+        for day in range(1, 8):
+            _write_session(self.dir, f"t2_202601{day:02d}_000000", keys=100 * day)
+        (self.dir / "broken.json").write_text("{not json")
+
+        self.assertEqual(sm.get_session_stats()["total_keys"], 2800)
+        self.assertEqual(sm.get_session_stats()["total_sessions"], 7)
+        listed = sm.list_sessions(limit=3)
+        self.assertEqual(
+            [s["session_id"] for s in listed],
+            ["t2_20260107_000000", "t2_20260106_000000", "t2_20260105_000000"],
+        )
+        self.assertTrue((self.dir / sm.CATALOG_NAME).exists())
+
+    def test_rebuild_picks_up_external_changes(self):
+        self.dir.mkdir(parents=True)
+        _write_session(self.dir, "t3_20260101_000000", keys=5)
+        self.assertEqual(sm.get_session_stats()["total_keys"], 5)
+
+        _write_session(self.dir, "t3_20260102_000000", keys=7)
+        (self.dir / "t3_20260101_000000.json").unlink()
+        self.assertEqual(sm.get_session_stats()["total_keys"], 5)  # catalog unchanged
+
+        self.assertEqual(sm.main(["rebuild"]), 0)
+        stats = sm.get_session_stats()
+        self.assertEqual((stats["total_sessions"], stats["total_keys"]), (1, 7))
+
+    def test_falls_back_to_files_without_catalog(self):
+        self.dir.mkdir(parents=True)
+        _write_session(self.dir, "t4_20260101_000000", keys=3)
+        _write_session(self.dir, "t4_20260102_000000", keys=4)
+        with patch.object(sm, "_get_catalog", return_value=None):
+            self.assertEqual(sm.get_session_stats()["total_keys"], 7)
+            listed = sm.list_sessions(limit=1)
+        self.assertEqual([s["session_id"] for s in listed], ["t4_20260102_000000"])
+
+    def test_missing_directory(self):
+        self.assertEqual(sm.list_sessions(), [])
+        self.assertEqual(sm.get_session_stats()["total_sessions"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for timing_advisor — cached day components and the multi-day planner.
+
+Covers: per-hour parity with the scalar formula, today's ranking, ranked
+window correctness (brute force), heatmap shape, validation, and caching.
+"""
+
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from engines.timing_advisor import (
+    MAX_PLAN_DAYS,
+    _ranked_windows,
+    day_components,
+    get_current_quality,
+    get_optimal_hours_today,
+    hour_components,
+    hourly_scores,
+    plan_timing,
+)
+
+START = date(2026, 3, 1)
+
+
+def _scalar_score(d: date, hour: int) -> float:
+    comp = day_components(d.year, d.month, d.day)
+    hour_s = hour_components(hour)[2]
+    return (comp.moon_score + comp.day_score + hour_s + comp.weekday_score) / 4.0
+
+
+class TestHourlyScores(unittest.TestCase):
+    """The vectorized grid equals the per-hour scalar formula."""
+
+    def test_grid_matches_scalar_formula(self):
+        grid = hourly_scores(START, 45)
+        self.assertEqual(grid.shape, (45, 24))
+        for i in range(45):
+            d = START + timedelta(days=i)
+            for hour in range(24):
+                self.assertEqual(round(grid[i, hour], 4), round(_scalar_score(d, hour), 4))
+
+    def test_optimal_hours_today(self):
+        ranked = get_optimal_hours_today()
+        self.assertEqual(sorted(h for h, _ in ranked), list(range(24)))
+        scores = [s for _, s in ranked]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        today = datetime.now(timezone.utc).date()
+        self.assertEqual(dict(ranked)[5], round(_scalar_score(today, 5), 4))
+
+    def test_current_quality_uses_same_score(self):
+        result = get_current_quality()
+        now = datetime.now(timezone.utc)
+        self.assertAlmostEqual(result["score"], _scalar_score(now.date(), now.hour), places=4)
+        self.assertIn(result["quality"], ("excellent", "good", "fair", "poor"))
+
+    def test_day_components_cached(self):
+        day_components.cache_clear()
+        hourly_scores(START, 10)
+        hourly_scores(START, 10)
+        info = day_components.cache_info()
+        self.assertEqual(info.misses, 10)
+        self.assertEqual(info.hits, 10)
+
+
+class TestPlanTiming(unittest.TestCase):
+    """Ranked windows and per-day details of plan_timing."""
+
+    def test_shape(self):
+        plan = plan_timing(START, days=90)
+        self.assertEqual(len(plan["heatmap"]), 90)
+        self.assertEqual({len(row) for row in plan["heatmap"]}, {24})
+        self.assertEqual(plan["days"][0]["date"], "2026-03-01")
+        self.assertEqual(plan["days"][-1]["date"], "2026-05-29")
+        first = plan["days"][0]
+        self.assertEqual(first["best_score"], max(plan["heatmap"][0]))
+
+    def test_best_window_matches_brute_force(self):
+        width = 3
+        plan = plan_timing(START, days=30, window_hours=width, top_k=5)
+        hourly = [s for row in hourly_scores(START, 30) for s in row]
+        best = max(
+            round(sum(hourly[i : i + width]) / width, 4) for i in range(len(hourly) - width + 1)
+        )
+        self.assertEqual(plan["windows"][0]["score"], best)
+
+    def test_windows_ranked_and_non_overlapping(self):
+        plan = plan_timing(START, days=30, window_hours=4, top_k=20)
+        windows = plan["windows"]
+        self.assertEqual(len(windows), 20)
+        scores = [w["score"] for w in windows]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+        spans = sorted(
+            (datetime.fromisoformat(w["start"]), datetime.fromisoformat(w["end"])) for w in windows
+        )
+        for (_, end), (begin, _) in zip(spans, spans[1:]):
+            self.assertLessEqual(end, begin)
+        self.assertEqual(spans[0][1] - spans[0][0], timedelta(hours=4))
+
+    def test_window_may_cross_midnight(self):
+        hourly = [0.0] * 22 + [1.0] * 4 + [0.0] * 22
+        self.assertEqual(_ranked_windows(hourly, 4, 1), [(22, 1.0)])
+
+    def test_invalid_ranges(self):
+        with self.assertRaises(ValueError):
+            plan_timing(START, days=0)
+        with self.assertRaises(ValueError):
+            plan_timing(START, days=MAX_PLAN_DAYS + 1)
+        with self.assertRaises(ValueError):
+            plan_timing(START, window_hours=25)
+
+
+if __name__ == "__main__":
+    unittest.main()
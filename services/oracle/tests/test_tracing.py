@@ -0,0 +1,122 @@
+"""Tests for tracing — span nesting, context propagation, Server-Timing, OTLP export."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from oracle_service import tracing
+from oracle_service.framework_bridge import generate_single_reading
+from oracle_service.tracing import JsonFileExporter, current_trace, span, start_trace
+from oracle_service.work_scheduler import WorkPool
+
+
+@pytest.fixture(autouse=True)
+def _no_exporter():
+    tracing.set_exporter(None)
+    yield
+    tracing.set_exporter(None)
+
+
+def test_span_outside_trace_is_shared_noop():
+    assert current_trace() is None
+    assert span("a") is span("b", key=1)
+    with span("a") as s:
+        assert s is None
+
+
+def test_spans_nest_and_record_errors():
+    with start_trace("request", route="/x") as trace:
+        with span("outer", n=1) as outer:
+            with span("inner"):
+                pass
+            with pytest.raises(ValueError):
+                with span("failing"):
+                    raise ValueError("boom")
+        assert current_trace() is trace
+    assert current_trace() is None
+
+    by_name = {s.name: s for s in trace.spans}
+    assert [s.name for s in trace.spans] == ["inner", "failing", "outer", "request"]
+    assert by_name["inner"].parent_id == outer.span_id
+    assert by_name["outer"].parent_id == trace.root.span_id
+    assert by_name["outer"].attributes == {"n": 1}
+    assert by_name["failing"].error == "ValueError"
+    assert all(s.end_ns >= s.start_ns for s in trace.spans)
+
+
+def test_server_timing_sums_spans_by_name():
+    with start_trace("request") as trace:
+        for _ in range(3):
+            with span("ai.interpret"):
+                pass
+        with span("db.store_reading"):
+            pass
+        header = trace.server_timing()
+    names = [part.split(";")[0] for part in header.split(", ")]
+    assert names == ["ai.interpret", "db.store_reading", "total"]
+    assert all(";dur=" in part for part in header.split(", "))
+
+
+@pytest.mark.asyncio
+async def test_spans_in_pool_threads_join_the_trace():
+    pool = WorkPool("test", workers=2)
+
+    def work():
+        with span("framework.step"):
+            return current_trace()
+
+    try:
+        with start_trace("request") as trace:
+            with span("reading.framework") as parent:
+                seen = await pool.run(work)
+    finally:
+        pool.shutdown()
+    assert seen is trace
+    step = next(s for s in trace.spans if s.name == "framework.step")
+    assert step.parent_id == parent.span_id
+
+
+def test_framework_pipeline_steps_are_traced():
+    with start_trace("request") as trace:
+        generate_single_reading(
+            full_name="Ada Lovelace",
+            birth_day=10,
+            birth_month=12,
+            birth_year=1815,
+            current_date=datetime(2026, 2, 13),
+        )
+    names = {s.name for s in trace.spans}
+    for step in (
+        "fc60_stamp",
+        "numerology",
+        "moon",
+        "ganzhi",
+        "heartbeat",
+        "reading",
+        "confidence",
+        "translation",
+        "assemble",
+    ):
+        assert f"framework.{step}" in names
+    assert "framework_bridge.orchestrate" in names
+
+
+def test_exports_otlp_json_lines(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracing.set_exporter(JsonFileExporter(str(path)))
+    with start_trace("POST /api/oracle/readings", **{"http.response.status_code": 200}):
+        with span("encrypt"):
+            pass
+
+    (line,) = path.read_text().splitlines()
+    spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    child, root = spans
+    assert root["name"] == "POST /api/oracle/readings"
+    assert root["kind"] == 2 and "parentSpanId" not in root
+    assert root["attributes"] == [
+        {"key": "http.response.status_code", "value": {"intValue": "200"}}
+    ]
+    assert child["parentSpanId"] == root["spanId"]
+    assert child["traceId"] == root["traceId"] and len(root["traceId"]) == 32
+    assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
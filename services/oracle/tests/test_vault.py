@@ -0,0 +1,154 @@
+"""Tests for the findings vault and its indexed segment store.
+
+Covers: segment rolling and O(limit) tail reads, reverse streaming,
+summary counters (checkpoint + replay after reopen), crash recovery of
+the offset index, adoption of a pre-segment vault_live.jsonl, and the
+vault's streaming CSV/JSON exports.
+"""
+
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from engines import vault, vault_store
+from engines.vault_store import SegmentStore
+
+
+def _entry(i: int) -> dict:
+    return {"i": i, "chain": "btc" if i % 3 else "eth", "balance": i % 4, "address": f"a{i}"}
+
+
+class TestSegmentStore(unittest.TestCase):
+    """SegmentStore on its own."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.dir = Path(self._tmpdir) / "segments"
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _filled(self, n: int, segment_bytes: int = 2000) -> SegmentStore:
+        store = SegmentStore(self.dir, segment_bytes=segment_bytes)
+        for i in range(n):
+            store.append(_entry(i))
+        return store
+
+    def test_rolls_segments_and_tails_across_them(self):
+        store = self._filled(300)
+        self.assertGreater(store.summary()["segments"], 5)
+        self.assertEqual([e["i"] for e in store.tail(5)], [295, 296, 297, 298, 299])
+        self.assertEqual([e["i"] for e in store.tail(120)], list(range(180, 300)))
+        self.assertEqual([e["i"] for e in store.tail(1000)], list(range(300)))
+        self.assertEqual([e["i"] for e in store.tail(0)], list(range(300)))
+
+    def test_iter_both_directions(self):
+        store = self._filled(150)
+        self.assertEqual([e["i"] for e in store.iter()], list(range(150)))
+        self.assertEqual([e["i"] for e in store.iter(reverse=True)], list(range(149, -1, -1)))
+
+    def test_summary_counters(self):
+        store = self._filled(90)
+        summary = store.summary()
+        entries = [_entry(i) for i in range(90)]
+        self.assertEqual(summary["total"], 90)
+        self.assertEqual(summary["with_balance"], sum(1 for e in entries if e["balance"] > 0))
+        self.assertEqual(summary["by_chain"], {"eth": 30, "btc": 60})
+        self.assertEqual(summary["bytes"], sum(p.stat().st_size for p in self.dir.glob("*.jsonl")))
+
+    def test_reopen_replays_past_checkpoint(self):
+        with patch.object(vault_store, "CHECKPOINT_EVERY", 50):
+            store = self._filled(130)
+        expected = store.summary()
+        saved = json.loads((self.dir / "summary.json").read_text())
+        self.assertEqual(saved["counters"]["total"], 100)
+
+        reopened = SegmentStore(self.dir, segment_bytes=2000)
+        self.assertEqual(reopened.summary(), expected)
+        reopened.append(_entry(130))
+        self.assertEqual(reopened.tail(2)[-1]["i"], 130)
+
+    def test_recovers_unindexed_records_and_partial_line(self):
+        store = self._filled(20, segment_bytes=1 << 20)
+        data = self.dir / "000001.jsonl"
+        index = self.dir / "000001.idx"
+        # Crash after two line writes but before their index entries, mid-third
+        with open(data, "a") as f:
+            f.write(json.dumps(_entry(20)) + "\n" + json.dumps(_entry(21)) + "\n" + '{"i": 2')
+        with open(index, "r+b") as f:
+            f.truncate(index.stat().st_size - 3)  # torn index entry too
+        del store
+
+        reopened = SegmentStore(self.dir)
+        self.assertEqual([e["i"] for e in reopened.tail(3)], [19, 20, 21])
+        self.assertEqual(reopened.summary()["total"], 22)
+        self.assertTrue(data.read_text().endswith("}\n"))
+
+    def test_adopts_legacy_vault(self):
+        legacy = Path(self._tmpdir) / "vault_live.jsonl"
+        legacy.write_text("".join(json.dumps(_entry(i)) + "\n" for i in range(10)) + "\n")
+        store = SegmentStore(self.dir, legacy_path=legacy)
+        self.assertFalse(legacy.exists())
+        self.assertEqual(store.summary()["total"], 10)
+        store.append(_entry(10))
+        self.assertEqual([e["i"] for e in store.tail(3)], [8, 9, 10])
+
+
+class TestVault(unittest.TestCase):
+    """engines.vault functions over the segment store."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        root = Path(self._tmpdir)
+        self._patches = [
+            patch.object(vault, "FINDINGS_DIR", root),
+            patch.object(vault, "SESSIONS_DIR", root / "sessions"),
+            patch.object(vault, "SUMMARIES_DIR", root / "summaries"),
+            patch.object(vault, "_store", None),
+        ]
+        for p in self._patches:
+            p.start()
+        vault.init_vault()
+        for i in range(40):
+            vault.record_finding(_entry(i))
+
+    def tearDown(self):
+        for p in reversed(self._patches):
+            p.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_get_findings_and_summary(self):
+        self.assertEqual([f["i"] for f in vault.get_findings(limit=3)], [37, 38, 39])
+        self.assertEqual(len(vault.get_findings(limit=0)), 40)
+        summary = vault.get_summary()
+        self.assertEqual(summary["total"], 40)
+        self.assertEqual(summary["by_chain"], {"eth": 14, "btc": 26})
+        self.assertGreater(summary["vault_size"], 0)
+
+    def test_export_json_matches_json_dump(self):
+        path = vault.export_json(str(Path(self._tmpdir) / "out.json"))
+        findings = vault.get_findings(limit=0)
+        self.assertEqual(Path(path).read_text(), json.dumps(findings, indent=2))
+
+    def test_export_json_empty(self):
+        with patch.object(vault, "FINDINGS_DIR", Path(self._tmpdir) / "empty"):
+            path = vault.export_json(str(Path(self._tmpdir) / "empty.json"))
+        self.assertEqual(Path(path).read_text(), "[]")
+
+    def test_export_csv(self):
+        path = vault.export_csv(str(Path(self._tmpdir) / "out.csv"))
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 40)
+        self.assertEqual(rows[-1]["i"], "39")
+        self.assertIn("session", rows[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+"""Tests for the WorkScheduler — priority classes, WFQ order, caps, metrics."""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from oracle_service.work_scheduler import (
+    BATCH,
+    BOT,
+    INTERACTIVE,
+    WorkPool,
+    WorkScheduler,
+    current_priority,
+    priority,
+)
+
+
+def _blocked_pool(**kwargs) -> tuple[WorkPool, threading.Event]:
+    """Pool whose single worker can be held busy until the event is set."""
+    return WorkPool("test", workers=1, **kwargs), threading.Event()
+
+
+# ──── Priority context ────────────────────────────────────────────
+
+
+def test_priority_context_nests_and_resets():
+    assert current_priority() == INTERACTIVE
+    with priority(BATCH):
+        assert current_priority() == BATCH
+        with priority("BOT"):
+            assert current_priority() == BOT
+        assert current_priority() == BATCH
+    assert current_priority() == INTERACTIVE
+
+
+def test_unknown_priority_is_interactive():
+    with priority("urgent!!"):
+        assert current_priority() == INTERACTIVE
+
+
+def test_config_from_env():
+    env = {
+        "NPS_SCHED_FRAMEWORK_WORKERS": "3",
+        "NPS_SCHED_AI_WORKERS": "5",
+        "NPS_SCHED_WEIGHTS": "interactive=10, batch=2, bogus=9, bot=x",
+        "NPS_SCHED_CAPS": "bot=1",
+    }
+    with patch.dict(os.environ, env):
+        scheduler = WorkScheduler.from_env()
+    try:
+        assert scheduler.framework.workers == 3
+        assert scheduler.ai.workers == 5
+        assert scheduler.ai.weights == {INTERACTIVE: 10.0, BOT: 4.0, BATCH: 2.0}
+        assert scheduler.framework.caps == {BOT: 1}
+    finally:
+        scheduler.shutdown()
+
+
+def test_default_caps_limit_batch():
+    scheduler = WorkScheduler(framework_workers=4, ai_workers=4)
+    try:
+        assert scheduler.framework.caps == {BATCH: 2}
+    finally:
+        scheduler.shutdown()
+
+
+# ──── Dispatch ────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_interactive_overtakes_queued_batch():
+    pool, gate = _blocked_pool()
+    order: list[str] = []
+    try:
+        blocker = asyncio.ensure_future(pool.run(gate.wait, INTERACTIVE))
+        await asyncio.sleep(0.01)
+        jobs = [pool.run(lambda: order.append(BATCH), BATCH) for _ in range(4)]
+        jobs += [pool.run(lambda: order.append(INTERACTIVE), INTERACTIVE) for _ in range(4)]
+        pending = asyncio.gather(*jobs)
+        await asyncio.sleep(0.01)
+        gate.set()
+        await asyncio.gather(blocker, pending)
+    finally:
+        pool.shutdown()
+    assert order == [INTERACTIVE] * 4 + [BATCH] * 4
+
+
+@pytest.mark.asyncio
+async def test_weighted_share_does_not_starve_batch():
+    pool, gate = _blocked_pool(weights={INTERACTIVE: 2.0, BATCH: 1.0})
+    order: list[str] = []
+    try:
+        blocker = asyncio.ensure_future(pool.run(gate.wait, BATCH))
+        await asyncio.sleep(0.01)
+        jobs = [pool.run(lambda: order.append(INTERACTIVE), INTERACTIVE) for _ in range(6)]
+        jobs += [pool.run(lambda: order.append(BATCH), BATCH) for _ in range(3)]
+        pending = asyncio.gather(*jobs)
+        await asyncio.sleep(0.01)
+        gate.set()
+        await asyncio.gather(blocker, pending)
+    finally:
+        pool.shutdown()
+    # 2:1 weights → batch gets roughly every third slot, not the tail
+    assert BATCH in order[:4]
+    assert order.count(BATCH) == 3
+
+
+@pytest.mark.asyncio
+async def test_class_cap_limits_concurrency():
+    pool = WorkPool("test", workers=4, caps={BATCH: 1})
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    try:
+        await asyncio.gather(*(pool.run(work, BATCH) for _ in range(4)))
+        assert peak == 1
+        await asyncio.gather(*(pool.run(work, INTERACTIVE) for _ in range(4)))
+        assert peak == 4
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_context_class_and_contextvars_reach_worker():
+    pool = WorkPool("test", workers=2)
+    try:
+        with priority(BOT):
+            seen = await pool.run(current_priority)
+        assert seen == BOT
+        assert pool.stats()["classes"][BOT]["completed"] == 1
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_exceptions_propagate():
+    pool = WorkPool("test", workers=1)
+
+    def boom():
+        raise ValueError("bad input")
+
+    try:
+        with pytest.raises(ValueError, match="bad input"):
+            await pool.run(boom)
+        assert await pool.run(lambda: 42) == 42
+    finally:
+        pool.shutdown()
+
+
+# ──── Metrics ─────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_metrics_per_class():
+    pool, gate = _blocked_pool()
+    try:
+        blocker = asyncio.ensure_future(pool.run(gate.wait, INTERACTIVE))
+        await asyncio.sleep(0.01)
+        waiting = asyncio.ensure_future(pool.run(lambda: None, BATCH))
+        await asyncio.sleep(0.05)
+        queued = pool.stats()["classes"][BATCH]
+        assert (queued["queued"], queued["running"]) == (1, 0)
+        gate.set()
+        await asyncio.gather(blocker, waiting)
+        stats = pool.stats()["classes"]
+    finally:
+        pool.shutdown()
+    assert stats[BATCH]["completed"] == 1
+    assert stats[BATCH]["wait_ms_max"] >= 40
+    assert stats[INTERACTIVE]["wait_ms_max"] < 40
+
+
+@pytest.mark.asyncio
+async def test_cancelled_while_queued_never_runs():
+    pool, gate = _blocked_pool()
+    ran: list[int] = []
+    try:
+        blocker = asyncio.ensure_future(pool.run(gate.wait))
+        await asyncio.sleep(0.01)
+        victim = asyncio.ensure_future(pool.run(lambda: ran.append(1), BOT))
+        await asyncio.sleep(0.01)
+        victim.cancel()
+        await asyncio.sleep(0)
+        gate.set()
+        await blocker
+        await pool.run(lambda: None, BOT)
+        stats = pool.stats()["classes"][BOT]
+    finally:
+        pool.shutdown()
+    assert ran == []
+    assert stats["cancelled"] == 1
+    assert stats["completed"] == 1
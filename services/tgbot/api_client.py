@@ -35,7 +35,10 @@ class NPSAPIClient:
         self._client = httpx.AsyncClient(
             base_url=config.API_BASE_URL,
             timeout=httpx.Timeout(API_TIMEOUT, connect=5.0),
-            headers={"Authorization": f"Bearer {api_key}"},
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "X-NPS-Priority": "bot",
+            },
         )
 
     async def _request(
@@ -18,7 +18,10 @@ async def get_client() -> httpx.AsyncClient:
         _client = httpx.AsyncClient(
             base_url=config.API_BASE_URL,
             timeout=httpx.Timeout(10.0, connect=5.0),
-            headers={"Authorization": f"Bearer {config.BOT_SERVICE_KEY}"},
+            headers={
+                "Authorization": f"Bearer {config.BOT_SERVICE_KEY}",
+                "X-NPS-Priority": "bot",
+            },
         )
     return _client
 
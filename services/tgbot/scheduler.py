@@ -42,7 +42,10 @@ class DailyScheduler:
             self._client = httpx.AsyncClient(
                 base_url=self._api_base_url,
                 timeout=httpx.Timeout(15.0, connect=5.0),
-                headers={"Authorization": f"Bearer {config.BOT_SERVICE_KEY}"},
+                headers={
+                    "Authorization": f"Bearer {config.BOT_SERVICE_KEY}",
+                    "X-NPS-Priority": "batch",
+                },
             )
         return self._client
 